@@ -136,6 +136,7 @@ app.post('/send-batch', authMiddleware, async (req, res) => {
             success: 0,
             failed: 0,
             expired: 0,
+            expired_endpoints: [],
             errors: []
         };
 
@@ -146,6 +147,7 @@ app.post('/send-batch', authMiddleware, async (req, res) => {
             } catch (error) {
                 if (error.statusCode === 410 || error.statusCode === 404) {
                     results.expired++;
+                    results.expired_endpoints.push(subscription.endpoint);
                 } else {
                     results.failed++;
                     results.errors.push({
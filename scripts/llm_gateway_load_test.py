@@ -0,0 +1,67 @@
+"""
+Load test for the LLM gateway against the local fake backend.
+
+Fires a burst of background calls (e.g. a nightly synthesis batch) with
+interactive chat calls arriving in the middle, then prints per-lane latency
+and the gateway metrics. No network calls are made.
+
+Usage:
+    python scripts/llm_gateway_load_test.py [background_calls] [interactive_calls]
+
+Tune with the usual settings, e.g. LLM_FAKE_LATENCY_MS=200 LLM_FAKE_ERROR_RATE=0.05.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.getcwd())
+os.environ["LLM_GATEWAY_BACKEND"] = "fake"
+
+from src.app.core.ai.gateway import LLMPriority, create_chat_model, get_llm_gateway, llm_priority
+
+MODEL = "anthropic/claude-haiku-4.5"
+
+
+async def timed_call(llm, priority: LLMPriority, index: int) -> tuple[LLMPriority, float, bool]:
+    started = time.perf_counter()
+    with llm_priority(priority):
+        try:
+            await llm.ainvoke(f"{priority.name.lower()} request {index}")
+            ok = True
+        except Exception:
+            ok = False
+    return priority, (time.perf_counter() - started) * 1000, ok
+
+
+async def run_load_test(background_calls: int, interactive_calls: int):
+    llm = create_chat_model(MODEL, temperature=0.7)
+
+    print(f"Queueing {background_calls} background calls...")
+    tasks = [asyncio.create_task(timed_call(llm, LLMPriority.BACKGROUND, i)) for i in range(background_calls)]
+
+    await asyncio.sleep(0.5)
+    print(f"Sending {interactive_calls} interactive calls mid-burst...")
+    tasks += [asyncio.create_task(timed_call(llm, LLMPriority.INTERACTIVE, i)) for i in range(interactive_calls)]
+
+    results = await asyncio.gather(*tasks)
+
+    for priority in LLMPriority:
+        latencies = sorted(ms for p, ms, _ in results if p == priority)
+        failures = sum(1 for p, _, ok in results if p == priority and not ok)
+        if latencies:
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+            print(f"{priority.name:<12} n={len(latencies):<4} p50={p50:8.0f}ms p95={p95:8.0f}ms failed={failures}")
+
+    print(json.dumps(get_llm_gateway().metrics(), indent=2))
+    await get_llm_gateway().close()
+
+
+if __name__ == "__main__":
+    background = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    interactive = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    asyncio.run(run_load_test(background, interactive))
@@ -1,14 +1,14 @@
 from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.config import settings
 from ..core.db.database import async_get_db
 from ..core.exceptions.http_exceptions import ForbiddenException, RateLimitException, UnauthorizedException
 from ..core.logger import logging
 from ..core.security import TokenType, oauth2_scheme, verify_token
-from ..core.utils.rate_limit import rate_limiter
+from ..core.utils.auth_cache import MISSING, auth_cache
+from ..core.utils.rate_limit import default_limit, rate_limiter, route_cost
 from ..crud.crud_rate_limit import crud_rate_limits
 from ..crud.crud_tier import crud_tiers
 from ..crud.crud_users import crud_users
@@ -17,9 +17,6 @@ from ..schemas.tier import TierRead
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_LIMIT = settings.DEFAULT_RATE_LIMIT_LIMIT
-DEFAULT_PERIOD = settings.DEFAULT_RATE_LIMIT_PERIOD
-
 
 async def get_token_from_header_or_query(request: Request, token: str | None = Depends(oauth2_scheme)) -> str:
     """Helper to get token from header (via oauth2_scheme) or query param."""
@@ -41,12 +38,17 @@ async def get_current_user(
     if token_data is None:
         raise UnauthorizedException("User not authenticated.")
 
+    user = auth_cache.get_user(token_data.username_or_email)
+    if user:
+        return user
+
     if "@" in token_data.username_or_email:
         user = await crud_users.get(db=db, email=token_data.username_or_email, is_deleted=False)
     else:
         user = await crud_users.get(db=db, username=token_data.username_or_email, is_deleted=False)
 
     if user:
+        auth_cache.set_user(token_data.username_or_email, user)
         return user
 
     raise UnauthorizedException("User not authenticated.")
@@ -62,10 +64,7 @@ async def get_optional_user(request: Request, db: AsyncSession = Depends(async_g
         if token_type.lower() != "bearer" or not token_value:
             return None
 
-        token_data = await verify_token(token_value, TokenType.ACCESS, db)
-        if token_data is None:
-            return None
-
+        # get_current_user verifies the token itself
         return await get_current_user(token_value, db=db)
 
     except HTTPException as http_exc:
@@ -86,7 +85,10 @@ async def get_current_superuser(current_user: Annotated[dict, Depends(get_curren
 
 
 async def rate_limiter_dependency(
-    request: Request, db: Annotated[AsyncSession, Depends(async_get_db)], user: dict | None = Depends(get_optional_user)
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+    user: dict | None = Depends(get_optional_user),
 ) -> None:
     if hasattr(request.app.state, "initialization_complete"):
         await request.app.state.initialization_complete.wait()
@@ -94,11 +96,17 @@ async def rate_limiter_dependency(
     path = sanitize_path(request.url.path)
     if user:
         user_id = user["id"]
-        tier = await crud_tiers.get(db, id=user["tier_id"], schema_to_select=TierRead)
+        tier = auth_cache.lookup(auth_cache.tiers, user["tier_id"])
+        if tier is MISSING:
+            tier = await crud_tiers.get(db, id=user["tier_id"], schema_to_select=TierRead)
+            auth_cache.remember(auth_cache.tiers, user["tier_id"], tier)
         if tier:
-            rate_limit = await crud_rate_limits.get(
-                db=db, tier_id=tier["id"], path=path, schema_to_select=RateLimitRead
-            )
+            rate_limit = auth_cache.lookup(auth_cache.rate_limits, (tier["id"], path))
+            if rate_limit is MISSING:
+                rate_limit = await crud_rate_limits.get(
+                    db=db, tier_id=tier["id"], path=path, schema_to_select=RateLimitRead
+                )
+                auth_cache.remember(auth_cache.rate_limits, (tier["id"], path), rate_limit)
             if rate_limit:
                 limit, period = rate_limit["limit"], rate_limit["period"]
             else:
@@ -106,14 +114,17 @@ async def rate_limiter_dependency(
                     f"User {user_id} with tier '{tier['name']}' has no specific rate limit for path '{path}'. \
                         Applying default rate limit."
                 )
-                limit, period = DEFAULT_LIMIT, DEFAULT_PERIOD
+                limit, period = default_limit(path)
         else:
             logger.warning(f"User {user_id} has no assigned tier. Applying default rate limit.")
-            limit, period = DEFAULT_LIMIT, DEFAULT_PERIOD
+            limit, period = default_limit(path)
     else:
         user_id = request.client.host if request.client else "unknown"
-        limit, period = DEFAULT_LIMIT, DEFAULT_PERIOD
-
-    is_limited = await rate_limiter.is_rate_limited(db=db, user_id=user_id, path=path, limit=limit, period=period)
-    if is_limited:
-        raise RateLimitException("Rate limit exceeded.")
+        limit, period = default_limit(path)
+
+    result = await rate_limiter.check(user_id=user_id, path=path, limit=limit, period=period, cost=route_cost(path))
+    if not result.allowed:
+        exc = RateLimitException("Rate limit exceeded.")
+        exc.headers = result.headers
+        raise exc
+    response.headers.update(result.headers)
@@ -13,7 +13,8 @@ from ...api.dependencies import get_current_user
 from ...core.db.database import async_get_db
 from ...core.events.bus import get_event_bus
 from ...core.exceptions.http_exceptions import NotFoundException
-from ...core.utils.geocoding import geocode_location
+from ...core.utils.auth_cache import auth_cache
+from ...core.utils.geocoding import get_geocoding_service
 from ...crud.crud_users import crud_users
 from ...protocol import USER_BIRTH_DATA_UPDATED
 from ...schemas.profile import BirthDataComplete, BirthDataInput, UserProfileRead
@@ -51,7 +52,7 @@ async def submit_birth_data(
     username = current_user["username"]
 
     # Geocode the birth location
-    geocode_result = geocode_location(birth_data.birth_location)
+    geocode_result = await get_geocoding_service().geocode(birth_data.birth_location)
 
     if geocode_result is None:
         return {
@@ -83,6 +84,13 @@ async def submit_birth_data(
     }
 
     await crud_users.update(db=db, object=update_data, username=username)
+    auth_cache.invalidate_user(username)
+
+    # The daily reset is scheduled at local midnight in this timezone
+    from ...core.scheduler import reschedule_daily_reset
+
+    await reschedule_daily_reset(db, user_id, birth_data_complete.birth_timezone)
+    await db.commit()
 
     # Generate trace ID for tracking
     trace_id = str(uuid4())
@@ -1,11 +1,10 @@
-import uuid
 from typing import Annotated, Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...api.dependencies import get_current_user
+from ...api.dependencies import get_current_user, rate_limiter_dependency
 from ...core.db.database import async_get_db
 from ...core.events.bus import get_event_bus
 from ...models.user import User
@@ -39,7 +38,7 @@ class ChatResponse(BaseModel):
 
 
 # Master Chat endpoints
-@router.post("/master/send", response_model=ChatResponse)
+@router.post("/master/send", response_model=ChatResponse, dependencies=[Depends(rate_limiter_dependency)])
 async def send_to_master_chat(
     request: SendMessageRequest,
     current_user: Annotated[User, Depends(get_current_user)],
@@ -261,7 +260,7 @@ async def list_sessions(
 
 
 # Journal Branch endpoints
-@router.post("/journal/send", response_model=ChatResponse)
+@router.post("/journal/send", response_model=ChatResponse, dependencies=[Depends(rate_limiter_dependency)])
 async def send_to_journal(
     request: SendMessageRequest,
     current_user: Annotated[User, Depends(get_current_user)],
@@ -286,16 +285,11 @@ async def get_journal_entries(
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ):
     """Get journal entries from session."""
-    from sqlalchemy import select
-
-    from src.app.models.user_profile import UserProfile
+    from src.app.modules.features.journal.store import JournalStore, entry_to_dict
 
-    result = await db.execute(select(UserProfile).where(UserProfile.user_id == current_user["id"]))
-    profile = result.scalar_one()
+    entries = await JournalStore().get_entries(current_user["id"], db)
 
-    entries = profile.data.get("journal_entries", [])
-
-    return {"entries": entries}
+    return {"entries": [entry_to_dict(e) for e in entries]}
 
 
 # Generative UI Endpoints
@@ -317,6 +311,7 @@ async def submit_component_response(
     from sqlalchemy.orm.attributes import flag_modified
 
     from src.app.models.user_profile import UserProfile
+    from src.app.modules.features.journal.store import JournalStore
 
     # Validation logic
     if response.component_type == ComponentType.MULTI_SLIDER:
@@ -342,59 +337,50 @@ async def submit_component_response(
     # Process response based on component type
     if response.component_type == ComponentType.MOOD_SLIDER and response.slider_value is not None:
         # Add to journal entries with mood score
-        if "journal_entries" not in profile_data:
-            profile_data["journal_entries"] = []
-
-        entry_id = str(uuid.uuid4())
-        entry = {
-            "id": entry_id,
-            "timestamp": response.submitted_at.isoformat(),
-            "content": f"Mood rating: {response.slider_value}/10",  # Using 'content' to match journal schema
-            "mood_score": response.slider_value,
-            "source": "mood_slider_component",
-        }
-
-        profile_data["journal_entries"].append(entry)
-
-        # Save back to profile
-        profile.data = profile_data
+        entry = await JournalStore().add_entry(
+            current_user["id"],
+            f"Mood rating: {response.slider_value}/10",
+            db,
+            mood_score=response.slider_value,
+            source="mood_slider_component",
+            created_at=response.submitted_at,
+        )
 
         # Publish event for journal entry creation
         event_bus = get_event_bus()
         await event_bus.publish(
             "journal.entry.created",
-            {"user_id": current_user["id"], "entry_id": entry_id, "content": entry["content"]},
+            {"user_id": current_user["id"], "entry_id": entry.entry_uuid, "content": entry.content},
             source="generative_ui.mood_slider",
             user_id=str(current_user["id"]),
         )
 
     elif response.component_type == ComponentType.MULTI_SLIDER and response.slider_values:
         # Handle multi-slider (Mood, Energy, Anxiety)
-        if "journal_entries" not in profile.data:
-            profile.data["journal_entries"] = []
-
         # Create a rich journal entry from values
         values_str = ", ".join([f"{k.capitalize()}: {v}/10" for k, v in response.slider_values.items()])
-        entry_id = str(uuid.uuid4())
-        entry = {
-            "id": entry_id,
-            "timestamp": response.submitted_at.isoformat(),
-            "content": f"Check-in: {values_str}",
-            "scores": response.slider_values,
-            "source": "multi_slider_component",
-        }
-
-        profile.data["journal_entries"].append(entry)
+        entry = await JournalStore().add_entry(
+            current_user["id"],
+            f"Check-in: {values_str}",
+            db,
+            mood_score=response.slider_values.get("mood"),
+            energy_score=response.slider_values.get("energy"),
+            context_snapshot={"scores": response.slider_values},
+            source="multi_slider_component",
+            created_at=response.submitted_at,
+        )
 
         # Publish event
         event_bus = get_event_bus()
         await event_bus.publish(
             "journal.entry.created",
-            {"user_id": current_user["id"], "entry_id": entry_id, "content": entry["content"]},
+            {"user_id": current_user["id"], "entry_id": entry.entry_uuid, "content": entry.content},
             source="generative_ui.multi_slider",
             user_id=str(current_user["id"]),
         )
 
+    profile.data = profile_data
+
     # Use flag_modified to ensure sqlalchemy tracks the JSON change
     flag_modified(profile, "data")
     await db.commit()
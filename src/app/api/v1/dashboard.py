@@ -1,8 +1,10 @@
+import hashlib
+import json
 import logging
 from datetime import UTC, datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,10 +14,8 @@ from src.app.core.db.database import async_get_db
 from src.app.core.memory.active_memory import get_active_memory
 from src.app.models.user_profile import UserProfile
 from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
-from src.app.modules.intelligence.observer.observer import Observer
-from src.app.modules.tracking.lunar.tracker import LunarTracker
-from src.app.modules.tracking.solar.tracker import SolarTracker
-from src.app.modules.tracking.transits.tracker import TransitTracker
+from src.app.modules.intelligence.observer.feed import IntelligenceFeedStore
+from src.app.modules.tracking.current_sky import get_current_sky_store, widget_fields
 
 logger = logging.getLogger(__name__)
 
@@ -120,12 +120,17 @@ async def get_dashboard_summary(
 
 @router.get("/intelligence", response_model=list[IntelligenceFeedItem])
 async def get_intelligence_feed(
-    current_user: Annotated[dict, Depends(get_current_user)], db: Annotated[AsyncSession, Depends(async_get_db)]
+    response: Response,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
 ):
     """
-    Unified intelligence feed:
+    Unified intelligence feed, ranked by confidence:
     1. Active Hypotheses (from Hypothesis module)
-    2. Detected Patterns (from Observer module)
+    2. Detected Patterns (precomputed by the Observer worker jobs)
+
+    Never runs the detectors; X-Feed-Computed-At reports pattern freshness.
     """
     user_id = current_user["id"]
     feed = []
@@ -147,83 +152,51 @@ async def get_intelligence_feed(
             )
         )
 
-    # --- 2. Get Observer Patterns ---
-    # Observer computes on the fly for now (caching later)
-    observer = Observer()
-
-    # Run detectors (concurrently ideally, but sequential for safety first)
+    # --- 2. Get stored Observer patterns ---
+    # Enough of the ranked pattern list to fill this page after merging
+    feed_store = IntelligenceFeedStore()
     try:
-        solar_patterns = await observer.detect_solar_correlations(user_id, db)
-        lunar_patterns = await observer.detect_lunar_correlations(user_id, db)
-        time_patterns = await observer.detect_time_based_patterns(user_id, db)
-
-        all_patterns = solar_patterns + lunar_patterns + time_patterns
-
-        for idx, p in enumerate(all_patterns):
-            feed.append(
-                IntelligenceFeedItem(
-                    id=f"pattern-{idx}-{user_id}",
-                    type="pattern",
-                    title=f"Pattern: {p['pattern_type'].replace('_', ' ').title()}",
-                    description=p["finding"],
-                    confidence=p["confidence"],
-                    timestamp=p["detected_at"],
-                    metadata=p,
-                )
-            )
-
+        patterns = await feed_store.get_page(user_id, offset=0, limit=offset + limit)
+        feed.extend(IntelligenceFeedItem(**p) for p in patterns)
+
+        freshness = await feed_store.get_freshness(user_id)
+        if freshness is None:
+            await feed_store.request_refresh(user_id)
+        else:
+            response.headers["X-Feed-Computed-At"] = freshness["computed_at"]
     except Exception as e:
-        logger.error(f"Error generating observer patterns: {e}")
+        logger.error(f"Error reading intelligence feed: {e}")
         # Don't fail the whole request
-        pass
 
-    # Sort by timestamp desc
-    feed.sort(key=lambda x: x.timestamp, reverse=True)
+    # Rank by confidence, newest first on ties
+    feed.sort(key=lambda x: (x.confidence, x.timestamp), reverse=True)
 
-    return feed
+    return feed[offset : offset + limit]
 
 
 @router.get("/cosmic", response_model=CosmicWidgetResponse)
 async def get_cosmic_widget(
+    request: Request,
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)],
 ):
     """
     Get current cosmic conditions.
+
+    Served from the worker-materialized current sky; only the natal transit
+    count is computed per user. Supports If-None-Match (304) on the sky version
+    plus the user's overlay.
     """
     user_id = current_user["id"]
-
-    # 1. Solar Data
-    solar_tracker = SolarTracker()
-    solar_data = await solar_tracker.fetch_current_data()
-
-    # 2. Lunar Data
-    lunar_tracker = LunarTracker()
-    lunar_data = await lunar_tracker.fetch_current_data()
-
-    # 3. Transit Data
-    transit_tracker = TransitTracker()
-    current_transit_data = await transit_tracker.fetch_current_data()
-
-    # Compare to natal for active count
-    comparison = await transit_tracker.compare_to_natal(user_id, current_transit_data)
-
-    positions = current_transit_data.data.get("positions", {})
-    moon_pos = positions.get("Moon", {})
-    sun_pos = positions.get("Sun", {})
-
-    # Count retrograde planets
-    retrograde_count = sum(1 for p in positions.values() if p.get("is_retrograde", False))
-
-    return CosmicWidgetResponse(
-        moon_phase=lunar_data.data.get("phase_name", "Unknown"),
-        moon_sign=moon_pos.get("sign") or lunar_data.data.get("sign", "Unknown"),
-        sun_sign=sun_pos.get("sign", "Unknown"),
-        active_transits_count=comparison.get("total_transits", 0),
-        geomagnetic_index=solar_data.data.get("kp_index", 0.0),
-        # Extended fields
-        bz=solar_data.data.get("bz"),
-        solar_wind_speed=solar_data.data.get("solar_wind_speed"),
-        shield_integrity=solar_data.data.get("shield_integrity"),
-        is_voc=lunar_data.data.get("is_voc", False),
-        retrograde_count=retrograde_count,
-    )
+    store = get_current_sky_store()
+    sky = await store.get_or_refresh()
+    overlay = {"active_transits_count": await store.active_transits_count(user_id, sky)}
+
+    overlay_hash = hashlib.sha256(json.dumps(overlay, sort_keys=True).encode()).hexdigest()[:16]
+    etag = f'W/"{sky["version"]}-{user_id}-{overlay_hash}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    return CosmicWidgetResponse(**widget_fields(sky), **overlay)
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.api.dependencies import async_get_db
 from src.app.api.dependencies import get_current_user as get_current_active_user
 from src.app.models.insight import JournalEntry, PromptStatus, ReflectionPrompt
+from src.app.modules.features.journal.store import JournalStore
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +35,12 @@ class JournalEntryCreate(BaseModel):
 
 
 class JournalEntryRead(BaseModel):
-    id: int
+    id: Optional[int] = None  # None for entries not yet moved out of the profile
     content: str
     mood_score: Optional[int] = None
+    energy_score: Optional[int] = None
     tags: List[str] = []
+    symptoms: List[str] = []
     context_snapshot: Optional[dict] = None
     created_at: str
     prompt_id: Optional[int] = None
@@ -76,35 +79,39 @@ async def list_pending_prompts(
 async def list_journal_entries(
     limit: int = 50,
     offset: int = 0,
+    before_id: Optional[int] = None,
     db: AsyncSession = Depends(async_get_db),
     current_user: dict = Depends(get_current_active_user),
 ):
     """
-    List past journal entries.
-    """
-    stmt = (
-        select(JournalEntry)
-        .where(JournalEntry.user_id == current_user["id"])
-        .order_by(JournalEntry.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
+    List past journal entries, newest first.
 
-    result = await db.execute(stmt)
-    entries = result.scalars().all()
-
-    return [
-        JournalEntryRead(
-            id=e.id,
-            content=e.content,
-            mood_score=e.mood_score,
-            tags=e.tags or [],
-            context_snapshot=e.context_snapshot,
-            created_at=e.created_at.isoformat(),
-            prompt_id=e.prompt_id,
+    Pass the id of the last entry received as ``before_id`` to get the next
+    page (keyset pagination). ``offset`` is still accepted.
+    """
+    if offset:
+        stmt = (
+            select(JournalEntry)
+            .where(JournalEntry.user_id == current_user["id"])
+            .order_by(JournalEntry.created_at.desc(), JournalEntry.id.desc())
+            .limit(limit)
+            .offset(offset)
         )
-        for e in entries
-    ]
+        entries = (await db.execute(stmt)).scalars().all()
+    else:
+        before = None
+        if before_id is not None:
+            created_at = await db.scalar(
+                select(JournalEntry.created_at).where(
+                    JournalEntry.id == before_id, JournalEntry.user_id == current_user["id"]
+                )
+            )
+            if created_at is None:
+                raise HTTPException(status_code=404, detail="Journal entry not found")
+            before = (created_at, before_id)
+        entries = await JournalStore().get_page(current_user["id"], db, limit=limit, before=before)
+
+    return [_journal_entry_read(e) for e in entries]
 
 
 @router.post("/journal", response_model=JournalEntryRead)
@@ -173,15 +180,15 @@ async def create_journal_entry(
             context_snapshot = {"error": str(e), "timestamp": None}
 
     # 3. Create entry
-    entry = JournalEntry(
-        user_id=current_user["id"],
-        content=entry_in.content,
+    entry = await JournalStore().add_entry(
+        current_user["id"],
+        entry_in.content,
+        db,
         mood_score=entry_in.mood_score,
         tags=entry_in.tags,
         prompt_id=entry_in.prompt_id,
         context_snapshot=context_snapshot,
     )
-    db.add(entry)
     await db.commit()
     await db.refresh(entry)
 
@@ -204,11 +211,17 @@ async def create_journal_entry(
         # Don't fail entry creation if hypothesis update fails
         logger.warning(f"[JournalAPI] Failed to update hypotheses for user {current_user['id']}: {e}")
 
+    return _journal_entry_read(entry)
+
+
+def _journal_entry_read(entry: JournalEntry) -> JournalEntryRead:
     return JournalEntryRead(
         id=entry.id,
         content=entry.content,
         mood_score=entry.mood_score,
+        energy_score=entry.energy_score,
         tags=entry.tags or [],
+        symptoms=entry.symptoms or [],
         context_snapshot=entry.context_snapshot,
         created_at=entry.created_at.isoformat(),
         prompt_id=entry.prompt_id,
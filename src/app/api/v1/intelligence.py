@@ -10,7 +10,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...api.dependencies import get_current_user
+from ...api.dependencies import get_current_user, rate_limiter_dependency
 from ...core.db.database import async_get_db
 from ...models.user import User
 from ...models.user_profile import UserProfile
@@ -225,7 +225,7 @@ async def _run_synthesis_background(user_id: int, model: str):
 # Query Endpoints
 # ============================================================================
 
-@router.post("/query", response_model=QueryResponse)
+@router.post("/query", response_model=QueryResponse, dependencies=[Depends(rate_limiter_dependency)])
 async def query_profile(
     request: QueryRequest,
     current_user: Annotated[dict, Depends(get_current_user)],
@@ -367,14 +367,7 @@ async def list_hypotheses(
     from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
 
     storage = HypothesisStorage()
-    hypotheses = await storage.get_hypotheses(current_user["id"])
-
-    # Apply filters
-    if status:
-        hypotheses = [h for h in hypotheses if h.status.value == status]
-
-    if min_confidence > 0:
-        hypotheses = [h for h in hypotheses if h.confidence >= min_confidence]
+    hypotheses = await storage.get_hypotheses(current_user["id"], min_confidence=min_confidence, status=status)
 
     # Count by status
     confirmed_count = len([h for h in hypotheses if h.status == HypothesisStatus.CONFIRMED])
@@ -404,9 +397,7 @@ async def get_hypothesis(
     from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
 
     storage = HypothesisStorage()
-    hypotheses = await storage.get_hypotheses(current_user["id"])
-
-    hypothesis = next((h for h in hypotheses if h.id == hypothesis_id), None)
+    hypothesis = await storage.get_hypothesis(current_user["id"], hypothesis_id)
 
     if not hypothesis:
         raise HTTPException(status_code=404, detail="Hypothesis not found")
@@ -525,9 +516,7 @@ async def recalculate_hypothesis_confidence(
     from src.app.modules.intelligence.hypothesis.updater import get_hypothesis_updater
 
     storage = HypothesisStorage()
-    hypotheses = await storage.get_hypotheses(current_user["id"])
-
-    hypothesis = next((h for h in hypotheses if h.id == hypothesis_id), None)
+    hypothesis = await storage.get_hypothesis(current_user["id"], hypothesis_id, db)
 
     if not hypothesis:
         raise HTTPException(status_code=404, detail="Hypothesis not found")
@@ -558,9 +547,7 @@ async def get_hypothesis_confidence_trends(
     from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
 
     storage = HypothesisStorage()
-    hypotheses = await storage.get_hypotheses(current_user["id"])
-
-    hypothesis = next((h for h in hypotheses if h.id == hypothesis_id), None)
+    hypothesis = await storage.get_hypothesis(current_user["id"], hypothesis_id)
 
     if not hypothesis:
         raise HTTPException(status_code=404, detail="Hypothesis not found")
@@ -827,7 +814,7 @@ async def get_contextual_synthesis(
 # Oracle Endpoints (Phase 28)
 # ============================================================================
 
-@router.post("/oracle/draw")
+@router.post("/oracle/draw", dependencies=[Depends(rate_limiter_dependency)])
 async def perform_oracle_draw(
     current_user: Annotated[dict, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)]
@@ -7,13 +7,15 @@ Provides:
 - Event trace retrieval
 - Active module monitoring
 - Real-time event streaming (SSE)
+- Event bus delivery metrics
+- LLM gateway concurrency metrics
 - Profile completion state
 - LLM activity logs
 """
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -61,7 +63,7 @@ async def get_active_modules(
     """
     Get list of currently active modules.
 
-    Scans events from the last 5 minutes to identify active modules.
+    Modules with an event in the last 5 minutes (per-module last-seen index).
 
     Returns:
         {"modules": list[str], "count": int}
@@ -79,49 +81,49 @@ async def get_active_modules(
 async def stream_events(
     request: Request,
     current_user: Annotated[dict, Depends(get_current_user)],
+    topics: str | None = None,
+    last_event_id: Annotated[str | None, Header()] = None,
 ) -> StreamingResponse:
     """
     Stream real-time events via Server-Sent Events (SSE).
 
     Returns an event stream that clients can subscribe to for
-    real-time system updates.
+    real-time system updates. Users receive their own and system events
+    (superusers receive all). ``topics`` narrows the stream to comma-separated
+    event type patterns. Reconnecting clients resume after ``Last-Event-ID``
+    (header, or ``last_event_id`` query parameter).
 
     Example client:
-        const evtSource = new EventSource('/api/v1/observability/stream');
+        const evtSource = new EventSource('/api/v1/observability/stream?topics=cosmic.*');
         evtSource.onmessage = (e) => console.log(e.data);
     """
-    import asyncio
     import json
 
-    from src.app.core.events.bus import get_event_bus
-
-    async def event_generator():
-        """Generate SSE events from event bus."""
-        bus = get_event_bus()
-        event_queue = asyncio.Queue()
+    from src.app.core.events.sse import get_sse_hub
 
-        async def queue_handler(packet):
-            await event_queue.put(packet)
+    hub = get_sse_hub()
+    await hub.start()
 
-        # Subscribe to all events
-        await bus.subscribe("*", queue_handler)
+    keepalive = f"data: {json.dumps({'type': 'keepalive'})}\n\n"
 
+    async def event_generator():
+        """Generate SSE frames from the hub."""
+        # Registered here so the finally below always disconnects it
+        client = hub.connect(
+            topics=[t.strip() for t in topics.split(",") if t.strip()] if topics else None,
+            user_id=None if current_user.get("is_superuser") else current_user["id"],
+            last_event_id=last_event_id or request.query_params.get("last_event_id"),
+        )
         try:
             while True:
                 # Check if client disconnected
                 if await request.is_disconnected():
                     break
 
-                try:
-                    # Wait for event with timeout
-                    packet = await asyncio.wait_for(event_queue.get(), timeout=30.0)
-                    data = json.dumps(packet.to_dict())
-                    yield f"data: {data}\n\n"
-                except TimeoutError:
-                    # Send keepalive
-                    yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
-        except asyncio.CancelledError:
-            pass
+                frame = await client.next_frame(timeout=30.0)
+                yield frame if frame is not None else keepalive
+        finally:
+            hub.disconnect(client)
 
     return StreamingResponse(
         event_generator(),
@@ -254,6 +256,46 @@ async def observability_health(request: Request) -> dict[str, Any]:
     }
 
 
+@router.get("/event-bus")
+async def get_event_bus_metrics(
+    request: Request,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> dict[str, Any]:
+    """
+    Get event bus delivery metrics.
+
+    Returns reader counters plus per-handler queue depth, lag and failures,
+    per consumer group pending/lag when the streams transport is enabled, and
+    SSE hub connection/lag metrics.
+    """
+    from src.app.core.events.bus import get_event_bus
+    from src.app.core.events.sse import get_sse_hub
+
+    bus = get_event_bus()
+    metrics = bus.get_metrics()
+    if bus.streams and bus.streams.redis_client:
+        metrics["stream_groups"] = await bus.streams.group_info()
+    metrics["sse"] = get_sse_hub().metrics()
+    return metrics
+
+
+@router.get("/llm-gateway")
+async def get_llm_gateway_metrics(
+    request: Request,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> dict[str, Any]:
+    """
+    Get LLM gateway metrics.
+
+    Returns global in-flight/queued counts plus, per model, requests by
+    priority lane, retries, failures, rate-limit throttling, latency and
+    queue wait percentiles.
+    """
+    from src.app.core.ai.gateway import get_llm_gateway
+
+    return get_llm_gateway().metrics()
+
+
 @router.get("/genesis-activity/{user_id}")
 async def get_genesis_activity(
     user_id: int,
@@ -85,16 +85,14 @@ async def geocode_location_endpoint(request: GeocodeRequest, current_user: Annot
     """
     Geocode a location string to coordinates and timezone.
     """
-    from src.app.core.utils.geocoding import geocode_location_cached
+    from src.app.core.utils.geocoding import get_geocoding_service
 
-    result = geocode_location_cached(request.location)
+    result = await get_geocoding_service().geocode(request.location)
 
     if not result:
         raise HTTPException(status_code=404, detail="Location not found")
 
-    address, lat, lng, tz = result
-
-    return {"address": address, "latitude": lat, "longitude": lng, "timezone": tz}
+    return result
 
 
 class ProfilePreferencesRequest(BaseModel):
@@ -297,6 +295,10 @@ async def submit_birth_data(
     user_model.birth_longitude = request.longitude
     user_model.birth_timezone = request.timezone
 
+    # The daily reset is scheduled at local midnight in this timezone
+    from src.app.core.scheduler import reschedule_daily_reset
+
+    await reschedule_daily_reset(db, user_model.id, request.timezone)
     await db.commit()
 
     logger.info(f"Birth data saved (time_unknown={request.time_unknown})")
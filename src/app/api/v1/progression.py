@@ -1,3 +1,5 @@
+from datetime import UTC, date, datetime, timedelta
+
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import select
@@ -5,7 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.api.dependencies import async_get_db
 from src.app.api.dependencies import get_current_user as get_current_active_user
-from src.app.models.progression import PlayerStats
+from src.app.models.progression import PlayerStats, level_threshold
+from src.app.modules.intelligence.evolution.ledger import experience_history
 
 router = APIRouter(prefix="/progression", tags=["progression"])
 
@@ -53,31 +56,10 @@ async def get_progression_stats(
         last_score = stats.sync_history[-1].get("score", stats.sync_rate)
         momentum = stats.sync_rate - last_score
 
-    # Calculate Level Thresholds
-    import math
-
-    def calculate_threshold(lvl):
-        if lvl <= 1:
-            return 0
-        return int((lvl - 1) * 1000 * math.pow(1.5, lvl - 2))
-
-    # Current Level Floor (Total XP required to reach CURRENT level)
-    # Using the formula derived from xp_to_next_level:
-    # To reach Level L, you needed the ceiling of L-1.
-    # Formula used in model: threshold = L * 1000 * 1.5^(L-1). This is the ceiling of L.
-    # So floor of L is ceiling of L-1.
-
-    # Let's verify formula from model `xp_to_next_level`:
-    # threshold = int(self.level * 1000 * math.pow(1.5, self.level - 1))
-    # This 'threshold' is the TOTAL XP needed to complete the current level.
-    xp_ceiling = int(stats.level * 1000 * math.pow(1.5, stats.level - 1))
-
-    # xp_floor is the ceiling of the previous level (stats.level - 1)
-    if stats.level > 1:
-        prev_level = stats.level - 1
-        xp_floor = int(prev_level * 1000 * math.pow(1.5, prev_level - 1))
-    else:
-        xp_floor = 0
+    # Level Thresholds: level_threshold(L) is the TOTAL XP needed to complete level L,
+    # so the floor of the current level is the ceiling of the previous one
+    xp_ceiling = level_threshold(stats.level)
+    xp_floor = level_threshold(stats.level - 1) if stats.level > 1 else 0
 
     xp_current_level = max(0, stats.experience_points - xp_floor)
     xp_required_level = max(1, xp_ceiling - xp_floor)  # Avoid div by 0
@@ -105,7 +87,10 @@ async def get_progression_history(
     current_user: dict = Depends(get_current_active_user),
 ):
     """
-    Returns a timeline of recent sync performance.
+    Returns a timeline of recent sync performance and XP gains.
+
+    Daily sync scores come from PlayerStats.sync_history, XP gains from the
+    experience ledger.
     """
     stmt = select(PlayerStats).where(PlayerStats.user_id == current_user["id"])
     result = await db.execute(stmt)
@@ -114,4 +99,14 @@ async def get_progression_history(
     if not stats:
         return []
 
-    return stats.sync_history[-limit:]
+    timeline = (stats.sync_history or [])[-limit:] + await experience_history(db, current_user["id"], limit=limit)
+    timeline.sort(key=_timeline_key)
+    return timeline[-limit:]
+
+
+def _timeline_key(entry: dict) -> datetime:
+    """XP entries sort by their timestamp, a day's sync score at the end of that day."""
+    if "timestamp" in entry:
+        moment = datetime.fromisoformat(entry["timestamp"])
+        return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+    return datetime.combine(date.fromisoformat(entry["date"]) + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
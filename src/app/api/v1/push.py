@@ -98,5 +98,6 @@ async def send_test_notification(
     results = await notification_service.send_to_user(
         db=db, user_id=current_user["id"], title="Cosmic Alert", body="The universe is speaking. Listen.", url="/"
     )
+    await db.commit()  # Expired subscriptions pruned by the send
 
     return {"results": results}
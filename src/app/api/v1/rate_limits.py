@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ...api.dependencies import get_current_superuser
 from ...core.db.database import async_get_db
 from ...core.exceptions.http_exceptions import DuplicateValueException, NotFoundException
+from ...core.utils.auth_cache import auth_cache
 from ...crud.crud_rate_limit import crud_rate_limits
 from ...crud.crud_tier import crud_tiers
 from ...schemas.rate_limit import RateLimitCreate, RateLimitCreateInternal, RateLimitRead, RateLimitUpdate
@@ -38,6 +39,8 @@ async def write_rate_limit(
     if created_rate_limit is None:
         raise NotFoundException("Failed to create rate limit")
 
+    auth_cache.invalidate_tiers()
+
     return created_rate_limit
 
 
@@ -96,6 +99,7 @@ async def patch_rate_limit(
         raise NotFoundException("Rate Limit not found")
 
     await crud_rate_limits.update(db=db, object=values, id=id)
+    auth_cache.invalidate_tiers()
     return {"message": "Rate Limit updated"}
 
 
@@ -112,4 +116,5 @@ async def erase_rate_limit(
         raise NotFoundException("Rate Limit not found")
 
     await crud_rate_limits.delete(db=db, id=id)
+    auth_cache.invalidate_tiers()
     return {"message": "Rate Limit deleted"}
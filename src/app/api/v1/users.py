@@ -8,6 +8,7 @@ from ...api.dependencies import get_current_superuser, get_current_user
 from ...core.db.database import async_get_db
 from ...core.exceptions.http_exceptions import DuplicateValueException, ForbiddenException, NotFoundException
 from ...core.security import blacklist_token, get_password_hash, oauth2_scheme
+from ...core.utils.auth_cache import auth_cache
 from ...crud.crud_rate_limit import crud_rate_limits
 from ...crud.crud_tier import crud_tiers
 from ...crud.crud_users import crud_users
@@ -100,6 +101,7 @@ async def patch_user(
             raise DuplicateValueException("Username not available")
 
     await crud_users.update(db=db, object=values, username=username)
+    auth_cache.invalidate_user(username)
     return {"message": "User updated"}
 
 
@@ -119,6 +121,7 @@ async def erase_user(
         raise ForbiddenException()
 
     await crud_users.delete(db=db, username=username)
+    auth_cache.invalidate_user(username)
     await blacklist_token(token=token, db=db)
     return {"message": "User deleted"}
 
@@ -135,6 +138,7 @@ async def erase_db_user(
         raise NotFoundException("User not found")
 
     await crud_users.db_delete(db=db, username=username)
+    auth_cache.invalidate_user(username)
     await blacklist_token(token=token, db=db)
     return {"message": "User deleted from the database"}
 
@@ -155,6 +159,7 @@ async def admin_delete_user(
         raise NotFoundException("User not found")
 
     await crud_users.db_delete(db=db, username=username)
+    auth_cache.invalidate_user(username)
     return {"message": f"User '{username}' permanently removed"}
 
 
@@ -219,4 +224,5 @@ async def patch_user_tier(
         raise NotFoundException("Tier not found")
 
     await crud_users.update(db=db, object=values.model_dump(), username=username)
+    auth_cache.invalidate_user(username)
     return {"message": f"User {db_user['name']} Tier updated"}
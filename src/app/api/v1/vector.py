@@ -58,6 +58,8 @@ async def populate_embeddings(
 
     from src.app.models.embedding import Embedding
     from src.app.models.user_profile import UserProfile
+    from src.app.modules.features.journal.store import JournalStore, entry_to_dict
+    from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
 
     service = EmbeddingService(settings.OPENROUTER_API_KEY.get_secret_value())
 
@@ -100,8 +102,9 @@ async def populate_embeddings(
 
     try:
         # 1. Journal Entries
+        journal_entries = await JournalStore().get_entries(current_user["id"], db)
         await process_content(
-            profile.data.get('journal_entries', []),
+            [entry_to_dict(e) for e in journal_entries],
             'entry_id', 'id', service.embed_journal_entry
         )
 
@@ -112,8 +115,9 @@ async def populate_embeddings(
         )
 
         # 3. Hypotheses
+        hypotheses = await HypothesisStorage().get_hypotheses(current_user["id"], db=db)
         await process_content(
-            profile.data.get('hypotheses', []),
+            [h.model_dump(mode="json") for h in hypotheses],
             'hypothesis_id', 'id', service.embed_hypothesis
         )
 
@@ -23,6 +23,7 @@ from typing import Any
 import redis.asyncio as redis
 
 from ...core.config import settings
+from ..telemetry.write_behind import WriteBehindBuffer
 
 
 class ActivityLogger:
@@ -30,7 +31,9 @@ class ActivityLogger:
     Logs LLM activity for observability.
 
     Records prompts, responses, tool calls, and reasoning
-    for debugging and transparency.
+    for debugging and transparency. Writes are buffered (write-behind) and
+    flushed in pipelined batches, so logging costs no Redis round trip on
+    the caller's path; reads flush pending writes first.
     """
 
     TTL_SECONDS = 86400  # 24 hours
@@ -38,6 +41,7 @@ class ActivityLogger:
     def __init__(self):
         """Initialize logger (call initialize() to connect to Redis)."""
         self.redis_client: redis.Redis | None = None
+        self.writer = WriteBehindBuffer("activity", lambda: self.redis_client)
 
     async def initialize(self) -> None:
         """Connect to Redis."""
@@ -49,7 +53,8 @@ class ActivityLogger:
         )
 
     async def cleanup(self) -> None:
-        """Disconnect from Redis."""
+        """Flush buffered records and disconnect from Redis."""
+        await self.writer.close()
         if self.redis_client:
             await self.redis_client.close()
 
@@ -98,14 +103,18 @@ class ActivityLogger:
             "metadata": metadata or {},
         }
 
-        # Store in Redis
         key = f"activity:{trace_id}:llm:{timestamp}"
-        await self.redis_client.set(key, json.dumps(activity), ex=self.TTL_SECONDS)
-
-        # Add to trace index
         index_key = f"activity:{trace_id}:index"
-        await self.redis_client.zadd(index_key, {key: timestamp})
-        await self.redis_client.expire(index_key, self.TTL_SECONDS)
+        data = json.dumps(activity)
+
+        def write(pipe):
+            pipe.set(key, data, ex=self.TTL_SECONDS)
+
+            # Add to trace index
+            pipe.zadd(index_key, {key: timestamp})
+            pipe.expire(index_key, self.TTL_SECONDS)
+
+        await self.writer.write(write)
 
     async def get_activity(self, trace_id: str) -> list[dict[str, Any]]:
         """
@@ -119,6 +128,7 @@ class ActivityLogger:
         """
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
         # Get all activity keys for this trace
         index_key = f"activity:{trace_id}:index"
@@ -158,6 +168,7 @@ class ActivityLogger:
         """
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
         activities = []
         pattern = "activity:*:llm:*"
@@ -209,19 +220,23 @@ class ActivityLogger:
             "details": details,
         }
 
-        # Store in Redis
         key = f"activity:{trace_id}:{agent}:{timestamp}"
-        await self.redis_client.set(key, json.dumps(activity), ex=self.TTL_SECONDS)
-
-        # Add to trace index
         index_key = f"activity:{trace_id}:index"
-        await self.redis_client.zadd(index_key, {key: timestamp})
-        await self.redis_client.expire(index_key, self.TTL_SECONDS)
-
-        # Also add to agent-specific index for filtering
         agent_index = f"activity_by_agent:{agent}"
-        await self.redis_client.zadd(agent_index, {key: timestamp})
-        await self.redis_client.expire(agent_index, self.TTL_SECONDS)
+        data = json.dumps(activity)
+
+        def write(pipe):
+            pipe.set(key, data, ex=self.TTL_SECONDS)
+
+            # Add to trace index
+            pipe.zadd(index_key, {key: timestamp})
+            pipe.expire(index_key, self.TTL_SECONDS)
+
+            # Also add to agent-specific index for filtering
+            pipe.zadd(agent_index, {key: timestamp})
+            pipe.expire(agent_index, self.TTL_SECONDS)
+
+        await self.writer.write(write)
 
     async def get_activities_by_agent(
         self,
@@ -231,6 +246,7 @@ class ActivityLogger:
         """Get activities for a specific agent."""
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
         index_key = f"activity_by_agent:{agent}"
         activity_keys = await self.redis_client.zrange(index_key, -limit, -1, desc=True)
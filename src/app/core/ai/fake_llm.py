@@ -0,0 +1,68 @@
+"""
+Local stand-in for OpenRouter chat models.
+
+Selected with LLM_GATEWAY_BACKEND=fake. Requests go through the LLM gateway
+like real ones, but are answered locally after a randomized delay around
+LLM_FAKE_LATENCY_MS, and fail with a 429 at LLM_FAKE_ERROR_RATE. Used to
+load-test gateway limits and priorities without network calls or spend
+(see scripts/llm_gateway_load_test.py).
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+import openai
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from ..config import settings
+from .gateway import get_llm_gateway
+
+
+class FakeChatModel(BaseChatModel):
+    """Echoes the last message back after a simulated provider latency."""
+
+    model_name: str = "fake"
+    temperature: float = 0.7
+    latency_ms: Optional[int] = None
+    error_rate: Optional[float] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "gutters-fake"
+
+    def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+        last = str(messages[-1].content) if messages else ""
+        message = AIMessage(content=f"[fake:{self.model_name}] {last[:200]}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _delay(self) -> float:
+        latency_ms = settings.LLM_FAKE_LATENCY_MS if self.latency_ms is None else self.latency_ms
+        return latency_ms * random.uniform(0.5, 1.5) / 1000
+
+    def _maybe_fail(self) -> None:
+        error_rate = settings.LLM_FAKE_ERROR_RATE if self.error_rate is None else self.error_rate
+        if random.random() < error_rate:
+            request = httpx.Request("POST", "https://fake.local/chat/completions")
+            response = httpx.Response(429, request=request)
+            raise openai.RateLimitError("Simulated rate limit", response=response, body=None)
+
+    async def _agenerate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        async def call() -> ChatResult:
+            await asyncio.sleep(self._delay())
+            self._maybe_fail()
+            return self._respond(messages)
+
+        return await get_llm_gateway().run(self.model_name, call)
+
+    def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self._delay())
+        self._maybe_fail()
+        return self._respond(messages)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeChatModel":
+        return self
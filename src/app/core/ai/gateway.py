@@ -0,0 +1,395 @@
+"""
+GUTTERS LLM Gateway
+
+Every chat model built by the LLM factories sends its requests through one
+process-wide gateway, so modules keep calling ``ainvoke`` independently while
+the process as a whole stays within provider limits.
+
+- One shared httpx connection pool per model.
+- A global and a per-model concurrency limit. Waiters are served by
+  priority lane: interactive chat ahead of background work (worker jobs,
+  event handlers), FIFO within a lane.
+- A per-model token bucket (LLM_GATEWAY_MODEL_RPM, LLM_GATEWAY_MODEL_BURST)
+  spreads bursts such as nightly batches instead of tripping rate limits.
+  Tokens are handed out by priority lane before a slot is taken.
+- Rate-limit, timeout, connection and 5xx errors are retried by the gateway
+  with exponential backoff and full jitter (the OpenAI client's own retries
+  are off, so retries do not multiply). Slots are released while backing off.
+- Queue wait, latency, retries and failures are kept per model
+  (``get_llm_gateway().metrics()``, /observability/llm-gateway).
+
+Example:
+    >>> from src.app.core.ai.gateway import LLMPriority, llm_priority
+    >>>
+    >>> with llm_priority(LLMPriority.BACKGROUND):
+    ...     await llm.ainvoke(prompt)  # queued behind interactive requests
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Optional, TypeVar
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from ..config import LLMBackendOption, settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LLMPriority(IntEnum):
+    """Priority lanes (lower is served first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Optional[LLMPriority]] = ContextVar("llm_priority", default=None)
+_in_gateway: ContextVar[bool] = ContextVar("llm_in_gateway", default=False)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority):
+    """Run LLM calls made inside the block in the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def set_llm_priority(priority: LLMPriority) -> None:
+    """Set the lane for the rest of the current task (e.g. a long-lived worker loop)."""
+    _priority.set(priority)
+
+
+class PrioritySemaphore:
+    """Semaphore whose waiters are woken lowest priority value first, FIFO within a priority."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int) -> None:
+        if self.in_use < self.limit and not self.queued:
+            self.in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after the slot was handed over: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)  # Slot handed over; in_use unchanged
+                return
+        self.in_use -= 1
+
+
+class TokenBucket:
+    """
+    Request budget refilled at ``per_minute``.
+
+    Callers wait for a token without holding any slot; waiters are served
+    lowest priority value first (FIFO within a priority) as tokens refill.
+    """
+
+    def __init__(self, per_minute: int, burst: int):
+        self.rate = per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _live_waiters(self) -> bool:
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters)
+
+    async def take(self, priority: int) -> float:
+        """Take one token; returns the seconds waited for it."""
+        if self.rate <= 0:
+            return 0.0
+
+        self._refill()
+        if self.tokens >= 1 and not self._live_waiters():
+            self.tokens -= 1
+            return 0.0
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after the token was handed over: give it back
+            if future.done() and not future.cancelled():
+                self.tokens += 1
+                self._dispatch()
+            raise
+        return time.monotonic() - started
+
+    def _dispatch(self) -> None:
+        """Hand refilled tokens to the waiters in priority order."""
+        self._timer = None
+        self._refill()
+        while self.tokens >= 1 and self._live_waiters():
+            _, _, future = heapq.heappop(self._waiters)
+            self.tokens -= 1
+            future.set_result(None)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._timer is None and self._live_waiters():
+            delay = max(0.0, (1 - self.tokens) / self.rate)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+
+class ModelLane:
+    """Limits, connection pool and metrics for one model."""
+
+    LATENCY_WINDOW = 256
+
+    def __init__(self, model: str):
+        self.model = model
+        self.semaphore = PrioritySemaphore(settings.LLM_GATEWAY_MODEL_CONCURRENCY)
+        self.bucket = TokenBucket(settings.LLM_GATEWAY_MODEL_RPM, settings.LLM_GATEWAY_MODEL_BURST)
+        self._http_client: httpx.AsyncClient | None = None
+
+        self.requests = {priority.name.lower(): 0 for priority in LLMPriority}
+        self.retries = 0
+        self.failures = 0
+        self.throttled_ms = 0.0
+        self.max_queue_wait_ms = 0.0
+        self.latencies_ms: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self.queue_waits_ms: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            limit = settings.LLM_GATEWAY_MODEL_CONCURRENCY
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+                timeout=httpx.Timeout(settings.LLM_GATEWAY_TIMEOUT_SECONDS, connect=10.0),
+            )
+        return self._http_client
+
+    def metrics(self) -> dict[str, Any]:
+        def percentile(values, q):
+            ordered = sorted(values)
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1) if ordered else None
+
+        return {
+            "model": self.model,
+            "in_flight": self.semaphore.in_use,
+            "queued": self.semaphore.queued,
+            "requests": dict(self.requests),
+            "retries": self.retries,
+            "failures": self.failures,
+            "throttled_ms": round(self.throttled_ms, 1),
+            "latency_p50_ms": percentile(self.latencies_ms, 0.5),
+            "latency_p95_ms": percentile(self.latencies_ms, 0.95),
+            "queue_wait_p95_ms": percentile(self.queue_waits_ms, 0.95),
+            "max_queue_wait_ms": round(self.max_queue_wait_ms, 1),
+        }
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate limits, timeouts, dropped connections and provider 5xx errors."""
+    import openai
+
+    return isinstance(
+        error,
+        (
+            openai.RateLimitError,
+            openai.APIConnectionError,  # Includes APITimeoutError
+            openai.InternalServerError,
+            httpx.TransportError,
+            TimeoutError,
+        ),
+    )
+
+
+def _retry_after(error: BaseException) -> float:
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after", 0)) if response is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class LLMGateway:
+    """Process-wide admission control for LLM requests."""
+
+    def __init__(self):
+        self.semaphore = PrioritySemaphore(settings.LLM_GATEWAY_MAX_CONCURRENCY)
+        self.lanes: dict[str, ModelLane] = {}
+        self.default_priority = LLMPriority.INTERACTIVE
+        self.max_retries = settings.LLM_GATEWAY_MAX_RETRIES
+
+    def lane(self, model: str) -> ModelLane:
+        if model not in self.lanes:
+            self.lanes[model] = ModelLane(model)
+        return self.lanes[model]
+
+    def http_client(self, model: str) -> httpx.AsyncClient:
+        """Shared connection pool for a model."""
+        return self.lane(model).http_client
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[None]:
+        """Hold a model and a global slot (no retries; used for streams)."""
+        if _in_gateway.get():
+            yield
+            return
+
+        lane = self.lane(model)
+        priority = _priority.get()
+        if priority is None:
+            priority = self.default_priority
+        queued_at = time.perf_counter()
+
+        # Budget first, so nothing sleeps on the rate limit while holding a slot
+        lane.throttled_ms += await lane.bucket.take(priority) * 1000
+
+        await lane.semaphore.acquire(priority)
+        try:
+            await self.semaphore.acquire(priority)
+            try:
+                wait_ms = (time.perf_counter() - queued_at) * 1000
+                lane.queue_waits_ms.append(wait_ms)
+                lane.max_queue_wait_ms = max(lane.max_queue_wait_ms, wait_ms)
+                lane.requests[priority.name.lower()] += 1
+
+                token = _in_gateway.set(True)
+                started = time.perf_counter()
+                try:
+                    yield
+                finally:
+                    _in_gateway.reset(token)
+                    lane.latencies_ms.append((time.perf_counter() - started) * 1000)
+            finally:
+                self.semaphore.release()
+        finally:
+            lane.semaphore.release()
+
+    async def run(self, model: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run one request in a slot, retrying transient errors with jittered backoff."""
+        if _in_gateway.get():
+            return await call()
+
+        lane = self.lane(model)
+        attempt = 0
+        while True:
+            try:
+                async with self.slot(model):
+                    return await call()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    lane.failures += 1
+                    raise
+
+                # Full jitter: uniform over [0, min(cap, base * 2^attempt)], at least Retry-After (capped)
+                ceiling = min(settings.LLM_GATEWAY_RETRY_MAX_MS, settings.LLM_GATEWAY_RETRY_BASE_MS * 2**attempt)
+                retry_after = min(_retry_after(e) * 1000, settings.LLM_GATEWAY_RETRY_MAX_MS)
+                delay = max(random.uniform(0, ceiling), retry_after) / 1000
+                attempt += 1
+                lane.retries += 1
+                logger.warning(f"[LLMGateway] {model} {type(e).__name__}; retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "backend": settings.LLM_GATEWAY_BACKEND.value,
+            "in_flight": self.semaphore.in_use,
+            "queued": self.semaphore.queued,
+            "limit": self.semaphore.limit,
+            "models": [lane.metrics() for lane in self.lanes.values()],
+        }
+
+    async def close(self) -> None:
+        """Close the per-model connection pools."""
+        for lane in self.lanes.values():
+            if lane._http_client is not None:
+                await lane._http_client.aclose()
+
+
+class GatewayChatOpenAI(ChatOpenAI):
+    """ChatOpenAI whose requests go through the LLM gateway."""
+
+    async def _agenerate(self, *args: Any, **kwargs: Any):
+        parent = super()
+        return await get_llm_gateway().run(self.model_name, lambda: parent._agenerate(*args, **kwargs))
+
+    async def _astream(self, *args: Any, **kwargs: Any):
+        async with get_llm_gateway().slot(self.model_name):
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+
+
+def create_chat_model(model: str, temperature: float = 0.7, **kwargs: Any) -> BaseChatModel:
+    """
+    Build a chat model for ``model`` behind the gateway.
+
+    Extra keyword arguments are passed to ChatOpenAI (API key, base URL,
+    max_tokens, headers). With LLM_GATEWAY_BACKEND=fake a local FakeChatModel
+    is returned instead.
+    """
+    if settings.LLM_GATEWAY_BACKEND == LLMBackendOption.FAKE:
+        from .fake_llm import FakeChatModel
+
+        return FakeChatModel(model_name=model, temperature=temperature)
+
+    return GatewayChatOpenAI(
+        model=model,
+        temperature=temperature,
+        http_async_client=get_llm_gateway().http_client(model),
+        max_retries=0,  # Retried by the gateway
+        request_timeout=settings.LLM_GATEWAY_TIMEOUT_SECONDS,
+        **kwargs,
+    )
+
+
+_llm_gateway: LLMGateway | None = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the singleton LLMGateway instance."""
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway()
+    return _llm_gateway
@@ -4,13 +4,17 @@ GUTTERS LLM Factory
 Factory for creating LangChain LLM instances using OpenRouter.
 
 OpenRouter provides access to multiple AI models through a unified API.
-This factory handles configuration, caching, and error handling.
+This factory handles configuration, caching, and error handling. Models are
+built behind the LLM gateway (see gateway.py) for shared concurrency limits,
+connection pools and retries.
 """
 
 from functools import lru_cache
 
 from langchain_openai import ChatOpenAI
 
+from .gateway import create_chat_model
+
 
 def get_llm(model_id: str, temperature: float = 0.7) -> ChatOpenAI:
     """
@@ -67,7 +71,7 @@ def _get_cached_llm(model_id: str, temperature: float, api_key: str) -> ChatOpen
     Returns:
         Configured ChatOpenAI instance
     """
-    return ChatOpenAI(
+    return create_chat_model(
         model=model_id,
         temperature=temperature,
         openai_api_key=api_key,
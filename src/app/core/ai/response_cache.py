@@ -0,0 +1,224 @@
+"""
+GUTTERS LLM Response Cache
+
+Caches responses of LLM calls that are effectively deterministic given their
+inputs (system log lines, oracle syntheses, reflection prompts, ...), so the
+same prompt is not re-sent to OpenRouter.
+
+- Opt-in per call site: wrap the LLM where it is used with ``cached_llm``.
+- Responses are keyed by model, temperature and a hash of the prompt with
+  whitespace normalized, and stored in Redis with a per-call-site TTL.
+- A sorted set of last-access times bounds the cache to
+  LLM_CACHE_MAX_ENTRIES; the least recently used entries are evicted.
+- Identical requests in flight at the same time share one LLM call.
+- Hits, misses, hit rate and saved latency are reported to ActivityLogger
+  (agent "llm.cache").
+
+Example:
+    >>> from src.app.core.ai.response_cache import cached_llm
+    >>>
+    >>> llm = cached_llm(get_standard_llm(), "journalist.log_entry", ttl=3600)
+    >>> response = await llm.ainvoke(prompt)  # LangChain message, as before
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm:cache:"
+LRU_KEY = "llm:cache:lru"
+TRACE_ID = "llm_cache"
+
+
+def _normalize(text: Any) -> str:
+    return " ".join(str(text).split())
+
+
+def prompt_key(llm: Any, prompt: Any) -> str:
+    """Cache key for a prompt sent to an LLM (model, temperature, normalized prompt)."""
+    if isinstance(prompt, (list, tuple)):
+        messages = [
+            [m.type, _normalize(m.content)] if isinstance(m, BaseMessage) else ["", _normalize(m)] for m in prompt
+        ]
+    else:
+        messages = [["", _normalize(prompt)]]
+
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", "")
+    payload = json.dumps([str(model), str(getattr(llm, "temperature", "")), messages])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters for one call site."""
+
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0  # Served by an identical request already in flight
+    saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.shared
+        return (self.hits + self.shared) / lookups if lookups else 0.0
+
+
+class LLMResponseCache:
+    """Redis-backed LLM response cache with LRU eviction and single-flight dedup."""
+
+    def __init__(self, max_entries: Optional[int] = None, default_ttl: Optional[int] = None):
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.default_ttl = default_ttl or settings.LLM_CACHE_DEFAULT_TTL
+        self.stats: dict[str, CacheStats] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def ainvoke(self, llm: Any, prompt: Any, call_site: str, ttl: Optional[int] = None, **kwargs) -> Any:
+        """
+        ``llm.ainvoke(prompt, **kwargs)``, answered from the cache when possible.
+
+        Cache hits are returned as an AIMessage; misses return the LLM's own response.
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return await llm.ainvoke(prompt, **kwargs)
+
+        key = prompt_key(llm, prompt)
+        started = time.perf_counter()
+
+        task = self._inflight.get(key)
+        leader = task is None
+        if leader:
+            task = asyncio.create_task(self._fetch(llm, prompt, key, ttl or self.default_ttl, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        response, llm_ms, hit = await asyncio.shield(task)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        event = ("cache_hit" if hit else "cache_miss") if leader else "cache_shared"
+        saved_ms = max(llm_ms - elapsed_ms, 0.0) if event != "cache_miss" else 0.0
+        await self._report(call_site, event, saved_ms, getattr(llm, "model_name", None))
+        return response
+
+    async def _fetch(self, llm: Any, prompt: Any, key: str, ttl: int, kwargs: dict) -> tuple[Any, float, bool]:
+        """(response, original LLM latency in ms, served from cache)."""
+        redis_client = await self._redis()
+
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(KEY_PREFIX + key)
+                if cached is not None:
+                    await redis_client.zadd(LRU_KEY, {key: time.time()})
+                    entry = json.loads(cached)
+                    return AIMessage(content=entry["content"]), entry.get("latency_ms", 0.0), True
+            except Exception as e:
+                logger.warning(f"[LLMResponseCache] Lookup failed: {e}")
+
+        started = time.perf_counter()
+        response = await llm.ainvoke(prompt, **kwargs)
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        if redis_client is not None and isinstance(getattr(response, "content", None), str):
+            try:
+                await self._store(redis_client, key, response.content, latency_ms, ttl)
+            except Exception as e:
+                logger.warning(f"[LLMResponseCache] Store failed: {e}")
+
+        return response, latency_ms, False
+
+    async def _store(self, redis_client, key: str, content: str, latency_ms: float, ttl: int) -> None:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(KEY_PREFIX + key, json.dumps({"content": content, "latency_ms": latency_ms}), ex=ttl)
+            pipe.zadd(LRU_KEY, {key: time.time()})
+            pipe.zcard(LRU_KEY)
+            *_, size = await pipe.execute()
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = [member for member, _ in await redis_client.zpopmin(LRU_KEY, overflow)]
+            if evicted:
+                await redis_client.delete(*(KEY_PREFIX + member for member in evicted))
+
+    async def _report(self, call_site: str, event: str, saved_ms: float, model: Any) -> None:
+        stats = self.stats.setdefault(call_site, CacheStats())
+        if event == "cache_hit":
+            stats.hits += 1
+        elif event == "cache_shared":
+            stats.shared += 1
+        else:
+            stats.misses += 1
+        stats.saved_ms += saved_ms
+
+        try:
+            from ..activity.logger import get_activity_logger
+
+            await get_activity_logger().log_activity(
+                trace_id=TRACE_ID,
+                agent="llm.cache",
+                activity_type=event,
+                details={
+                    "call_site": call_site,
+                    "model": str(model) if model else None,
+                    "saved_ms": round(saved_ms, 1),
+                    "hit_rate": round(stats.hit_rate, 3),
+                    "total_saved_ms": round(stats.saved_ms, 1),
+                },
+            )
+        except Exception as e:
+            logger.debug(f"[LLMResponseCache] Metrics report failed: {e}")
+
+    @staticmethod
+    async def _redis():
+        from ..memory import get_active_memory
+
+        memory = get_active_memory()
+        if memory.redis_client is None:
+            await memory.initialize()
+        return memory.redis_client
+
+
+class CachedLLM:
+    """An LLM whose ``ainvoke`` goes through the response cache (other attributes pass through)."""
+
+    def __init__(self, llm: Any, call_site: str, ttl: Optional[int] = None):
+        self.llm = llm
+        self.call_site = call_site
+        self.ttl = ttl
+
+    async def ainvoke(self, prompt: Any, **kwargs) -> Any:
+        return await get_llm_cache().ainvoke(self.llm, prompt, self.call_site, ttl=self.ttl, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+
+def cached_llm(llm: Any, call_site: str, ttl: Optional[int] = None) -> CachedLLM:
+    """
+    Opt a call site into the response cache.
+
+    Args:
+        llm: LangChain chat model (e.g. from get_llm or LLMConfig.get_llm)
+        call_site: Name reported in cache metrics (e.g. "oracle.synthesis")
+        ttl: Seconds to keep responses (default LLM_CACHE_DEFAULT_TTL)
+    """
+    return CachedLLM(llm, call_site, ttl)
+
+
+_llm_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the singleton LLMResponseCache instance."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
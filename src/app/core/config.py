@@ -155,9 +155,39 @@ class RedisRateLimiterSettings(BaseSettings):
         return f"{protocol}://{self.REDIS_RATE_LIMIT_HOST}:{self.REDIS_RATE_LIMIT_PORT}"
 
 
+class RateLimitAlgorithmOption(str, Enum):
+    FIXED_WINDOW = "fixed_window"
+    SLIDING_WINDOW = "sliding_window"
+    TOKEN_BUCKET = "token_bucket"
+
+
 class DefaultRateLimitSettings(BaseSettings):
     DEFAULT_RATE_LIMIT_LIMIT: int = 10
     DEFAULT_RATE_LIMIT_PERIOD: int = 3600
+    DEFAULT_RATE_LIMIT_ALGORITHM: RateLimitAlgorithmOption = RateLimitAlgorithmOption.SLIDING_WINDOW
+    # Quota units charged per request, keyed by sanitized path (unlisted paths cost 1)
+    RATE_LIMIT_ROUTE_COSTS: dict[str, int] = {
+        "api_v1_intelligence_query": 2,
+        "api_v1_intelligence_oracle_draw": 5,
+        "api_v1_chat_master_send": 2,
+        "api_v1_chat_journal_send": 2,
+    }
+    # Quota units per DEFAULT_RATE_LIMIT_PERIOD for costed routes with no tier-specific row
+    # (60 queries, 10 oracle draws per hour); other routes use DEFAULT_RATE_LIMIT_LIMIT
+    RATE_LIMIT_ROUTE_DEFAULT_LIMITS: dict[str, int] = {
+        "api_v1_intelligence_query": 120,
+        "api_v1_intelligence_oracle_draw": 50,
+        "api_v1_chat_master_send": 120,
+        "api_v1_chat_journal_send": 120,
+    }
+
+
+class AuthCacheSettings(BaseSettings):
+    # Revoked tokens mirrored in Redis; user/tier/rate-limit rows cached in-process
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_USER_TTL: int = 30
+    AUTH_CACHE_TIER_TTL: int = 300
+    AUTH_CACHE_MAX_ENTRIES: int = 10_000
 
 
 class CRUDAdminSettings(BaseSettings):
@@ -211,6 +241,131 @@ class PushSettings(BaseSettings):
 
     PUSH_SERVICE_SECRET: str = "gutters-push-service-secret-token-change-me"
     PUSH_SERVICE_URL: str = "http://localhost:4000"
+    # Broadcast fan-out: subscriptions per /send-batch request, requests in flight
+    PUSH_BATCH_SIZE: int = 500
+    PUSH_MAX_CONCURRENCY: int = 4
+
+
+class EventBusTransportOption(str, Enum):
+    PUBSUB = "pubsub"
+    STREAMS = "streams"
+
+
+class SSEOverflowPolicyOption(str, Enum):
+    DROP = "drop"
+    COALESCE = "coalesce"
+
+
+class EventBusSettings(BaseSettings):
+    EVENT_BUS_HANDLER_QUEUE_SIZE: int = 1000
+    EVENT_BUS_HANDLER_CONCURRENCY: int = 1
+
+    # "streams" delivers subscriptions through Redis Streams consumer groups;
+    # pub/sub is still published to for fan-out consumers (SSE)
+    EVENT_BUS_TRANSPORT: EventBusTransportOption = EventBusTransportOption.PUBSUB
+    EVENT_BUS_STREAM_KEY: str = "events:stream"
+    EVENT_BUS_STREAM_MAXLEN: int = 100_000
+    EVENT_BUS_STREAM_BATCH_SIZE: int = 50
+    EVENT_BUS_STREAM_BLOCK_MS: int = 5000
+    EVENT_BUS_STREAM_MAX_DELIVERIES: int = 5
+    EVENT_BUS_STREAM_CLAIM_IDLE_MS: int = 60_000
+    EVENT_BUS_CONSUMER_NAME: str | None = None
+
+    # SSE hub: per-client queue bound, what to do when a slow client's queue is
+    # full, and how many recent events are kept for Last-Event-ID resume
+    SSE_CLIENT_QUEUE_SIZE: int = 256
+    SSE_OVERFLOW_POLICY: SSEOverflowPolicyOption = SSEOverflowPolicyOption.COALESCE
+    SSE_REPLAY_BUFFER_SIZE: int = 1000
+
+
+class TelemetrySettings(BaseSettings):
+    # Activity/trace records are buffered and flushed in pipelined batches
+    TELEMETRY_WRITE_BEHIND: bool = True
+    TELEMETRY_FLUSH_INTERVAL_MS: int = 250
+    TELEMETRY_FLUSH_BATCH_SIZE: int = 200
+    TELEMETRY_BUFFER_MAX_SIZE: int = 10_000
+
+
+class EphemerisGridSettings(BaseSettings):
+    EPHEMERIS_GRID_DIR: str = "./data/ephemeris_grid"
+    EPHEMERIS_GRID_YEARS_BACK: int = 2
+    EPHEMERIS_GRID_YEARS_AHEAD: int = 3
+    # JPL kernel for Skyfield fallbacks (loaded once per process)
+    EPHEMERIS_KERNEL_PATH: str = "de421.bsp"
+
+
+class GeocodingBackendOption(str, Enum):
+    NOMINATIM = "nominatim"
+    OFFLINE = "offline"
+
+
+class GeocodingSettings(BaseSettings):
+    # "offline" resolves from a built-in gazetteer (tests, no network)
+    GEOCODING_BACKEND: GeocodingBackendOption = GeocodingBackendOption.NOMINATIM
+    GEOCODING_CACHE_TTL: int = 2_592_000  # 30 days
+    GEOCODING_NEGATIVE_CACHE_TTL: int = 86_400
+    # Nominatim TOS: at most 1 request/second for the whole application
+    GEOCODING_MIN_INTERVAL_SECONDS: float = 1.0
+
+
+class OracleEntropySettings(BaseSettings):
+    # Quantum values are prefetched into Redis by the worker, off the draw path
+    ORACLE_ENTROPY_RESERVOIR_SIZE: int = 4096
+    ORACLE_ENTROPY_REFILL_BATCH: int = 1024  # ANU QRNG max per request
+
+
+class ProgressionSettings(BaseSettings):
+    # XP packets for one user arriving within this window are applied as one update
+    PROGRESSION_XP_COALESCE_MS: int = 250
+
+
+class JournalSettings(BaseSettings):
+    # Also read entries still in UserProfile.data['journal_entries'] (until the backfill has run)
+    JOURNAL_LEGACY_READS: bool = True
+    JOURNAL_BACKFILL_BATCH_SIZE: int = 100
+
+
+class GenerativeUISettings(BaseSettings):
+    # Local component decisions below this confidence are escalated to the LLM
+    GENERATIVE_UI_CLASSIFIER_THRESHOLD: float = 0.8
+    GENERATIVE_UI_DECISION_LOG_SIZE: int = 5000
+    # Decision log entries hold hashed features only; the log expires when idle
+    GENERATIVE_UI_DECISION_LOG_TTL: int = 2592000  # 30 days
+
+
+class LLMCacheSettings(BaseSettings):
+    # Response cache for opted-in, effectively deterministic LLM call sites
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_DEFAULT_TTL: int = 86_400
+    LLM_CACHE_MAX_ENTRIES: int = 10_000
+
+
+class LLMBackendOption(str, Enum):
+    OPENROUTER = "openrouter"
+    FAKE = "fake"
+
+
+class LLMGatewaySettings(BaseSettings):
+    # "fake" answers locally after LLM_FAKE_LATENCY_MS (load tests, no network)
+    LLM_GATEWAY_BACKEND: LLMBackendOption = LLMBackendOption.OPENROUTER
+    LLM_GATEWAY_MAX_CONCURRENCY: int = 16
+    LLM_GATEWAY_MODEL_CONCURRENCY: int = 8
+    # Per-model request budget (token bucket); 0 disables it
+    LLM_GATEWAY_MODEL_RPM: int = 120
+    LLM_GATEWAY_MODEL_BURST: int = 10
+    LLM_GATEWAY_MAX_RETRIES: int = 3
+    LLM_GATEWAY_RETRY_BASE_MS: int = 500
+    LLM_GATEWAY_RETRY_MAX_MS: int = 20_000
+    LLM_GATEWAY_TIMEOUT_SECONDS: float = 120.0
+    LLM_FAKE_LATENCY_MS: int = 800
+    LLM_FAKE_ERROR_RATE: float = 0.0
+
+
+class SynthesisSettings(BaseSettings):
+    # Background triggers for one user within the window share one synthesis
+    SYNTHESIS_DEBOUNCE_SECONDS: int = 300
+    # Shorter window for critical triggers (new module data, confirmed Genesis fields)
+    SYNTHESIS_CRITICAL_DEBOUNCE_SECONDS: int = 30
 
 
 class Settings(
@@ -225,12 +380,24 @@ class Settings(
     RedisQueueSettings,
     RedisRateLimiterSettings,
     DefaultRateLimitSettings,
+    AuthCacheSettings,
     CRUDAdminSettings,
     EnvironmentSettings,
     CORSSettings,
     FileLoggerSettings,
     ConsoleLoggerSettings,
     PushSettings,
+    EventBusSettings,
+    TelemetrySettings,
+    EphemerisGridSettings,
+    GeocodingSettings,
+    OracleEntropySettings,
+    ProgressionSettings,
+    JournalSettings,
+    GenerativeUISettings,
+    LLMCacheSettings,
+    LLMGatewaySettings,
+    SynthesisSettings,
 ):
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", ".env"),
@@ -5,18 +5,28 @@ Redis pub/sub event bus for module communication.
 
 Provides simple publish/subscribe pattern for event-driven architecture.
 Modules can publish events and subscribe to patterns to react to system changes.
+
+Delivery to handlers is concurrent and bounded: see events/dispatcher.py.
+With EVENT_BUS_TRANSPORT=streams, subscriptions are durable Redis Streams
+consumer groups instead (see events/streams.py); pub/sub is still published
+to for fan-out consumers such as the SSE endpoint.
 """
 
 import asyncio
 import json
+import logging
 from collections.abc import Callable
 from typing import Any
 
 import redis.asyncio as redis
 
-from ...core.config import settings
+from ...core.config import EventBusTransportOption, settings
 from ...protocol.packet import Packet
 from ..telemetry.tracer import get_tracer
+from .dispatcher import EventDispatcher
+from .streams import StreamTransport
+
+logger = logging.getLogger(__name__)
 
 
 class EventBus:
@@ -26,6 +36,10 @@ class EventBus:
     Supports pattern matching for flexible event subscriptions.
     All events are transmitted as Packet instances serialized to JSON.
 
+    The reader loop only deserializes and enqueues; each handler drains its
+    own bounded queue, so a slow (e.g. LLM-backed) handler never stalls
+    delivery to the others.
+
     Example:
         >>> bus = EventBus()
         >>> await bus.initialize()
@@ -45,7 +59,28 @@ class EventBus:
         self.redis_client: redis.Redis | None = None
         self.pubsub: redis.client.PubSub | None = None
         self.handlers: dict[str, list[Callable]] = {}
+        self.dispatcher = EventDispatcher(
+            default_max_queue=settings.EVENT_BUS_HANDLER_QUEUE_SIZE,
+            default_max_concurrency=settings.EVENT_BUS_HANDLER_CONCURRENCY,
+        )
         self._listener_task: asyncio.Task | None = None
+        self.messages_received = 0
+        self.decode_errors = 0
+
+        # Durable transport (subscriptions registered before initialize() start with it)
+        self.streams: StreamTransport | None = None
+        if settings.EVENT_BUS_TRANSPORT == EventBusTransportOption.STREAMS:
+            self.streams = StreamTransport(
+                redis_client=None,
+                stream_key=settings.EVENT_BUS_STREAM_KEY,
+                consumer_name=settings.EVENT_BUS_CONSUMER_NAME,
+                maxlen=settings.EVENT_BUS_STREAM_MAXLEN,
+                batch_size=settings.EVENT_BUS_STREAM_BATCH_SIZE,
+                block_ms=settings.EVENT_BUS_STREAM_BLOCK_MS,
+                max_deliveries=settings.EVENT_BUS_STREAM_MAX_DELIVERIES,
+                claim_idle_ms=settings.EVENT_BUS_STREAM_CLAIM_IDLE_MS,
+                max_concurrency=settings.EVENT_BUS_HANDLER_CONCURRENCY,
+            )
 
     async def initialize(self) -> None:
         """
@@ -63,9 +98,17 @@ class EventBus:
         )
         self.pubsub = self.redis_client.pubsub()
 
+        # Patterns registered before initialize() still need a Redis subscription
+        if self.handlers:
+            await self.pubsub.psubscribe(*self.handlers.keys())
+
         # Start background listener
         self._listener_task = asyncio.create_task(self._listen())
 
+        if self.streams:
+            self.streams.redis_client = self.redis_client
+            await self.streams.start()
+
     async def cleanup(self) -> None:
         """
         Disconnect from Redis and stop listening.
@@ -79,19 +122,42 @@ class EventBus:
             except asyncio.CancelledError:
                 pass
 
+        if self.streams:
+            await self.streams.stop()
+
+        await self.dispatcher.close()
+
         if self.pubsub:
             await self.pubsub.close()
 
         if self.redis_client:
             await self.redis_client.close()
 
-    async def subscribe(self, pattern: str, handler: Callable[[Packet], Any]) -> None:
+    async def subscribe(
+        self,
+        pattern: str,
+        handler: Callable[[Packet], Any],
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        durable: bool | None = None,
+        group: str | None = None,
+    ) -> None:
         """
         Subscribe to events matching a pattern.
 
         Args:
             pattern: Event pattern to match (e.g., "module.*", "cosmic.storm.*")
             handler: Async callable that receives Packet instances
+            max_concurrency: Concurrent invocations of this handler
+                (default EVENT_BUS_HANDLER_CONCURRENCY; 1 keeps delivery ordered)
+            max_queue: Queued packets before the reader blocks
+                (default EVENT_BUS_HANDLER_QUEUE_SIZE; pub/sub only)
+            durable: Deliver through a Redis Streams consumer group. Defaults to
+                True when EVENT_BUS_TRANSPORT=streams. Pass False for per-process
+                fan-out (e.g. SSE), which always uses pub/sub.
+            group: Consumer group name for durable subscriptions (defaults to the
+                handler's module and qualified name); processes sharing a group
+                share the load
 
         Example:
             >>> async def on_user_created(packet: Packet):
@@ -100,6 +166,14 @@ class EventBus:
             >>>
             >>> await bus.subscribe("user.created", on_user_created)
         """
+        if durable is None:
+            durable = self.streams is not None
+        if durable:
+            if not self.streams:
+                raise RuntimeError("Durable subscriptions require EVENT_BUS_TRANSPORT=streams")
+            await self.streams.subscribe(pattern, handler, group=group, max_concurrency=max_concurrency)
+            return
+
         if pattern not in self.handlers:
             self.handlers[pattern] = []
             # Dynamically subscribe if listening has started
@@ -107,6 +181,22 @@ class EventBus:
                 await self.pubsub.psubscribe(pattern)
 
         self.handlers[pattern].append(handler)
+        self.dispatcher.add(pattern, handler, max_queue=max_queue, max_concurrency=max_concurrency)
+
+    async def unsubscribe(self, pattern: str, handler: Callable[[Packet], Any]) -> None:
+        """
+        Remove a pub/sub subscription added with ``subscribe()``.
+
+        The Redis pattern subscription is dropped once no handlers remain.
+        """
+        handlers = self.handlers.get(pattern, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+        if await self.dispatcher.remove(pattern, handler):
+            self.handlers.pop(pattern, None)
+            if self.pubsub:
+                await self.pubsub.punsubscribe(pattern)
 
     async def publish_packet(self, packet: Packet) -> None:
         """
@@ -122,7 +212,11 @@ class EventBus:
         except Exception:
             pass
 
-        # Serialize and publish
+        # Durable delivery to consumer groups
+        if self.streams:
+            await self.streams.publish(packet)
+
+        # Serialize and publish (fan-out)
         message = json.dumps(packet.to_dict())
         await self.redis_client.publish(packet.event_type, message)
 
@@ -170,52 +264,62 @@ class EventBus:
                         continue
                     raise e
 
-                if message:
-                    try:
-                        # Deserialize packet
-                        msg_data = message["data"]
-                        if isinstance(msg_data, bytes):
-                            msg_data = msg_data.decode("utf-8")
-
-                        data = json.loads(msg_data)
-                        packet = Packet.from_dict(data)
-
-                        # Find matching handlers
-                        channel = message["channel"]
-                        handlers = self.handlers.get(channel, [])
-
-                        for pattern, p_handlers in self.handlers.items():
-                            if pattern != channel and self._match_pattern(pattern, channel):
-                                handlers.extend(p_handlers)
-
-                        # Invoke handlers
-                        for handler in handlers:
-                            try:
-                                if asyncio.iscoroutinefunction(handler):
-                                    await handler(packet)
-                                else:
-                                    handler(packet)
-                            except Exception as e:
-                                print(f"Error in event handler: {e}")
-
-                    except Exception as e:
-                        print(f"Error processing event message: {e}")
-
-                await asyncio.sleep(0.01)  # Yield
+                if not message:
+                    continue
+
+                self.messages_received += 1
+                try:
+                    # Deserialize packet
+                    msg_data = message["data"]
+                    if isinstance(msg_data, bytes):
+                        msg_data = msg_data.decode("utf-8")
+
+                    packet = Packet.from_dict(json.loads(msg_data))
+                except Exception as e:
+                    self.decode_errors += 1
+                    logger.error(f"Error processing event message: {e}")
+                    continue
+
+                # Hand off to per-handler queues (blocks only when a queue is full)
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                await self.dispatcher.dispatch(channel, packet)
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            print(f"Listener loop error: {e}")
+            logger.error(f"Listener loop error: {e}")
 
-    def _match_pattern(self, pattern: str, channel: str) -> bool:
-        """Simple pattern matching for module.* style patterns."""
-        if "*" not in pattern:
-            return pattern == channel
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Delivery metrics: message counts, per-handler queue depth and lag.
 
-        import re
+        Returns:
+            Dict with reader counters plus dispatcher/handler metrics
+        """
+        return {
+            "transport": EventBusTransportOption.STREAMS.value
+            if self.streams
+            else EventBusTransportOption.PUBSUB.value,
+            "listening": bool(self._listener_task and not self._listener_task.done()),
+            "patterns": len(self.handlers),
+            "messages_received": self.messages_received,
+            "decode_errors": self.decode_errors,
+            **self.dispatcher.metrics(),
+            "streams": self.streams.metrics() if self.streams else None,
+        }
+
+    async def replay(self, group: str, from_id: str = "0") -> None:
+        """
+        Redeliver stream entries after ``from_id`` to a durable consumer group.
 
-        regex = pattern.replace(".", "\\.").replace("*", ".*")
-        return bool(re.match(f"^{regex}$", channel))
+        Args:
+            group: Consumer group name
+            from_id: Stream ID to resume after ("0" = everything retained)
+        """
+        if not self.streams or not self.streams.redis_client:
+            raise RuntimeError("Replay requires an initialized EVENT_BUS_TRANSPORT=streams bus")
+        await self.streams.replay(group, from_id)
 
 
 # Singleton instance
@@ -0,0 +1,328 @@
+"""
+GUTTERS Event Dispatcher
+
+Concurrent, filtered delivery of bus packets to subscribed handlers.
+
+The Redis reader loop in EventBus only deserializes a message and hands the
+packet to the dispatcher, which:
+- Resolves matching handlers through precompiled matchers (exact lookup, a
+  segment trie for ``prefix.*`` patterns, compiled regexes for anything else),
+  with a per-channel resolution cache
+- Enqueues the packet on each handler's bounded queue, drained by that
+  handler's own worker tasks (``max_concurrency`` per handler)
+
+A full queue blocks the reader (backpressure) instead of dropping events or
+growing memory without bound, and a slow handler only delays its own queue.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from ...protocol.packet import Packet
+
+logger = logging.getLogger(__name__)
+
+# Max distinct channels remembered by the resolution cache
+_RESOLUTION_CACHE_SIZE = 1024
+
+
+class _TrieNode:
+    __slots__ = ("children", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.wildcard: list[str] = []
+
+
+class PatternMatcher:
+    """
+    Precompiled glob matcher for bus subscription patterns.
+
+    Semantics match the original ``module.*`` globbing: ``*`` matches any
+    run of characters (dots included), everything else is literal.
+
+    - Exact patterns: dict lookup
+    - ``*`` and ``a.b.*`` patterns: dot-segment trie, one walk per channel
+    - Any other glob (``a.*.c``, ``cosmic*``): compiled regex, built once
+    """
+
+    def __init__(self) -> None:
+        self._exact: set[str] = set()
+        self._root = _TrieNode()
+        self._regexes: dict[str, re.Pattern] = {}
+        self._cache: dict[str, tuple[str, ...]] = {}
+
+    def add(self, pattern: str) -> None:
+        """Register a pattern (idempotent)."""
+        self._cache.clear()
+
+        if "*" not in pattern:
+            self._exact.add(pattern)
+        elif pattern == "*":
+            if pattern not in self._root.wildcard:
+                self._root.wildcard.append(pattern)
+        elif pattern.endswith(".*") and "*" not in pattern[:-2]:
+            node = self._root
+            for segment in pattern[:-2].split("."):
+                node = node.children.setdefault(segment, _TrieNode())
+            if pattern not in node.wildcard:
+                node.wildcard.append(pattern)
+        else:
+            regex = re.escape(pattern).replace(r"\*", ".*")
+            self._regexes[pattern] = re.compile(f"^{regex}$")
+
+    def remove(self, pattern: str) -> None:
+        """Unregister a pattern."""
+        self._cache.clear()
+
+        if "*" not in pattern:
+            self._exact.discard(pattern)
+            return
+        if pattern in self._regexes:
+            del self._regexes[pattern]
+            return
+
+        node = self._root
+        if pattern != "*":
+            for segment in pattern[:-2].split("."):
+                node = node.children.get(segment)
+                if node is None:
+                    return
+        if pattern in node.wildcard:
+            node.wildcard.remove(pattern)
+
+    def match(self, channel: str) -> tuple[str, ...]:
+        """Return every registered pattern matching ``channel``."""
+        cached = self._cache.get(channel)
+        if cached is not None:
+            return cached
+
+        matched: list[str] = []
+        if channel in self._exact:
+            matched.append(channel)
+
+        # A wildcard at depth k matches when at least one segment remains
+        node = self._root
+        matched.extend(node.wildcard)
+        segments = channel.split(".")
+        for segment in segments[:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            matched.extend(node.wildcard)
+
+        for pattern, regex in self._regexes.items():
+            if regex.match(channel):
+                matched.append(pattern)
+
+        result = tuple(matched)
+        if len(self._cache) >= _RESOLUTION_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[channel] = result
+        return result
+
+
+class HandlerWorker:
+    """
+    Bounded queue plus worker tasks for a single subscribed handler.
+
+    Handlers run in their own tasks so they cannot stall the reader loop;
+    ``max_concurrency=1`` (default) preserves per-handler ordering.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        handler: Callable[[Packet], Any],
+        max_queue: int,
+        max_concurrency: int,
+    ) -> None:
+        self.pattern = pattern
+        self.handler = handler
+        self.name = getattr(handler, "__qualname__", repr(handler))
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue: asyncio.Queue[tuple[Packet, float]] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._is_coroutine = asyncio.iscoroutinefunction(handler)
+        self._tasks: list[asyncio.Task] = []
+
+        # Metrics
+        self.delivered = 0
+        self.failed = 0
+        self.backpressure_waits = 0
+        self.last_queue_wait_ms = 0.0
+        self.max_queue_wait_ms = 0.0
+        self.last_event_lag_ms = 0.0
+
+    def start(self) -> None:
+        """Spawn worker tasks (requires a running event loop)."""
+        if self._tasks:
+            return
+        for _ in range(self.max_concurrency):
+            self._tasks.append(asyncio.create_task(self._run()))
+
+    async def submit(self, packet: Packet) -> None:
+        """Enqueue a packet, waiting for space if the queue is full."""
+        if self.queue.full():
+            self.backpressure_waits += 1
+        await self.queue.put((packet, time.monotonic()))
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Let queued packets finish (bounded by ``drain_timeout``), then cancel workers."""
+        if self._tasks and not self.queue.empty():
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=drain_timeout)
+            except TimeoutError:
+                logger.warning(f"[EventDispatcher] Dropping {self.queue.qsize()} queued events for {self.name}")
+
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _run(self) -> None:
+        from ..ai.gateway import LLMPriority, set_llm_priority
+
+        # Event handlers are background work for the LLM gateway
+        set_llm_priority(LLMPriority.BACKGROUND)
+        while True:
+            packet, enqueued_at = await self.queue.get()
+            try:
+                wait_ms = (time.monotonic() - enqueued_at) * 1000
+                self.last_queue_wait_ms = wait_ms
+                self.max_queue_wait_ms = max(self.max_queue_wait_ms, wait_ms)
+                self.last_event_lag_ms = _event_age_ms(packet)
+
+                if self._is_coroutine:
+                    await self.handler(packet)
+                else:
+                    self.handler(packet)
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error in event handler {self.name} ({self.pattern}): {e}")
+            finally:
+                self.queue.task_done()
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "pattern": self.pattern,
+            "handler": self.name,
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "max_concurrency": self.max_concurrency,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "backpressure_waits": self.backpressure_waits,
+            "last_queue_wait_ms": round(self.last_queue_wait_ms, 2),
+            "max_queue_wait_ms": round(self.max_queue_wait_ms, 2),
+            "last_event_lag_ms": round(self.last_event_lag_ms, 2),
+        }
+
+
+def _event_age_ms(packet: Packet) -> float:
+    """Milliseconds since the packet was created by its publisher."""
+    ts = packet.timestamp
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return max(0.0, (datetime.now(UTC) - ts).total_seconds() * 1000)
+
+
+class EventDispatcher:
+    """
+    Routes packets to per-handler workers.
+
+    Example:
+        >>> dispatcher = EventDispatcher(default_max_queue=100, default_max_concurrency=1)
+        >>> dispatcher.add("module.*", handle_module_event)
+        >>> await dispatcher.dispatch("module.initialized", packet)
+    """
+
+    def __init__(self, default_max_queue: int, default_max_concurrency: int) -> None:
+        self.default_max_queue = default_max_queue
+        self.default_max_concurrency = default_max_concurrency
+        self.matcher = PatternMatcher()
+        self.workers: dict[str, list[HandlerWorker]] = {}
+        self.dispatched = 0
+        self.unmatched = 0
+
+    def add(
+        self,
+        pattern: str,
+        handler: Callable[[Packet], Any],
+        max_queue: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> HandlerWorker:
+        """Register a handler and start its worker tasks."""
+        worker = HandlerWorker(
+            pattern,
+            handler,
+            max_queue=max_queue or self.default_max_queue,
+            max_concurrency=max_concurrency or self.default_max_concurrency,
+        )
+        self.workers.setdefault(pattern, []).append(worker)
+        self.matcher.add(pattern)
+        worker.start()
+        return worker
+
+    async def remove(self, pattern: str, handler: Callable[[Packet], Any]) -> bool:
+        """
+        Unregister a handler and stop its workers.
+
+        Returns:
+            True if the pattern has no handlers left
+        """
+        workers = self.workers.get(pattern, [])
+        # Equality, not identity: bound methods are a new object on every access
+        for worker in [w for w in workers if w.handler == handler]:
+            workers.remove(worker)
+            await worker.stop(drain_timeout=0)
+
+        if not workers:
+            self.workers.pop(pattern, None)
+            self.matcher.remove(pattern)
+            return True
+        return False
+
+    async def dispatch(self, channel: str, packet: Packet) -> int:
+        """
+        Enqueue ``packet`` for every handler matching ``channel``.
+
+        Returns:
+            Number of handlers the packet was queued for
+        """
+        queued = 0
+        for pattern in self.matcher.match(channel):
+            for worker in self.workers.get(pattern, ()):
+                await worker.submit(packet)
+                queued += 1
+
+        self.dispatched += 1
+        if not queued:
+            self.unmatched += 1
+        return queued
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """Drain and stop every worker."""
+        for workers in self.workers.values():
+            for worker in workers:
+                await worker.stop(drain_timeout=drain_timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        handlers = [w.metrics() for workers in self.workers.values() for w in workers]
+        return {
+            "dispatched": self.dispatched,
+            "unmatched": self.unmatched,
+            "total_queue_depth": sum(h["queue_depth"] for h in handlers),
+            "handlers": handlers,
+        }
@@ -0,0 +1,259 @@
+"""
+GUTTERS SSE Hub
+
+Fans event bus traffic out to Server-Sent Events clients.
+
+The hub holds one ``"*"`` pub/sub subscription per process, however many
+clients are connected. Each packet is serialized into an SSE frame once and
+offered to every client whose filters match:
+
+- topics: event type patterns (``cosmic.*``); all events when unset
+- user: events for that user plus system events (no ``user_id``)
+
+Client queues are bounded. When a slow client's queue is full, the hub either
+drops the oldest queued event (``drop``) or replaces the queued event of the
+same type (``coalesce``, falling back to drop). Dropped events are counted.
+
+Recent frames are kept in a replay buffer, so a reconnecting client that sends
+``Last-Event-ID`` resumes without a gap (unless it fell out of the buffer).
+Event ids are ``<hub epoch>-<sequence>``; ids from another process lifetime
+are not replayed.
+
+Example:
+    >>> hub = get_sse_hub()
+    >>> await hub.start()
+    >>> client = hub.connect(topics=["cosmic.*"], user_id="42")
+    >>> frame = await client.next_frame(timeout=30.0)
+    >>> hub.disconnect(client)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+from ...core.config import SSEOverflowPolicyOption, settings
+from ...protocol.packet import Packet
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SSEEvent:
+    """A packet serialized once into an SSE frame."""
+
+    seq: int
+    event_type: str
+    user_id: str | None
+    frame: str
+    published_at: float
+
+
+class SSEClient:
+    """One connected SSE consumer with its filters and bounded queue."""
+
+    def __init__(
+        self,
+        topics: list[str] | None = None,
+        user_id: str | None = None,
+        max_queue: int | None = None,
+        policy: SSEOverflowPolicyOption | None = None,
+    ) -> None:
+        self.topics = topics or None
+        self.user_id = str(user_id) if user_id is not None else None
+        self.max_queue = max_queue or settings.SSE_CLIENT_QUEUE_SIZE
+        self.policy = SSEOverflowPolicyOption(policy or settings.SSE_OVERFLOW_POLICY)
+
+        self._queue: deque[SSEEvent] = deque()
+        self._ready = asyncio.Event()
+        self.connected_at = time.time()
+
+        # Metrics
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_seq = 0
+
+    def matches(self, event: SSEEvent) -> bool:
+        if self.user_id is not None and event.user_id is not None and event.user_id != self.user_id:
+            return False
+        if self.topics is None:
+            return True
+        return any(fnmatchcase(event.event_type, topic) for topic in self.topics)
+
+    def offer(self, event: SSEEvent) -> None:
+        """Queue an event without blocking, applying the overflow policy."""
+        if len(self._queue) >= self.max_queue:
+            if self.policy == SSEOverflowPolicyOption.COALESCE and self._coalesce(event):
+                return
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(event)
+        self._ready.set()
+
+    def _coalesce(self, event: SSEEvent) -> bool:
+        """Replace the queued event of the same type with ``event``."""
+        for queued in self._queue:
+            if queued.event_type == event.event_type:
+                self._queue.remove(queued)
+                self._queue.append(event)
+                self.coalesced += 1
+                return True
+        return False
+
+    async def next_frame(self, timeout: float) -> str | None:
+        """Next SSE frame, or None if nothing arrived within ``timeout``."""
+        if not self._queue:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+
+        event = self._queue.popleft()
+        self.delivered += 1
+        self.last_seq = event.seq
+        return event.frame
+
+    def metrics(self, head_seq: int) -> dict[str, Any]:
+        oldest = self._queue[0] if self._queue else None
+        return {
+            "user_id": self.user_id,
+            "topics": self.topics,
+            "queued": len(self._queue),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "lag_events": head_seq - self.last_seq if self.last_seq else len(self._queue),
+            "lag_seconds": round(time.time() - oldest.published_at, 3) if oldest else 0.0,
+            "connected_seconds": round(time.time() - self.connected_at, 1),
+        }
+
+
+class SSEHub:
+    """Process-wide SSE broadcaster fed by a single event bus subscription."""
+
+    PATTERN = "*"
+
+    def __init__(self, bus: Any = None, replay_size: int | None = None) -> None:
+        self._bus = bus
+        self.replay: deque[SSEEvent] = deque(maxlen=replay_size or settings.SSE_REPLAY_BUFFER_SIZE)
+        self.clients: set[SSEClient] = set()
+        self.epoch = str(int(time.time() * 1000))
+        self.seq = 0
+        self.published = 0
+        self.serialize_errors = 0
+        self._started = False
+        self._start_lock: asyncio.Lock | None = None
+
+    @property
+    def bus(self):
+        if self._bus is None:
+            from .bus import get_event_bus
+
+            self._bus = get_event_bus()
+        return self._bus
+
+    async def start(self) -> None:
+        """Subscribe to the bus once (idempotent)."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            # Per-process pub/sub fan-out, never a stream group
+            await self.bus.subscribe(self.PATTERN, self.publish, durable=False)
+            self._started = True
+
+    async def stop(self) -> None:
+        """Drop the bus subscription."""
+        if self._started:
+            await self.bus.unsubscribe(self.PATTERN, self.publish)
+            self._started = False
+
+    def connect(
+        self,
+        topics: list[str] | None = None,
+        user_id: str | None = None,
+        last_event_id: str | None = None,
+        policy: SSEOverflowPolicyOption | None = None,
+    ) -> SSEClient:
+        """Register a client, queueing replayed events after ``last_event_id``."""
+        client = SSEClient(topics=topics, user_id=user_id, policy=policy)
+        after = self._parse_event_id(last_event_id)
+        if after is not None:
+            for event in self.replay:
+                if event.seq > after and client.matches(event):
+                    client.offer(event)
+        self.clients.add(client)
+        logger.debug(f"[SSEHub] Client connected ({len(self.clients)} total)")
+        return client
+
+    def disconnect(self, client: SSEClient) -> None:
+        self.clients.discard(client)
+        logger.debug(f"[SSEHub] Client disconnected ({len(self.clients)} total)")
+
+    async def publish(self, packet: Packet) -> None:
+        """Serialize a packet once and offer it to every matching client."""
+        try:
+            data = json.dumps(packet.to_dict(), default=str)
+        except (TypeError, ValueError) as e:
+            self.serialize_errors += 1
+            logger.warning(f"[SSEHub] Could not serialize {packet.event_type}: {e}")
+            return
+
+        self.seq += 1
+        event = SSEEvent(
+            seq=self.seq,
+            event_type=packet.event_type,
+            user_id=str(packet.user_id) if packet.user_id is not None else None,
+            frame=f"id: {self.epoch}-{self.seq}\ndata: {data}\n\n",
+            published_at=time.time(),
+        )
+        self.replay.append(event)
+        self.published += 1
+
+        for client in self.clients:
+            if client.matches(event):
+                client.offer(event)
+
+    def _parse_event_id(self, event_id: str | None) -> int | None:
+        """Sequence number from an id issued by this hub, else None."""
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def metrics(self) -> dict[str, Any]:
+        clients = [client.metrics(self.seq) for client in self.clients]
+        return {
+            "subscribed": self._started,
+            "connections": len(clients),
+            "published": self.published,
+            "serialize_errors": self.serialize_errors,
+            "replay_buffer": len(self.replay),
+            "dropped": sum(c["dropped"] for c in clients),
+            "max_lag_events": max((c["lag_events"] for c in clients), default=0),
+            "max_lag_seconds": max((c["lag_seconds"] for c in clients), default=0.0),
+            "clients": clients,
+        }
+
+
+# Singleton instance
+_sse_hub: SSEHub | None = None
+
+
+def get_sse_hub() -> SSEHub:
+    """Get the singleton SSEHub instance."""
+    global _sse_hub
+    if _sse_hub is None:
+        _sse_hub = SSEHub()
+    return _sse_hub
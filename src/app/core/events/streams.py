@@ -0,0 +1,345 @@
+"""
+GUTTERS Event Streams Transport
+
+Durable EventBus transport on Redis Streams.
+
+Every packet is appended (XADD) to a single capped stream. Each subscriber
+gets its own consumer group, so:
+- Events published while no worker is running are delivered on startup
+- A handler that raises leaves its entry pending; it is retried (XCLAIM)
+  and moved to a dead-letter stream after ``max_deliveries`` attempts
+- Horizontally scaled processes join the same group and share the load
+  instead of each receiving (and deserializing) every event
+
+Entries carry ``event_type`` as a separate field, so a group skips
+non-matching entries without decoding the packet JSON.
+
+Pub/sub stays in place for fan-out consumers such as the SSE stream.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from collections.abc import Callable
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from ...protocol.packet import Packet
+from .dispatcher import PatternMatcher
+
+logger = logging.getLogger(__name__)
+
+
+def default_consumer_name() -> str:
+    """Unique consumer name for this process (host + pid)."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def default_group_name(handler: Callable) -> str:
+    """Consumer group for a handler: its defining module and qualified name."""
+    module = getattr(handler, "__module__", "handler")
+    qualname = getattr(handler, "__qualname__", repr(handler))
+    return f"{module}:{qualname}"
+
+
+class _ConsumerGroup:
+    """Patterns, handlers and counters for one consumer group."""
+
+    def __init__(self, name: str, max_concurrency: int) -> None:
+        self.name = name
+        self.matcher = PatternMatcher()
+        self.handlers: dict[str, list[Callable[[Packet], Any]]] = {}
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.task: asyncio.Task | None = None
+        self.last_reclaim = 0.0
+
+        self.delivered = 0
+        self.skipped = 0
+        self.failed = 0
+        self.dead_lettered = 0
+
+    def add(self, pattern: str, handler: Callable[[Packet], Any]) -> None:
+        self.handlers.setdefault(pattern, []).append(handler)
+        self.matcher.add(pattern)
+
+    def handlers_for(self, event_type: str) -> list[Callable[[Packet], Any]]:
+        return [h for pattern in self.matcher.match(event_type) for h in self.handlers.get(pattern, ())]
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "group": self.name,
+            "patterns": list(self.handlers.keys()),
+            "delivered": self.delivered,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "dead_lettered": self.dead_lettered,
+        }
+
+
+class StreamTransport:
+    """
+    Redis Streams delivery with consumer groups, acks and a dead-letter stream.
+
+    Example:
+        >>> transport = StreamTransport(redis_client, stream_key="events:stream")
+        >>> await transport.subscribe("module.*", handler, group="observer")
+        >>> await transport.start()
+        >>> await transport.publish(packet)
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        stream_key: str,
+        dead_letter_key: str | None = None,
+        consumer_name: str | None = None,
+        maxlen: int = 100_000,
+        batch_size: int = 50,
+        block_ms: int = 5000,
+        max_deliveries: int = 5,
+        claim_idle_ms: int = 60_000,
+        max_concurrency: int = 1,
+    ) -> None:
+        self.redis_client = redis_client
+        self.stream_key = stream_key
+        self.dead_letter_key = dead_letter_key or f"{stream_key}:dead"
+        self.consumer_name = consumer_name or default_consumer_name()
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.max_deliveries = max_deliveries
+        self.claim_idle_ms = claim_idle_ms
+        self.max_concurrency = max_concurrency
+        self.groups: dict[str, _ConsumerGroup] = {}
+        self._started = False
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    async def publish(self, packet: Packet) -> str:
+        """
+        Append a packet to the stream (approximate MAXLEN trim).
+
+        Returns:
+            Stream entry ID
+        """
+        fields = {"event_type": packet.event_type, "packet": json.dumps(packet.to_dict())}
+        return await self.redis_client.xadd(self.stream_key, fields, maxlen=self.maxlen, approximate=True)
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    async def subscribe(
+        self,
+        pattern: str,
+        handler: Callable[[Packet], Any],
+        group: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> str:
+        """
+        Attach a handler to a consumer group (created on first use).
+
+        Returns:
+            The consumer group name
+        """
+        group_name = group or default_group_name(handler)
+        consumer_group = self.groups.get(group_name)
+        if consumer_group is None:
+            consumer_group = _ConsumerGroup(group_name, max_concurrency or self.max_concurrency)
+            self.groups[group_name] = consumer_group
+            if self._started:
+                await self._start_group(consumer_group)
+
+        consumer_group.add(pattern, handler)
+        return group_name
+
+    async def start(self) -> None:
+        """Create groups and start one reader task per group."""
+        self._started = True
+        for consumer_group in self.groups.values():
+            await self._start_group(consumer_group)
+
+    async def stop(self) -> None:
+        """Cancel reader tasks (unacked entries stay pending for redelivery)."""
+        self._started = False
+        for consumer_group in self.groups.values():
+            if consumer_group.task:
+                consumer_group.task.cancel()
+                try:
+                    await consumer_group.task
+                except asyncio.CancelledError:
+                    pass
+                consumer_group.task = None
+
+    async def _start_group(self, consumer_group: _ConsumerGroup) -> None:
+        try:
+            # "$" = only events published after the group first appears
+            await self.redis_client.xgroup_create(self.stream_key, consumer_group.name, id="$", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        consumer_group.task = asyncio.create_task(self._consume(consumer_group))
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    async def replay(self, group: str, from_id: str = "0") -> None:
+        """
+        Rewind a consumer group so entries after ``from_id`` are redelivered.
+
+        Args:
+            group: Consumer group name
+            from_id: Stream ID to resume after ("0" = everything retained)
+        """
+        await self.redis_client.xgroup_setid(self.stream_key, group, id=from_id)
+
+    async def read_range(self, start: str = "-", end: str = "+", count: int = 100) -> list[Packet]:
+        """Read packets directly by ID range (ad-hoc backfills, debugging)."""
+        entries = await self.redis_client.xrange(self.stream_key, min=start, max=end, count=count)
+        return [Packet.from_dict(json.loads(fields["packet"])) for _, fields in entries]
+
+    # ------------------------------------------------------------------
+    # Consuming
+    # ------------------------------------------------------------------
+
+    async def _consume(self, consumer_group: _ConsumerGroup) -> None:
+        """Reader loop: reclaim stale entries, then read new ones in batches."""
+        from ..ai.gateway import LLMPriority, set_llm_priority
+
+        # Event handlers are background work for the LLM gateway
+        set_llm_priority(LLMPriority.BACKGROUND)
+        while True:
+            try:
+                await self._reclaim_stale(consumer_group)
+
+                response = await self.redis_client.xreadgroup(
+                    consumer_group.name,
+                    self.consumer_name,
+                    {self.stream_key: ">"},
+                    count=self.batch_size,
+                    block=self.block_ms,
+                )
+                for _, entries in response or []:
+                    await self._process_batch(consumer_group, entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[EventStreams] Reader error in group {consumer_group.name}: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _process_batch(self, consumer_group: _ConsumerGroup, entries: list) -> None:
+        """Run matching handlers for a batch, then XACK everything that succeeded."""
+        results = await asyncio.gather(*(self._process_entry(consumer_group, eid, f) for eid, f in entries))
+        acked = [entry_id for (entry_id, _), ok in zip(entries, results) if ok]
+        if acked:
+            await self.redis_client.xack(self.stream_key, consumer_group.name, *acked)
+
+    async def _process_entry(self, consumer_group: _ConsumerGroup, entry_id: str, fields: dict) -> bool:
+        """
+        Deliver one entry (at-least-once: a retry re-runs every matching handler).
+
+        Returns:
+            True if it can be acked (handled, skipped or undecodable)
+        """
+        handlers = consumer_group.handlers_for(fields.get("event_type", ""))
+        if not handlers:
+            consumer_group.skipped += 1
+            return True
+
+        try:
+            packet = Packet.from_dict(json.loads(fields["packet"]))
+        except Exception as e:
+            await self._dead_letter(consumer_group, entry_id, fields, f"decode error: {e}")
+            return True
+
+        async with consumer_group.semaphore:
+            try:
+                for handler in handlers:
+                    if asyncio.iscoroutinefunction(handler):
+                        await handler(packet)
+                    else:
+                        handler(packet)
+            except Exception as e:
+                consumer_group.failed += 1
+                logger.error(f"[EventStreams] Handler failed in group {consumer_group.name} ({entry_id}): {e}")
+                return False
+
+        consumer_group.delivered += 1
+        return True
+
+    async def _reclaim_stale(self, consumer_group: _ConsumerGroup) -> None:
+        """
+        Retry entries left pending by crashed consumers or failed handlers.
+
+        Entries delivered ``max_deliveries`` times go to the dead-letter stream.
+        Runs at most every half ``claim_idle_ms`` per group.
+        """
+        now = time.monotonic()
+        if (now - consumer_group.last_reclaim) * 1000 < self.claim_idle_ms / 2:
+            return
+        consumer_group.last_reclaim = now
+
+        pending = await self.redis_client.xpending_range(
+            self.stream_key,
+            consumer_group.name,
+            min="-",
+            max="+",
+            count=self.batch_size,
+            idle=self.claim_idle_ms,
+        )
+        if not pending:
+            return
+
+        retry_ids = []
+        for item in pending:
+            entry_id = item["message_id"]
+            if item["times_delivered"] >= self.max_deliveries:
+                entries = await self.redis_client.xrange(self.stream_key, min=entry_id, max=entry_id)
+                fields = entries[0][1] if entries else {}
+                await self._dead_letter(consumer_group, entry_id, fields, "max deliveries exceeded")
+                await self.redis_client.xack(self.stream_key, consumer_group.name, entry_id)
+            else:
+                retry_ids.append(entry_id)
+
+        if retry_ids:
+            claimed = await self.redis_client.xclaim(
+                self.stream_key, consumer_group.name, self.consumer_name, self.claim_idle_ms, retry_ids
+            )
+            # Entries trimmed from the stream come back as (id, None)
+            await self._process_batch(consumer_group, [(eid, f) for eid, f in claimed if f])
+
+    async def _dead_letter(self, consumer_group: _ConsumerGroup, entry_id: str, fields: dict, reason: str) -> None:
+        consumer_group.dead_lettered += 1
+        await self.redis_client.xadd(
+            self.dead_letter_key,
+            {**fields, "original_id": entry_id, "group": consumer_group.name, "reason": reason},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        logger.warning(f"[EventStreams] Dead-lettered {entry_id} from group {consumer_group.name}: {reason}")
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "stream": self.stream_key,
+            "consumer": self.consumer_name,
+            "groups": [g.metrics() for g in self.groups.values()],
+        }
+
+    async def group_info(self) -> list[dict[str, Any]]:
+        """Server-side pending count and lag per group (XINFO GROUPS)."""
+        try:
+            return await self.redis_client.xinfo_groups(self.stream_key)
+        except ResponseError:
+            return []
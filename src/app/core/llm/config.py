@@ -8,6 +8,7 @@ from enum import Enum
 
 from langchain_openai import ChatOpenAI
 
+from src.app.core.ai.gateway import create_chat_model
 from src.app.core.config import settings
 
 
@@ -118,7 +119,7 @@ class LLMConfig:
         """
         config = LLMConfig.MODELS[tier]
 
-        return ChatOpenAI(
+        return create_chat_model(
             base_url="https://openrouter.ai/api/v1",
             api_key=settings.OPENROUTER_API_KEY,
             model=config.model_id,
@@ -11,15 +11,23 @@ Events that trigger re-synthesis:
 - Genesis field confirmed (refined data)
 - User requested (manual refresh)
 - Scheduled (daily at user's preferred time)
+
+Background triggers are coalesced per user: the first trigger opens a
+pending batch, later ones join it, and the batch runs as one ARQ job once
+its debounce window has passed. Synthesis is skipped when its inputs
+(module outputs and Observer findings) are unchanged since the last run.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from ..config import settings
 from .active_memory import get_active_memory
 
 if TYPE_CHECKING:
@@ -58,6 +66,30 @@ CRITICAL_TRIGGERS = {
     SynthesisTrigger.USER_REQUESTED,
 }
 
+# Pending background batch per user: opened_at (ms) plus trigger:<name> -> count
+PENDING_KEY = "synthesis:pending:{user_id}"
+PENDING_TTL = 3600
+# Input fingerprint of the synthesis currently in hot memory
+FINGERPRINT_KEY = "synthesis:fingerprint:{user_id}"
+
+
+def trigger_priority(trigger: str | SynthesisTrigger) -> int:
+    """0 = user is waiting, 1 = critical (new data), 2 = everything else (tracker events, schedule)."""
+    if trigger == SynthesisTrigger.USER_REQUESTED:
+        return 0
+    if trigger in CRITICAL_TRIGGERS:
+        return 1
+    return 2
+
+
+def debounce_seconds(priority: int) -> int:
+    """How long after a batch opens a trigger of this priority lets it wait."""
+    if priority == 0:
+        return 0
+    if priority == 1:
+        return settings.SYNTHESIS_CRITICAL_DEBOUNCE_SECONDS
+    return settings.SYNTHESIS_DEBOUNCE_SECONDS
+
 
 class SynthesisOrchestrator:
     """
@@ -91,6 +123,7 @@ class SynthesisOrchestrator:
         """
         self.memory = memory
         self.event_bus = None  # Set during startup via set_event_bus()
+        self._inline_runs: dict[int, asyncio.Task] = {}  # Fallback runs when ARQ is unavailable
 
     def set_event_bus(self, event_bus: Any) -> None:
         """Set event bus for publishing synthesis events."""
@@ -190,23 +223,89 @@ class SynthesisOrchestrator:
             return await self._run_synthesis(user_id, trigger_str)
 
     async def _queue_background_synthesis(self, user_id: int, trigger_type: str) -> None:
-        """Queue synthesis as background job."""
+        """
+        Add a trigger to the user's pending batch and make sure a job will run it.
+
+        The batch runs ``debounce_seconds`` after it was opened, judged by its
+        most urgent trigger. Job ids are per batch and priority, so repeated
+        triggers don't enqueue again; the first job to run claims the whole
+        batch and any later one finds it empty.
+        """
+        opened_at = await self._join_pending(user_id, trigger_type)
+        priority = trigger_priority(trigger_type)
+
         try:
             # Try ARQ worker first
             from src.app.core.worker.client import get_arq_pool
 
             pool = await get_arq_pool()
             if pool:
-                await pool.enqueue_job("synthesize_profile_job", user_id, trigger_type)
-                logger.info(f"Queued synthesis job for user {user_id}, trigger: {trigger_type}")
+                defer = max(0.0, opened_at / 1000 + debounce_seconds(priority) - time.time())
+                job = await pool.enqueue_job(
+                    "synthesis_batch_job",
+                    user_id,
+                    _job_id=f"synthesis:{user_id}:{opened_at}:{priority}",
+                    _defer_by=timedelta(seconds=defer),
+                )
+                if job:
+                    logger.info(f"Queued synthesis job for user {user_id} in {defer:.0f}s, trigger: {trigger_type}")
+                else:
+                    logger.debug(f"Synthesis already queued for user {user_id}, coalesced trigger: {trigger_type}")
                 return
         except Exception as e:
             logger.warning(f"ARQ not available, running synthesis inline: {e}")
 
-        # Fallback: run inline (but don't block)
-        import asyncio
+        # Fallback: run inline (but don't block), one run per user at a time
+        running = self._inline_runs.get(user_id)
+        if running is None or running.done():
+            self._inline_runs[user_id] = asyncio.create_task(self.run_pending_synthesis(user_id))
+
+    async def _join_pending(self, user_id: int, trigger_type: str) -> int:
+        """Record a trigger in the user's pending batch; returns when the batch opened (epoch ms)."""
+        key = PENDING_KEY.format(user_id=user_id)
+        async with self.memory.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, "opened_at", int(time.time() * 1000))
+            pipe.hincrby(key, f"trigger:{trigger_type}", 1)
+            pipe.expire(key, PENDING_TTL)
+            pipe.hget(key, "opened_at")
+            *_, opened_at = await pipe.execute()
+        return int(opened_at)
+
+    async def _claim_pending(self, user_id: int) -> dict[str, int]:
+        """Atomically take the user's pending batch (trigger -> count); empty if already claimed."""
+        key = PENDING_KEY.format(user_id=user_id)
+        async with self.memory.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(key)
+            pipe.delete(key)
+            batch, _ = await pipe.execute()
+        return {
+            field.removeprefix("trigger:"): int(count) for field, count in batch.items() if field.startswith("trigger:")
+        }
+
+    async def run_pending_synthesis(self, user_id: int) -> dict | None:
+        """
+        Run one synthesis for all triggers pending for a user.
 
-        asyncio.create_task(self._run_synthesis(user_id, trigger_type))
+        Called by the ``synthesis_batch_job`` worker job.
+
+        Returns:
+            Synthesis dict, or None if another job already ran this batch.
+        """
+        triggers = await self._claim_pending(user_id)
+        if not triggers:
+            logger.debug(f"No pending synthesis for user {user_id}, already coalesced")
+            return None
+
+        from ..ai.gateway import LLMPriority, llm_priority
+
+        trigger_str = ",".join(sorted(triggers, key=trigger_priority))
+        if sum(triggers.values()) > 1:
+            logger.info(f"Coalesced {sum(triggers.values())} synthesis triggers for user {user_id}: {triggers}")
+
+        # A user waiting on their refresh goes ahead of other background LLM work
+        lane = LLMPriority.INTERACTIVE if SynthesisTrigger.USER_REQUESTED.value in triggers else LLMPriority.BACKGROUND
+        with llm_priority(lane):
+            return await self._run_synthesis(user_id, trigger_str)
 
     async def _run_synthesis(self, user_id: int, trigger_type: str) -> dict:
         """
@@ -223,10 +322,34 @@ class SynthesisOrchestrator:
         start_time = datetime.now(UTC)
 
         try:
+            from sqlalchemy import select
+
             from ...core.db.database import local_session
+            from ...models.user_profile import UserProfile
             from ...modules.intelligence.synthesis import ProfileSynthesizer
+            from ...modules.intelligence.synthesis.synthesizer import FALLBACK_SYNTHESIS
+
+            fingerprint_key = FINGERPRINT_KEY.format(user_id=user_id)
 
             async with local_session() as db:
+                result = await db.execute(select(UserProfile.data).where(UserProfile.user_id == user_id))
+                profile_data = result.scalar_one_or_none()
+                fingerprint = ProfileSynthesizer.input_fingerprint(profile_data) if profile_data else None
+
+                current = await self.memory.get_master_synthesis(user_id)
+                if current and fingerprint and fingerprint == await self.memory.redis_client.get(fingerprint_key):
+                    # Same inputs as the current synthesis: keep it, and mark it fresh
+                    await self.memory.set_master_synthesis(
+                        user_id,
+                        current["synthesis"],
+                        current.get("themes", []),
+                        current.get("modules_included", []),
+                        current.get("count_confirmed_theories", 0),
+                    )
+                    await self.memory.redis_client.expire(fingerprint_key, self.memory.HOT_TTL)
+                    logger.info(f"Synthesis inputs unchanged for user {user_id}, skipped (trigger: {trigger_type})")
+                    return {**current, "validity": "valid"}
+
                 synthesizer = ProfileSynthesizer()
                 synthesis = await synthesizer.synthesize_profile(user_id, db)
 
@@ -234,6 +357,8 @@ class SynthesisOrchestrator:
             await self.memory.set_master_synthesis(
                 user_id, synthesis.synthesis, synthesis.themes, synthesis.modules_included
             )
+            if fingerprint and synthesis.synthesis != FALLBACK_SYNTHESIS:
+                await self.memory.redis_client.set(fingerprint_key, fingerprint, ex=self.memory.HOT_TTL)
 
             # Publish event
             if self.event_bus:
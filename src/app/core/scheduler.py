@@ -1,10 +1,12 @@
+import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta, tzinfo
 from zoneinfo import ZoneInfo
 
 from arq.connections import RedisSettings
 from croniter import croniter
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.config import settings
@@ -13,8 +15,14 @@ from src.app.core.events.bus import get_event_bus
 from src.app.models.progression import PlayerStats
 from src.app.models.push import PushSubscription
 from src.app.models.user import User
+from src.app.modules.features.journal.store import JournalStore
 from src.app.modules.features.quests.models import Quest, QuestCategory, QuestLog, QuestStatus, RecurrenceType
 from src.app.modules.infrastructure.push.service import notification_service
+from src.app.modules.intelligence.hypothesis.updater import get_hypothesis_updater
+from src.app.modules.intelligence.oracle.quantum import QuantumEntropy
+from src.app.modules.intelligence.oracle.reservoir import get_entropy_reservoir
+from src.app.modules.tracking.current_sky import get_current_sky_store
+from src.app.modules.tracking.ephemeris_grid import get_ephemeris_grid
 from src.app.modules.tracking.lunar.tracker import LunarTracker
 from src.app.modules.tracking.solar.tracker import SolarTracker
 
@@ -65,6 +73,7 @@ async def trigger_quest_notification(ctx, quest_id: int):
                 body=quest.description or "Time to complete your quest!",
                 url=f"/quests/{quest.id}",  # Deep link
             )
+            await db.commit()  # Expired subscriptions pruned by the send
             logger.info(f"Quest {quest_id}: Notification Result: {result}")
 
         # 3. Create or Retrieve Quest Log (Pending)
@@ -176,148 +185,305 @@ async def cosmic_heartbeat(ctx):
         logger.error(f"Error in Cosmic Heartbeat: {e}", exc_info=True)
 
 
-async def daily_reset_job(ctx):
+async def refresh_ephemeris_grid(ctx):
     """
-    Analyzes previous day's performance for all users.
-    Calculates WMA Sync Rate, updates streaks, and renews Daily Quests.
-    Runs hourly but only executes reset logic if it's midnight for the user.
+    Rebuilds the precomputed ephemeris grid when its rolling window is stale.
+
+    The build runs in a thread (bulk swisseph sampling is CPU-bound) and is
+    published atomically, so API processes pick it up on their next reload check.
     """
-    logger.info("Executing Daily Reset Check...")
+    try:
+        grid = get_ephemeris_grid()
+        rebuilt = await asyncio.to_thread(grid.ensure_current)
+        if rebuilt:
+            logger.info(f"Ephemeris grid rebuilt (JD {grid.start_jd:.1f}-{grid.end_jd:.1f})")
+    except Exception as e:
+        logger.error(f"Error refreshing ephemeris grid: {e}", exc_info=True)
 
-    async with async_session_factory() as db:
-        # 1. Fetch all active users
-        stmt = select(User).where(User.is_deleted.is_(False))
-        result = await db.execute(stmt)
-        users = result.scalars().all()
 
-        for user in users:
-            try:
-                # 2. Determine User's local time
-                user_tz_str = user.birth_timezone or "UTC"
-                try:
-                    user_tz = ZoneInfo(user_tz_str)
-                except Exception:
-                    user_tz = UTC
+async def refresh_current_sky(ctx):
+    """
+    Rematerializes the shared "current sky" document served by /dashboard/cosmic.
+
+    Slow or failing upstreams (NOAA) keep their last known values.
+    """
+    try:
+        sky = await get_current_sky_store().refresh()
+        if sky["stale"]:
+            logger.warning(f"Current sky refreshed with stale components: {sky['stale']}")
+    except Exception as e:
+        logger.error(f"Error refreshing current sky: {e}", exc_info=True)
+
+
+async def refill_oracle_entropy(ctx):
+    """
+    Tops up the Oracle's quantum entropy reservoir with one bulk ANU request.
 
-                now_local = datetime.now(user_tz)
+    Draws consume the reservoir and fall back to the OS CSPRNG when it is empty,
+    so a failed refill only lowers the share of QUANTUM readings.
+    """
+    try:
+        # Off the request path, so the quantum API gets a generous timeout
+        added = await get_entropy_reservoir().refill(QuantumEntropy(timeout_ms=15000))
+        if added:
+            logger.info(f"Oracle entropy reservoir refilled with {added} quantum values")
+    except Exception as e:
+        logger.warning(f"Oracle entropy refill failed: {e}")
 
-                # 3. Check if reset is due (Midnight or later today, and last_reset was yesterday)
-                stats_stmt = select(PlayerStats).where(PlayerStats.user_id == user.id)
-                stats_result = await db.execute(stats_stmt)
-                stats = stats_result.scalar_one_or_none()
 
-                if not stats:
-                    stats = PlayerStats(user_id=user.id)
-                    db.add(stats)
-                    await db.commit()
-                    await db.refresh(stats)
+async def decay_hypotheses(ctx):
+    """
+    Nightly recency decay for every user's hypotheses.
 
-                # last_reset_at is UTC in DB
-                last_reset_local = stats.last_reset_at.astimezone(user_tz) if stats.last_reset_at else None
+    Evidence is evaluated in vectorized batches of hypotheses and only changed
+    confidences, statuses and evidence weights are written.
+    """
+    try:
+        async with async_session_factory() as db:
+            await get_hypothesis_updater().decay_all_hypotheses(db)
+    except Exception as e:
+        logger.error(f"Error decaying hypotheses: {e}", exc_info=True)
 
-                # Logic: If now is >= midnight today, and was never reset OR was reset before today's 00:00
-                if not last_reset_local or last_reset_local.date() < now_local.date():
-                    # PERFORM RESET
-                    logger.info(f"Resetting day for user {user.id} (TZ: {user_tz_str})")
-                    await _perform_user_daily_reset(db, user, stats, user_tz)
 
-            except Exception as e:
-                logger.error(f"Failed to process daily reset for user {user.id}: {e}")
+async def backfill_journal_entries(ctx):
+    """
+    Move journal entries out of UserProfile.data into the journal_entries table.
 
-    logger.info("Daily Reset Check complete.")
+    Enqueued on worker startup; runs batch by batch (one commit per profile)
+    until a batch removes nothing. Lists that kept changing mid-copy are left
+    for the next run.
+    """
+    store = JournalStore()
+    migrated = 0
+    try:
+        async with async_session_factory() as db:
+            while batch := await store.backfill(db):
+                migrated += batch
+    except Exception as e:
+        logger.error(f"Error backfilling journal entries: {e}", exc_info=True)
 
+    if migrated:
+        logger.info(f"Journal backfill complete ({migrated} profiles).")
 
-async def _perform_user_daily_reset(db: AsyncSession, user: User, stats: PlayerStats, tz: ZoneInfo):
-    """Internal logic to update WMA and renew quests."""
-    # 1. Evaluate yesterday's quests
-    # Yesterday in user's TZ: from [now - 24h] start of day to [now - 24h] end of day
-    now_local = datetime.now(tz)
-    yesterday_local = now_local - timedelta(days=1)
 
-    start_of_yesterday = datetime.combine(yesterday_local.date(), datetime.min.time()).replace(tzinfo=tz)
-    end_of_yesterday = datetime.combine(yesterday_local.date(), datetime.max.time()).replace(tzinfo=tz)
+# Users reset per transaction in daily_reset_job
+RESET_BATCH_SIZE = 500
+
+
+def _user_timezone(tz_name: str | None) -> tzinfo:
+    try:
+        return ZoneInfo(tz_name or "UTC")
+    except Exception:
+        return UTC
+
+
+def next_local_midnight(now: datetime, tz: tzinfo) -> datetime:
+    """UTC instant of the first local midnight in ``tz`` after ``now``."""
+    tomorrow = now.astimezone(tz).date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time(), tzinfo=tz).astimezone(UTC)
 
-    # Query logs scheduled for yesterday
-    log_stmt = (
-        select(QuestLog)
-        .join(Quest)
-        .where(
-            Quest.user_id == user.id,
-            QuestLog.scheduled_for >= start_of_yesterday,
-            QuestLog.scheduled_for <= end_of_yesterday,
-        )
-    )
-    result = await db.execute(log_stmt)
-    logs = result.scalars().all()
 
-    total = len(logs)
-    completed = len([l for l in logs if l.status == QuestStatus.COMPLETED])
+def next_reset_for(last_reset_at: datetime | None, tz: tzinfo, now: datetime) -> datetime:
+    """Next daily reset in ``tz``: now if today's reset has not run yet there, else the next local midnight."""
+    if last_reset_at is None or last_reset_at.astimezone(tz).date() < now.astimezone(tz).date():
+        return now
+    return next_local_midnight(now, tz)
 
+
+async def reschedule_daily_reset(db: AsyncSession, user_id: int, tz_name: str | None) -> None:
+    """Recompute a user's next_reset_at after their timezone changed (caller commits)."""
+    stats = (await db.execute(select(PlayerStats).where(PlayerStats.user_id == user_id))).scalar_one_or_none()
+    if stats is not None:
+        stats.next_reset_at = next_reset_for(stats.last_reset_at, _user_timezone(tz_name), datetime.now(UTC))
+
+
+def apply_daily_sync(stats: PlayerStats, total: int, completed: int, day: date) -> None:
+    """Fold one day's quest completion into the WMA sync rate, history and streak."""
     daily_sync = (
         completed / total if total > 0 else 1.0
     )  # Perfect sync if no quests? Or 0? User asked for 1.0-ish logic.
 
-    # 2. Update WMA (7-day Weighted Moving Average)
+    # 7-day Weighted Moving Average
     # new_wma = (daily_sync * 0.4) + (prev_avg * 0.6)
-    stats.sync_rate = (daily_sync * 0.4) + (stats.sync_rate * 0.6)
+    stats.sync_rate = (daily_sync * 0.4) + ((stats.sync_rate or 0.0) * 0.6)
 
     # Update History (JSONB)
     history = stats.sync_history.copy() if stats.sync_history else []
-    history.append({"date": yesterday_local.date().isoformat(), "score": daily_sync})
+    history.append({"date": day.isoformat(), "score": daily_sync})
     stats.sync_history = history[-7:]  # Keep last 7
 
-    # 3. Streak Evaluation
+    # Streak Evaluation
     if completed > 0:
-        stats.streak_count += 1
+        stats.streak_count = (stats.streak_count or 0) + 1
     else:
         stats.streak_count = 0  # Streak broken
 
-    stats.last_reset_at = datetime.now(UTC)
-
-    # 4. Renew DAILY category quests for TODAY
-    daily_quests_stmt = select(Quest).where(
-        Quest.user_id == user.id, Quest.category == QuestCategory.DAILY, Quest.is_active.is_(True)
-    )
-    q_result = await db.execute(daily_quests_stmt)
-    dailies = q_result.scalars().all()
-
-    for q in dailies:
-        # Create new log for today
-        log = QuestLog(
-            quest_id=q.id,
-            status=QuestStatus.PENDING,
-            scheduled_for=datetime.now(UTC),  # Or today's start in TZ
+
+async def daily_reset_job(ctx):
+    """
+    Analyzes previous day's performance for users whose local midnight has passed.
+    Calculates WMA Sync Rate, updates streaks, and renews Daily Quests.
+
+    Runs hourly. PlayerStats.next_reset_at (indexed) holds each user's next
+    local midnight in UTC, so a run only selects users that are due. Due users
+    are bucketed by timezone and reset in batches with set-based queries.
+    """
+    logger.info("Executing Daily Reset Check...")
+    now = datetime.now(UTC)
+    reset_count = 0
+
+    async with async_session_factory() as db:
+        # 1. Every active user needs a stats row (new rows are due immediately)
+        missing_stmt = (
+            select(User.id)
+            .outerjoin(PlayerStats, PlayerStats.user_id == User.id)
+            .where(User.is_deleted.is_(False), PlayerStats.id.is_(None))
+        )
+        missing = (await db.execute(missing_stmt)).scalars().all()
+        if missing:
+            db.add_all([PlayerStats(user_id=user_id) for user_id in missing])
+            await db.commit()
+
+        # 2. Users whose local midnight has passed, bucketed by timezone
+        due_stmt = (
+            select(PlayerStats.user_id, User.birth_timezone)
+            .join(User, User.id == PlayerStats.user_id)
+            .where(
+                User.is_deleted.is_(False),
+                or_(PlayerStats.next_reset_at.is_(None), PlayerStats.next_reset_at <= now),
+            )
+        )
+        buckets: dict[str, list[int]] = defaultdict(list)
+        for user_id, tz_name in (await db.execute(due_stmt)).all():
+            buckets[tz_name or "UTC"].append(user_id)
+
+        # 3. Reset each bucket in batches
+        for tz_name, user_ids in buckets.items():
+            tz = _user_timezone(tz_name)
+            for i in range(0, len(user_ids), RESET_BATCH_SIZE):
+                batch = user_ids[i : i + RESET_BATCH_SIZE]
+                try:
+                    reset_count += await _reset_user_batch(db, batch, tz, now)
+                except Exception as e:
+                    await db.rollback()
+                    logger.error(f"Failed to process daily reset for {len(batch)} users (TZ: {tz_name}): {e}")
+
+    logger.info(f"Daily Reset Check complete ({reset_count} users reset).")
+
+
+async def _reset_user_batch(db: AsyncSession, user_ids: list[int], tz: tzinfo, now: datetime) -> int:
+    """
+    Reset a batch of users sharing a timezone, in one transaction.
+
+    Returns:
+        Number of users whose day was reset
+    """
+    today = now.astimezone(tz).date()
+    yesterday = today - timedelta(days=1)
+    start_of_yesterday = datetime.combine(yesterday, datetime.min.time(), tzinfo=tz)
+    start_of_today = datetime.combine(today, datetime.min.time(), tzinfo=tz)
+    next_reset = next_local_midnight(now, tz)
+
+    result = await db.execute(select(PlayerStats).where(PlayerStats.user_id.in_(user_ids)))
+    all_stats = result.scalars().all()
+
+    # Rows without a schedule yet may already have been reset today
+    due = [s for s in all_stats if not s.last_reset_at or s.last_reset_at.astimezone(tz).date() < today]
+    for stats in all_stats:
+        stats.next_reset_at = next_reset
+
+    if due:
+        due_ids = [s.user_id for s in due]
+
+        # 1. Yesterday's quest logs, aggregated per user
+        counts_stmt = (
+            select(
+                Quest.user_id,
+                func.count(QuestLog.id),
+                func.count(QuestLog.id).filter(QuestLog.status == QuestStatus.COMPLETED),
+            )
+            .join(Quest, Quest.id == QuestLog.quest_id)
+            .where(
+                Quest.user_id.in_(due_ids),
+                QuestLog.scheduled_for >= start_of_yesterday,
+                QuestLog.scheduled_for < start_of_today,
+            )
+            .group_by(Quest.user_id)
+        )
+        counts = {user_id: (total, completed) for user_id, total, completed in (await db.execute(counts_stmt)).all()}
+
+        # 2. Update WMA, history and streaks
+        for stats in due:
+            total, completed = counts.get(stats.user_id, (0, 0))
+            apply_daily_sync(stats, total, completed, yesterday)
+            stats.last_reset_at = now
+
+        # 3. Renew DAILY category quests for TODAY
+        dailies_stmt = select(Quest.id).where(
+            Quest.user_id.in_(due_ids), Quest.category == QuestCategory.DAILY, Quest.is_active.is_(True)
+        )
+        daily_ids = (await db.execute(dailies_stmt)).scalars().all()
+        db.add_all(
+            [QuestLog(quest_id=quest_id, status=QuestStatus.PENDING, scheduled_for=now) for quest_id in daily_ids]
         )
-        db.add(log)
 
     await db.commit()
-    await db.refresh(stats)
+    return len(due)
 
 
 async def startup(ctx):
     """Initialize periodic jobs on worker startup."""
     logger.info("Scheduler worker starting up...")
 
+    from src.app.core.ai.gateway import LLMPriority, get_llm_gateway
+
+    # Scheduled LLM work queues behind interactive chat
+    get_llm_gateway().default_priority = LLMPriority.BACKGROUND
+
     # Schedule the first Cosmic Heartbeat immediately
     await ctx["redis"].enqueue_job("cosmic_heartbeat")
 
+    # Online move of profile-stored journal entries (no-op once done)
+    await ctx["redis"].enqueue_job("backfill_journal_entries")
+
     # In production, arq handles periodic jobs via cron, but for now
     # we can daisy-chain it if we don't use CronSettings.
     # Actually, let's use CronSettings for robustness.
 
 
 async def shutdown(ctx):
-    pass
+    from src.app.core.activity.logger import get_activity_logger
+    from src.app.core.ai.gateway import get_llm_gateway
+    from src.app.core.telemetry.tracer import get_tracer
+
+    # Flush trace and activity records buffered by jobs
+    await get_tracer().cleanup()
+    await get_activity_logger().cleanup()
+
+    await get_llm_gateway().close()
 
 
 from arq import cron
 
 
 class WorkerSettings:
-    functions = [trigger_quest_notification, cosmic_heartbeat, daily_reset_job]
+    functions = [
+        trigger_quest_notification,
+        cosmic_heartbeat,
+        daily_reset_job,
+        refresh_ephemeris_grid,
+        refresh_current_sky,
+        refill_oracle_entropy,
+        decay_hypotheses,
+        backfill_journal_entries,
+    ]
     cron_jobs = [
         cron(cosmic_heartbeat, hour=None, minute=0, second=0),  # Run every hour on the hour
         cron(daily_reset_job, hour=None, minute=0, second=0),  # Check resets every hour
+        cron(refresh_ephemeris_grid, hour=0, minute=15, second=0),  # Roll the ephemeris window daily
+        cron(refresh_current_sky, minute=set(range(0, 60, 5)), second=0),  # Dashboard cosmic widget
+        cron(refill_oracle_entropy, minute=set(range(2, 60, 5)), second=0),  # One ANU request per run
+        cron(decay_hypotheses, hour=3, minute=30, second=0),  # Nightly evidence recency decay
     ]
     redis_settings = redis_settings
     on_startup = startup
@@ -12,6 +12,7 @@ from ..crud.crud_users import crud_users
 from .config import settings
 from .db.crud_token_blacklist import crud_token_blacklist
 from .schemas import TokenBlacklistCreate, TokenData
+from .utils.auth_cache import auth_cache
 
 SECRET_KEY: SecretStr = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
@@ -90,7 +91,7 @@ async def verify_token(token: str, expected_token_type: TokenType, db: AsyncSess
     TokenData | None
         TokenData instance if the token is valid, None otherwise.
     """
-    is_blacklisted = await crud_token_blacklist.exists(db, token=token)
+    is_blacklisted = await auth_cache.is_revoked(token, db)
     if is_blacklisted:
         return None
 
@@ -126,6 +127,10 @@ async def blacklist_tokens(access_token: str, refresh_token: str, db: AsyncSessi
         if exp_timestamp is not None:
             expires_at = datetime.fromtimestamp(exp_timestamp)
             await crud_token_blacklist.create(db, object=TokenBlacklistCreate(token=token, expires_at=expires_at))
+            await auth_cache.revoke(token, exp_timestamp)
+
+        if payload.get("sub"):
+            auth_cache.invalidate_user(payload["sub"])
 
 
 async def blacklist_token(token: str, db: AsyncSession) -> None:
@@ -134,3 +139,7 @@ async def blacklist_token(token: str, db: AsyncSession) -> None:
     if exp_timestamp is not None:
         expires_at = datetime.fromtimestamp(exp_timestamp)
         await crud_token_blacklist.create(db, object=TokenBlacklistCreate(token=token, expires_at=expires_at))
+        await auth_cache.revoke(token, exp_timestamp)
+
+    if payload.get("sub"):
+        auth_cache.invalidate_user(payload["sub"])
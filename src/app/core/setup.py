@@ -164,11 +164,33 @@ def lifespan_factory(
             if isinstance(settings, RedisRateLimiterSettings):
                 await close_redis_rate_limit_pool()
 
+            # Write XP gains still waiting in the coalescing window
+            from ..modules.intelligence.evolution.engine import get_evolution_engine
+
+            await get_evolution_engine().flush()
+
             # Close EventBus
             from ..core.events.bus import get_event_bus
 
             await get_event_bus().cleanup()
 
+            # Flush buffered observability writes
+            from ..core.activity.logger import get_activity_logger
+            from ..core.telemetry.tracer import get_tracer
+
+            await get_tracer().cleanup()
+            await get_activity_logger().cleanup()
+
+            # Close the pooled push-service client
+            from ..modules.infrastructure.push.service import notification_service
+
+            await notification_service.close()
+
+            # Close the per-model LLM connection pools
+            from ..core.ai.gateway import get_llm_gateway
+
+            await get_llm_gateway().close()
+
     return lifespan
 
 
@@ -1,4 +1,5 @@
 """GUTTERS Telemetry - Event tracing and observability."""
 from .tracer import Tracer, get_tracer
+from .write_behind import WriteBehindBuffer
 
-__all__ = ["Tracer", "get_tracer"]
+__all__ = ["Tracer", "WriteBehindBuffer", "get_tracer"]
@@ -17,6 +17,7 @@ import redis.asyncio as redis
 
 from ...core.config import settings
 from ...protocol.packet import Packet
+from .write_behind import WriteBehindBuffer
 
 
 class Tracer:
@@ -25,13 +26,28 @@ class Tracer:
 
     Records all events to Redis for debugging and monitoring.
     Each trace groups related events together.
+
+    Indexes maintained alongside the event keys:
+    - trace:{trace_id}:index  - sorted set of a trace's event keys
+    - trace:recent            - global sorted set of event keys (score = epoch seconds)
+    - trace:modules:last_seen - hash of module -> last event epoch seconds
+
+    Reads go through the indexes plus MGET, so they scale with the result
+    size instead of the keyspace. Writes are buffered (write-behind) and
+    flushed in pipelined batches; reads flush pending writes first.
     """
 
     TTL_SECONDS = 86400  # 24 hours
+    ACTIVE_WINDOW_SECONDS = 300  # 5 minutes
+    MAX_RECENT = 10000  # Cap on the global recent-events index
+
+    RECENT_INDEX_KEY = "trace:recent"
+    MODULES_LAST_SEEN_KEY = "trace:modules:last_seen"
 
     def __init__(self):
         """Initialize tracer (call initialize() to connect to Redis)."""
         self.redis_client: redis.Redis | None = None
+        self.writer = WriteBehindBuffer("trace", lambda: self.redis_client)
 
     async def initialize(self) -> None:
         """Connect to Redis."""
@@ -43,7 +59,8 @@ class Tracer:
         )
 
     async def cleanup(self) -> None:
-        """Disconnect from Redis."""
+        """Flush buffered events and disconnect from Redis."""
+        await self.writer.close()
         if self.redis_client:
             await self.redis_client.close()
 
@@ -51,9 +68,12 @@ class Tracer:
         """
         Record an event packet to Redis.
 
-        Storage key: trace:{trace_id}:event:{timestamp}
+        Storage key: trace:{trace_id}:event:{epoch_seconds}
         TTL: 24 hours
 
+        The event and its index updates are buffered and written together in
+        the next pipelined flush.
+
         Args:
             packet: Event packet to record
         """
@@ -61,21 +81,47 @@ class Tracer:
             await self.initialize()
 
         trace_id = packet.trace_id or "unknown"
-        timestamp = packet.timestamp or time.time()
+        score = packet.timestamp.timestamp() if packet.timestamp else time.time()
 
         # Create Redis key
-        key = f"trace:{trace_id}:event:{timestamp}"
+        key = f"trace:{trace_id}:event:{score}"
+        index_key = f"trace:{trace_id}:index"
 
         # Serialize packet
         data = json.dumps(packet.to_dict())
 
-        # Store with TTL
-        await self.redis_client.set(key, data, ex=self.TTL_SECONDS)
+        source = packet.source
 
-        # Also add to trace index (sorted set for ordering)
-        index_key = f"trace:{trace_id}:index"
-        await self.redis_client.zadd(index_key, {key: timestamp})
-        await self.redis_client.expire(index_key, self.TTL_SECONDS)
+        def write(pipe):
+            pipe.set(key, data, ex=self.TTL_SECONDS)
+
+            # Per-trace index (sorted set for ordering)
+            pipe.zadd(index_key, {key: score})
+            pipe.expire(index_key, self.TTL_SECONDS)
+
+            # Global recent index, trimmed by age and size
+            pipe.zadd(self.RECENT_INDEX_KEY, {key: score})
+            pipe.zremrangebyscore(self.RECENT_INDEX_KEY, "-inf", time.time() - self.TTL_SECONDS)
+            pipe.zremrangebyrank(self.RECENT_INDEX_KEY, 0, -(self.MAX_RECENT + 1))
+
+            if source and source != "system":
+                pipe.hset(self.MODULES_LAST_SEEN_KEY, source, score)
+
+        await self.writer.write(write)
+
+    async def _load_packets(self, keys: list[str]) -> list[Packet]:
+        """MGET event keys and parse them, skipping expired or malformed entries."""
+        if not keys:
+            return []
+
+        packets = []
+        for data in await self.redis_client.mget(keys):
+            if data:
+                try:
+                    packets.append(Packet.from_dict(json.loads(data)))
+                except (json.JSONDecodeError, Exception):
+                    pass
+        return packets
 
     async def get_trace(self, trace_id: str) -> list[Packet]:
         """
@@ -89,8 +135,9 @@ class Tracer:
         """
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
-        # Get all event keys for this trace
+        # Get all event keys for this trace (already in timestamp order)
         index_key = f"trace:{trace_id}:index"
         event_keys = await self.redis_client.zrange(index_key, 0, -1)
 
@@ -101,19 +148,10 @@ class Tracer:
             async for key in self.redis_client.scan_iter(match=pattern):
                 event_keys.append(key)
 
-        # Retrieve and parse events
-        packets = []
-        for key in event_keys:
-            data = await self.redis_client.get(key)
-            if data:
-                try:
-                    packet_dict = json.loads(data)
-                    packets.append(Packet.from_dict(packet_dict))
-                except (json.JSONDecodeError, Exception):
-                    pass
+        packets = await self._load_packets(event_keys)
 
         # Sort by timestamp
-        packets.sort(key=lambda p: p.timestamp or 0)
+        packets.sort(key=lambda p: p.timestamp)
 
         return packets
 
@@ -121,38 +159,33 @@ class Tracer:
         """
         Get list of modules that have been active in the last 5 minutes.
 
-        Scans recent events to identify active modules.
+        Reads the per-module last-seen hash (one entry per module).
 
         Returns:
             List of active module names
         """
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
-        # Current time and 5 minutes ago
         now = time.time()
-        five_min_ago = now - 300
-
-        active_modules = set()
-
-        # Scan for recent event keys
-        pattern = "trace:*:event:*"
-        async for key in self.redis_client.scan_iter(match=pattern):
-            # Extract timestamp from key
-            parts = key.split(":")
-            if len(parts) >= 4:
-                try:
-                    ts = float(parts[-1])
-                    if ts >= five_min_ago:
-                        # Get the event data
-                        data = await self.redis_client.get(key)
-                        if data:
-                            packet_dict = json.loads(data)
-                            source = packet_dict.get("source", "")
-                            if source and source != "system":
-                                active_modules.add(source)
-                except (ValueError, json.JSONDecodeError):
-                    pass
+        last_seen = await self.redis_client.hgetall(self.MODULES_LAST_SEEN_KEY)
+
+        active_modules = []
+        stale_modules = []
+        for module, ts in last_seen.items():
+            try:
+                seen_at = float(ts)
+            except ValueError:
+                stale_modules.append(module)
+                continue
+            if seen_at >= now - self.ACTIVE_WINDOW_SECONDS:
+                active_modules.append(module)
+            elif seen_at < now - self.TTL_SECONDS:
+                stale_modules.append(module)
+
+        if stale_modules:
+            await self.redis_client.hdel(self.MODULES_LAST_SEEN_KEY, *stale_modules)
 
         return sorted(active_modules)
 
@@ -164,30 +197,17 @@ class Tracer:
             limit: Maximum number of events to return
 
         Returns:
-            List of recent Packet objects
+            List of recent Packet objects (newest first)
         """
         if not self.redis_client:
             await self.initialize()
+        await self.writer.flush()
 
-        events = []
-        pattern = "trace:*:event:*"
-
-        async for key in self.redis_client.scan_iter(match=pattern):
-            data = await self.redis_client.get(key)
-            if data:
-                try:
-                    packet_dict = json.loads(data)
-                    events.append(Packet.from_dict(packet_dict))
-                except (json.JSONDecodeError, Exception):
-                    pass
-
-            if len(events) >= limit * 2:  # Get extra for sorting
-                break
-
-        # Sort by timestamp (newest first)
-        events.sort(key=lambda p: p.timestamp or 0, reverse=True)
+        if limit <= 0:
+            return []
 
-        return events[:limit]
+        event_keys = await self.redis_client.zrevrange(self.RECENT_INDEX_KEY, 0, limit - 1)
+        return await self._load_packets(event_keys)
 
 
 # Singleton instance
@@ -0,0 +1,175 @@
+"""
+GUTTERS Telemetry Write-Behind Buffer
+
+Takes observability writes (activity records, trace events) off the request
+path. Callers enqueue a record synchronously; a background task flushes the
+buffer to Redis in one pipelined round trip when ``batch_size`` records are
+waiting or every ``flush_interval`` seconds, whichever comes first.
+
+Memory is bounded: once ``max_size`` records are waiting, the oldest are
+dropped (and counted) rather than blocking callers.
+
+Example:
+    >>> buffer = WriteBehindBuffer("activity", lambda: redis_client)
+    >>> buffer.add(lambda pipe: pipe.set("key", "value", ex=60))
+    >>> await buffer.close()  # final flush on shutdown
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# A buffered record: applies its commands to a pipeline
+PipelineWrite = Callable[[Pipeline], Any]
+
+
+class WriteBehindBuffer:
+    """Bounded, batching write-behind queue for Redis pipeline writes."""
+
+    def __init__(
+        self,
+        name: str,
+        get_client: Callable[[], redis.Redis | None],
+        flush_interval: float | None = None,
+        batch_size: int | None = None,
+        max_size: int | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        self.name = name
+        self.get_client = get_client
+        self.flush_interval = flush_interval or settings.TELEMETRY_FLUSH_INTERVAL_MS / 1000
+        self.batch_size = batch_size or settings.TELEMETRY_FLUSH_BATCH_SIZE
+        self.max_size = max_size or settings.TELEMETRY_BUFFER_MAX_SIZE
+        self.enabled = settings.TELEMETRY_WRITE_BEHIND if enabled is None else enabled
+
+        self._buffer: deque[PipelineWrite] = deque(maxlen=self.max_size)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        # Metrics
+        self.enqueued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.flush_errors = 0
+
+    def add(self, write: PipelineWrite) -> None:
+        """
+        Enqueue a record without awaiting Redis.
+
+        Drops the oldest buffered record when full.
+        """
+        if len(self._buffer) == self.max_size:
+            self.dropped += 1
+        self._buffer.append(write)
+        self.enqueued += 1
+
+        self._ensure_task()
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def write(self, write: PipelineWrite) -> None:
+        """Enqueue a record, or write it immediately when write-behind is disabled."""
+        if self.enabled:
+            self.add(write)
+            return
+
+        client = self.get_client()
+        pipe = client.pipeline(transaction=False)
+        write(pipe)
+        await pipe.execute()
+
+    async def flush(self) -> int:
+        """
+        Write everything buffered in one pipeline.
+
+        Returns:
+            Number of records flushed
+        """
+        self._bind_loop()
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+
+            client = self.get_client()
+            if client is None:
+                return 0
+
+            batch = list(self._buffer)
+            self._buffer.clear()
+
+            pipe = client.pipeline(transaction=False)
+            for write in batch:
+                write(pipe)
+            try:
+                await pipe.execute()
+            except Exception as e:
+                self.flush_errors += 1
+                self.dropped += len(batch)
+                logger.warning(f"[WriteBehind:{self.name}] Flush of {len(batch)} records failed: {e}")
+                return 0
+
+            self.flushed += len(batch)
+            return len(batch)
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Recreate loop-bound primitives when used from a new event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        if loop is not self._loop:
+            self._loop = loop
+            self._flush_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._task = None
+        return loop
+
+    def _ensure_task(self) -> None:
+        loop = self._bind_loop()
+        if loop is None:
+            # No running loop: records are written on the next flush()
+            return
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "buffered": len(self._buffer),
+            "capacity": self.max_size,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "flush_errors": self.flush_errors,
+        }
@@ -0,0 +1,191 @@
+"""
+Auth fast path.
+
+Per-request auth used to cost three or four Postgres round trips: the token
+blacklist lookup, the user row, the tier row and the tier's rate-limit row.
+
+- Revoked tokens are mirrored into Redis (``auth:revoked:<digest>`` expiring
+  with the token). Once the mirror has been warmed from ``token_blacklist``
+  (marker key ``auth:revoked:warm``), a miss in Redis is authoritative, so
+  verifying a token is one Redis round trip. Without Redis, or before the
+  mirror is warm, the blacklist table is checked as before. A failed mirror
+  write drops the warm marker, so misses go back to the table until the
+  mirror is re-warmed.
+- User, tier and rate-limit rows are kept in short-TTL in-process caches,
+  invalidated on user update/delete, logout and tier/rate-limit changes.
+  Other processes converge within the TTL.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.logger import logging
+from ..config import settings
+from . import cache
+
+logger = logging.getLogger(__name__)
+
+REVOKED_KEY_PREFIX = "auth:revoked:"
+REVOKED_WARM_KEY = "auth:revoked:warm"
+REVOKED_WARM_TTL = 86400  # Re-read the blacklist table daily
+
+# Returned by TTLCache.get on a miss (None is a valid cached value)
+MISSING = object()
+
+
+def token_digest(token: str) -> str:
+    """Stable, fixed-size identifier for a token (tokens carry no jti claim)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TTLCache:
+    """Small in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class AuthCache:
+    def __init__(self) -> None:
+        self.enabled = settings.AUTH_CACHE_ENABLED
+        self.users = TTLCache(settings.AUTH_CACHE_USER_TTL, settings.AUTH_CACHE_MAX_ENTRIES)
+        self.tiers = TTLCache(settings.AUTH_CACHE_TIER_TTL, settings.AUTH_CACHE_MAX_ENTRIES)
+        self.rate_limits = TTLCache(settings.AUTH_CACHE_TIER_TTL, settings.AUTH_CACHE_MAX_ENTRIES)
+        self._warm_lock = asyncio.Lock()
+        # Set when a mirror write failed and the warm marker could not be dropped
+        self._mirror_stale = False
+
+    # -------------- revoked tokens --------------
+    async def is_revoked(self, token: str, db: AsyncSession) -> bool:
+        from ..db.crud_token_blacklist import crud_token_blacklist
+
+        if self.enabled and cache.client is not None:
+            try:
+                if self._mirror_stale:
+                    await self.invalidate_revocations()
+                pipe = cache.client.pipeline(transaction=False)
+                pipe.exists(REVOKED_KEY_PREFIX + token_digest(token))
+                pipe.exists(REVOKED_WARM_KEY)
+                revoked, warm = await pipe.execute()
+                if revoked:
+                    return True
+                if warm and not self._mirror_stale:
+                    return False
+                if not warm:
+                    await self.warm_revocations(db)
+            except Exception as e:
+                logger.warning(f"Revoked-token cache unavailable, checking database: {e}")
+
+        return bool(await crud_token_blacklist.exists(db, token=token))
+
+    async def revoke(self, token: str, exp_timestamp: float) -> None:
+        """Mirror a blacklisted token into Redis until its ``exp`` claim."""
+        if not self.enabled or cache.client is None:
+            return
+        ttl = int(exp_timestamp - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await cache.client.set(REVOKED_KEY_PREFIX + token_digest(token), 1, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Failed to mirror revoked token to cache: {e}")
+            await self.invalidate_revocations()
+
+    async def invalidate_revocations(self) -> None:
+        """Drop the warm marker so a Redis miss is no longer trusted."""
+        try:
+            await cache.client.delete(REVOKED_WARM_KEY)
+            self._mirror_stale = False
+        except Exception as e:
+            self._mirror_stale = True
+            logger.warning(f"Failed to drop revoked-token warm marker, checking database until it is: {e}")
+
+    async def warm_revocations(self, db: AsyncSession) -> None:
+        """Load every unexpired blacklist row into Redis, then set the warm marker."""
+        from ..db.token_blacklist import TokenBlacklist
+
+        async with self._warm_lock:
+            if await cache.client.exists(REVOKED_WARM_KEY):
+                return
+
+            # expires_at is stored as naive local time (datetime.fromtimestamp)
+            now = datetime.now()
+            result = await db.execute(
+                select(TokenBlacklist.token, TokenBlacklist.expires_at).where(TokenBlacklist.expires_at > now)
+            )
+            pipe = cache.client.pipeline(transaction=False)
+            for token, expires_at in result.all():
+                ttl = int((expires_at - now).total_seconds())
+                if ttl > 0:
+                    pipe.set(REVOKED_KEY_PREFIX + token_digest(token), 1, ex=ttl)
+            pipe.set(REVOKED_WARM_KEY, 1, ex=REVOKED_WARM_TTL)
+            await pipe.execute()
+
+    # -------------- users / tiers / rate limits --------------
+    def get_user(self, username_or_email: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        user = self.users.get(username_or_email)
+        return None if user is MISSING else dict(user)
+
+    def set_user(self, username_or_email: str, user: dict[str, Any]) -> None:
+        if self.enabled:
+            self.users.set(username_or_email, dict(user))
+
+    def invalidate_user(self, username_or_email: str) -> None:
+        """Drop a user's cached row, whether it was cached by username or email."""
+        stale = [
+            key
+            for key, (_, user) in self.users._data.items()
+            if username_or_email in (key, user.get("username"), user.get("email"))
+        ]
+        for key in stale:
+            self.users.pop(key)
+
+    def lookup(self, store: TTLCache, key: Any) -> Any:
+        """Cached value from ``store`` (``tiers``/``rate_limits``), or MISSING."""
+        return store.get(key) if self.enabled else MISSING
+
+    def remember(self, store: TTLCache, key: Any, value: Any) -> None:
+        if self.enabled:
+            store.set(key, value)
+
+    def invalidate_tiers(self) -> None:
+        """Drop cached tier and rate-limit rows."""
+        self.tiers.clear()
+        self.rate_limits.clear()
+
+
+auth_cache = AuthCache()
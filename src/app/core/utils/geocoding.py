@@ -8,16 +8,34 @@ coordinates can significantly affect house placements and ascendant.
 Uses:
 - Nominatim (OpenStreetMap) for geocoding (free, TOS: 1 req/sec)
 - TimezoneFinder for timezone resolution from coordinates
+
+Request handlers use the async ``GeocodingService`` (``get_geocoding_service()``):
+- Results are cached in Redis by normalized place name, so they are shared by
+  every process and survive restarts. Misses are cached for a shorter time.
+- Nominatim calls run in a thread behind an asyncio rate limiter. With Redis
+  the 1 req/sec slot is claimed in Redis, so the limit holds across processes.
+- TimezoneFinder lookups run in a thread and are memoized by coordinates.
+- ``GEOCODING_BACKEND=offline`` resolves from a built-in gazetteer (tests).
+
+The synchronous functions below remain for scripts.
 """
+import asyncio
+import json
 import logging
+import threading
 import time
+from collections.abc import Callable
 from functools import lru_cache
 from typing import Any
 
 from geopy.exc import GeocoderServiceError, GeocoderTimedOut
 from geopy.geocoders import Nominatim
+from redis.asyncio import Redis
 from timezonefinder import TimezoneFinder
 
+from ..config import GeocodingBackendOption, settings
+from . import cache
+
 logger = logging.getLogger(__name__)
 
 # Rate limiting: track last request time
@@ -26,6 +44,15 @@ _last_request_time: float = 0.0
 # Reusable geocoder and timezone finder instances
 _geocoder: Nominatim | None = None
 _timezone_finder: TimezoneFinder | None = None
+_timezone_finder_lock = threading.Lock()
+
+CACHE_KEY_PREFIX = "geocode:place:"
+RATE_LIMIT_KEY = "geocode:nominatim:slot"
+
+# Timezone memo granularity: 4 decimal places is ~11m
+COORD_PRECISION = 4
+
+_MISSING = object()
 
 
 def _get_geocoder() -> Nominatim:
@@ -43,10 +70,88 @@ def _get_timezone_finder() -> TimezoneFinder:
     """Get or create the TimezoneFinder instance."""
     global _timezone_finder
     if _timezone_finder is None:
-        _timezone_finder = TimezoneFinder()
+        with _timezone_finder_lock:
+            if _timezone_finder is None:
+                _timezone_finder = TimezoneFinder()
     return _timezone_finder
 
 
+@lru_cache(maxsize=4096)
+def _timezone_at(latitude: float, longitude: float) -> str | None:
+    """Memoized TimezoneFinder lookup (callers round the coordinates)."""
+    return _get_timezone_finder().timezone_at(lat=latitude, lng=longitude)
+
+
+def normalize_place(location_str: str) -> str:
+    """
+    Cache key form of a place name.
+
+    Example:
+        >>> normalize_place("  San Francisco ,CA,  USA. ")
+        'san francisco, ca, usa'
+    """
+    parts = (" ".join(part.split()).strip(" .") for part in location_str.lower().split(","))
+    return ", ".join(part for part in parts if part)
+
+
+class NominatimBackend:
+    """Blocking Nominatim client (run it in a thread)."""
+
+    rate_limited = True
+
+    def geocode(self, query: str) -> tuple[str, float, float] | None:
+        location = _get_geocoder().geocode(query, addressdetails=True)
+        if location is None:
+            return None
+        return location.address, float(location.latitude), float(location.longitude)
+
+    def reverse(self, latitude: float, longitude: float) -> str | None:
+        location = _get_geocoder().reverse((latitude, longitude), language="en")
+        return location.address if location is not None else None
+
+
+class OfflineGazetteer:
+    """
+    Network-free stand-in for Nominatim.
+
+    Resolves the first component of a place name (the city) against a small
+    fixed table of well-known places.
+    """
+
+    rate_limited = False
+
+    PLACES: dict[str, tuple[str, float, float]] = {
+        "san francisco": ("San Francisco, California, United States", 37.7749, -122.4194),
+        "los angeles": ("Los Angeles, California, United States", 34.0522, -118.2437),
+        "new york": ("New York, New York, United States", 40.7128, -74.0060),
+        "chicago": ("Chicago, Illinois, United States", 41.8781, -87.6298),
+        "london": ("London, England, United Kingdom", 51.5074, -0.1278),
+        "paris": ("Paris, Ile-de-France, France", 48.8566, 2.3522),
+        "berlin": ("Berlin, Germany", 52.5200, 13.4050),
+        "cairo": ("Cairo, Egypt", 30.0444, 31.2357),
+        "mumbai": ("Mumbai, Maharashtra, India", 19.0760, 72.8777),
+        "tokyo": ("Tokyo, Japan", 35.6762, 139.6503),
+        "sydney": ("Sydney, New South Wales, Australia", -33.8688, 151.2093),
+        "sao paulo": ("Sao Paulo, Brazil", -23.5505, -46.6333),
+    }
+
+    def geocode(self, query: str) -> tuple[str, float, float] | None:
+        city = normalize_place(query).split(",")[0]
+        return self.PLACES.get(city)
+
+    def reverse(self, latitude: float, longitude: float) -> str | None:
+        for address, lat, lng in self.PLACES.values():
+            if abs(lat - latitude) < 0.5 and abs(lng - longitude) < 0.5:
+                return address
+        return None
+
+
+def _get_backend() -> NominatimBackend | OfflineGazetteer:
+    if settings.GEOCODING_BACKEND == GeocodingBackendOption.OFFLINE:
+        return OfflineGazetteer()
+    return NominatimBackend()
+
+
 def _rate_limit() -> None:
     """
     Enforce Nominatim TOS rate limit (1 request per second).
@@ -84,8 +189,7 @@ def get_timezone_from_coords(latitude: float, longitude: float) -> str:
         >>> print(tz)
         'America/New_York'
     """
-    tf = _get_timezone_finder()
-    timezone = tf.timezone_at(lat=latitude, lng=longitude)
+    timezone = _timezone_at(round(latitude, COORD_PRECISION), round(longitude, COORD_PRECISION))
 
     if timezone is None:
         raise ValueError(
@@ -125,21 +229,21 @@ def geocode_location(location_str: str) -> dict[str, Any] | None:
         logger.warning("Empty location string provided")
         return None
 
-    geocoder = _get_geocoder()
+    backend = _get_backend()
 
     try:
         # Enforce rate limit
-        _rate_limit()
+        if backend.rate_limited:
+            _rate_limit()
 
         # Geocode the location
-        location = geocoder.geocode(location_str, addressdetails=True)
+        location = backend.geocode(location_str)
 
         if location is None:
             logger.warning(f"Could not geocode location: {location_str}")
             return None
 
-        latitude = float(location.latitude)
-        longitude = float(location.longitude)
+        address, latitude, longitude = location
 
         # Get timezone from coordinates
         try:
@@ -149,7 +253,7 @@ def geocode_location(location_str: str) -> dict[str, Any] | None:
             timezone = "UTC"  # Fallback
 
         result = {
-            "address": location.address,
+            "address": address,
             "latitude": latitude,
             "longitude": longitude,
             "timezone": timezone,
@@ -188,21 +292,22 @@ def reverse_geocode(latitude: float, longitude: float) -> str | None:
         >>> print(address)
         'San Francisco, California, USA'
     """
-    geocoder = _get_geocoder()
+    backend = _get_backend()
 
     try:
         # Enforce rate limit
-        _rate_limit()
+        if backend.rate_limited:
+            _rate_limit()
 
         # Reverse geocode
-        location = geocoder.reverse((latitude, longitude), language="en")
+        address = backend.reverse(latitude, longitude)
 
-        if location is None:
+        if address is None:
             logger.warning(f"Could not reverse geocode: {latitude}, {longitude}")
             return None
 
-        logger.info(f"Reverse geocoded {latitude:.4f}, {longitude:.4f} -> '{location.address}'")
-        return location.address
+        logger.info(f"Reverse geocoded {latitude:.4f}, {longitude:.4f} -> '{address}'")
+        return address
 
     except GeocoderTimedOut:
         logger.error(f"Reverse geocoding timed out for: {latitude}, {longitude}")
@@ -215,30 +320,167 @@ def reverse_geocode(latitude: float, longitude: float) -> str | None:
         return None
 
 
-@lru_cache(maxsize=256)
-def geocode_location_cached(location_str: str) -> tuple[str, float, float, str] | None:
+class AsyncRateLimiter:
     """
-    Cached version of geocode_location for frequently used locations.
+    Spaces calls at least ``interval`` seconds apart without blocking the loop.
 
-    Returns tuple instead of dict for hashability.
+    Callers in a process queue on an asyncio lock. When a Redis client is
+    given, each call also claims the slot with ``SET NX PX``, so every process
+    shares one budget.
+    """
 
-    Args:
-        location_str: Human-readable location
+    def __init__(self, interval: float, key: str = RATE_LIMIT_KEY) -> None:
+        self.interval = interval
+        self.key = key
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self, redis_client: Redis | None = None) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            delay = self._next_slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if redis_client is not None:
+                await self._claim_shared_slot(redis_client)
+            self._next_slot = time.monotonic() + self.interval
+
+    async def _claim_shared_slot(self, redis_client: Redis) -> None:
+        interval_ms = max(1, int(self.interval * 1000))
+        while True:
+            try:
+                if await redis_client.set(self.key, 1, nx=True, px=interval_ms):
+                    return
+                wait_ms = await redis_client.pttl(self.key)
+            except Exception as e:
+                logger.warning(f"[Geocoding] Shared rate limit unavailable, limiting per process: {e}")
+                return
+            await asyncio.sleep(max(wait_ms, 10) / 1000)
+
+
+class GeocodingService:
+    """Async geocoding with a shared Redis cache and non-blocking rate limiting."""
+
+    def __init__(
+        self,
+        backend: NominatimBackend | OfflineGazetteer | None = None,
+        get_client: Callable[[], Redis | None] | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+    ) -> None:
+        self.backend = backend or _get_backend()
+        self.get_client = get_client or (lambda: cache.client)
+        self.rate_limiter = rate_limiter or AsyncRateLimiter(settings.GEOCODING_MIN_INTERVAL_SECONDS)
+
+    async def geocode(self, location_str: str) -> dict[str, Any] | None:
+        """
+        Async equivalent of ``geocode_location``.
+
+        Returns:
+            Dict with address, latitude, longitude, timezone, or None if not found
+        """
+        if not location_str or not location_str.strip():
+            logger.warning("Empty location string provided")
+            return None
 
-    Returns:
-        Tuple of (address, latitude, longitude, timezone) or None
+        place = normalize_place(location_str)
+        cached = await self._cache_get(place)
+        if cached is not _MISSING:
+            return cached
+
+        try:
+            location = await self._call_backend(self.backend.geocode, location_str.strip())
+        except GeocoderTimedOut:
+            logger.error(f"Geocoding timed out for: {location_str}")
+            return None
+        except GeocoderServiceError as e:
+            logger.error(f"Geocoding service error for '{location_str}': {e}")
+            return None
+        except Exception as e:
+            logger.exception(f"Unexpected error geocoding '{location_str}': {e}")
+            return None
+
+        if location is None:
+            logger.warning(f"Could not geocode location: {location_str}")
+            await self._cache_set(place, None, settings.GEOCODING_NEGATIVE_CACHE_TTL)
+            return None
+
+        address, latitude, longitude = location
+        timezone = await self.timezone_at(latitude, longitude)
+        if timezone is None:
+            logger.warning(f"Could not determine timezone for coordinates: {latitude}, {longitude}")
+            timezone = "UTC"  # Fallback
+
+        result = {
+            "address": address,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone,
+        }
+        await self._cache_set(place, result, settings.GEOCODING_CACHE_TTL)
+
+        logger.info(f"Geocoded '{location_str}' -> {latitude:.4f}, {longitude:.4f} ({timezone})")
+        return result
+
+    async def reverse(self, latitude: float, longitude: float) -> str | None:
+        """Async equivalent of ``reverse_geocode``."""
+        try:
+            address = await self._call_backend(self.backend.reverse, latitude, longitude)
+        except (GeocoderTimedOut, GeocoderServiceError) as e:
+            logger.error(f"Reverse geocoding failed for {latitude}, {longitude}: {e}")
+            return None
+        except Exception as e:
+            logger.exception(f"Unexpected error reverse geocoding: {e}")
+            return None
+
+        if address is None:
+            logger.warning(f"Could not reverse geocode: {latitude}, {longitude}")
+        return address
+
+    async def timezone_at(self, latitude: float, longitude: float) -> str | None:
+        """IANA timezone for coordinates, resolved in a thread and memoized."""
+        return await asyncio.to_thread(
+            _timezone_at, round(latitude, COORD_PRECISION), round(longitude, COORD_PRECISION)
+        )
+
+    async def _call_backend(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.backend.rate_limited:
+            await self.rate_limiter.acquire(self.get_client())
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def _cache_get(self, place: str) -> Any:
+        client = self.get_client()
+        if client is None:
+            return _MISSING
+        try:
+            data = await client.get(CACHE_KEY_PREFIX + place)
+        except Exception as e:
+            logger.warning(f"[Geocoding] Cache read failed: {e}")
+            return _MISSING
+        return _MISSING if data is None else json.loads(data)
+
+    async def _cache_set(self, place: str, result: dict[str, Any] | None, ttl: int) -> None:
+        client = self.get_client()
+        if client is None:
+            return
+        try:
+            await client.set(CACHE_KEY_PREFIX + place, json.dumps(result), ex=ttl)
+        except Exception as e:
+            logger.warning(f"[Geocoding] Cache write failed: {e}")
+
+
+# Singleton instance
+_geocoding_service: GeocodingService | None = None
 
-    Example:
-        >>> result = geocode_location_cached("Tokyo, Japan")
-        >>> address, lat, lon, tz = result
-    """
-    result = geocode_location(location_str)
-    if result is None:
-        return None
 
-    return (
-        result["address"],
-        result["latitude"],
-        result["longitude"],
-        result["timezone"],
-    )
+def get_geocoding_service() -> GeocodingService:
+    """Get the singleton GeocodingService instance."""
+    global _geocoding_service
+    if _geocoding_service is None:
+        _geocoding_service = GeocodingService()
+    return _geocoding_service
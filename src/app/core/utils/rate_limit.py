@@ -1,14 +1,125 @@
+import math
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Optional
 
 from redis.asyncio import ConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.config import RateLimitAlgorithmOption, settings
 from ...core.logger import logging
 from ...schemas.rate_limit import sanitize_path
 
 logger = logging.getLogger(__name__)
 
+# Each script checks and charges a request in one atomic round trip and returns
+# {allowed, remaining, reset_after_ms, retry_after_ms}.
+
+# Fixed window: INCRBY + EXPIRE (no un-expiring key if the caller dies in between)
+_FIXED_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[2])
+local current = redis.call('INCRBY', KEYS[1], ARGV[3])
+if redis.call('PTTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if current > limit then
+    return {0, 0, ttl, ttl}
+end
+return {1, limit - current, ttl, 0}
+"""
+
+# Sliding window counter: the previous window's count is weighted by how much of
+# it still overlaps the sliding period. Windows are aligned to Redis server time.
+_SLIDING_WINDOW_SCRIPT = """
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local window = math.floor(now / period)
+local current_key = KEYS[1] .. ':' .. window
+local current = tonumber(redis.call('GET', current_key) or '0')
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (window - 1)) or '0')
+local elapsed = now - window * period
+local used = previous * (period - elapsed) / period + current
+local reset_after = math.ceil((period - elapsed) * 1000)
+if used + cost > limit then
+    local retry_after = reset_after
+    if current + cost <= limit and previous > 0 then
+        retry_after = math.min(retry_after, math.ceil((used + cost - limit) * period / previous * 1000))
+    end
+    return {0, math.max(0, math.floor(limit - used)), reset_after, retry_after}
+end
+redis.call('INCRBY', current_key, cost)
+redis.call('EXPIRE', current_key, period * 2)
+return {1, math.max(0, math.floor(limit - used - cost)), reset_after, 0}
+"""
+
+# Token bucket: ``limit`` tokens refilled continuously over ``period`` seconds,
+# stored as a hash {tokens, ts} that expires once the bucket would be full again.
+_TOKEN_BUCKET_SCRIPT = """
+local period_ms = tonumber(ARGV[1]) * 1000
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = capacity / period_ms
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+local reset_after = math.ceil((capacity - tokens) / rate)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], reset_after + 1000)
+return {allowed, math.floor(tokens), reset_after, retry_after}
+"""
+
+_SCRIPTS = {
+    RateLimitAlgorithmOption.FIXED_WINDOW: _FIXED_WINDOW_SCRIPT,
+    RateLimitAlgorithmOption.SLIDING_WINDOW: _SLIDING_WINDOW_SCRIPT,
+    RateLimitAlgorithmOption.TOKEN_BUCKET: _TOKEN_BUCKET_SCRIPT,
+}
+
+
+def route_cost(path: str) -> int:
+    """Quota units charged for a request to ``path`` (sanitized or raw)."""
+    return settings.RATE_LIMIT_ROUTE_COSTS.get(sanitize_path(path), 1)
+
+
+def default_limit(path: str) -> tuple[int, int]:
+    """(limit, period) for ``path`` when the caller's tier has no rate limit row for it."""
+    limit = settings.RATE_LIMIT_ROUTE_DEFAULT_LIMITS.get(sanitize_path(path), settings.DEFAULT_RATE_LIMIT_LIMIT)
+    return limit, settings.DEFAULT_RATE_LIMIT_PERIOD
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: int  # seconds until the quota is fully available again
+    retry_after: int  # seconds until this request would be allowed (0 when allowed)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_after),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
 
 class RateLimiter:
     _instance: Optional["RateLimiter"] = None
@@ -35,27 +146,50 @@ class RateLimiter:
             raise Exception("Redis client is not initialized.")
         return instance.client
 
-    async def is_rate_limited(self, db: AsyncSession, user_id: int, path: str, limit: int, period: int) -> bool:
+    async def check(
+        self,
+        user_id: int | str,
+        path: str,
+        limit: int,
+        period: int,
+        cost: int = 1,
+        algorithm: RateLimitAlgorithmOption | None = None,
+    ) -> RateLimitResult:
+        """
+        Charge ``cost`` units against a user's quota for ``path``.
+
+        Denied requests are not charged, except under the fixed window, which
+        counts every attempt as before.
+        """
         client = self.get_client()
-        current_timestamp = int(datetime.now(UTC).timestamp())
-        window_start = current_timestamp - (current_timestamp % period)
+        algorithm = RateLimitAlgorithmOption(algorithm or settings.DEFAULT_RATE_LIMIT_ALGORITHM)
 
         sanitized_path = sanitize_path(path)
-        key = f"ratelimit:{user_id}:{sanitized_path}:{window_start}"
+        key = f"ratelimit:{algorithm.value}:{user_id}:{sanitized_path}"
+        if algorithm == RateLimitAlgorithmOption.FIXED_WINDOW:
+            current_timestamp = int(datetime.now(UTC).timestamp())
+            window_start = current_timestamp - (current_timestamp % period)
+            key = f"ratelimit:{user_id}:{sanitized_path}:{window_start}"
 
         try:
-            current_count = await client.incr(key)
-            if current_count == 1:
-                await client.expire(key, period)
-
-            if current_count > limit:
-                return True
-
+            allowed, remaining, reset_after_ms, retry_after_ms = await client.eval(
+                _SCRIPTS[algorithm], 1, key, period, limit, cost
+            )
         except Exception as e:
             logger.exception(f"Error checking rate limit for user {user_id} on path {path}: {e}")
             raise e
 
-        return False
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=int(remaining),
+            reset_after=math.ceil(int(reset_after_ms) / 1000),
+            retry_after=math.ceil(int(retry_after_ms) / 1000),
+        )
+
+    async def is_rate_limited(self, db: AsyncSession, user_id: int, path: str, limit: int, period: int) -> bool:
+        result = await self.check(user_id=user_id, path=path, limit=limit, period=period)
+        return not result.allowed
 
 
 rate_limiter = RateLimiter()
@@ -58,12 +58,44 @@ async def synthesize_profile_job(ctx: Worker, user_id: int, model_id: str | None
             }
 
 
+async def synthesis_batch_job(ctx: Worker, user_id: int) -> dict:
+    """
+    Background job: Run a user's coalesced synthesis batch.
+
+    Enqueued by SynthesisOrchestrator with a per-batch job id and deferred by
+    the debounce window; all triggers that arrived meanwhile share this run.
+    """
+    from src.app.core.memory import get_orchestrator
+
+    orchestrator = await get_orchestrator()
+    synthesis = await orchestrator.run_pending_synthesis(user_id)
+
+    return {"status": "complete" if synthesis else "coalesced", "user_id": user_id}
+
+
 # -------- base functions --------
 async def startup(ctx: Worker) -> None:
+    from src.app.core.ai.gateway import LLMPriority, get_llm_gateway
+    from src.app.modules.tracking.skyfield_ephemeris import get_skyfield_ephemeris
+
+    # Worker LLM calls queue behind interactive chat
+    get_llm_gateway().default_priority = LLMPriority.BACKGROUND
+
+    # Map the JPL kernel once before tracking jobs run
+    await asyncio.to_thread(get_skyfield_ephemeris().warm_up)
     logging.info("Worker Started")
 
 
 async def shutdown(ctx: Worker) -> None:
+    from src.app.core.activity.logger import get_activity_logger
+    from src.app.core.ai.gateway import get_llm_gateway
+    from src.app.core.telemetry.tracer import get_tracer
+
+    # Flush trace and activity records buffered by jobs
+    await get_tracer().cleanup()
+    await get_activity_logger().cleanup()
+
+    await get_llm_gateway().close()
     logging.info("Worker end")
 
 
@@ -171,11 +203,13 @@ async def observer_analysis_job(ctx: Worker) -> None:
 
     from src.app.core.db.database import async_session
     from src.app.models.user import User
+    from src.app.modules.intelligence.observer.feed import IntelligenceFeedStore
     from src.app.modules.intelligence.observer.observer import Observer
     from src.app.modules.intelligence.observer.storage import ObserverFindingStorage
 
     observer = Observer()
     storage = ObserverFindingStorage()
+    feed_store = IntelligenceFeedStore()
 
     try:
         async with async_session() as db:
@@ -196,6 +230,9 @@ async def observer_analysis_job(ctx: Worker) -> None:
                     for finding in all_findings:
                         await storage.store_finding(user.id, finding, db)
 
+                    # Materialize the dashboard intelligence feed
+                    await feed_store.store(user.id, solar_findings + lunar_findings + time_findings)
+
                     logging.info(f"[Observer] Analyzed user {user.id}: {len(all_findings)} findings")
 
                 except Exception as e:
@@ -206,6 +243,23 @@ async def observer_analysis_job(ctx: Worker) -> None:
         traceback.print_exc()
 
 
+async def refresh_intelligence_feed_job(ctx: Worker, user_id: int) -> int:
+    """
+    Background job: Recompute one user's dashboard intelligence feed.
+
+    Enqueued (debounced) after new journal entries, or when a user opens the
+    dashboard before the nightly observer job has produced a feed.
+    """
+    from src.app.core.db.database import local_session
+    from src.app.modules.intelligence.observer.feed import IntelligenceFeedStore
+
+    async with local_session() as db:
+        count = await IntelligenceFeedStore().rebuild(user_id, db)
+
+    logging.info(f"[Observer] Refreshed intelligence feed for user {user_id}: {count} patterns")
+    return count
+
+
 async def generate_hypotheses_job(ctx: Worker) -> None:
     """
     Background job: Generate theories from Observer patterns.
@@ -277,9 +331,13 @@ async def populate_embeddings_job(ctx: Worker) -> None:
     from src.app.models.embedding import Embedding
     from src.app.models.user import User
     from src.app.models.user_profile import UserProfile
+    from src.app.modules.features.journal.store import JournalStore, entry_to_dict
+    from src.app.modules.intelligence.hypothesis.storage import HypothesisStorage
     from src.app.modules.intelligence.vector.embedding_service import EmbeddingService
 
     service = EmbeddingService(settings.OPENROUTER_API_KEY.get_secret_value())
+    hypothesis_storage = HypothesisStorage()
+    journal_store = JournalStore()
 
     try:
         async with local_session() as db:
@@ -298,8 +356,8 @@ async def populate_embeddings_job(ctx: Worker) -> None:
                     embeddings_created = 0
 
                     # 1. JOURNAL ENTRIES
-                    journal_entries = profile.data.get("journal_entries", [])
-                    for entry in journal_entries:
+                    journal_entries = await journal_store.get_entries(user.id, db)
+                    for entry in map(entry_to_dict, journal_entries):
                         # Check if already embedded
                         entry_id = entry.get("id")
                         if not entry_id:
@@ -350,8 +408,8 @@ async def populate_embeddings_job(ctx: Worker) -> None:
                         embeddings_created += 1
 
                     # 3. HYPOTHESES
-                    hypotheses = profile.data.get("hypotheses", [])
-                    for hypothesis in hypotheses:
+                    hypotheses = await hypothesis_storage.get_hypotheses(user.id, db=db)
+                    for hypothesis in (h.model_dump(mode="json") for h in hypotheses):
                         hyp_id = hypothesis.get("id")
                         if not hyp_id:
                             continue
@@ -16,9 +16,11 @@ from .functions import (
     on_job_end,
     on_job_start,
     populate_embeddings_job,
+    refresh_intelligence_feed_job,
     sample_background_task,
     shutdown,
     startup,
+    synthesis_batch_job,
     synthesize_profile_job,
     update_lunar_tracking_job,
     update_solar_tracking_job,
@@ -34,11 +36,13 @@ class WorkerSettings:
     functions = [
         sample_background_task,
         synthesize_profile_job,
+        synthesis_batch_job,
         update_solar_tracking_job,
         update_lunar_tracking_job,
         update_lunar_tracking_job,
         update_transit_tracking_job,
         observer_analysis_job,
+        refresh_intelligence_feed_job,
         generate_hypotheses_job,
         populate_embeddings_job,
         daily_chronos_update_job,
@@ -4,9 +4,10 @@ from src.app.modules.intelligence.oracle.models import OracleReading
 from .chat_session import ChatMessage, ChatSession
 from .cosmic_conditions import CosmicConditions
 from .embedding import Embedding
+from .hypothesis import HypothesisConfidenceSnapshot, HypothesisEvidence, HypothesisRecord
 from .insight import JournalEntry, ReflectionPrompt
 from .post import Post
-from .progression import PlayerStats
+from .progression import ExperienceEvent, PlayerStats
 from .rate_limit import RateLimit
 from .system_configuration import SystemConfiguration
 from .tier import Tier
@@ -27,7 +28,11 @@ __all__ = [
     "ReflectionPrompt",
     "JournalEntry",
     "PlayerStats",
+    "ExperienceEvent",
     "Quest",
     "QuestLog",
     "OracleReading",
+    "HypothesisRecord",
+    "HypothesisEvidence",
+    "HypothesisConfidenceSnapshot",
 ]
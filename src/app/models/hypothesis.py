@@ -0,0 +1,84 @@
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.db.database import Base
+
+
+class HypothesisRecord(Base):
+    """
+    A theory hypothesis (see modules.intelligence.hypothesis.models.Hypothesis).
+
+    Filterable fields are columns; the remaining model fields live in
+    ``attributes``. Evidence and confidence history are child tables so an
+    update only touches the rows that changed.
+    """
+
+    __tablename__ = "hypotheses"
+    __table_args__ = (Index("ix_hypotheses_user_status_confidence", "user_id", "status", "confidence"),)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
+
+    hypothesis_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    claim: Mapped[str] = mapped_column(Text, nullable=False)
+    predicted_value: Mapped[str] = mapped_column(Text, nullable=False)
+
+    confidence: Mapped[float] = mapped_column(Float, default=0.0)
+    status: Mapped[str] = mapped_column(String(20), default="forming")
+    evidence_count: Mapped[int] = mapped_column(Integer, default=0)
+    contradictions: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Remaining Hypothesis fields (correlations, temporal context, breakdown, ...)
+    attributes: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    last_updated: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    last_evidence_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class HypothesisEvidence(Base):
+    """
+    One weighted evidence record of a hypothesis.
+
+    The record is immutable apart from its recency-adjusted weights, which are
+    columns so a recalculation can update them without rewriting ``record``.
+    """
+
+    __tablename__ = "hypothesis_evidence"
+    __table_args__ = (Index("ix_hypothesis_evidence_hypothesis_position", "hypothesis_id", "position"),)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    hypothesis_id: Mapped[str] = mapped_column(ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    evidence_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    is_contradiction: Mapped[bool] = mapped_column(Boolean, default=False)
+    recency_multiplier: Mapped[float] = mapped_column(Float, default=1.0)
+    effective_weight: Mapped[float] = mapped_column(Float, default=0.0)
+
+    # Serialized EvidenceRecord without the weight columns above
+    record: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class HypothesisConfidenceSnapshot(Base):
+    """Point-in-time confidence snapshot of a hypothesis (append-only)."""
+
+    __tablename__ = "hypothesis_confidence_snapshots"
+    __table_args__ = (
+        Index("ix_hypothesis_confidence_snapshots_hypothesis_recorded", "hypothesis_id", "recorded_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    hypothesis_id: Mapped[str] = mapped_column(ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False)
+
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    # Serialized ConfidenceSnapshot
+    snapshot: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
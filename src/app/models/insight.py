@@ -1,8 +1,10 @@
+import uuid
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any, Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.core.db.database import Base
@@ -61,16 +63,31 @@ class JournalEntry(Base):
     """
     User journal entries.
     Now a proper SQL model instead of UserProfile JSON.
+
+    The single journal store: read and written through
+    modules/features/journal/store.py (JournalStore).
     """
 
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        Index("ix_journal_entries_user_created", "user_id", "created_at", "id"),
+        Index("ix_journal_entries_tags", "tags", postgresql_using="gin"),
+        Index("ix_journal_entries_symptoms", "symptoms", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
 
+    # Stable public ID (embeddings, events); legacy profile entries keep theirs
+    entry_uuid: Mapped[str] = mapped_column(String(36), unique=True, default=lambda: str(uuid.uuid4()))
+
     content: Mapped[str] = mapped_column(Text, nullable=False)
     mood_score: Mapped[int] = mapped_column(Integer, nullable=True)  # 1-10
-    tags: Mapped[Optional[list[str]]] = mapped_column(JSON, default=list)
+    energy_score: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 1-10
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, default=list)
+    themes: Mapped[Optional[list[str]]] = mapped_column(JSONB, default=list)
+    # Symptom labels matched from content and tags when written (NULL: not computed yet)
+    symptoms: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
 
     # Link to the prompt if this was a response
     prompt_id: Mapped[Optional[int]] = mapped_column(ForeignKey("reflection_prompts.id"), nullable=True)
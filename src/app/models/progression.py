@@ -1,11 +1,44 @@
+import math
+from bisect import bisect_right
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.core.db.database import Base
 
+MAX_LEVEL = 100
+
+
+def level_threshold(level: int) -> int:
+    """Total XP that completes ``level``: XP = Level * 1000 * 1.5^(Level-1)"""
+    return int(level * 1000 * math.pow(1.5, level - 1))
+
+
+# LEVEL_THRESHOLDS[i] completes level i + 1
+LEVEL_THRESHOLDS = tuple(level_threshold(level) for level in range(1, MAX_LEVEL + 1))
+
+
+def level_for_experience(experience_points: int) -> int:
+    """Level reached with ``experience_points`` total XP (bisect over the thresholds)."""
+    return min(bisect_right(LEVEL_THRESHOLDS, experience_points or 0) + 1, MAX_LEVEL)
+
+
+def rank_for_level(level: int) -> str:
+    """Derives rank from level."""
+    if level >= 51:
+        return "S"
+    if level >= 41:
+        return "A"
+    if level >= 31:
+        return "B"
+    if level >= 21:
+        return "C"
+    if level >= 11:
+        return "D"
+    return "E"
+
 
 class PlayerStats(Base):
     """
@@ -26,11 +59,13 @@ class PlayerStats(Base):
 
     streak_count: Mapped[int] = mapped_column(Integer, default=0)
 
-    # Stores last 7 days of raw sync scores for WMA calculation
+    # Stores last 7 days of raw sync scores for WMA calculation (XP gains live in experience_events)
     # Format: [{"date": "2026-01-26", "score": 0.8}, ...]
     sync_history: Mapped[list[dict]] = mapped_column(JSONB, default=list)
 
     last_reset_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    # UTC instant of the user's next local midnight; daily_reset_job selects on it
+    next_reset_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), onupdate=lambda: datetime.now(UTC), default=lambda: datetime.now(UTC)
@@ -41,22 +76,46 @@ class PlayerStats(Base):
     @property
     def rank(self) -> str:
         """Derives rank from level."""
-        if self.level >= 51:
-            return "S"
-        if self.level >= 41:
-            return "A"
-        if self.level >= 31:
-            return "B"
-        if self.level >= 21:
-            return "C"
-        if self.level >= 11:
-            return "D"
-        return "E"
+        return rank_for_level(self.level)
 
     @property
     def xp_to_next_level(self) -> int:
         """Threshold formula: XP = Level * 1000 * 1.5^(Level-1)"""
-        import math
+        return max(0, level_threshold(self.level) - self.experience_points)
+
+
+class ExperienceEvent(Base):
+    """
+    Append-only XP ledger.
+
+    One row per experience gain. PlayerStats.experience_points is the running
+    sum of this table, incremented atomically; total_after/level_after record
+    the running values right after the event, so progression history is read
+    from here instead of being copied into JSON.
+    """
+
+    __tablename__ = "experience_events"
+    __table_args__ = (Index("ix_experience_events_user_created", "user_id", "created_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
+
+    amount: Mapped[int] = mapped_column(Integer)
+    reason: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str] = mapped_column(String(30))
+    source: Mapped[str | None] = mapped_column(String(50), default=None)
+    details: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    total_after: Mapped[int] = mapped_column(Integer)
+    level_after: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
 
-        threshold = int(self.level * 1000 * math.pow(1.5, self.level - 1))
-        return max(0, threshold - self.experience_points)
+    def to_history_entry(self) -> dict:
+        return {
+            "timestamp": self.created_at.isoformat(),
+            "amount": self.amount,
+            "reason": self.reason,
+            "category": self.category,
+            "new_total": self.total_after,
+            "level": self.level_after,
+        }
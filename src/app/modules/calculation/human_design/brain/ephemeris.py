@@ -16,6 +16,8 @@ from datetime import datetime
 
 import swisseph as swe
 
+from src.app.modules.tracking.ephemeris_grid import get_ephemeris_grid
+
 from . import constants
 
 
@@ -109,6 +111,10 @@ class EphemerisCalculator:
         - Earth: Opposite Sun (Sun + 180°)
         - South Node: Opposite North Node (North + 180°)
 
+        Dates inside the precomputed ephemeris grid window are interpolated
+        from the grid; anything else (e.g. historical births) goes straight
+        to Swiss Ephemeris.
+
         Args:
             jd: Julian date
             planet_name: Planet name (Sun, Moon, Mercury, etc.)
@@ -121,21 +127,20 @@ class EphemerisCalculator:
         if planet_code is None:
             raise ValueError(f"Unknown planet: {planet_name}")
 
+        grid = get_ephemeris_grid()
+
         # Handle derived positions
         if planet_name == "Earth":
             # Earth is opposite Sun
-            sun_result = swe.calc_ut(jd, swe.SUN)
-            return (sun_result[0][0] + 180) % 360
+            return (grid.calc_ut(jd, swe.SUN)[0] + 180) % 360
 
         elif planet_name == "South_Node":
             # South Node is opposite North Node
-            north_result = swe.calc_ut(jd, swe.TRUE_NODE)
-            return (north_result[0][0] + 180) % 360
+            return (grid.calc_ut(jd, swe.TRUE_NODE)[0] + 180) % 360
 
         else:
             # Regular planet calculation
-            result = swe.calc_ut(jd, planet_code)
-            return result[0][0]
+            return grid.calc_ut(jd, planet_code)[0]
 
     def longitude_to_gate(self, longitude: float) -> tuple[int, int]:
         """
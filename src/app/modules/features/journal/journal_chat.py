@@ -5,17 +5,14 @@ Focused conversational interface for creating journal entries.
 """
 
 import json
-import uuid
-from datetime import UTC, datetime
 from typing import Any, Dict, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.llm.config import LLMTier, get_standard_llm
-from src.app.models.user_profile import UserProfile
 from src.app.modules.features.chat.session_manager import SessionManager
+from src.app.modules.features.journal.store import JournalStore
 
 
 class JournalChatHandler:
@@ -40,7 +37,7 @@ class JournalChatHandler:
         2. Add user message
         3. Analyze if message is a journal entry (LLM + Heuristic Fallback)
         4. If entry: Extract structured data (mood, tags, themes)
-        5. Store entry in UserProfile.data['journal_entries']
+        5. Store entry in the journal store
         6. Generate empathetic response
         7. Return response
         """
@@ -157,11 +154,7 @@ If NOT a journal entry (question, request), set is_entry to false."""
             return False, None
 
     async def _store_journal_entry(self, user_id: int, text: str, structured_data: Dict, db: AsyncSession) -> str:
-        """Store journal entry in UserProfile.data['journal_entries']."""
-        # Get profile
-        result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
-        profile = result.scalar_one()
-
+        """Store journal entry in the journal store."""
         # Inject Magi chronos context
         context_snapshot = {}
         try:
@@ -187,34 +180,20 @@ If NOT a journal entry (question, request), set is_entry to false."""
             print(f"[JournalChat] Failed to inject magi context: {e}")
 
         # Create entry
-        entry_id = str(uuid.uuid4())
-        entry = {
-            "id": entry_id,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "text": text,
-            "mood_score": structured_data.get("mood_score", 5),
-            "energy_score": structured_data.get("energy_score", 5),
-            "tags": structured_data.get("tags", []),
-            "themes": structured_data.get("themes", []),
-            "context_snapshot": context_snapshot,
-        }
-
-        # Add to journal_entries
-        # We need to deep copy the existing data, modify it, and reassign to trigger SQLAlchemy detection
-        data = dict(profile.data)
-        if "journal_entries" not in data:
-            data["journal_entries"] = []
-
-        data["journal_entries"].append(entry)
-        profile.data = data
-
-        from sqlalchemy.orm.attributes import flag_modified
-
-        flag_modified(profile, "data")
+        entry = await JournalStore().add_entry(
+            user_id,
+            text,
+            db,
+            mood_score=structured_data.get("mood_score", 5),
+            energy_score=structured_data.get("energy_score", 5),
+            tags=structured_data.get("tags", []),
+            themes=structured_data.get("themes", []),
+            context_snapshot=context_snapshot,
+        )
 
         await db.commit()
 
-        return entry_id
+        return entry.entry_uuid
 
     async def _generate_entry_response(self, text: str, structured: Dict) -> str:
         """Generate empathetic response to journal entry."""
@@ -0,0 +1,318 @@
+"""
+Journal store.
+
+The journal_entries table is the single home of journal content. Entries
+carry precomputed mood/energy/symptom columns and are read in keyset pages
+over (user_id, created_at, id), so reads never load the user profile.
+
+Older entries lived in UserProfile.data['journal_entries']. Until
+backfill() has moved a user's list into the table (the scheduler runs it in
+batches on worker startup), reads also pick those entries up through a
+single-key JSONB lookup. JOURNAL_LEGACY_READS=false turns that off once the
+backfill is done.
+"""
+
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+from src.app.models.insight import JournalEntry, JournalSource
+from src.app.models.user_profile import UserProfile
+from src.app.modules.intelligence.matching import match_entry, register_vocabulary
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 500
+LEGACY_KEY = "journal_entries"
+BACKFILL_COLUMNS = (
+    "user_id", "entry_uuid", "content", "mood_score", "energy_score", "tags", "themes", "symptoms",
+    "context_snapshot", "source", "created_at", "updated_at",
+)
+
+# Symptoms precomputed into journal_entries.symptoms (matched as written or spaced)
+JOURNAL_SYMPTOMS = [
+    "headache", "migraine", "anxiety", "fatigue", "insomnia",
+    "irritability", "brain_fog", "low_energy", "restlessness",
+    "stress", "overwhelm", "mood_low", "motivation_low",
+]
+SYMPTOM_VOCABULARY = "journal.symptoms"
+register_vocabulary(SYMPTOM_VOCABULARY, {s: {s, s.replace("_", " ")} for s in JOURNAL_SYMPTOMS})
+
+
+def journal_symptoms(content: str | None, tags: list[str] | None, entry_id: Any = None) -> list[str]:
+    """Symptoms mentioned in an entry's content or tags (one cached scan)."""
+    text = "\n".join([content or "", *(tags or [])])
+    return match_entry(entry_id, text).labels(SYMPTOM_VOCABULARY)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    elif value:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            parsed = datetime.now(UTC)
+    else:
+        parsed = datetime.now(UTC)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def entry_from_legacy(user_id: int, data: dict[str, Any]) -> JournalEntry:
+    """Build a (transient) JournalEntry from a UserProfile.data['journal_entries'] item."""
+    content = data.get("text") or data.get("content") or ""
+    tags = list(data.get("tags") or [])
+    scores = data.get("scores") or {}
+    created_at = _parse_timestamp(data.get("timestamp") or data.get("date"))
+
+    entry = JournalEntry(
+        user_id=user_id,
+        content=content,
+        mood_score=data.get("mood_score", scores.get("mood")),
+        energy_score=data.get("energy_score", scores.get("energy")),
+        tags=tags,
+        themes=list(data.get("themes") or []),
+        symptoms=journal_symptoms(content, tags, data.get("id")),
+        context_snapshot=data.get("context_snapshot") or ({"scores": scores} if scores else None),
+        source=data.get("source") or JournalSource.USER,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    # Entries without an ID get a deterministic one, so repeated reads agree
+    entry.entry_uuid = str(data.get("id") or uuid.uuid5(uuid.NAMESPACE_OID, f"{user_id}:{created_at}:{content}"))
+    return entry
+
+
+def entry_to_dict(entry: JournalEntry) -> dict[str, Any]:
+    """The entry in the shape UserProfile.data['journal_entries'] items had."""
+    return {
+        "id": entry.entry_uuid,
+        "timestamp": entry.created_at.isoformat(),
+        "text": entry.content,
+        "mood_score": entry.mood_score,
+        "energy_score": entry.energy_score,
+        "tags": entry.tags or [],
+        "themes": entry.themes or [],
+        "symptoms": entry.symptoms or [],
+        "context_snapshot": entry.context_snapshot or {},
+        "source": getattr(entry.source, "value", entry.source),
+    }
+
+
+class JournalStore:
+    """Reads and writes journal entries."""
+
+    async def add_entry(
+        self,
+        user_id: int,
+        content: str,
+        db: AsyncSession,
+        mood_score: Optional[int] = None,
+        energy_score: Optional[int] = None,
+        tags: Optional[list[str]] = None,
+        themes: Optional[list[str]] = None,
+        context_snapshot: Optional[dict[str, Any]] = None,
+        source: str = JournalSource.USER,
+        prompt_id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+    ) -> JournalEntry:
+        """
+        Add an entry with its symptom labels precomputed (caller commits).
+
+        Also schedules the debounced intelligence feed refresh, so every
+        write path (journal API, chat, journal chat) keeps the feed current.
+
+        Returns:
+            The flushed entry (id and entry_uuid assigned)
+        """
+        tags = list(tags or [])
+        entry = JournalEntry(
+            user_id=user_id,
+            content=content,
+            mood_score=mood_score,
+            energy_score=energy_score,
+            tags=tags,
+            themes=list(themes or []),
+            symptoms=journal_symptoms(content, tags),
+            context_snapshot=context_snapshot,
+            source=source,
+            prompt_id=prompt_id,
+            created_at=created_at or datetime.now(UTC),
+        )
+        db.add(entry)
+        await db.flush()
+
+        try:
+            from src.app.modules.intelligence.observer.feed import IntelligenceFeedStore
+
+            await IntelligenceFeedStore().request_refresh(user_id)
+        except Exception as e:
+            logger.warning(f"[JournalStore] Failed to schedule feed refresh for user {user_id}: {e}")
+        return entry
+
+    async def iter_entries(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        page_size: int = PAGE_SIZE,
+    ) -> AsyncIterator[JournalEntry]:
+        """
+        Entries in [since, until), oldest first, fetched in keyset pages.
+
+        Not-yet-backfilled profile entries are merged in by timestamp.
+        """
+        legacy = deque(
+            sorted(
+                (
+                    e for e in await self._legacy_entries(user_id, db)
+                    if (since is None or e.created_at >= since) and (until is None or e.created_at < until)
+                ),
+                key=lambda e: e.created_at,
+            )
+        )
+
+        after = None
+        while True:
+            stmt = select(JournalEntry).where(JournalEntry.user_id == user_id)
+            if since is not None:
+                stmt = stmt.where(JournalEntry.created_at >= since)
+            if until is not None:
+                stmt = stmt.where(JournalEntry.created_at < until)
+            if after is not None:
+                stmt = stmt.where(tuple_(JournalEntry.created_at, JournalEntry.id) > after)
+            stmt = stmt.order_by(JournalEntry.created_at, JournalEntry.id).limit(page_size)
+
+            page = (await db.execute(stmt)).scalars().all()
+            for entry in page:
+                while legacy and legacy[0].created_at < entry.created_at:
+                    yield legacy.popleft()
+                yield self._with_symptoms(entry)
+
+            if len(page) < page_size:
+                break
+            after = (page[-1].created_at, page[-1].id)
+
+        for entry in legacy:
+            yield entry
+
+    async def get_entries(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[JournalEntry]:
+        """All entries in [since, until), oldest first."""
+        return [e async for e in self.iter_entries(user_id, db, since=since, until=until)]
+
+    async def get_page(
+        self,
+        user_id: int,
+        db: AsyncSession,
+        limit: int = 50,
+        before: Optional[tuple[datetime, int]] = None,
+    ) -> list[JournalEntry]:
+        """
+        One page of entries, newest first.
+
+        Args:
+            before: (created_at, id) of the last entry of the previous page
+        """
+        stmt = select(JournalEntry).where(JournalEntry.user_id == user_id)
+        if before is not None:
+            stmt = stmt.where(tuple_(JournalEntry.created_at, JournalEntry.id) < before)
+        stmt = stmt.order_by(JournalEntry.created_at.desc(), JournalEntry.id.desc()).limit(limit)
+        entries = [self._with_symptoms(e) for e in (await db.execute(stmt)).scalars().all()]
+
+        legacy = await self._legacy_entries(user_id, db)
+        if not legacy:
+            return entries
+        if before is not None:
+            legacy = [e for e in legacy if e.created_at < before[0]]
+        return sorted(entries + legacy, key=lambda e: e.created_at, reverse=True)[:limit]
+
+    async def get_recent(self, user_id: int, db: AsyncSession, limit: int = 10) -> list[JournalEntry]:
+        """The latest ``limit`` entries, oldest first."""
+        return list(reversed(await self.get_page(user_id, db, limit=limit)))
+
+    async def backfill(self, db: AsyncSession, batch_size: int | None = None) -> int:
+        """
+        Move one batch of profiles' journal_entries lists into the table.
+
+        Each profile is copied and its key removed in the same transaction.
+        A list is only removed if it is unchanged since it was read, and
+        inserts are idempotent on entry_uuid, so this is safe to run while
+        the application is serving traffic. Non-list values hold no entries
+        and are removed unconditionally.
+
+        Returns:
+            Number of profiles whose key was removed in this batch (0 when
+            done, or when every selected list changed while being copied)
+        """
+        batch_size = batch_size or settings.JOURNAL_BACKFILL_BATCH_SIZE
+        legacy = UserProfile.data[LEGACY_KEY]
+        result = await db.execute(
+            select(UserProfile.user_id, legacy).where(UserProfile.data.has_key(LEGACY_KEY)).limit(batch_size)
+        )
+        profiles = result.all()
+
+        migrated = 0
+        for user_id, items in profiles:
+            if not isinstance(items, list):
+                # JSONB null never equals a bound NULL, so no unchanged-value guard here
+                result = await db.execute(
+                    update(UserProfile)
+                    .where(UserProfile.user_id == user_id)
+                    .values(data=UserProfile.data.op("-")(LEGACY_KEY))
+                )
+                await db.commit()
+                migrated += result.rowcount
+                continue
+
+            rows = []
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                entry = entry_from_legacy(user_id, item)
+                rows.append({column: getattr(entry, column) for column in BACKFILL_COLUMNS})
+            if rows:
+                await db.execute(pg_insert(JournalEntry).on_conflict_do_nothing(index_elements=["entry_uuid"]), rows)
+
+            result = await db.execute(
+                update(UserProfile)
+                .where(UserProfile.user_id == user_id, legacy == items)
+                .values(data=UserProfile.data.op("-")(LEGACY_KEY))
+            )
+            await db.commit()
+            migrated += result.rowcount
+
+        if migrated:
+            logger.info(f"[JournalStore] Backfilled journal entries for {migrated} profiles")
+        return migrated
+
+    async def _legacy_entries(self, user_id: int, db: AsyncSession) -> list[JournalEntry]:
+        """Entries still in UserProfile.data (only that key is fetched)."""
+        if not settings.JOURNAL_LEGACY_READS:
+            return []
+        items = await db.scalar(select(UserProfile.data[LEGACY_KEY]).where(UserProfile.user_id == user_id))
+        if not isinstance(items, list):
+            return []
+        return [entry_from_legacy(user_id, item) for item in items if isinstance(item, dict)]
+
+    @staticmethod
+    def _with_symptoms(entry: JournalEntry) -> JournalEntry:
+        # Rows written before the column existed are labelled on read
+        if entry.symptoms is None:
+            entry.symptoms = journal_symptoms(entry.content, entry.tags, entry.id)
+        return entry
+
@@ -3,21 +3,48 @@ Push Notification Service - Node.js Microservice Adapter
 
 Delegates push notification sending to Node.js microservice using proven web-push library.
 This approach guarantees compatibility with Apple APNs Web Push.
+
+Broadcasts resolve every opted-in subscription in one joined query, format the
+message once, and stream subscriptions in chunks to ``/send-batch`` over a
+shared keep-alive client. Endpoints reported expired are deleted in bulk.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import Select, delete, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.config import settings
 from src.app.models.push import PushSubscription
+from src.app.models.user import User
+from src.app.models.user_profile import UserProfile
 
 logger = logging.getLogger(__name__)
 
 
+def opted_in_subscriptions(preference_key: str) -> Select:
+    """
+    Subscriptions of active users who have not opted out of ``preference_key``.
+
+    Preferences are opt-out: a missing profile or key counts as enabled.
+    Only JSON ``true`` otherwise counts as enabled; a malformed value (e.g.
+    ``"true"`` or ``1``) opts that user out instead of failing a boolean cast
+    for the whole broadcast.
+    """
+    preference = UserProfile.data[("preferences", "notifications", preference_key)]
+    return (
+        select(PushSubscription.endpoint, PushSubscription.p256dh, PushSubscription.auth)
+        .join(User, User.id == PushSubscription.user_id)
+        .outerjoin(UserProfile, UserProfile.user_id == PushSubscription.user_id)
+        .where(User.is_deleted.is_(False), or_(preference.is_(None), preference == literal(True, JSONB)))
+        .order_by(PushSubscription.id)
+    )
+
+
 class NotificationService:
     """
     Push notification service using Node.js microservice.
@@ -32,9 +59,34 @@ class NotificationService:
         self.service_url = settings.PUSH_SERVICE_URL
         self.auth_token = settings.PUSH_SERVICE_SECRET
 
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
         if not self.auth_token or "change-me" in self.auth_token:
             logger.warning("⚠️  PUSH_SERVICE_SECRET is unset or default. Push verification will fail.")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client (recreated when used from a new event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.service_url,
+                headers={"Authorization": f"Bearer {self.auth_token}"},
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=settings.PUSH_MAX_CONCURRENCY,
+                    max_keepalive_connections=settings.PUSH_MAX_CONCURRENCY,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def send_notification(
         self,
         subscription: PushSubscription,
@@ -61,34 +113,117 @@ class NotificationService:
         logger.info("⚡ Sending push notification via Node.js service")
         logger.info(f"   Endpoint: {endpoint_display}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.service_url}/send",
-                    json=payload,
-                    headers={"Authorization": f"Bearer {self.auth_token}"},
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    logger.info("✅ Push sent successfully")
-                    return True
-                elif response.status_code in [404, 410]:
-                    logger.warning(f"⚠️  Subscription expired ({response.status_code})")
-                    return False
-                else:
-                    logger.error(f"❌ Push failed ({response.status_code})")
-                    logger.error(f"   Response: {response.text}")
-                    return False
-
-            except httpx.RequestError as exc:
-                logger.error(f"❌ Connection error to push service: {exc}")
-                logger.error(f"   Make sure Node.js push service is running at {self.service_url}")
+        try:
+            response = await self._get_client().post("/send", json=payload, timeout=10.0)
+
+            if response.status_code == 200:
+                logger.info("✅ Push sent successfully")
+                return True
+            elif response.status_code in [404, 410]:
+                logger.warning(f"⚠️  Subscription expired ({response.status_code})")
                 return False
-            except Exception as e:
-                logger.error(f"❌ Unexpected Error: {type(e).__name__}: {str(e)}")
+            else:
+                logger.error(f"❌ Push failed ({response.status_code})")
+                logger.error(f"   Response: {response.text}")
                 return False
 
+        except httpx.RequestError as exc:
+            logger.error(f"❌ Connection error to push service: {exc}")
+            logger.error(f"   Make sure Node.js push service is running at {self.service_url}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Unexpected Error: {type(e).__name__}: {str(e)}")
+            return False
+
+    async def _send_batch(self, subscriptions: list[dict], message: dict) -> dict:
+        """
+        POST one chunk of subscriptions to /send-batch.
+
+        Returns:
+            Counts plus the endpoints the push service reported as expired
+        """
+        failed = {"success": 0, "failed": len(subscriptions), "expired": 0, "expired_endpoints": []}
+
+        try:
+            response = await self._get_client().post(
+                "/send-batch", json={"subscriptions": subscriptions, "payload": message}
+            )
+        except httpx.RequestError as exc:
+            logger.error(f"❌ Connection error to push service: {exc}")
+            return failed
+        except Exception as e:
+            logger.error(f"❌ Error: {str(e)}")
+            return failed
+
+        if response.status_code != 200:
+            logger.error(f"❌ Batch push failed ({response.status_code}): {response.text}")
+            return failed
+
+        results = response.json().get("results", {})
+        return {
+            "success": results.get("success", 0),
+            "failed": results.get("failed", 0),
+            "expired": results.get("expired", 0),
+            "expired_endpoints": results.get("expired_endpoints", []),
+        }
+
+    async def prune_subscriptions(self, db: AsyncSession, endpoints: list[str]) -> int:
+        """Delete expired subscriptions in one statement (caller commits)."""
+        if not endpoints:
+            return 0
+
+        result = await db.execute(delete(PushSubscription).where(PushSubscription.endpoint.in_(endpoints)))
+        await db.flush()
+        logger.info(f"🗑️  Cleaned up {result.rowcount} expired subscription(s)")
+        return result.rowcount
+
+    async def broadcast(
+        self,
+        db: AsyncSession,
+        preference_key: str,
+        title: str,
+        body: str,
+        url: str = "/",
+        icon: Optional[str] = None,
+    ) -> dict:
+        """
+        Send one message to every subscription not opted out of ``preference_key``.
+
+        Subscriptions are streamed from the database in chunks of PUSH_BATCH_SIZE;
+        at most PUSH_MAX_CONCURRENCY chunks are in flight, which also bounds how
+        far the cursor reads ahead. Expired subscriptions are deleted in the
+        caller's transaction; the caller commits.
+        """
+        message = {"title": title, "body": body, "url": url, "icon": icon}
+        semaphore = asyncio.Semaphore(settings.PUSH_MAX_CONCURRENCY)
+        totals = {"success": 0, "failed": 0, "expired": 0}
+        expired_endpoints: list[str] = []
+
+        async def send_chunk(chunk: list[dict]) -> None:
+            try:
+                result = await self._send_batch(chunk, message)
+            finally:
+                semaphore.release()
+            for key in totals:
+                totals[key] += result[key]
+            expired_endpoints.extend(result["expired_endpoints"])
+
+        tasks = []
+        rows = await db.stream(opted_in_subscriptions(preference_key))
+        async for partition in rows.partitions(settings.PUSH_BATCH_SIZE):
+            chunk = [{"endpoint": r.endpoint, "keys": {"p256dh": r.p256dh, "auth": r.auth}} for r in partition]
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(send_chunk(chunk)))
+        await asyncio.gather(*tasks)
+
+        await self.prune_subscriptions(db, expired_endpoints)
+
+        logger.info(
+            f"📊 Broadcast '{preference_key}': ✅ {totals['success']}, "
+            f"❌ {totals['failed']}, ⚠️  {totals['expired']}"
+        )
+        return totals
+
     async def send_to_user(
         self,
         db: AsyncSession,
@@ -100,6 +235,9 @@ class NotificationService:
     ) -> dict:
         """
         Send notification to all user subscriptions with auto-cleanup.
+
+        Expired subscriptions are deleted in the caller's transaction; the
+        caller commits.
         """
         logger.info(f"📤 Sending to user {user_id}")
 
@@ -116,45 +254,13 @@ class NotificationService:
             {"endpoint": sub.endpoint, "keys": {"p256dh": sub.p256dh, "auth": sub.auth}} for sub in subscriptions
         ]
 
-        payload = {"subscriptions": subs_array, "payload": {"title": title, "body": body, "url": url, "icon": icon}}
+        results = await self._send_batch(subs_array, {"title": title, "body": body, "url": url, "icon": icon})
+        await self.prune_subscriptions(db, results.pop("expired_endpoints"))
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.service_url}/send-batch",
-                    json=payload,
-                    headers={"Authorization": f"Bearer {self.auth_token}"},
-                    timeout=30.0,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("results", {})
-
-                    if results.get("expired", 0) > 0:
-                        logger.info(f"🗑️  Cleaning up {results['expired']} expired subscription(s)")
-                        # In a real impl, we would delete them here
-
-                    logger.info(
-                        f"📊 Results: ✅ {results.get('success', 0)}, "
-                        f"❌ {results.get('failed', 0)}, ⚠️  {results.get('expired', 0)}"
-                    )
-
-                    return {
-                        "success": results.get("success", 0),
-                        "failed": results.get("failed", 0),
-                        "expired": results.get("expired", 0),
-                    }
-                else:
-                    logger.error(f"❌ Batch push failed ({response.status_code}): {response.text}")
-                    return {"success": 0, "failed": len(subscriptions), "expired": 0}
-
-            except httpx.RequestError as exc:
-                logger.error(f"❌ Connection error to push service: {exc}")
-                return {"success": 0, "failed": len(subscriptions), "expired": 0}
-            except Exception as e:
-                logger.error(f"❌ Error: {str(e)}")
-                return {"success": 0, "failed": len(subscriptions), "expired": 0}
+        logger.info(
+            f"📊 Results: ✅ {results['success']}, ❌ {results['failed']}, ⚠️  {results['expired']}"
+        )
+        return results
 
 
 notification_service = NotificationService()
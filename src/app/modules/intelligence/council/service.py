@@ -267,7 +267,7 @@ class CouncilService:
 
         from sqlalchemy import and_, select
 
-        from src.app.models.journal_entry import JournalEntry
+        from src.app.models.insight import JournalEntry
 
         if db_session is None:
             logger.warning("[CouncilService] analyze_gate_history called without db_session")
@@ -515,7 +515,7 @@ class CouncilService:
 
         from sqlalchemy import and_, desc, select
 
-        from src.app.models.journal_entry import JournalEntry
+        from src.app.models.insight import JournalEntry
         from src.app.models.quest import Quest
 
         guidance = []
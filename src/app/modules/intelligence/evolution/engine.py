@@ -1,12 +1,18 @@
+import asyncio
 import logging
-import math
+from collections import defaultdict
 from datetime import UTC, datetime
 
-from sqlalchemy import select
-
+from src.app.core.config import settings
 from src.app.core.db.database import local_session
 from src.app.core.events.bus import get_event_bus
-from src.app.models.progression import PlayerStats
+from src.app.modules.intelligence.evolution.ledger import (
+    ExperienceGain,
+    LedgerUpdate,
+    experience_history,
+    record_experience,
+    sync_profile_progression,
+)
 from src.app.protocol import events
 from src.app.protocol.packet import ProgressionPacket
 
@@ -18,13 +24,22 @@ class EvolutionEngine:
     Centralized Progression Engine for rank and XP math.
 
     Handles:
-    1. XP accumulation from ProgressionPackets.
+    1. XP accumulation from ProgressionPackets, via the XP ledger.
     2. Level-up logic and Rank thresholds.
     3. Temporal snapshots for progression history.
+
+    Packets for a user are coalesced: the first one opens a short window
+    (PROGRESSION_XP_COALESCE_MS) and everything that arrives for that user
+    before it closes is written in one transaction.
     """
 
-    def __init__(self):
+    def __init__(self, coalesce_window: float | None = None):
         self.bus = get_event_bus()
+        self.coalesce_window = (
+            settings.PROGRESSION_XP_COALESCE_MS / 1000 if coalesce_window is None else coalesce_window
+        )
+        self._pending: dict[int, list[ExperienceGain]] = defaultdict(list)
+        self._flushes: dict[int, asyncio.Task] = {}
 
     async def initialize(self):
         """Register listener for experience gain."""
@@ -32,17 +47,11 @@ class EvolutionEngine:
 
     async def handle_experience_gain(self, packet: ProgressionPacket):
         """
-        Process experience gain events.
+        Queue an experience gain for the user's next ledger write.
         """
-        # DEBUG LOG
-        print(
-            f"DEBUG: EvolutionEngine received XP packet for user {packet.user_id}. "
-            f"Amount: {getattr(packet, 'amount', 'unset')}"
-        )
-
         user_id = packet.user_id
         if not user_id:
-            print("DEBUG: No user_id in packet")
+            logger.debug("[EvolutionEngine] XP packet without user_id ignored")
             return
 
         # Packet source mapping for XP gain logic
@@ -51,112 +60,99 @@ class EvolutionEngine:
         reason = getattr(packet, "reason", "Insight Integration")
         category = getattr(packet, "category", "SYNC")
 
-        print(f"DEBUG: Processing XP. Amount: {amount}, Reason: {reason}")
-
         # If the packet was received as a generic Packet, try to extract from payload
         if not hasattr(packet, "amount") and packet.payload:
             amount = packet.payload.get("amount", amount)
             reason = packet.payload.get("reason", reason)
             category = packet.payload.get("category", category)
 
-        async with local_session() as db:
-            # 1. Update PlayerStats
-            stmt = select(PlayerStats).where(PlayerStats.user_id == int(user_id))
-            result = await db.execute(stmt)
-            stats = result.scalar_one_or_none()
-
-            if not stats:
-                stats = PlayerStats(user_id=int(user_id))
-                db.add(stats)
-
-            # Handle NULL values from existing database rows
-            if stats.experience_points is None:
-                stats.experience_points = 0
-            if stats.level is None:
-                stats.level = 1
-
-            old_level = stats.level
-            stats.experience_points += amount
-
-            # Check Level Up (Loop for Power Leveling)
-            leveled_up = False
-            while True:
-                # Threshold: XP = Level * 1000 * 1.5^(Level-1)
-                next_level_threshold = int(stats.level * 1000 * math.pow(1.5, stats.level - 1))
-
-                if stats.experience_points >= next_level_threshold:
-                    stats.level += 1
-                    leveled_up = True
-                    logger.info(f"EvolutionEngine: Power Leveling! User {user_id} -> Level {stats.level}")
-                else:
-                    break
-
-            # 2. Update History Snapshot (JSONB)
-            history_entry = {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "amount": amount,
-                "reason": reason,
-                "category": category,
-                "new_total": stats.experience_points,
-                "level": stats.level,
-            }
-
-            # Ensure stats.sync_history is a list AND clone it to force SQLAlchemy update
-            current_history = list(stats.sync_history) if stats.sync_history else []
-
-            # Keep last 50 entries for temporal analysis
-            current_history.append(history_entry)
-            if len(current_history) > 50:
-                current_history = current_history[-50:]
-
-            stats.sync_history = current_history
+        user_id = int(user_id)
+        self._pending[user_id].append(
+            ExperienceGain(
+                amount=int(amount),
+                reason=str(reason)[:255],
+                category=str(category),
+                source=packet.source,
+                details=packet.payload or {},
+            )
+        )
+        if user_id not in self._flushes:
+            self._flushes[user_id] = asyncio.create_task(self._flush_later(user_id))
 
-            await db.commit()
-            await db.refresh(stats)
+    async def _flush_later(self, user_id: int) -> None:
+        await asyncio.sleep(self.coalesce_window)
+        await self.flush_user(user_id)
 
-            # 3. Emit Level Up if occurred
-            if leveled_up:
-                activity_trace = {
-                    "title": "System Evolution",
-                    "description": f"User reached Level {stats.level} (Rank {stats.rank})",
-                    "milestones": [f"Rank: {stats.rank}", f"Level: {old_level} -> {stats.level}"],
-                    "timestamp": datetime.now(UTC).isoformat(),
-                }
+    async def flush_user(self, user_id: int) -> LedgerUpdate | None:
+        """
+        Write a user's queued gains to the ledger in one transaction.
 
-                await self.bus.publish(
-                    events.EVOLUTION_LEVEL_UP,
+        Returns:
+            The ledger update, or None if nothing was queued or the write failed
+        """
+        # Gains arriving from here on open a new window
+        self._flushes.pop(user_id, None)
+        gains = self._pending.pop(user_id, [])
+        if not gains:
+            return None
+
+        try:
+            async with local_session() as db:
+                result = await record_experience(db, user_id, gains)
+                history = await experience_history(db, user_id)
+
+                # Sync to UserProfile (Observability)
+                await sync_profile_progression(
+                    db,
+                    user_id,
                     {
-                        "old_level": old_level,
-                        "new_level": stats.level,
-                        "rank": stats.rank,
-                        "activity_trace": activity_trace,
+                        "level": result.level,
+                        "rank": result.rank,
+                        "sync_rate": result.sync_rate,
+                        "xp": result.experience_points,
+                        "history": history,
+                        "updated_at": datetime.now(UTC).isoformat(),
                     },
-                    user_id=str(user_id),
                 )
-                logger.info(f"EvolutionEngine: USER {user_id} LEVELED UP to {stats.level} ({stats.rank})")
-
-            # 4. Sync to UserProfile (Observability)
-            from src.app.models.user_profile import UserProfile
-
-            stmt = select(UserProfile).where(UserProfile.user_id == int(user_id))
-            result = await db.execute(stmt)
-            profile = result.scalar_one_or_none()
-
-            if profile:
-                p_data = dict(profile.data or {})
-                p_data["progression"] = {
-                    "level": stats.level,
-                    "rank": stats.rank,
-                    "sync_rate": stats.sync_rate,
-                    "xp": stats.experience_points,
-                    "history": stats.sync_history,
-                    "updated_at": datetime.now(UTC).isoformat(),
-                }
-                profile.data = p_data
-                from sqlalchemy.orm.attributes import flag_modified
-
-                flag_modified(profile, "data")
                 await db.commit()
+        except Exception as e:
+            logger.error(f"[EvolutionEngine] Failed to record {len(gains)} XP gains for user {user_id}: {e}")
+            return None
+
+        logger.debug(
+            f"[EvolutionEngine] User {user_id}: +{sum(g.amount for g in gains)} XP from {len(gains)} gains "
+            f"(total {result.experience_points})"
+        )
+
+        # Emit Level Up if occurred
+        if result.leveled_up:
+            activity_trace = {
+                "title": "System Evolution",
+                "description": f"User reached Level {result.level} (Rank {result.rank})",
+                "milestones": [f"Rank: {result.rank}", f"Level: {result.old_level} -> {result.level}"],
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
+
+            await self.bus.publish(
+                events.EVOLUTION_LEVEL_UP,
+                {
+                    "old_level": result.old_level,
+                    "new_level": result.level,
+                    "rank": result.rank,
+                    "activity_trace": activity_trace,
+                },
+                user_id=str(user_id),
+            )
+            logger.info(f"EvolutionEngine: USER {user_id} LEVELED UP to {result.level} ({result.rank})")
+
+        return result
+
+    async def flush(self) -> None:
+        """Write every queued gain now (shutdown)."""
+        for task in list(self._flushes.values()):
+            task.cancel()
+        for user_id in list(self._pending):
+            await self.flush_user(user_id)
 
 
 # Singleton
@@ -0,0 +1,150 @@
+"""
+GUTTERS Progression Ledger
+
+XP is accounted as an append-only ledger (experience_events). A batch of
+gains for one user is applied in a single transaction:
+
+1. One upsert adds the batch total to PlayerStats.experience_points with an
+   atomic SQL increment (no read-modify-write, so concurrent writers cannot
+   lose updates) and returns the new total.
+2. The level follows from the total by bisecting the precomputed thresholds;
+   it is only ever raised, with GREATEST, so racing writers converge.
+3. The gains are appended with the running total/level after each one, which
+   is what progression history is read from.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.progression import ExperienceEvent, PlayerStats, level_for_experience, rank_for_level
+from src.app.models.user_profile import UserProfile
+
+HISTORY_SIZE = 50
+
+
+@dataclass
+class ExperienceGain:
+    """One XP packet waiting to be written to the ledger."""
+
+    amount: int
+    reason: str
+    category: str
+    source: str | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class LedgerUpdate:
+    """Outcome of applying a batch of gains for one user."""
+
+    user_id: int
+    experience_points: int
+    old_level: int
+    level: int
+    sync_rate: float
+    gains: int
+
+    @property
+    def leveled_up(self) -> bool:
+        return self.level > self.old_level
+
+    @property
+    def rank(self) -> str:
+        return rank_for_level(self.level)
+
+
+async def record_experience(db: AsyncSession, user_id: int, gains: list[ExperienceGain]) -> LedgerUpdate:
+    """
+    Apply a batch of XP gains for one user (caller commits).
+
+    Args:
+        db: Database session
+        user_id: User receiving the XP
+        gains: Gains in arrival order
+
+    Returns:
+        New total and level, plus the level before the batch
+    """
+    batch_total = sum(g.amount for g in gains)
+    now = datetime.now(UTC)
+
+    stmt = pg_insert(PlayerStats).values(user_id=user_id, experience_points=batch_total)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlayerStats.user_id],
+        set_={
+            "experience_points": func.coalesce(PlayerStats.experience_points, 0) + batch_total,
+            "updated_at": now,
+        },
+    ).returning(PlayerStats.experience_points, PlayerStats.level, PlayerStats.sync_rate)
+    experience_points, old_level, sync_rate = (await db.execute(stmt)).one()
+    old_level = old_level or 1
+
+    level = max(old_level, level_for_experience(experience_points))
+    if level > old_level:
+        level = await db.scalar(
+            update(PlayerStats)
+            .where(PlayerStats.user_id == user_id)
+            .values(level=func.greatest(func.coalesce(PlayerStats.level, 1), level))
+            .returning(PlayerStats.level)
+        )
+
+    # Running values after each gain; the batch occupies the last batch_total XP of the sum
+    running = experience_points - batch_total
+    rows = []
+    for gain in gains:
+        running += gain.amount
+        rows.append(
+            {
+                "user_id": user_id,
+                "amount": gain.amount,
+                "reason": gain.reason,
+                "category": gain.category,
+                "source": gain.source,
+                "details": gain.details,
+                "total_after": running,
+                "level_after": max(old_level, level_for_experience(running)),
+                "created_at": gain.occurred_at,
+            }
+        )
+    await db.execute(insert(ExperienceEvent), rows)
+
+    return LedgerUpdate(
+        user_id=user_id,
+        experience_points=experience_points,
+        old_level=old_level,
+        level=level,
+        sync_rate=sync_rate or 0.0,
+        gains=len(gains),
+    )
+
+
+async def experience_history(db: AsyncSession, user_id: int, limit: int = HISTORY_SIZE) -> list[dict]:
+    """Most recent ledger entries for a user, oldest first."""
+    stmt = (
+        select(ExperienceEvent)
+        .where(ExperienceEvent.user_id == user_id)
+        .order_by(ExperienceEvent.created_at.desc(), ExperienceEvent.id.desc())
+        .limit(limit)
+    )
+    events = (await db.execute(stmt)).scalars().all()
+    return [event.to_history_entry() for event in reversed(events)]
+
+
+async def sync_profile_progression(db: AsyncSession, user_id: int, progression: dict[str, Any]) -> None:
+    """Replace UserProfile.data['progression'] in place (jsonb ||, no read-modify-write)."""
+    await db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == user_id)
+        .values(
+            data=func.coalesce(UserProfile.data, literal({}, JSONB)).op("||")(
+                literal({"progression": progression}, JSONB)
+            )
+        )
+    )
@@ -0,0 +1,214 @@
+"""
+Local classifier for Generative UI component decisions.
+
+Decides whether a chat turn should get an interactive component without an
+LLM round trip. Messages are embedded as hashed word/bigram vectors and
+compared (cosine) against one centroid per decision; the softmax of those
+similarities is the decision's confidence.
+
+The model starts from a small seed set and learns from the LLM: turns the
+classifier is not confident about are escalated by ComponentGenerator, and
+the LLM's decision is logged to Redis and folded into the centroids. New
+processes load the logged decisions on first use. The log holds only hashed
+feature buckets and labels, never message text, and expires when no
+decision has been logged for GENERATIVE_UI_DECISION_LOG_TTL.
+"""
+
+import json
+import logging
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.app.core.config import settings
+
+from .models import ComponentType
+
+logger = logging.getLogger(__name__)
+
+NO_COMPONENT = "none"
+DIMENSIONS = 1 << 12
+SHARPNESS = 8.0  # Softmax temperature over cosine similarities
+DECISION_LOG_KEY = "generative_ui:decisions"
+
+_TOKEN = re.compile(r"[a-z']+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from had has have i i'm im is it it's its me my of on or so "
+    "that the this to was were with you your".split()
+)
+
+# Cold-start decisions, in the spirit of the LLM prompt's examples
+SEED_EXAMPLES: list[tuple[str, str]] = [
+    ("I felt anxious today", ComponentType.MULTI_SLIDER.value),
+    ("I'm feeling very overwhelmed right now", ComponentType.MULTI_SLIDER.value),
+    ("I feel exhausted and stressed after work", ComponentType.MULTI_SLIDER.value),
+    ("Feeling drained, tired and a bit on edge", ComponentType.MULTI_SLIDER.value),
+    ("I've been so tired and irritable all week", ComponentType.MULTI_SLIDER.value),
+    ("I feel restless and can't focus, kind of panicky", ComponentType.MULTI_SLIDER.value),
+    ("My mood is really low today", ComponentType.MOOD_SLIDER.value),
+    ("I'm in a great mood", ComponentType.MOOD_SLIDER.value),
+    ("Feeling happy today", ComponentType.MOOD_SLIDER.value),
+    ("I feel sad", ComponentType.MOOD_SLIDER.value),
+    ("What's my sun sign?", NO_COMPONENT),
+    ("What is my Human Design type?", NO_COMPONENT),
+    ("Explain my life path number", NO_COMPONENT),
+    ("Which gate is active right now?", NO_COMPONENT),
+    ("What does my birth chart say about my career?", NO_COMPONENT),
+    ("Tell me about my current planetary period", NO_COMPONENT),
+    ("How does the moon phase affect me this week?", NO_COMPONENT),
+    ("Thanks!", NO_COMPONENT),
+]
+
+
+def hashed_features(message: str) -> dict[int, int]:
+    """Hashed bag of words and bigrams, as bucket -> count."""
+    words = [w for w in _TOKEN.findall(message.lower()) if w not in STOPWORDS]
+    features = Counter(words)
+    features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    if "?" in message:
+        features["<question>"] += 1
+
+    buckets: Counter[int] = Counter()
+    for feature, count in features.items():
+        buckets[zlib.crc32(feature.encode()) % DIMENSIONS] += count
+    return dict(buckets)
+
+
+def features_to_vector(buckets: dict[int, int]) -> np.ndarray:
+    """L2-normalized dense vector from hashed feature buckets."""
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    for bucket, count in buckets.items():
+        vector[int(bucket) % DIMENSIONS] += count
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def embed_message(message: str) -> np.ndarray:
+    """L2-normalized hashed bag of words and bigrams."""
+    return features_to_vector(hashed_features(message))
+
+
+@dataclass(frozen=True)
+class ComponentDecision:
+    """A local decision and how sure the classifier is of it."""
+
+    component_type: Optional[ComponentType]
+    confidence: float
+
+    @property
+    def should_generate(self) -> bool:
+        return self.component_type is not None
+
+
+class ComponentClassifier:
+    """
+    Nearest-centroid classifier over hashed message vectors.
+
+    Example:
+        >>> classifier = get_component_classifier()
+        >>> await classifier.load()
+        >>> decision = classifier.classify("I felt anxious today")
+        >>> decision.component_type, decision.confidence >= classifier.threshold
+        (<ComponentType.MULTI_SLIDER: 'multi_slider'>, True)
+    """
+
+    def __init__(self, threshold: Optional[float] = None, log_size: Optional[int] = None):
+        self.threshold = settings.GENERATIVE_UI_CLASSIFIER_THRESHOLD if threshold is None else threshold
+        self.log_size = log_size or settings.GENERATIVE_UI_DECISION_LOG_SIZE
+        self.log_ttl = settings.GENERATIVE_UI_DECISION_LOG_TTL
+        self._sums: dict[str, np.ndarray] = {}
+        self._loaded = False
+
+        for message, label in SEED_EXAMPLES:
+            self.learn(message, label)
+
+    def learn(self, message: str, label: str) -> None:
+        """Fold one labelled message into its decision's centroid."""
+        self._learn_vector(embed_message(message), label)
+
+    def _learn_vector(self, vector: np.ndarray, label: str) -> None:
+        if label in self._sums:
+            self._sums[label] += vector
+        else:
+            self._sums[label] = vector.copy()
+
+    def classify(self, message: str) -> ComponentDecision:
+        """Closest decision for a message; messages sharing no features with any decision get low confidence."""
+        labels = list(self._sums)
+        centroids = np.stack([self._sums[label] for label in labels])
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        similarity = centroids @ embed_message(message)
+        weights = np.exp(SHARPNESS * (similarity - similarity.max()))
+        best = int(np.argmax(similarity))
+        confidence = float(weights[best] / weights.sum())
+
+        label = labels[best]
+        return ComponentDecision(None if label == NO_COMPONENT else ComponentType(label), confidence)
+
+    async def load(self) -> None:
+        """Train on decisions logged by earlier processes (once per process)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        redis_client = await self._redis()
+        if redis_client is None:
+            return
+        try:
+            logged = await redis_client.lrange(DECISION_LOG_KEY, 0, self.log_size - 1)
+        except Exception as e:
+            logger.warning(f"[ComponentClassifier] Could not load logged decisions: {e}")
+            return
+
+        for raw in logged:
+            try:
+                item = json.loads(raw)
+                if item["label"] != NO_COMPONENT:
+                    ComponentType(item["label"])
+                self._learn_vector(features_to_vector(item["features"]), item["label"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        logger.info(f"[ComponentClassifier] Trained on {len(logged)} logged decisions")
+
+    async def record(self, message: str, component_type: Optional[ComponentType]) -> None:
+        """Learn an LLM decision and log its hashed features for other processes."""
+        label = component_type.value if component_type else NO_COMPONENT
+        features = hashed_features(message)
+        self._learn_vector(features_to_vector(features), label)
+
+        redis_client = await self._redis()
+        if redis_client is None:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.lpush(DECISION_LOG_KEY, json.dumps({"features": features, "label": label}))
+            pipe.ltrim(DECISION_LOG_KEY, 0, self.log_size - 1)
+            pipe.expire(DECISION_LOG_KEY, self.log_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[ComponentClassifier] Could not log decision: {e}")
+
+    @staticmethod
+    async def _redis():
+        from src.app.core.memory import get_active_memory
+
+        memory = get_active_memory()
+        if memory.redis_client is None:
+            await memory.initialize()
+        return memory.redis_client
+
+
+_component_classifier: ComponentClassifier | None = None
+
+
+def get_component_classifier() -> ComponentClassifier:
+    """Get the process-wide ComponentClassifier."""
+    global _component_classifier
+    if _component_classifier is None:
+        _component_classifier = ComponentClassifier()
+    return _component_classifier
@@ -13,6 +13,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.app.core.llm.config import get_premium_llm
 
+from .classifier import get_component_classifier
 from .models import (
     ChecklistItem,
     ComponentSpec,
@@ -33,13 +34,15 @@ class ComponentGenerator:
     """
     Generates interactive UI components based on conversation context.
 
-    Uses LLM to decide when to show a component and what it should contain.
+    A local classifier decides when to show a component; ambiguous turns
+    escalate to the LLM, whose decisions train the classifier.
     USES PREMIUM LLM TIER (Sonnet 4.5) for high-fidelity decisions.
     """
 
     def __init__(self):
         # CRITICAL: Use premium LLM for component decisions
         self.llm = get_premium_llm()
+        self.classifier = get_component_classifier()
 
     async def should_generate_component(
         self, message: str, conversation_history: List[dict], context: dict
@@ -47,13 +50,31 @@ class ComponentGenerator:
         """
         Decide if a UI component should be generated.
 
+        Confident local decisions are returned without an LLM call; the rest
+        are escalated and the LLM's answer is recorded for training.
+
         Returns:
             (should_generate, component_type)
 
         Examples:
-            "I felt anxious today" → (True, MOOD_SLIDER)
+            "I felt anxious today" → (True, MULTI_SLIDER)
             "What's my sun sign?" → (False, None)
         """
+        await self.classifier.load()
+        decision = self.classifier.classify(message)
+        if decision.confidence >= self.classifier.threshold:
+            logger.debug(f"[ComponentGenerator] Local decision {decision.component_type} ({decision.confidence:.2f})")
+            return decision.should_generate, decision.component_type
+
+        llm_decision = await self._llm_decision(message)
+        if llm_decision is None:
+            return False, None
+
+        await self.classifier.record(message, llm_decision[1])
+        return llm_decision
+
+    async def _llm_decision(self, message: str) -> Optional[tuple[bool, Optional[ComponentType]]]:
+        """Ask the LLM; None if it failed (such turns are not used for training)."""
         prompt = f"""Analyze this conversation and determine if an interactive UI component would be helpful.
 
 User message: "{message}"
@@ -108,14 +129,14 @@ Don't suggest components for simple factual questions.
                     return True, comp_type
                 except ValueError:
                     logger.warning(f"LLM suggested invalid component type: {comp_type_str}")
-                    return False, None
+                    return None
 
             return False, None
 
         except Exception as e:
             # Logic error or LLM failure -> graceful degradation to text only
             logger.error(f"[ComponentGenerator] Decision failed: {e}")
-            return False, None
+            return None
 
     async def generate_mood_slider(self, message: str, context: dict) -> ComponentSpec:
         """Generate a single mood slider component."""
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.db.database import local_session
 from src.app.core.events.bus import get_event_bus
 from src.app.models.user_profile import UserProfile
+from src.app.modules.features.journal.store import JournalStore
 from src.app.modules.intelligence.evolution.refiner import get_evolution_refiner
 from src.app.modules.intelligence.genesis.persistence import get_genesis_persistence
 from src.app.protocol import events
@@ -127,8 +128,8 @@ class GenesisSemanticListener:
             if not profile:
                 return
 
-            journal_entries = profile.data.get("journal_entries", [])[-3:]
-            journal_text = " | ".join([e.get("text", "") for e in journal_entries])
+            journal_entries = await JournalStore().get_recent(user_id, db, limit=3)
+            journal_text = " | ".join([e.content or "" for e in journal_entries])
 
             # 2. Find Candidates to refine
             uncertainties = await self.persistence.get_all_from_profile(user_id, db)
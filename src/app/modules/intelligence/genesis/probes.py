@@ -208,8 +208,10 @@ class ProbeGenerator:
             pass
 
         try:
-            # Generate with LLM
-            response = await self.llm.ainvoke(prompt)
+            # Generate with LLM (identical prompts are answered from the response cache)
+            from ....core.ai.response_cache import cached_llm
+
+            response = await cached_llm(self.llm, "genesis.probe", ttl=3600).ainvoke(prompt)
             result = self._parse_llm_response(response.content, probe_type)
 
             probe = ProbePacket(
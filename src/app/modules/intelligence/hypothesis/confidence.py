@@ -454,29 +454,11 @@ class WeightedConfidenceCalculator:
         Returns:
             Updated evidence records with new recency values
         """
-        for record in evidence_records:
-            new_recency = self.calculate_recency_multiplier(
-                record.timestamp,
-                current_time
-            )
-
-            # Update recency and recalculate effective weight
-            record.recency_multiplier = new_recency
-
-            if record.is_contradiction:
-                record.effective_weight = (
-                    record.base_weight *
-                    record.source_reliability *
-                    2.0  # Contradiction amplification
-                )
-            else:
-                record.effective_weight = (
-                    record.base_weight *
-                    record.source_reliability *
-                    record.recency_multiplier *
-                    record.position_factor
-                )
+        from .evidence_matrix import EvidenceMatrix
 
+        matrix = EvidenceMatrix.from_records(evidence_records, self)
+        matrix.evaluate(current_time)
+        matrix.write_back(evidence_records)
         return evidence_records
 
     def calculate_confidence(
@@ -505,7 +487,7 @@ class WeightedConfidenceCalculator:
             return self.BASE_CONFIDENCE
 
         if update_recency:
-            self.update_evidence_recency(evidence_records)
+            return self.evaluate_evidence(evidence_records)["total_confidence"]
 
         # Sum contributions
         total_weighted_score = sum(
@@ -513,6 +495,18 @@ class WeightedConfidenceCalculator:
             for record in evidence_records
         )
 
+        return self.normalize_score(total_weighted_score)
+
+    def normalize_score(self, total_weighted_score: float) -> float:
+        """
+        Map a summed effective weight to a confidence score.
+
+        Args:
+            total_weighted_score: Sum of effective weights (support minus contradictions)
+
+        Returns:
+            Confidence score between 0.0 and 1.0
+        """
         # Apply base confidence
         raw_confidence = self.BASE_CONFIDENCE + (total_weighted_score * self.CONFIDENCE_SCALE)
 
@@ -523,6 +517,30 @@ class WeightedConfidenceCalculator:
         # Clamp to valid range
         return max(0.0, min(1.0, normalized))
 
+    def evaluate_evidence(
+        self,
+        evidence_records: List[EvidenceRecord],
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Update recency and compute confidence and breakdown in one pass.
+
+        Records are updated in place with their recency-adjusted weights.
+
+        Args:
+            evidence_records: Evidence records (models or serialized dicts)
+            current_time: Reference time for decay calculation
+
+        Returns:
+            Breakdown dictionary (see get_confidence_breakdown)
+        """
+        from .evidence_matrix import EvidenceMatrix
+
+        matrix = EvidenceMatrix.from_records(evidence_records, self)
+        breakdown = matrix.evaluate(current_time)
+        matrix.write_back(evidence_records)
+        return breakdown
+
     def calculate_initial_confidence(
         self,
         evidence_type: EvidenceType,
@@ -578,80 +596,21 @@ class WeightedConfidenceCalculator:
         Returns:
             Dictionary with breakdown details
         """
-        if not evidence_records:
-            return {
-                "total_confidence": self.BASE_CONFIDENCE,
-                "evidence_count": 0,
-                "supporting_count": 0,
-                "contradiction_count": 0,
-                "by_evidence_type": {},
-                "by_source": {},
-                "top_contributors": [],
-                "recency_impact": 0.0,
-            }
-
-        # Update recency for accurate breakdown
-        self.update_evidence_recency(evidence_records)
-
-        # Counts
-        supporting = [r for r in evidence_records if not r.is_contradiction]
-        contradictions = [r for r in evidence_records if r.is_contradiction]
-
-        # Group by type
-        by_type: Dict[str, float] = {}
-        for record in evidence_records:
-            type_key = record.evidence_type.value
-            by_type[type_key] = by_type.get(type_key, 0) + record.effective_weight
-
-        # Group by source
-        by_source: Dict[str, float] = {}
-        for record in evidence_records:
-            by_source[record.source] = (
-                by_source.get(record.source, 0) + record.effective_weight
-            )
-
-        # Top contributors (sorted by absolute effective weight)
-        sorted_records = sorted(
-            evidence_records,
-            key=lambda r: abs(r.effective_weight),
-            reverse=True
-        )
-        top_contributors = [
-            {
-                "id": r.id,
-                "type": r.evidence_type.value,
-                "contribution": round(r.effective_weight, 4),
-                "reasoning": r.reasoning[:100],
-                "age_days": (datetime.utcnow() - r.timestamp.replace(tzinfo=None)).days
-                    if r.timestamp.tzinfo else (datetime.utcnow() - r.timestamp).days,
-            }
-            for r in sorted_records[:5]
-        ]
-
-        # Recency impact (average recency multiplier)
-        avg_recency = sum(r.recency_multiplier for r in evidence_records) / len(evidence_records)
-        recency_impact = 1.0 - avg_recency  # How much recency has reduced weights
+        return self.evaluate_evidence(evidence_records)
 
+    def empty_breakdown(self) -> Dict[str, Any]:
+        """Breakdown of a hypothesis without evidence."""
         return {
-            "total_confidence": self.calculate_confidence(evidence_records, update_recency=False),
-            "evidence_count": len(evidence_records),
-            "supporting_count": len(supporting),
-            "contradiction_count": len(contradictions),
-            "weighted_support": sum(r.effective_weight for r in supporting),
-            "weighted_contradiction": sum(abs(r.effective_weight) for r in contradictions),
-            "by_evidence_type": {k: round(v, 4) for k, v in by_type.items()},
-            "by_source": {k: round(v, 4) for k, v in by_source.items()},
-            "top_contributors": top_contributors,
-            "recency_impact": round(recency_impact, 2),
-            "average_age_days": round(
-                sum(
-                    (datetime.utcnow() - r.timestamp.replace(tzinfo=None)).days
-                    if r.timestamp.tzinfo
-                    else (datetime.utcnow() - r.timestamp).days
-                    for r in evidence_records
-                ) / len(evidence_records),
-                1
-            ),
+            "total_confidence": self.BASE_CONFIDENCE,
+            "evidence_count": 0,
+            "supporting_count": 0,
+            "contradiction_count": 0,
+            "weighted_support": 0.0,
+            "weighted_contradiction": 0.0,
+            "by_evidence_type": {},
+            "by_source": {},
+            "top_contributors": [],
+            "recency_impact": 0.0,
         }
 
     def create_snapshot(
@@ -673,8 +632,32 @@ class WeightedConfidenceCalculator:
         Returns:
             ConfidenceSnapshot capturing current state
         """
-        breakdown = self.get_confidence_breakdown(evidence_records)
+        return self.snapshot_from_breakdown(
+            self.get_confidence_breakdown(evidence_records),
+            trigger=trigger,
+            evidence_id=evidence_id,
+            status=status
+        )
 
+    def snapshot_from_breakdown(
+        self,
+        breakdown: Dict[str, Any],
+        trigger: str,
+        evidence_id: Optional[str] = None,
+        status: str = "forming"
+    ) -> ConfidenceSnapshot:
+        """
+        Create confidence snapshot from an already computed breakdown.
+
+        Args:
+            breakdown: Result of get_confidence_breakdown / evaluate_evidence
+            trigger: What triggered this snapshot
+            evidence_id: Optional triggering evidence ID
+            status: Current hypothesis status
+
+        Returns:
+            ConfidenceSnapshot capturing current state
+        """
         return ConfidenceSnapshot(
             confidence=breakdown["total_confidence"],
             trigger=trigger,
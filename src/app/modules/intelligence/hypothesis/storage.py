@@ -1,104 +1,402 @@
 """
 Hypothesis persistence.
 
-Stores hypotheses in UserProfile.data['hypotheses'] and caches in Redis.
+Hypotheses live in the ``hypotheses`` table, with their evidence records and
+confidence history in ``hypothesis_evidence`` and
+``hypothesis_confidence_snapshots``. Storing a hypothesis upserts its row,
+inserts only new evidence and snapshots, and updates only the evidence whose
+recency-adjusted weight changed. Status and confidence filters run in SQL.
+
+Each hypothesis is cached in Redis under ``hypothesis:<id>``.
 """
 
-from typing import List, Optional
+import json
+import math
+import uuid
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.attributes import flag_modified
 
-from src.app.models.user_profile import UserProfile
+from src.app.models.hypothesis import HypothesisConfidenceSnapshot, HypothesisEvidence, HypothesisRecord
 
 from .models import Hypothesis
 
+CACHE_KEY = "hypothesis:{hypothesis_id}"
+CACHE_TTL = 604800  # 7 days
+MAX_CONFIDENCE_SNAPSHOTS = 50
+
+# Hypothesis fields stored as columns of the hypotheses table
+ROW_FIELDS = (
+    "id",
+    "user_id",
+    "hypothesis_type",
+    "claim",
+    "predicted_value",
+    "confidence",
+    "status",
+    "evidence_count",
+    "contradictions",
+    "generated_at",
+    "last_updated",
+    "last_evidence_at",
+)
+CHILD_FIELDS = ("evidence_records", "confidence_history")
+
+# Evidence fields that change on recalculation and are stored as columns
+EVIDENCE_WEIGHT_FIELDS = ("recency_multiplier", "effective_weight")
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    """Parse a datetime (or ISO string); naive values are taken as UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def hypothesis_row(hypothesis: Hypothesis) -> Dict[str, Any]:
+    """Column values of the hypotheses row for ``hypothesis``."""
+    row = {field: getattr(hypothesis, field) for field in ROW_FIELDS}
+    row["hypothesis_type"] = hypothesis.hypothesis_type.value
+    row["status"] = hypothesis.status.value
+    for field in ("generated_at", "last_updated", "last_evidence_at"):
+        row[field] = _as_utc(row[field])
+    row["attributes"] = hypothesis.model_dump(mode="json", exclude=set(ROW_FIELDS) | set(CHILD_FIELDS))
+    return row
+
+
+def evidence_row(hypothesis_id: str, position: int, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values of a hypothesis_evidence row for a serialized EvidenceRecord."""
+    # Legacy records without an ID get a stable one derived from their position
+    evidence_id = record.get("id") or str(uuid.uuid5(uuid.NAMESPACE_OID, f"{hypothesis_id}:{position}"))
+    return {
+        "id": evidence_id,
+        "hypothesis_id": hypothesis_id,
+        "position": position,
+        "evidence_type": str(record.get("evidence_type", "")),
+        "is_contradiction": bool(record.get("is_contradiction", False)),
+        "recency_multiplier": float(record.get("recency_multiplier", 1.0)),
+        "effective_weight": float(record.get("effective_weight", 0.0)),
+        "record": {k: v for k, v in record.items() if k not in EVIDENCE_WEIGHT_FIELDS and k != "id"},
+        "recorded_at": _as_utc(record.get("timestamp")) or datetime.now(UTC),
+    }
+
+
+def snapshot_row(hypothesis_id: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values of a hypothesis_confidence_snapshots row."""
+    return {
+        "hypothesis_id": hypothesis_id,
+        "confidence": float(snapshot.get("confidence", 0.0)),
+        "snapshot": snapshot,
+        "recorded_at": _as_utc(snapshot.get("timestamp")) or datetime.now(UTC),
+    }
+
+
+def hypothesis_from_rows(
+    row: HypothesisRecord,
+    evidence: List[HypothesisEvidence],
+    snapshots: List[HypothesisConfidenceSnapshot],
+) -> Hypothesis:
+    """Rebuild a Hypothesis from its row and child rows (in stored order)."""
+    data = dict(row.attributes or {})
+    data.update({field: getattr(row, field) for field in ROW_FIELDS})
+    data["evidence_records"] = [
+        {
+            **e.record,
+            "id": e.id,
+            "recency_multiplier": e.recency_multiplier,
+            "effective_weight": e.effective_weight,
+        }
+        for e in evidence
+    ]
+    data["confidence_history"] = [s.snapshot for s in snapshots]
+    return Hypothesis(**data)
+
 
 class HypothesisStorage:
     """Store and retrieve theory-based hypotheses."""
 
-    async def store_hypothesis(self, hypothesis: Hypothesis, db: AsyncSession) -> None:
+    async def store_hypothesis(self, hypothesis: Hypothesis, db: Optional[AsyncSession] = None) -> None:
         """Store hypothesis in database and cache in Redis."""
-        result = await db.execute(select(UserProfile).where(UserProfile.user_id == hypothesis.user_id))
-        profile = result.scalar_one_or_none()
+        if db is None:
+            from src.app.core.db.database import local_session
+
+            async with local_session() as session:
+                return await self.store_hypothesis(hypothesis, session)
 
-        if not profile:
-            # Create profile if not exists (should normally exist)
-            profile = UserProfile(user_id=hypothesis.user_id, data={})
-            db.add(profile)
+        row = hypothesis_row(hypothesis)
+        immutable = {"id", "user_id", "generated_at"}
+        stmt = pg_insert(HypothesisRecord).values(**row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HypothesisRecord.id],
+            set_={key: stmt.excluded[key] for key in row if key not in immutable},
+        )
+        await db.execute(stmt)
 
-        if "hypotheses" not in profile.data:
-            profile.data["hypotheses"] = []
+        await self._store_evidence(hypothesis, db)
+        await self._store_snapshots(hypothesis, db)
 
-        # Add or update hypothesis
-        existing_index = next((i for i, h in enumerate(profile.data["hypotheses"]) if h["id"] == hypothesis.id), None)
+        await db.commit()
 
-        if existing_index is not None:
-            profile.data["hypotheses"][existing_index] = hypothesis.model_dump(mode="json")
-        else:
-            profile.data["hypotheses"].append(hypothesis.model_dump(mode="json"))
+        await self._cache([hypothesis])
 
-        # Mark as modified for JSONB
-        flag_modified(profile, "data")
+    async def _store_evidence(self, hypothesis: Hypothesis, db: AsyncSession) -> None:
+        """Insert new evidence records and update weights that changed."""
+        if not hypothesis.evidence_records:
+            return
 
-        await db.commit()
+        result = await db.execute(
+            select(HypothesisEvidence.id, HypothesisEvidence.effective_weight).where(
+                HypothesisEvidence.hypothesis_id == hypothesis.id
+            )
+        )
+        stored = dict(result.all())
 
-        # Cache in Redis
-        from src.app.core.memory.active_memory import get_active_memory
+        new_rows = []
+        reweighted = []
+        for position, record in enumerate(hypothesis.evidence_records):
+            row = evidence_row(hypothesis.id, position, record)
+            if row["id"] not in stored:
+                new_rows.append(row)
+            elif not math.isclose(stored[row["id"]], row["effective_weight"], abs_tol=1e-9):
+                reweighted.append({key: row[key] for key in ("id", *EVIDENCE_WEIGHT_FIELDS)})
 
-        memory = get_active_memory()
-        await memory.initialize()
+        if new_rows:
+            await db.execute(insert(HypothesisEvidence), new_rows)
+        if reweighted:
+            # Bulk UPDATE by primary key
+            await db.execute(update(HypothesisEvidence), reweighted)
+
+    async def _store_snapshots(self, hypothesis: Hypothesis, db: AsyncSession) -> None:
+        """Append snapshots newer than the latest stored one and trim the history."""
+        if not hypothesis.confidence_history:
+            return
 
-        # Get all hypotheses to update cache
-        await memory.set(
-            f"hypotheses:{hypothesis.user_id}",
-            profile.data["hypotheses"],
-            ttl=604800,  # 7 days
+        latest = await db.scalar(
+            select(func.max(HypothesisConfidenceSnapshot.recorded_at)).where(
+                HypothesisConfidenceSnapshot.hypothesis_id == hypothesis.id
+            )
+        )
+        rows = [snapshot_row(hypothesis.id, s) for s in hypothesis.confidence_history]
+        new_rows = [r for r in rows if latest is None or r["recorded_at"] > latest]
+        if not new_rows:
+            return
+
+        await db.execute(insert(HypothesisConfidenceSnapshot), new_rows)
+        await self._trim_snapshots([hypothesis.id], db)
+
+    async def _trim_snapshots(self, hypothesis_ids: List[str], db: AsyncSession) -> None:
+        """Keep the newest MAX_CONFIDENCE_SNAPSHOTS snapshots of each hypothesis."""
+        ranked = (
+            select(
+                HypothesisConfidenceSnapshot.id,
+                func.row_number()
+                .over(
+                    partition_by=HypothesisConfidenceSnapshot.hypothesis_id,
+                    order_by=(HypothesisConfidenceSnapshot.recorded_at.desc(), HypothesisConfidenceSnapshot.id.desc()),
+                )
+                .label("rank"),
+            )
+            .where(HypothesisConfidenceSnapshot.hypothesis_id.in_(hypothesis_ids))
+            .subquery()
+        )
+        await db.execute(
+            delete(HypothesisConfidenceSnapshot).where(
+                HypothesisConfidenceSnapshot.id.in_(
+                    select(ranked.c.id).where(ranked.c.rank > MAX_CONFIDENCE_SNAPSHOTS)
+                )
+            )
         )
 
     async def get_hypotheses(
-        self, user_id: int, min_confidence: float = 0.0, status: Optional[str] = None
+        self,
+        user_id: int,
+        min_confidence: float = 0.0,
+        status: Optional[str] = None,
+        db: Optional[AsyncSession] = None,
+        exclude_statuses: Optional[List[str]] = None,
     ) -> List[Hypothesis]:
-        """Get theory hypotheses for user."""
+        """Get theory hypotheses for user, filtered by confidence and status."""
+        if db is None:
+            from src.app.core.db.database import local_session
+
+            async with local_session() as session:
+                return await self.get_hypotheses(user_id, min_confidence, status, session, exclude_statuses)
+
+        query = select(HypothesisRecord.id).where(
+            HypothesisRecord.user_id == user_id,
+            HypothesisRecord.confidence >= min_confidence,
+        )
+        if status:
+            query = query.where(HypothesisRecord.status == status)
+        if exclude_statuses:
+            query = query.where(HypothesisRecord.status.not_in(exclude_statuses))
+
+        result = await db.execute(query.order_by(HypothesisRecord.generated_at))
+        return await self._load(list(result.scalars().all()), db)
+
+    async def get_hypothesis(
+        self, user_id: int, hypothesis_id: str, db: Optional[AsyncSession] = None
+    ) -> Optional[Hypothesis]:
+        """Get one of the user's hypotheses by ID."""
+        if db is None:
+            from src.app.core.db.database import local_session
+
+            async with local_session() as session:
+                return await self.get_hypothesis(user_id, hypothesis_id, session)
+
+        hypotheses = await self._load([hypothesis_id], db)
+        if not hypotheses or hypotheses[0].user_id != user_id:
+            return None
+        return hypotheses[0]
+
+    async def get_confirmed_hypotheses(self, user_id: int) -> List[Hypothesis]:
+        """Get only confirmed hypotheses (confidence > 0.85)."""
+        return await self.get_hypotheses(user_id, min_confidence=0.85, status="confirmed")
+
+    # =========================================================================
+    # BATCH RECALCULATION
+    # =========================================================================
+
+    async def get_hypothesis_rows(self, after_id: str, limit: int, db: AsyncSession) -> List[HypothesisRecord]:
+        """Hypothesis rows (without evidence) after ``after_id``, in ID order."""
+        result = await db.execute(
+            select(HypothesisRecord).where(HypothesisRecord.id > after_id).order_by(HypothesisRecord.id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_evidence_columns(self, hypothesis_ids: List[str], db: AsyncSession) -> List[Any]:
+        """
+        The evidence fields confidence depends on, as row mappings keyed like EvidenceRecord.
+
+        Ordered by hypothesis and position; the data payload is not loaded.
+        """
+        record = HypothesisEvidence.record
+        result = await db.execute(
+            select(
+                HypothesisEvidence.id,
+                HypothesisEvidence.hypothesis_id,
+                HypothesisEvidence.evidence_type,
+                HypothesisEvidence.is_contradiction,
+                HypothesisEvidence.recency_multiplier,
+                HypothesisEvidence.effective_weight,
+                HypothesisEvidence.recorded_at.label("timestamp"),
+                record["base_weight"].as_float().label("base_weight"),
+                record["source_reliability"].as_float().label("source_reliability"),
+                record["position_factor"].as_float().label("position_factor"),
+                record["source"].as_string().label("source"),
+                func.left(record["reasoning"].as_string(), 100).label("reasoning"),
+            )
+            .where(HypothesisEvidence.hypothesis_id.in_(hypothesis_ids))
+            .order_by(HypothesisEvidence.hypothesis_id, HypothesisEvidence.position)
+        )
+        return list(result.mappings().all())
+
+    async def apply_recalculations(
+        self,
+        hypotheses: List[Dict[str, Any]],
+        evidence_weights: List[Dict[str, Any]],
+        snapshots: List[Dict[str, Any]],
+        invalidate: List[str],
+        db: AsyncSession,
+    ) -> None:
+        """
+        Write a batch of recalculated hypotheses in bulk.
+
+        Args:
+            hypotheses: Rows of id, confidence, status and attributes
+            evidence_weights: Rows of id, recency_multiplier and effective_weight
+            snapshots: snapshot_row() values to append
+            invalidate: Hypothesis IDs whose cache entries are now stale
+            db: Database session
+        """
+        if hypotheses:
+            await db.execute(update(HypothesisRecord), hypotheses)
+        if evidence_weights:
+            await db.execute(update(HypothesisEvidence), evidence_weights)
+        if snapshots:
+            await db.execute(insert(HypothesisConfidenceSnapshot), snapshots)
+            await self._trim_snapshots([s["hypothesis_id"] for s in snapshots], db)
+        await db.commit()
+
+        if invalidate:
+            from src.app.core.memory.active_memory import get_active_memory
+
+            memory = get_active_memory()
+            await memory.initialize()
+            await memory.redis_client.delete(*(CACHE_KEY.format(hypothesis_id=h) for h in invalidate))
+
+    async def _load(self, hypothesis_ids: List[str], db: AsyncSession) -> List[Hypothesis]:
+        """Load hypotheses by ID from Redis, falling back to the database for misses."""
+        if not hypothesis_ids:
+            return []
+
         from src.app.core.memory.active_memory import get_active_memory
 
         memory = get_active_memory()
         await memory.initialize()
 
-        # Try Redis first
-        cached = await memory.get(f"hypotheses:{user_id}")
-
-        if cached:
-            hypotheses_data = cached
-        else:
-            # Fallback to database
-            from src.app.core.db.database import local_session
+        cached = await memory.redis_client.mget([CACHE_KEY.format(hypothesis_id=h) for h in hypothesis_ids])
+        found = {h: Hypothesis(**json.loads(value)) for h, value in zip(hypothesis_ids, cached) if value}
 
-            async with local_session() as db:
-                result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
-                profile = result.scalar_one_or_none()
+        missing = [h for h in hypothesis_ids if h not in found]
+        if missing:
+            fetched = await self._fetch(missing, db)
+            await self._cache(fetched.values())
+            found.update(fetched)
 
-                if not profile or "hypotheses" not in profile.data:
-                    return []
+        return [found[h] for h in hypothesis_ids if h in found]
 
-                hypotheses_data = profile.data["hypotheses"]
+    async def _fetch(self, hypothesis_ids: List[str], db: AsyncSession) -> Dict[str, Hypothesis]:
+        """Load hypotheses with their evidence and history (three queries)."""
+        rows = (
+            await db.execute(select(HypothesisRecord).where(HypothesisRecord.id.in_(hypothesis_ids)))
+        ).scalars().all()
+        if not rows:
+            return {}
 
-                # Cache
-                await memory.set(f"hypotheses:{user_id}", hypotheses_data, ttl=604800)
+        evidence: Dict[str, List[HypothesisEvidence]] = {row.id: [] for row in rows}
+        for e in (
+            await db.execute(
+                select(HypothesisEvidence)
+                .where(HypothesisEvidence.hypothesis_id.in_(evidence))
+                .order_by(HypothesisEvidence.hypothesis_id, HypothesisEvidence.position)
+            )
+        ).scalars():
+            evidence[e.hypothesis_id].append(e)
 
-        # Parse and filter
-        hypotheses = [Hypothesis(**h) for h in hypotheses_data]
+        snapshots: Dict[str, List[HypothesisConfidenceSnapshot]] = {row.id: [] for row in rows}
+        for s in (
+            await db.execute(
+                select(HypothesisConfidenceSnapshot)
+                .where(HypothesisConfidenceSnapshot.hypothesis_id.in_(snapshots))
+                .order_by(
+                    HypothesisConfidenceSnapshot.hypothesis_id,
+                    HypothesisConfidenceSnapshot.recorded_at,
+                    HypothesisConfidenceSnapshot.id,
+                )
+            )
+        ).scalars():
+            snapshots[s.hypothesis_id].append(s)
 
-        # Filter by confidence
-        hypotheses = [h for h in hypotheses if h.confidence >= min_confidence]
+        return {row.id: hypothesis_from_rows(row, evidence[row.id], snapshots[row.id]) for row in rows}
 
-        # Filter by status
-        if status:
-            hypotheses = [h for h in hypotheses if h.status.value == status]
+    async def _cache(self, hypotheses) -> None:
+        """Cache hypotheses individually in Redis."""
+        from src.app.core.memory.active_memory import get_active_memory
 
-        return hypotheses
+        memory = get_active_memory()
+        await memory.initialize()
 
-    async def get_confirmed_hypotheses(self, user_id: int) -> List[Hypothesis]:
-        """Get only confirmed hypotheses (confidence > 0.85)."""
-        return await self.get_hypotheses(user_id, min_confidence=0.85, status="confirmed")
+        pipe = memory.redis_client.pipeline(transaction=False)
+        for hypothesis in hypotheses:
+            pipe.set(
+                CACHE_KEY.format(hypothesis_id=hypothesis.id),
+                json.dumps(hypothesis.model_dump(mode="json")),
+                ex=CACHE_TTL,
+            )
+        await pipe.execute()
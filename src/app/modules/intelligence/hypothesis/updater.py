@@ -13,12 +13,15 @@ and managing their evolution over time.
 """
 
 import logging
+import string
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.events.bus import get_event_bus
+from src.app.modules.intelligence.matching import KeywordMatcher, match_entry, register_vocabulary
 from src.app.protocol.events import (
     HYPOTHESIS_CONFIRMED,
     HYPOTHESIS_EVIDENCE_ADDED,
@@ -29,15 +32,48 @@ from src.app.protocol.events import (
 )
 
 from .confidence import (
+    ConfidenceThresholds,
     EvidenceRecord,
     EvidenceType,
     WeightedConfidenceCalculator,
 )
+from .evidence_matrix import EvidenceMatrix
 from .models import Hypothesis, HypothesisStatus
-from .storage import HypothesisStorage
+from .storage import HypothesisStorage, hypothesis_from_rows, snapshot_row
 
 logger = logging.getLogger(__name__)
 
+# Hypotheses whose evidence matrices stay cached for incremental updates
+MATRIX_CACHE_SIZE = 512
+
+# Hypotheses per vectorized batch in decay_all_hypotheses
+DECAY_BATCH_SIZE = 500
+
+# Keywords by hypothesis type, for journal relevance
+TYPE_KEYWORDS = {
+    "cosmic_sensitivity": [
+        "headache", "migraine", "anxiety", "fatigue", "energy",
+        "tired", "restless", "mood", "sleep", "storm", "magnetic"
+    ],
+    "temporal_pattern": [
+        "monday", "tuesday", "wednesday", "thursday", "friday",
+        "saturday", "sunday", "morning", "evening", "night"
+    ],
+    "transit_effect": [
+        "retrograde", "transit", "mercury", "venus", "mars",
+        "jupiter", "saturn", "uranus", "neptune", "pluto"
+    ],
+    "theme_correlation": [
+        "theme", "period", "card", "magi", "planetary"
+    ],
+    "cyclical_pattern": [
+        "recurring", "pattern", "cycle", "again", "always",
+        "every time", "consistently"
+    ]
+}
+for _type, _keywords in TYPE_KEYWORDS.items():
+    register_vocabulary(f"hypothesis.{_type}", _keywords)
+
 
 class HypothesisUpdater:
     """
@@ -69,6 +105,9 @@ class HypothesisUpdater:
         self.calculator = calculator or WeightedConfidenceCalculator()
         self.event_bus = get_event_bus()
 
+        # Evidence matrices of recently updated hypotheses, by hypothesis ID
+        self._matrices: OrderedDict[str, EvidenceMatrix] = OrderedDict()
+
     async def _ensure_event_bus(self) -> None:
         """Ensure event bus is initialized."""
         if not self.event_bus.redis_client:
@@ -109,8 +148,7 @@ class HypothesisUpdater:
         await self._ensure_event_bus()
 
         # Get hypothesis
-        hypotheses = await self.storage.get_hypotheses(user_id)
-        hypothesis = next((h for h in hypotheses if h.id == hypothesis_id), None)
+        hypothesis = await self.storage.get_hypothesis(user_id, hypothesis_id, db)
 
         if not hypothesis:
             logger.warning(f"Hypothesis {hypothesis_id} not found for user {user_id}")
@@ -495,27 +533,20 @@ class HypothesisUpdater:
         Returns:
             Updated hypothesis
         """
-        # Parse evidence records
-        evidence_records = [
-            EvidenceRecord(**record)
-            for record in hypothesis.evidence_records
-        ]
-
-        # Calculate new confidence
-        new_confidence = self.calculator.calculate_confidence(evidence_records)
-
-        # Get breakdown for caching
-        breakdown = self.calculator.get_confidence_breakdown(evidence_records)
+        # Recency, confidence and breakdown in one pass over the evidence columns
+        matrix = self._evidence_matrix(hypothesis)
+        breakdown = matrix.evaluate()
 
         # Create snapshot
-        snapshot = self.calculator.create_snapshot(
-            evidence_records,
+        snapshot = self.calculator.snapshot_from_breakdown(
+            breakdown,
             trigger="evidence_added",
-            evidence_id=evidence_records[-1].id if evidence_records else None,
+            evidence_id=matrix.ids[-1] if matrix.size else None,
             status=hypothesis.status.value
         )
 
         # Update hypothesis
+        new_confidence = breakdown["total_confidence"]
         hypothesis.confidence = new_confidence
         hypothesis.confidence_breakdown = breakdown
         hypothesis.last_recalculation = datetime.now(UTC)
@@ -525,10 +556,7 @@ class HypothesisUpdater:
         hypothesis.update_status_from_confidence()
 
         # Update evidence records with recency-adjusted weights
-        hypothesis.evidence_records = [
-            record.model_dump(mode="json")
-            for record in evidence_records
-        ]
+        matrix.write_back(hypothesis.evidence_records)
 
         # Persist
         await self.storage.store_hypothesis(hypothesis, db)
@@ -540,6 +568,32 @@ class HypothesisUpdater:
 
         return hypothesis
 
+    def _evidence_matrix(self, hypothesis: Hypothesis) -> EvidenceMatrix:
+        """
+        Get the evidence matrix of a hypothesis, reusing the cached one.
+
+        A cached matrix is extended with appended records (O(1) each) and
+        rebuilt when the stored evidence no longer starts with its records.
+        """
+        records = hypothesis.evidence_records
+        matrix = self._matrices.pop(hypothesis.id, None)
+
+        if matrix is not None:
+            n = matrix.size
+            if n > len(records) or (n and matrix.ids[n - 1] != str(records[n - 1].get("id", ""))):
+                matrix = None
+
+        if matrix is None:
+            matrix = EvidenceMatrix.from_records(records, self.calculator)
+        else:
+            for record in records[matrix.size:]:
+                matrix.append(record)
+
+        self._matrices[hypothesis.id] = matrix
+        if len(self._matrices) > MATRIX_CACHE_SIZE:
+            self._matrices.popitem(last=False)
+        return matrix
+
     async def recalculate_all_user_hypotheses(
         self,
         user_id: int,
@@ -557,7 +611,7 @@ class HypothesisUpdater:
         Returns:
             List of updated hypotheses
         """
-        hypotheses = await self.storage.get_hypotheses(user_id)
+        hypotheses = await self.storage.get_hypotheses(user_id, db=db)
 
         updated = []
         for hypothesis in hypotheses:
@@ -566,6 +620,93 @@ class HypothesisUpdater:
 
         return updated
 
+    async def decay_all_hypotheses(
+        self,
+        db: AsyncSession,
+        batch_size: int = DECAY_BATCH_SIZE
+    ) -> int:
+        """
+        Apply recency decay to every user's hypotheses.
+
+        Evidence of each page of hypotheses is loaded as columns and
+        evaluated in one vectorized pass. Changed confidences, statuses and
+        evidence weights are written back in bulk. Status changes emit the
+        same events as the per-evidence path once the batch is committed.
+        Hypotheses without evidence records keep their initial confidence.
+
+        Args:
+            db: Database session
+            batch_size: Hypotheses per batch
+
+        Returns:
+            Number of hypotheses whose confidence or status changed
+        """
+        now = datetime.now(UTC)
+        refreshed = 0
+        after_id = ""
+
+        while True:
+            rows = await self.storage.get_hypothesis_rows(after_id, batch_size, db)
+            if not rows:
+                break
+            after_id = rows[-1].id
+
+            evidence = await self.storage.get_evidence_columns([row.id for row in rows], db)
+            index = {row.id: g for g, row in enumerate(rows)}
+            matrix = EvidenceMatrix.from_records(evidence, self.calculator)
+            breakdowns = matrix.evaluate_groups([index[e["hypothesis_id"]] for e in evidence], len(rows), now)
+
+            changed_evidence = matrix.changed_rows()
+            stale_cache = {evidence[i]["hypothesis_id"] for i in changed_evidence}
+
+            updates = []
+            snapshots = []
+            transitions = []
+            for row, breakdown in zip(rows, breakdowns):
+                if not breakdown["evidence_count"]:
+                    continue
+
+                confidence = breakdown["total_confidence"]
+                days_since = (now - row.last_evidence_at).days if row.last_evidence_at else 0
+                status = ConfidenceThresholds.get_status_for_confidence(confidence, row.contradictions, days_since)
+                if abs(confidence - row.confidence) < 1e-6 and status == row.status:
+                    continue
+
+                updates.append({
+                    "id": row.id,
+                    "confidence": confidence,
+                    "status": status,
+                    "attributes": {
+                        **(row.attributes or {}),
+                        "confidence_breakdown": breakdown,
+                        "last_recalculation": now.isoformat(),
+                    },
+                })
+                snapshot = self.calculator.snapshot_from_breakdown(breakdown, trigger="recency_decay", status=status)
+                snapshots.append(snapshot_row(row.id, snapshot.model_dump(mode="json")))
+                stale_cache.add(row.id)
+
+                if status != row.status:
+                    hypothesis = hypothesis_from_rows(row, [], [])
+                    hypothesis.confidence = confidence
+                    hypothesis.status = HypothesisStatus(status)
+                    transitions.append((hypothesis, row.confidence, HypothesisStatus(row.status)))
+
+            await self.storage.apply_recalculations(
+                updates,
+                matrix.weight_updates(changed_evidence),
+                snapshots,
+                sorted(stale_cache),
+                db,
+            )
+            refreshed += len(updates)
+
+            for hypothesis, old_confidence, old_status in transitions:
+                await self._emit_update_events(hypothesis, old_confidence, old_status, "recency_decay")
+
+        logger.info(f"[HypothesisUpdater] Recency decay refreshed {refreshed} hypotheses")
+        return refreshed
+
     async def _emit_update_events(
         self,
         hypothesis: Hypothesis,
@@ -794,52 +935,32 @@ class HypothesisUpdater:
         Returns:
             List of relevant hypotheses with relevance scores
         """
-        hypotheses = await self.storage.get_hypotheses(user_id)
+        # Skip rejected/stale hypotheses
+        hypotheses = await self.storage.get_hypotheses(
+            user_id, exclude_statuses=[HypothesisStatus.REJECTED.value, HypothesisStatus.STALE.value]
+        )
 
         relevant = []
 
-        # Keywords by hypothesis type
-        type_keywords = {
-            "cosmic_sensitivity": [
-                "headache", "migraine", "anxiety", "fatigue", "energy",
-                "tired", "restless", "mood", "sleep", "storm", "magnetic"
-            ],
-            "temporal_pattern": [
-                "monday", "tuesday", "wednesday", "thursday", "friday",
-                "saturday", "sunday", "morning", "evening", "night"
-            ],
-            "transit_effect": [
-                "retrograde", "transit", "mercury", "venus", "mars",
-                "jupiter", "saturn", "uranus", "neptune", "pluto"
-            ],
-            "theme_correlation": [
-                "theme", "period", "card", "magi", "planetary"
-            ],
-            "cyclical_pattern": [
-                "recurring", "pattern", "cycle", "again", "always",
-                "every time", "consistently"
-            ]
-        }
+        # One scan for the type keywords (shared matcher, cached by content)
+        type_matches = match_entry(None, journal_content)
 
-        content_lower = journal_content.lower()
+        # One scan for every hypothesis' claim words and predicted value
+        claim_matches = KeywordMatcher({
+            "claim": {
+                h.id: [w for w in (word.strip(string.punctuation) for word in h.claim.split()) if len(w) > 4]
+                for h in hypotheses
+            },
+            "predicted": {h.id: [h.predicted_value] for h in hypotheses if h.predicted_value},
+        }).scan(journal_content)
 
         for hypothesis in hypotheses:
-            # Skip rejected/stale hypotheses
-            if hypothesis.status in [HypothesisStatus.REJECTED, HypothesisStatus.STALE]:
-                continue
-
             # Check keyword match
-            keywords = type_keywords.get(hypothesis.hypothesis_type.value, [])
-            matching = [kw for kw in keywords if kw in content_lower]
+            matching = type_matches.labels(f"hypothesis.{hypothesis.hypothesis_type.value}")
 
             # Check claim/predicted value match
-            claim_match = any(
-                word.lower() in content_lower
-                for word in hypothesis.claim.split()
-                if len(word) > 4
-            )
-
-            predicted_match = hypothesis.predicted_value.lower() in content_lower
+            claim_match = claim_matches.has("claim", hypothesis.id)
+            predicted_match = claim_matches.has("predicted", hypothesis.id)
 
             # Calculate relevance
             relevance = 0.0
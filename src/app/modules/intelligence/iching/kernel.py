@@ -3948,6 +3948,9 @@ class SwissEphemerisService:
     This service provides exact solar longitudes for precise gate/line
     calculations, down to tone and base level.
 
+    When the GUTTERS precomputed ephemeris grid is importable, positions
+    are interpolated from it (falling back to swisseph outside its window).
+
     Requires: pip install pyswisseph
     """
 
@@ -3970,6 +3973,20 @@ class SwissEphemerisService:
             self._swe = None
             self._available = False
 
+        self._grid = None
+        if self._available:
+            try:
+                from src.app.modules.tracking.ephemeris_grid import get_ephemeris_grid
+                self._grid = get_ephemeris_grid()
+            except ImportError:
+                self._grid = None
+
+    def _calc_longitude(self, jd: float, body_id: int) -> float:
+        """Longitude of a body, via the ephemeris grid when available."""
+        if self._grid is not None:
+            return self._grid.calc_ut(jd, body_id)[0]
+        return self._swe.calc_ut(jd, body_id)[0][0]
+
     @property
     def is_available(self) -> bool:
         """Check if ephemeris is available."""
@@ -3989,8 +4006,7 @@ class SwissEphemerisService:
             raise RuntimeError("Swiss Ephemeris not available")
 
         # Calculate Sun position (tropical)
-        result = self._swe.calc_ut(jd, self._swe.SUN)
-        return result[0][0]  # Longitude is first element
+        return self._calc_longitude(jd, self._swe.SUN)
 
     def get_planetary_positions(self, jd: float) -> Dict[str, float]:
         """
@@ -4027,8 +4043,7 @@ class SwissEphemerisService:
 
         positions = {}
         for name, body_id in bodies.items():
-            result = self._swe.calc_ut(jd, body_id)
-            positions[name] = result[0][0]
+            positions[name] = self._calc_longitude(jd, body_id)
 
         # Earth is opposite Sun
         positions["Earth"] = (positions["Sun"] + 180) % 360
@@ -0,0 +1,182 @@
+"""
+Insight Trigger Index.
+
+Inverted index from cosmic trigger keys to the users who can react to them,
+so a global COSMIC_UPDATE only loads findings for users with a matching
+Observer pattern instead of scanning every user.
+
+Redis layout:
+- ``insight:index:solar_symptom``: users with a qualifying solar_symptom finding
+- ``insight:index:lunar_phase:<phase>``: users with a qualifying lunar_phase
+  finding for that phase (lowercased; may be empty)
+- ``insight:index:lunar_phases``: known phases, for substring matching
+- ``insight:index:user:<id>``: keys the user is in, to drop stale memberships
+- ``insight:cooldown:<topic>``: sorted set of user id -> last prompt timestamp
+
+A finding qualifies at confidence >= MIN_FINDING_CONFIDENCE (the threshold
+evaluate_cosmic_triggers uses). The index is maintained by
+ObserverFindingStorage.store_finding and rebuilt from the database when Redis
+has lost it.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MIN_FINDING_CONFIDENCE = 0.6
+PROMPT_COOLDOWN = timedelta(hours=18)
+
+SOLAR_KEY = "insight:index:solar_symptom"
+LUNAR_KEY = "insight:index:lunar_phase:{phase}"
+LUNAR_PHASES_KEY = "insight:index:lunar_phases"
+USER_KEYS_KEY = "insight:index:user:{user_id}"
+COOLDOWN_KEY = "insight:cooldown:{topic}"
+BUILT_KEY = "insight:index:built"
+
+
+def index_keys(findings: Iterable[dict[str, Any]]) -> set[str]:
+    """Index keys a user belongs to, given their stored findings."""
+    keys = set()
+    for finding in findings:
+        if finding.get("confidence", 0) < MIN_FINDING_CONFIDENCE:
+            continue
+        pattern_type = finding.get("pattern_type")
+        if pattern_type == "solar_symptom":
+            keys.add(SOLAR_KEY)
+        elif pattern_type == "lunar_phase":
+            keys.add(LUNAR_KEY.format(phase=(finding.get("phase") or "").lower()))
+    return keys
+
+
+class InsightTriggerIndex:
+    """Maintains and queries the cosmic trigger inverted index."""
+
+    def __init__(self):
+        """Initialize index (call initialize() to connect to Redis)."""
+        self.redis_client: redis.Redis | None = None
+
+    async def initialize(self) -> None:
+        """Connect to Redis."""
+        if self.redis_client:
+            return
+        self.redis_client = redis.Redis(
+            host=settings.REDIS_CACHE_HOST,
+            port=settings.REDIS_CACHE_PORT,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            decode_responses=True,
+        )
+
+    async def update_user(self, user_id: int, findings: list[dict[str, Any]]) -> None:
+        """Replace a user's index memberships with those of ``findings``."""
+        await self.initialize()
+        user_key = USER_KEYS_KEY.format(user_id=user_id)
+        old_keys = set(await self.redis_client.smembers(user_key))
+        new_keys = index_keys(findings)
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        for key in old_keys - new_keys:
+            pipe.srem(key, user_id)
+        for key in new_keys - old_keys:
+            pipe.sadd(key, user_id)
+        phases = [key.removeprefix(LUNAR_KEY.format(phase="")) for key in new_keys if key != SOLAR_KEY]
+        if phases:
+            pipe.sadd(LUNAR_PHASES_KEY, *phases)
+        pipe.delete(user_key)
+        if new_keys:
+            pipe.sadd(user_key, *new_keys)
+        await pipe.execute()
+
+    async def solar_candidates(self) -> set[int]:
+        """Users with a qualifying solar_symptom finding."""
+        await self.initialize()
+        return {int(uid) for uid in await self.redis_client.smembers(SOLAR_KEY)}
+
+    async def lunar_candidates(self, moon_phase: str) -> set[int]:
+        """Users with a qualifying lunar_phase finding matching ``moon_phase``."""
+        await self.initialize()
+        target = moon_phase.lower()
+        phases = [p for p in await self.redis_client.smembers(LUNAR_PHASES_KEY) if p in target]
+        if not phases:
+            return set()
+        members = await self.redis_client.sunion(*(LUNAR_KEY.format(phase=p) for p in phases))
+        return {int(uid) for uid in members}
+
+    async def mark_prompted(self, topic: str, user_ids: Iterable[int], when: datetime | None = None) -> None:
+        """Record that ``user_ids`` received a ``topic`` prompt."""
+        mapping = {str(uid): (when or datetime.now(UTC)).timestamp() for uid in user_ids}
+        if not mapping:
+            return
+        await self.initialize()
+        key = COOLDOWN_KEY.format(topic=topic)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zadd(key, mapping)
+        # Entries older than the cooldown no longer matter
+        pipe.zremrangebyscore(key, "-inf", (datetime.now(UTC) - PROMPT_COOLDOWN).timestamp())
+        await pipe.execute()
+
+    async def cooling_down(self, topic: str, user_ids: Iterable[int]) -> set[int]:
+        """The subset of ``user_ids`` prompted on ``topic`` within the cooldown."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return set()
+        await self.initialize()
+        cutoff = (datetime.now(UTC) - PROMPT_COOLDOWN).timestamp()
+        scores = await self.redis_client.zmscore(COOLDOWN_KEY.format(topic=topic), [str(uid) for uid in user_ids])
+        return {uid for uid, score in zip(user_ids, scores) if score is not None and score >= cutoff}
+
+    async def ensure_built(self, db: AsyncSession) -> None:
+        """Rebuild the index from the database if Redis has lost it."""
+        await self.initialize()
+        if await self.redis_client.exists(BUILT_KEY):
+            return
+        await self.rebuild(db)
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Rebuild memberships from stored findings and cooldowns from recent prompts."""
+        from src.app.models.insight import ReflectionPrompt
+        from src.app.models.user_profile import UserProfile
+
+        await self.initialize()
+
+        profiles = await db.execute(
+            select(UserProfile.user_id, UserProfile.data["observer_findings"]).where(
+                UserProfile.data.has_key("observer_findings")
+            )
+        )
+        indexed = 0
+        for user_id, findings in profiles.all():
+            await self.update_user(user_id, findings or [])
+            indexed += 1
+
+        since = datetime.now(UTC) - PROMPT_COOLDOWN
+        recent = await db.execute(
+            select(ReflectionPrompt.topic, ReflectionPrompt.user_id, ReflectionPrompt.created_at).where(
+                ReflectionPrompt.created_at >= since
+            )
+        )
+        for topic, user_id, created_at in recent.all():
+            await self.mark_prompted(topic, [user_id], created_at)
+
+        await self.redis_client.set(BUILT_KEY, datetime.now(UTC).isoformat())
+        logger.info(f"[InsightIndex] Rebuilt trigger index for {indexed} users")
+
+
+# Singleton instance
+_trigger_index: InsightTriggerIndex | None = None
+
+
+def get_trigger_index() -> InsightTriggerIndex:
+    """Get the singleton InsightTriggerIndex instance."""
+    global _trigger_index
+    if _trigger_index is None:
+        _trigger_index = InsightTriggerIndex()
+    return _trigger_index
@@ -13,8 +13,6 @@ Event Handlers:
 import logging
 from typing import Any
 
-from sqlalchemy import select
-
 from src.app.core.db.database import async_get_db
 from src.app.core.events.bus import get_event_bus
 from src.app.modules.intelligence.insight.manager import InsightManager
@@ -32,7 +30,9 @@ logger = logging.getLogger(__name__)
 async def handle_cosmic_update(payload: dict[str, Any]):
     """
     Handle COSMIC_UPDATE event.
-    Trigger InsightManager to evaluate potential reflection prompts for ALL users.
+
+    Global updates only evaluate users the trigger index matches (a qualifying
+    solar/lunar pattern and no active cooldown), in one concurrent batch.
     """
     manager = InsightManager()
 
@@ -43,21 +43,19 @@ async def handle_cosmic_update(payload: dict[str, Any]):
         # 2. Case: Global Event (No specific user_id)
         if not user_id:
             logger.info("Insight Engine reacting to GLOBAL COSMIC_UPDATE")
-            # Fetch all active users
-            from src.app.models.user import User
-
-            stmt = select(User.id).where(User.is_deleted.is_(False))
-            result = await db.execute(stmt)
-            user_ids = result.scalars().all()
-
-            for uid in user_ids:
-                try:
-                    # Note: We could parallelize this with asyncio.gather,
-                    # but for now we'll do them sequentially to avoid overloading DB/LLM.
-                    # Ideally this triggers an arq job per user.
-                    await manager.evaluate_cosmic_triggers(uid, payload, db)
-                except Exception as e:
-                    logger.error(f"Error evaluating insights for user {uid}: {e}")
+            try:
+                user_ids = await manager.find_cosmic_candidates(payload, db)
+                if not user_ids:
+                    logger.info("[InsightListener] No users match this cosmic update")
+                    return
+
+                prompts = await manager.evaluate_cosmic_triggers_batch(user_ids, payload, db)
+                logger.info(
+                    f"[InsightListener] Cosmic update evaluated for {len(user_ids)} matching users, "
+                    f"{len(prompts)} prompts created"
+                )
+            except Exception as e:
+                logger.error(f"Error evaluating global cosmic insights: {e}")
 
         # 3. Case: Targeted Event
         else:
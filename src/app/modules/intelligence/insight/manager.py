@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from datetime import UTC, datetime, timedelta
@@ -7,17 +8,26 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.ai.response_cache import cached_llm
 from src.app.core.llm.config import get_premium_llm
 from src.app.models.insight import PromptPhase, PromptStatus, ReflectionPrompt
+from src.app.models.user import User
 from src.app.modules.features.quests.manager import QuestManager
 from src.app.modules.features.quests.models import QuestCategory, QuestDifficulty, QuestSource
 from src.app.modules.infrastructure.push.service import NotificationService
 from src.app.modules.intelligence.observer.storage import ObserverFindingStorage
 
+from .index import MIN_FINDING_CONFIDENCE, PROMPT_COOLDOWN, get_trigger_index
 from .schemas import TriggerContext
 
 logger = logging.getLogger(__name__)
 
+# Kp index at which a geomagnetic storm triggers solar prompts
+SOLAR_STORM_KP = 5
+
+# Users whose findings / prompt texts are fetched at once in a global update
+COSMIC_EVAL_CONCURRENCY = 8
+
 
 class InsightManager:
     """
@@ -48,75 +58,160 @@ class InsightManager:
         logger.info(f"Evaluating triggers for user {user_id} with data {cosmic_data}")
 
         # 1. Fetch User Patterns (Observer Findings)
-        findings = await self.observer_storage.get_findings(user_id, min_confidence=0.6)
+        findings = await self.observer_storage.get_findings(user_id, min_confidence=MIN_FINDING_CONFIDENCE)
 
+        # 2. Check Triggers logic
         prompts = []
+        for topic, finding, trigger_ctx, phase in self.match_cosmic_triggers(findings, cosmic_data):
+            # Anti-Spam Check
+            if not await self._should_trigger(user_id, topic, phase, db):
+                logger.info(f"Skipping {topic} trigger due to cooldown")
+                continue
 
-        # 2. Check Triggers logic
+            prompt = await self._create_prompt(user_id, finding, trigger_ctx, phase, topic, db)
+            if prompt:
+                prompts.append(prompt)
+
+        return prompts
+
+    def match_cosmic_triggers(
+        self, findings: List[Dict], cosmic_data: Dict[str, Any]
+    ) -> List[tuple[str, Dict, TriggerContext, PromptPhase]]:
+        """
+        Match a user's findings against the current cosmic state.
+
+        Returns:
+            (topic, finding, trigger context, phase) for each triggered topic,
+            at most one per topic (the cooldown allows one prompt per topic)
+        """
+        matches = []
 
         # --- Solar Check ---
         kp_index = float(cosmic_data.get("kp_index", 0))
-        if kp_index >= 5:  # Storm condition
+        if kp_index >= SOLAR_STORM_KP:  # Storm condition
             # Phase Determination
             # For volatile events like Solar, we assume PEAK if storm is active.
             # Ideally we track history to see if it just started or is ending for INTEGRATION.
             # Simplified: Active Storm = PEAK.
-
-            phase = PromptPhase.PEAK
             trigger_ctx = TriggerContext(
                 source_type="cosmic_event", metric="kp_index", value=kp_index, timestamp=datetime.now(UTC)
             )
 
             # Match against findings
-            relevant_findings = [f for f in findings if f.get("pattern_type") == "solar_symptom"]
-
-            if relevant_findings:
-                for finding in relevant_findings:
-                    # Anti-Spam Check (Topic: solar_sensitivity)
-                    if not await self._should_trigger(user_id, "solar_sensitivity", phase, db):
-                        logger.info("Skipping Solar trigger due to cooldown")
-                        continue
-
-                    prompt = await self._create_prompt(user_id, finding, trigger_ctx, phase, "solar_sensitivity", db)
-                    if prompt:
-                        prompts.append(prompt)
+            match = next((f for f in findings if f.get("pattern_type") == "solar_symptom"), None)
+            if match:
+                matches.append(("solar_sensitivity", match, trigger_ctx, PromptPhase.PEAK))
 
         # --- Lunar Check ---
-        moon_phase = cosmic_data.get("moon_phase", "")  # e.g. 'Full', 'New'
-        # Assume cosmic_data includes 'approaching_phase' if we have predictive logic upstream
-        # Or we calculate it.
-        # For this implementation, I'll rely on explicit 'event_phase' in cosmic_data if available,
-        # or defaults.
-
         # Example: Input might contain {'moon_phase': 'Full', 'phase_type': 'peak'}
         # or {'approaching_moon': 'New', 'hours_until': 24, 'phase_type': 'anticipation'}
-
         lunar_event_type = cosmic_data.get("moon_event_type", "none")  # anticipation, peak, integration
 
         if lunar_event_type != "none":
             phase = PromptPhase(lunar_event_type)  # Map string to Enum
-
-            trigger_val = cosmic_data.get("moon_phase_name", moon_phase)
+            target_moon = cosmic_data.get("moon_phase_name", cosmic_data.get("moon_phase", ""))
 
             trigger_ctx = TriggerContext(
-                source_type="cosmic_event", metric="moon_phase", value=trigger_val, timestamp=datetime.now(UTC)
+                source_type="cosmic_event", metric="moon_phase", value=target_moon, timestamp=datetime.now(UTC)
             )
 
-            relevant_findings = [f for f in findings if f.get("pattern_type") == "lunar_phase"]
-            # Filter related to specific phase if possible, but pattern just says "during {phase}"
             # We assume if user has pattern for 'Full Moon', we trigger on Anticipation/Peak/Integration of Full Moon.
+            match = next(
+                (
+                    f
+                    for f in findings
+                    if f.get("pattern_type") == "lunar_phase" and f.get("phase", "").lower() in target_moon.lower()
+                ),
+                None,
+            )
+            if match:
+                matches.append(("lunar_pattern", match, trigger_ctx, phase))
 
-            target_moon = trigger_val
+        return matches
 
-            match = next((f for f in relevant_findings if f.get("phase", "").lower() in target_moon.lower()), None)
+    async def find_cosmic_candidates(self, cosmic_data: Dict[str, Any], db: AsyncSession) -> List[int]:
+        """
+        Active users that may react to a global cosmic update.
 
-            if match:
-                if await self._should_trigger(user_id, "lunar_pattern", phase, db):
-                    prompt = await self._create_prompt(user_id, match, trigger_ctx, phase, "lunar_pattern", db)
-                    if prompt:
-                        prompts.append(prompt)
+        Uses the trigger index: only users with a qualifying solar/lunar pattern
+        who are not in cooldown for that topic.
+        """
+        index = get_trigger_index()
+        await index.ensure_built(db)
 
-        return prompts
+        candidates: set[int] = set()
+        if float(cosmic_data.get("kp_index", 0)) >= SOLAR_STORM_KP:
+            solar = await index.solar_candidates()
+            candidates |= solar - await index.cooling_down("solar_sensitivity", solar)
+
+        if cosmic_data.get("moon_event_type", "none") != "none":
+            lunar = await index.lunar_candidates(cosmic_data.get("moon_phase_name", cosmic_data.get("moon_phase", "")))
+            candidates |= lunar - await index.cooling_down("lunar_pattern", lunar)
+
+        if not candidates:
+            return []
+
+        result = await db.execute(select(User.id).where(User.id.in_(list(candidates)), User.is_deleted.is_(False)))
+        return list(result.scalars().all())
+
+    async def evaluate_cosmic_triggers_batch(
+        self, user_ids: List[int], cosmic_data: Dict[str, Any], db: AsyncSession
+    ) -> List[ReflectionPrompt]:
+        """
+        evaluate_cosmic_triggers for many users at once.
+
+        Findings and prompt texts are fetched concurrently (at most
+        COSMIC_EVAL_CONCURRENCY at a time), cooldowns are checked with one
+        query, and the prompts are inserted in one commit.
+        """
+        semaphore = asyncio.Semaphore(COSMIC_EVAL_CONCURRENCY)
+
+        async def match_user(user_id: int) -> list:
+            async with semaphore:
+                findings = await self.observer_storage.get_findings(user_id, min_confidence=MIN_FINDING_CONFIDENCE)
+            return [(user_id, *match) for match in self.match_cosmic_triggers(findings, cosmic_data)]
+
+        per_user = await asyncio.gather(*(match_user(uid) for uid in user_ids), return_exceptions=True)
+        matches = []
+        for user_id, result in zip(user_ids, per_user):
+            if isinstance(result, BaseException):
+                logger.error(f"Error evaluating insights for user {user_id}: {result}")
+            else:
+                matches.extend(result)
+        if not matches:
+            return []
+
+        # Anti-Spam: one query for every (user, topic) pair
+        cutoff = datetime.now(UTC) - PROMPT_COOLDOWN
+        recent = await db.execute(
+            select(ReflectionPrompt.user_id, ReflectionPrompt.topic).where(
+                ReflectionPrompt.user_id.in_(list({m[0] for m in matches})),
+                ReflectionPrompt.topic.in_(list({m[1] for m in matches})),
+                ReflectionPrompt.created_at >= cutoff,
+            )
+        )
+        cooling = {(user_id, topic) for user_id, topic in recent.all()}
+        matches = [m for m in matches if (m[0], m[1]) not in cooling]
+
+        async def build_prompt(user_id, topic, finding, trigger_ctx, phase) -> ReflectionPrompt:
+            async with semaphore:
+                prompt_text = await self.generate_prompt_text(finding, trigger_ctx, phase)
+            return self._build_prompt(user_id, prompt_text, trigger_ctx, phase, topic)
+
+        prompts = await asyncio.gather(*(build_prompt(*m) for m in matches))
+        db.add_all(prompts)
+        await db.commit()
+
+        for topic in {m[1] for m in matches}:
+            await self._mark_prompted(topic, [p.user_id for p in prompts if p.topic == topic])
+
+        for (user_id, topic, finding, trigger_ctx, phase), db_prompt in zip(matches, prompts):
+            try:
+                await self._after_prompt_created(user_id, db_prompt, finding, trigger_ctx, phase, topic, db)
+            except Exception as e:
+                logger.error(f"Error delivering insight prompt {db_prompt.id} to user {user_id}: {e}")
+
+        return list(prompts)
 
     async def _should_trigger(self, user_id: int, topic: str, phase: PromptPhase, db: AsyncSession) -> bool:
         """
@@ -125,7 +220,7 @@ class InsightManager:
         Rules:
         1. No prompts with same topic in last 18 hours.
         """
-        cutoff = datetime.now(UTC) - timedelta(hours=18)
+        cutoff = datetime.now(UTC) - PROMPT_COOLDOWN
 
         stmt = select(ReflectionPrompt).where(
             ReflectionPrompt.user_id == user_id, ReflectionPrompt.topic == topic, ReflectionPrompt.created_at >= cutoff
@@ -135,18 +230,12 @@ class InsightManager:
 
         return existing is None
 
-    async def _create_prompt(
-        self, user_id: int, finding: Dict, trigger: TriggerContext, phase: PromptPhase, topic: str, db: AsyncSession
-    ) -> Optional[ReflectionPrompt]:
-        """Generate prompt via LLM, save to DB, and notify."""
-
-        # 1. Generate Text
-        prompt_text = await self.generate_prompt_text(finding, trigger, phase)
-
-        # 2. Save
+    def _build_prompt(
+        self, user_id: int, prompt_text: str, trigger: TriggerContext, phase: PromptPhase, topic: str
+    ) -> ReflectionPrompt:
         expires = datetime.now(UTC) + timedelta(hours=24)  # Default expiry
 
-        db_prompt = ReflectionPrompt(
+        return ReflectionPrompt(
             user_id=user_id,
             prompt_text=prompt_text,
             topic=topic,
@@ -155,15 +244,48 @@ class InsightManager:
             status=PromptStatus.PENDING,
             expires_at=expires,
         )
+
+    async def _create_prompt(
+        self, user_id: int, finding: Dict, trigger: TriggerContext, phase: PromptPhase, topic: str, db: AsyncSession
+    ) -> Optional[ReflectionPrompt]:
+        """Generate prompt via LLM, save to DB, and notify."""
+
+        # 1. Generate Text
+        prompt_text = await self.generate_prompt_text(finding, trigger, phase)
+
+        # 2. Save
+        db_prompt = self._build_prompt(user_id, prompt_text, trigger, phase, topic)
         db.add(db_prompt)
         await db.commit()
         await db.refresh(db_prompt)
+        await self._mark_prompted(topic, [user_id])
 
+        await self._after_prompt_created(user_id, db_prompt, finding, trigger, phase, topic, db)
+        return db_prompt
+
+    async def _mark_prompted(self, topic: str, user_ids: List[int]) -> None:
+        """Record the cooldown in the trigger index (the database stays authoritative)."""
+        try:
+            await get_trigger_index().mark_prompted(topic, user_ids)
+        except Exception as e:
+            logger.warning(f"Failed to update insight cooldown index: {e}")
+
+    async def _after_prompt_created(
+        self,
+        user_id: int,
+        db_prompt: ReflectionPrompt,
+        finding: Dict,
+        trigger: TriggerContext,
+        phase: PromptPhase,
+        topic: str,
+        db: AsyncSession,
+    ) -> None:
+        """Notify, emit the prompt event and maybe start a companion quest."""
         # 3. Notify
         await self.notification_service.send_notification(
             user_id,
             title=f"Cosmic Reflection ({phase.value.title()})",
-            body=prompt_text,
+            body=db_prompt.prompt_text,
             data={"url": f"/journal/new?prompt_id={db_prompt.id}"},  # Deep link
             db=db,
         )
@@ -178,8 +300,6 @@ class InsightManager:
             except Exception as e:
                 logger.error(f"Failed to trigger proactive quest: {e}")
 
-        return db_prompt
-
     async def _emit_prompt_event(self, user_id: int, prompt_id: int, topic: str):
         """Emit REFLECTION_PROMPT_GENERATED event."""
         from src.app.core.events.bus import get_event_bus
@@ -273,7 +393,8 @@ class InsightManager:
         """
 
         try:
-            response = await self.llm.ainvoke([SystemMessage(content=system_prompt), HumanMessage(content=user_msg)])
+            llm = cached_llm(self.llm, "insight.prompt_text", ttl=6 * 3600)
+            response = await llm.ainvoke([SystemMessage(content=system_prompt), HumanMessage(content=user_msg)])
             return response.content.strip()
         except Exception as e:
             logger.error(f"LLM Prompt Gen failed: {e}")
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional
 
+from src.app.core.ai.response_cache import cached_llm
 from src.app.core.llm.config import get_standard_llm
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,8 @@ class JournalistEngine:
     """
 
     def __init__(self):
-        self.llm = get_standard_llm()  # Haiku for speed/cost
+        # Haiku for speed/cost; the same event in the same context gets the same log line
+        self.llm = cached_llm(get_standard_llm(), "journalist.log_entry", ttl=6 * 3600)
 
     async def generate_log_entry(
         self, event_type: str, title: str, context: Dict[str, Any], details: Optional[Dict[str, Any]] = None
@@ -0,0 +1,203 @@
+"""
+Shared Keyword Matcher
+
+Compiles keyword vocabularies (symptoms, themes, hypothesis keywords, ...)
+into one Aho-Corasick automaton, so a document is scanned once for every
+vocabulary instead of once per keyword per consumer.
+
+- A vocabulary maps labels to surface forms (``{"brain_fog": ["brain fog",
+  "brain_fog"]}``); a plain list uses each term as its own label.
+- Matching is case-insensitive and word-bounded at the start of a term, so
+  "art" no longer matches "start" while "headache" still matches
+  "headaches". ``match_suffixes=False`` also requires a boundary at the end.
+- A scan returns a ``DocumentMatches`` bitset with one bit per
+  (vocabulary, label); consumers query it by vocabulary.
+- ``match_entry`` caches scans of the shared matcher by entry ID and
+  content hash, so each journal entry is scanned once for all consumers.
+
+Example:
+    >>> register_vocabulary("symptoms", ["headache", "fatigue"])
+    >>> matches = match_entry(entry_id=42, text="Headaches and fatigue today")
+    >>> matches.labels("symptoms")
+    ['headache', 'fatigue']
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+Vocabulary = Mapping[str, Iterable[str]] | Iterable[str]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class DocumentMatches:
+    """Match bitset of one document against a compiled matcher."""
+
+    __slots__ = ("bits", "_matcher")
+
+    def __init__(self, bits: int, matcher: "KeywordMatcher") -> None:
+        self.bits = bits
+        self._matcher = matcher
+
+    def labels(self, vocabulary: str) -> list[str]:
+        """Matched labels of ``vocabulary``, in vocabulary order."""
+        return [label for label, bit in self._matcher.label_bits(vocabulary) if self.bits & bit]
+
+    def has(self, vocabulary: str, label: str) -> bool:
+        return bool(self.bits & self._matcher.bit(vocabulary, label))
+
+    def any(self, vocabulary: str) -> bool:
+        return bool(self.bits & self._matcher.mask(vocabulary))
+
+    def count(self, vocabulary: str) -> int:
+        return (self.bits & self._matcher.mask(vocabulary)).bit_count()
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over the surface forms of several vocabularies."""
+
+    def __init__(self, vocabularies: Mapping[str, Vocabulary], match_suffixes: bool = True) -> None:
+        self.match_suffixes = match_suffixes
+
+        self._labels: dict[str, list[tuple[str, int]]] = {}
+        self._masks: dict[str, int] = {}
+
+        # Trie: per node, char -> child; outputs are (term length, bits)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, int]]] = [[]]
+
+        bit = 1
+        for name, vocabulary in vocabularies.items():
+            items = vocabulary.items() if isinstance(vocabulary, Mapping) else ((t, [t]) for t in vocabulary)
+            labels = []
+            for label, surfaces in items:
+                labels.append((label, bit))
+                for surface in surfaces:
+                    self._add(surface.lower(), bit)
+                bit <<= 1
+            self._labels[name] = labels
+            self._masks[name] = sum(b for _, b in labels)
+
+        self._build_failure_links()
+
+    def _add(self, term: str, bit: int) -> None:
+        if not term:
+            return
+        node = 0
+        for char in term:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = child
+        self._out[node].append((len(term), bit))
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                # Inherit matches ending here through the failure link
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> DocumentMatches:
+        """Match every vocabulary against ``text`` in one pass."""
+        text = (text or "").lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        end = len(text)
+        bits = 0
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, bit in out[node]:
+                if bits & bit:
+                    continue
+                start = i - length + 1
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                    continue
+                if not self.match_suffixes and i + 1 < end and _is_word_char(text[i + 1]) and _is_word_char(char):
+                    continue
+                bits |= bit
+        return DocumentMatches(bits, self)
+
+    def label_bits(self, vocabulary: str) -> list[tuple[str, int]]:
+        return self._labels.get(vocabulary, [])
+
+    def bit(self, vocabulary: str, label: str) -> int:
+        return next((b for lbl, b in self.label_bits(vocabulary) if lbl == label), 0)
+
+    def mask(self, vocabulary: str) -> int:
+        return self._masks.get(vocabulary, 0)
+
+
+# ============================================================================
+# Shared matcher and per-entry cache
+# ============================================================================
+
+ENTRY_CACHE_SIZE = 4096
+
+_vocabularies: dict[str, Vocabulary] = {}
+_shared_matcher: KeywordMatcher | None = None
+_entry_cache: OrderedDict[tuple[Any, str], int] = OrderedDict()
+_lock = threading.Lock()
+
+
+def register_vocabulary(name: str, vocabulary: Vocabulary) -> None:
+    """Add or replace a vocabulary of the shared matcher (recompiled lazily)."""
+    global _shared_matcher
+    vocabulary = dict(vocabulary) if isinstance(vocabulary, Mapping) else list(vocabulary)
+    with _lock:
+        if _vocabularies.get(name) == vocabulary:
+            return
+        _vocabularies[name] = vocabulary
+        _shared_matcher = None
+        # Cached bitsets refer to the previous bit layout
+        _entry_cache.clear()
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Get the shared matcher compiled from all registered vocabularies."""
+    global _shared_matcher
+    with _lock:
+        if _shared_matcher is None:
+            _shared_matcher = KeywordMatcher(_vocabularies)
+        return _shared_matcher
+
+
+def match_entry(entry_id: Any, text: str) -> DocumentMatches:
+    """
+    Scan an entry with the shared matcher, cached by entry ID and content hash.
+
+    An edited entry hashes differently and is rescanned.
+    """
+    matcher = get_keyword_matcher()
+    key = (entry_id, hashlib.blake2b((text or "").encode(), digest_size=16).hexdigest())
+
+    with _lock:
+        bits = _entry_cache.get(key)
+        if bits is not None and matcher is _shared_matcher:
+            _entry_cache.move_to_end(key)
+            return DocumentMatches(bits, matcher)
+
+    matches = matcher.scan(text)
+    with _lock:
+        if matcher is _shared_matcher:
+            _entry_cache[key] = matches.bits
+            if len(_entry_cache) > ENTRY_CACHE_SIZE:
+                _entry_cache.popitem(last=False)
+    return matches
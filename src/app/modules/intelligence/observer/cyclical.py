@@ -25,6 +25,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.models.user_profile import UserProfile
+from src.app.modules.features.journal.store import JOURNAL_SYMPTOMS, JournalStore, journal_symptoms
 
 logger = logging.getLogger(__name__)
 
@@ -182,12 +183,8 @@ class CyclicalPatternDetector:
     PERIOD_DAYS = 52  # Days per magi period
     PERIODS_PER_YEAR = 7
 
-    # Symptoms to track
-    TRACKED_SYMPTOMS = [
-        "headache", "migraine", "anxiety", "fatigue", "insomnia",
-        "irritability", "brain_fog", "low_energy", "restlessness",
-        "stress", "overwhelm", "mood_low", "motivation_low"
-    ]
+    # Symptoms to track (precomputed into journal_entries.symptoms)
+    TRACKED_SYMPTOMS = JOURNAL_SYMPTOMS
 
     # Themes for alignment detection
     PLANET_THEMES = {
@@ -1055,25 +1052,18 @@ class CyclicalPatternDetector:
         user_id: int,
         db: AsyncSession
     ) -> list[dict]:
-        """Get all journal entries for a user."""
-        from src.app.models.journal import JournalEntry
-
-        result = await db.execute(
-            select(JournalEntry)
-            .where(JournalEntry.user_id == user_id)
-            .order_by(JournalEntry.created_at.desc())
-        )
-        entries = result.scalars().all()
+        """Get all journal entries for a user (newest first)."""
+        entries = await JournalStore().get_entries(user_id, db)
 
         return [
             {
                 "created_at": e.created_at,
                 "content": e.content,
-                "mood_score": e.mood_score if hasattr(e, "mood_score") else None,
-                "energy_score": e.energy_score if hasattr(e, "energy_score") else None,
-                "symptoms": e.symptoms if hasattr(e, "symptoms") else [],
+                "mood_score": e.mood_score,
+                "energy_score": e.energy_score,
+                "symptoms": e.symptoms or [],
             }
-            for e in entries
+            for e in reversed(entries)
         ]
 
     # =========================================================================
@@ -1176,8 +1166,6 @@ class CyclicalPatternDetector:
         Returns:
             Dictionary mapping period key to list of entries
         """
-        from src.app.models.insight import JournalEntry
-
         if not periods:
             return {}
 
@@ -1185,15 +1173,13 @@ class CyclicalPatternDetector:
         earliest = min(p.start_date for p in periods)
         latest = max(p.end_date for p in periods)
 
-        # Fetch all entries in range
-        result = await db.execute(
-            select(JournalEntry)
-            .where(JournalEntry.user_id == user_id)
-            .where(JournalEntry.created_at >= datetime.combine(earliest, datetime.min.time()))
-            .where(JournalEntry.created_at <= datetime.combine(latest, datetime.max.time()))
-            .order_by(JournalEntry.created_at)
+        # Fetch all entries in range (keyset pages on the user/created_at index)
+        entries = await JournalStore().get_entries(
+            user_id,
+            db,
+            since=datetime.combine(earliest, datetime.min.time(), tzinfo=UTC),
+            until=datetime.combine(latest + timedelta(days=1), datetime.min.time(), tzinfo=UTC),
         )
-        entries = result.scalars().all()
 
         # Group entries by period
         entries_by_period = defaultdict(list)
@@ -1208,9 +1194,9 @@ class CyclicalPatternDetector:
                         'id': entry.id,
                         'content': entry.content,
                         'mood_score': entry.mood_score,
-                        'energy_score': entry.context_snapshot.get('energy_score') if entry.context_snapshot else None,
+                        'energy_score': entry.energy_score,
                         'tags': entry.tags or [],
-                        'symptoms': self._extract_symptoms_from_entry(entry),
+                        'symptoms': entry.symptoms or [],
                         'created_at': entry.created_at.isoformat()
                     })
                     break
@@ -1266,25 +1252,8 @@ class CyclicalPatternDetector:
         )
 
     def _extract_symptoms_from_entry(self, entry) -> list[str]:
-        """Extract symptoms from a journal entry."""
-        symptoms = []
-
-        # Check tags
-        tags = entry.tags or []
-        for tag in tags:
-            tag_lower = tag.lower()
-            for symptom in self.TRACKED_SYMPTOMS:
-                if symptom in tag_lower:
-                    symptoms.append(symptom)
-
-        # Check content for symptom keywords
-        content = (entry.content or '').lower()
-        for symptom in self.TRACKED_SYMPTOMS:
-            if symptom.replace('_', ' ') in content or symptom in content:
-                if symptom not in symptoms:
-                    symptoms.append(symptom)
-
-        return symptoms
+        """Extract symptoms from a journal entry's tags and content (one cached scan)."""
+        return journal_symptoms(entry.content, entry.tags, entry.id)
 
 
 # ============================================================================
@@ -0,0 +1,146 @@
+"""
+Intelligence feed store.
+
+Observer findings are turned into a per-user dashboard feed in the worker
+and kept in Redis, so the dashboard reads a precomputed sorted set instead
+of running detectors per request. New journal entries schedule a debounced
+rebuild.
+"""
+
+import json
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class IntelligenceFeedStore:
+    """
+    Precomputed per-user Observer pattern feed for the dashboard.
+
+    Detectors run only in the worker (nightly observer job, and debounced
+    refreshes after new journal entries); the read path is a ranked range
+    read from Redis.
+
+    Stored per user:
+    - observer:feed:{user_id}        - sorted set of item ids, score = confidence
+    - observer:feed:{user_id}:items  - hash of item id -> feed item JSON
+    - observer:feed:{user_id}:meta   - hash with computed_at and count
+    """
+
+    FEED_TTL = 604800  # 7 days, same as cached findings
+
+    # Debounce window for journal-triggered refreshes
+    REFRESH_DEFER_SECONDS = 120
+
+    @staticmethod
+    def _keys(user_id: int) -> tuple[str, str, str]:
+        base = f"observer:feed:{user_id}"
+        return base, f"{base}:items", f"{base}:meta"
+
+    @staticmethod
+    def pattern_to_item(user_id: int, idx: int, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an Observer finding into a dashboard feed item."""
+        return {
+            "id": f"pattern-{idx}-{user_id}",
+            "type": "pattern",
+            "title": f"Pattern: {pattern['pattern_type'].replace('_', ' ').title()}",
+            "description": pattern["finding"],
+            "confidence": pattern["confidence"],
+            "timestamp": pattern["detected_at"],
+            "metadata": pattern,
+        }
+
+    async def _redis(self):
+        from src.app.core.memory import get_active_memory
+
+        memory = get_active_memory()
+        await memory.initialize()
+        return memory.redis_client
+
+    async def rebuild(self, user_id: int, db: AsyncSession) -> int:
+        """
+        Run the feed detectors for a user and replace the stored feed.
+
+        Returns:
+            Number of patterns stored
+        """
+        from .observer import Observer
+
+        observer = Observer()
+        patterns = (
+            await observer.detect_solar_correlations(user_id, db)
+            + await observer.detect_lunar_correlations(user_id, db)
+            + await observer.detect_time_based_patterns(user_id, db)
+        )
+        await self.store(user_id, patterns)
+        return len(patterns)
+
+    async def store(self, user_id: int, patterns: List[Dict[str, Any]]) -> None:
+        """Atomically replace a user's feed with the given findings."""
+        redis_client = await self._redis()
+        feed_key, items_key, meta_key = self._keys(user_id)
+        items = [self.pattern_to_item(user_id, idx, p) for idx, p in enumerate(patterns)]
+
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.delete(feed_key, items_key)
+        if items:
+            pipe.zadd(feed_key, {item["id"]: item["confidence"] for item in items})
+            pipe.hset(items_key, mapping={item["id"]: json.dumps(item, default=str) for item in items})
+        pipe.hset(meta_key, mapping={"computed_at": datetime.now(UTC).isoformat(), "count": len(items)})
+        for key in (feed_key, items_key, meta_key):
+            pipe.expire(key, self.FEED_TTL)
+        await pipe.execute()
+
+    async def get_page(self, user_id: int, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Feed items ranked by confidence (highest first)."""
+        if limit <= 0:
+            return []
+
+        redis_client = await self._redis()
+        feed_key, items_key, _ = self._keys(user_id)
+        item_ids = await redis_client.zrevrange(feed_key, offset, offset + limit - 1)
+        if not item_ids:
+            return []
+
+        items = []
+        for data in await redis_client.hmget(items_key, item_ids):
+            if data:
+                items.append(json.loads(data))
+        return items
+
+    async def get_freshness(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """computed_at/count of the stored feed, or None if never computed."""
+        redis_client = await self._redis()
+        _, _, meta_key = self._keys(user_id)
+        meta = await redis_client.hgetall(meta_key)
+        if not meta:
+            return None
+        return {"computed_at": meta.get("computed_at"), "count": int(meta.get("count", 0))}
+
+    async def request_refresh(self, user_id: int) -> bool:
+        """
+        Enqueue a debounced background rebuild.
+
+        Journal entries within the same window share one job id, so a burst of
+        entries triggers a single rebuild.
+
+        Returns:
+            True if a job was enqueued (False if one is already pending or no queue)
+        """
+        from src.app.core.utils import queue
+
+        if queue.pool is None:
+            return False
+
+        job = await queue.pool.enqueue_job(
+            "refresh_intelligence_feed_job",
+            user_id,
+            _job_id=f"intelligence_feed:{user_id}:{int(time.time() // self.REFRESH_DEFER_SECONDS)}",
+            _defer_by=timedelta(seconds=self.REFRESH_DEFER_SECONDS),
+        )
+        return job is not None
@@ -8,6 +8,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.events.bus import get_event_bus
+from src.app.modules.features.journal.store import JournalStore, entry_to_dict
+from src.app.modules.intelligence.matching import match_entry, register_vocabulary
 from src.app.protocol.events import (
     CYCLICAL_PATTERN_DETECTED,
     CYCLICAL_PATTERN_EVOLUTION,
@@ -16,6 +18,20 @@ from src.app.protocol.events import (
 
 logger = logging.getLogger(__name__)
 
+# Symptoms correlated against solar activity
+SOLAR_SYMPTOMS = ["headache", "anxiety", "fatigue", "insomnia", "irritability"]
+
+# Journal themes correlated against transits
+THEME_KEYWORDS = {
+    "relationship": ["relationship", "partner", "love", "romance", "breakup"],
+    "work": ["work", "job", "career", "project", "meeting", "boss"],
+    "health": ["health", "sick", "pain", "tired", "energy"],
+    "creativity": ["creative", "art", "writing", "project", "inspiration"],
+    "anxiety": ["anxiety", "stress", "worry", "nervous", "panic"],
+}
+THEME_VOCABULARY = "observer.themes"
+register_vocabulary(THEME_VOCABULARY, THEME_KEYWORDS)
+
 
 class Observer:
     """
@@ -263,9 +279,7 @@ class Observer:
         kp_values = [event["kp_index"] for event in solar_events]
 
         # For each symptom type, check correlation
-        symptoms = ["headache", "anxiety", "fatigue", "insomnia", "irritability"]
-
-        for symptom in symptoms:
+        for symptom in SOLAR_SYMPTOMS:
             # Get symptom occurrences aligned with Kp data
             symptom_scores = self._align_symptom_scores(journal_entries, solar_events, symptom)
 
@@ -650,50 +664,29 @@ class Observer:
         return parsed_history
 
     async def _get_journal_entries(self, user_id: int, db: AsyncSession, days: int) -> List[Dict]:
-        """Get journal entries from database."""
-        from src.app.models.user_profile import UserProfile
-
-        result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
-        profile = result.scalar_one_or_none()
-
-        if not profile or not profile.data:
-            return []
-
-        # Get journal entries from profile.data
-        entries = profile.data.get("journal_entries", [])
-
-        # Filter by date range
+        """Get journal entries from the journal store (range read on the user/created_at index)."""
         cutoff = datetime.now(UTC) - timedelta(days=days)
-        filtered = []
-        for e in entries:
-            try:
-                ts_str = e["timestamp"]
-                if not ts_str.endswith("Z") and "+" not in ts_str:
-                    ts_str += "Z"
-                ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                if ts >= cutoff:
-                    e_copy = e.copy()
-                    e_copy["timestamp"] = ts  # Use datetime object
-                    filtered.append(e_copy)
-            except (ValueError, TypeError):
-                continue
+        entries = await JournalStore().get_entries(user_id, db, since=cutoff)
 
-        return filtered
+        # Timestamps as datetime objects
+        return [{**entry_to_dict(e), "timestamp": e.created_at} for e in entries]
 
     def _align_symptom_scores(self, journal_entries: List[Dict], solar_events: List[Dict], symptom: str) -> List[float]:
         """
         Align symptom mentions with solar event data.
+
+        ``symptom`` is one of SOLAR_SYMPTOMS.
         """
+        # Symptoms are precomputed per entry by the journal store
+        mentioned = [e["timestamp"] for e in journal_entries if symptom in e.get("symptoms", [])]
+
         scores = []
 
         for event in solar_events:
             event_time = event["timestamp"]
 
-            # Find journal entries within 24 hours of event
-            nearby_entries = [e for e in journal_entries if abs((e["timestamp"] - event_time).total_seconds()) < 86400]
-
-            # Check if symptom mentioned
-            symptom_present = any(symptom.lower() in e.get("text", "").lower() for e in nearby_entries)
+            # Symptom mentioned in a journal entry within 24 hours of event
+            symptom_present = any(abs((ts - event_time).total_seconds()) < 86400 for ts in mentioned)
 
             scores.append(1.0 if symptom_present else 0.0)
 
@@ -746,22 +739,11 @@ class Observer:
         """
         Extract themes from journal entries using simple keyword matching.
         """
-        themes = {"relationship": [], "work": [], "health": [], "creativity": [], "anxiety": []}
-
-        keywords = {
-            "relationship": ["relationship", "partner", "love", "romance", "breakup"],
-            "work": ["work", "job", "career", "project", "meeting", "boss"],
-            "health": ["health", "sick", "pain", "tired", "energy"],
-            "creativity": ["creative", "art", "writing", "project", "inspiration"],
-            "anxiety": ["anxiety", "stress", "worry", "nervous", "panic"],
-        }
+        themes = {theme: [] for theme in THEME_KEYWORDS}
 
         for entry in journal_entries:
-            text = entry.get("text", "").lower()
-
-            for theme, words in keywords.items():
-                if any(word in text for word in words):
-                    themes[theme].append(entry)
+            for theme in match_entry(entry.get("id"), entry.get("text", "")).labels(THEME_VOCABULARY):
+                themes[theme].append(entry)
 
         # Remove empty themes
         return {k: v for k, v in themes.items() if v}
@@ -1,8 +1,11 @@
+import logging
 from typing import Any, Dict, List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 
 class ObserverFindingStorage:
     """
@@ -58,6 +61,14 @@ class ObserverFindingStorage:
             ttl=604800  # 7 days
         )
 
+        # Keep the cosmic trigger index in step with the stored findings
+        from src.app.modules.intelligence.insight.index import get_trigger_index
+
+        try:
+            await get_trigger_index().update_user(user_id, profile.data['observer_findings'])
+        except Exception as e:
+            logger.warning(f"[ObserverStorage] Could not update trigger index for user {user_id}: {e}")
+
     async def get_findings(
         self,
         user_id: int,
@@ -11,6 +11,7 @@
 
 from .models import OracleReading
 from .quantum import QuantumEntropy
+from .reservoir import EntropyReservoir, get_entropy_reservoir
 from .service import OracleService
 
-__all__ = ["OracleReading", "OracleService", "QuantumEntropy"]
+__all__ = ["EntropyReservoir", "OracleReading", "OracleService", "QuantumEntropy", "get_entropy_reservoir"]
@@ -16,11 +16,14 @@ from __future__ import annotations
 
 import math
 import secrets
-from typing import List, Literal, Tuple
+from typing import TYPE_CHECKING, List, Literal, Tuple
 
 import httpx
 import structlog
 
+if TYPE_CHECKING:
+    from .reservoir import EntropyReservoir
+
 logger = structlog.get_logger(__name__)
 
 # ANU Quantum Random Numbers Server
@@ -44,16 +47,19 @@ class QuantumEntropy:
 
     Performance:
         Fetches all needed random values in a SINGLE batched API call
-        to avoid rate-limiting and connection overhead.
+        to avoid rate-limiting and connection overhead. With a reservoir,
+        full Oracle draws read prefetched values and make no API call.
     """
 
-    def __init__(self, timeout_ms: int = ANU_TIMEOUT_MS):
+    def __init__(self, timeout_ms: int = ANU_TIMEOUT_MS, reservoir: EntropyReservoir | None = None):
         """
         Args:
             timeout_ms: Maximum wait time for quantum API in milliseconds.
+            reservoir: Prefetched entropy pool used by get_full_oracle_draw().
         """
         self._timeout_seconds = timeout_ms / 1000.0
         self._system_random = secrets.SystemRandom()
+        self.reservoir = reservoir
 
     async def get_true_random(
         self, min_val: int, max_val: int
@@ -267,10 +273,16 @@ class QuantumEntropy:
         from ANU QRNG in one HTTP request, avoiding rate-limit failures
         that occur with 4 sequential calls.
 
+        With a reservoir configured, the 4 values are taken from it instead
+        (see _draw_from_reservoir) and no API call is made.
+
         Returns:
             Tuple of (card_rank, suit_name, hexagram_number, line, entropy_source).
             entropy_source is QUANTUM only if ALL values came from the batch.
         """
+        if self.reservoir is not None:
+            return await self._draw_from_reservoir()
+
         suits = ["Hearts", "Clubs", "Diamonds", "Spades"]
 
         try:
@@ -317,3 +329,44 @@ class QuantumEntropy:
         )
 
         return card_rank, suit_name, hexagram, line, combined_source
+
+    async def _draw_from_reservoir(
+        self,
+    ) -> Tuple[int, str, int, int, EntropySource]:
+        """
+        Draw a complete Oracle reading from prefetched reservoir values.
+
+        A value in the rejection zone is replaced by a local CSPRNG sample,
+        which downgrades the draw to LOCAL_CHAOS like a drained reservoir.
+        """
+        suits = ["Hearts", "Clubs", "Diamonds", "Spades"]
+        range_sizes = (13, 4, 64, 6)
+
+        entries = await self.reservoir.take(len(range_sizes))
+
+        mapped: List[int] = []
+        sources: List[EntropySource] = []
+        for entry, range_size in zip(entries, range_sizes):
+            try:
+                mapped.append(self._rejection_sample_from_uint16(entry.value, range_size))
+                sources.append(entry.source)
+            except ValueError:
+                mapped.append(self._rejection_sample_local(range_size))
+                sources.append("LOCAL_CHAOS")
+
+        rank_val, suit_val, hex_val, line_val = mapped
+        combined_source: EntropySource = (
+            "QUANTUM" if all(source == "QUANTUM" for source in sources)
+            else "LOCAL_CHAOS"
+        )
+
+        logger.info(
+            "quantum.oracle.reservoir_draw",
+            provenance=[entry.encode() for entry in entries],
+            card=f"{1 + rank_val} of {suits[suit_val]}",
+            hexagram=1 + hex_val,
+            line=1 + line_val,
+            entropy_source=combined_source,
+        )
+
+        return 1 + rank_val, suits[suit_val], 1 + hex_val, 1 + line_val, combined_source
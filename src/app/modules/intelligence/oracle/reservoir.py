@@ -0,0 +1,145 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      QUANTUM ENTROPY RESERVOIR                               ║
+║                                                                              ║
+║   Redis-backed pool of prefetched ANU QRNG uint16 values. The worker         ║
+║   refills it in bulk on a schedule, so Oracle draws never wait on the        ║
+║   quantum API.                                                               ║
+║                                                                              ║
+║   Each value keeps its provenance (source + fetch time). When the pool       ║
+║   is drained or Redis is unreachable, draws are topped up from the OS        ║
+║   CSPRNG and marked LOCAL_CHAOS.                                             ║
+║                                                                              ║
+║   Author: GUTTERS Project                                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import redis.asyncio as redis
+import structlog
+
+from src.app.core.config import settings
+
+from .quantum import EntropySource
+
+if TYPE_CHECKING:
+    from .quantum import QuantumEntropy
+
+logger = structlog.get_logger(__name__)
+
+RESERVOIR_KEY = "oracle:entropy:reservoir"
+
+
+@dataclass(frozen=True)
+class EntropyValue:
+    """A uint16 entropy value with its provenance."""
+
+    value: int
+    source: EntropySource
+    fetched_at: float
+
+    def encode(self) -> str:
+        return f"{self.value}:{self.source}:{self.fetched_at:.0f}"
+
+    @classmethod
+    def decode(cls, entry: str) -> EntropyValue:
+        value, source, fetched_at = entry.split(":")
+        return cls(value=int(value), source=source, fetched_at=float(fetched_at))  # type: ignore[arg-type]
+
+
+class EntropyReservoir:
+    """
+    FIFO pool of prefetched entropy values in a Redis list.
+
+    Consumers pop values atomically (LPOP with a count), so concurrent draws
+    across API workers never reuse a value.
+    """
+
+    def __init__(self, size: int | None = None, refill_batch: int | None = None):
+        """Initialize reservoir (call initialize() to connect to Redis)."""
+        self.size = size or settings.ORACLE_ENTROPY_RESERVOIR_SIZE
+        self.refill_batch = refill_batch or settings.ORACLE_ENTROPY_REFILL_BATCH
+        self.redis_client: redis.Redis | None = None
+
+    async def initialize(self) -> None:
+        """Connect to Redis."""
+        if self.redis_client:
+            return
+        self.redis_client = redis.Redis(
+            host=settings.REDIS_CACHE_HOST,
+            port=settings.REDIS_CACHE_PORT,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            decode_responses=True,
+        )
+
+    async def level(self) -> int:
+        """Number of values currently in the reservoir."""
+        await self.initialize()
+        return await self.redis_client.llen(RESERVOIR_KEY)
+
+    async def take(self, count: int) -> list[EntropyValue]:
+        """
+        Pop ``count`` values, topping up from the OS CSPRNG if drained.
+
+        Never raises and never touches the network beyond Redis.
+        """
+        values: list[EntropyValue] = []
+        try:
+            await self.initialize()
+            entries = await self.redis_client.lpop(RESERVOIR_KEY, count) or []
+            values = [EntropyValue.decode(entry) for entry in entries]
+        except Exception as e:
+            logger.warning("quantum.reservoir.unavailable", error=str(e))
+
+        missing = count - len(values)
+        if missing > 0:
+            logger.info("quantum.reservoir.drained", requested=count, available=len(values))
+            now = time.time()
+            values.extend(EntropyValue(secrets.randbits(16), "LOCAL_CHAOS", now) for _ in range(missing))
+
+        return values
+
+    async def refill(self, quantum: QuantumEntropy) -> int:
+        """
+        Top the reservoir up with one bulk ANU request.
+
+        At most one request is made per call, keeping the worker well inside
+        the QRNG rate limit; the scheduled job calls this repeatedly.
+
+        Returns:
+            Number of values added
+        """
+        level = await self.level()
+        wanted = min(self.refill_batch, self.size - level)
+        if wanted <= 0:
+            return 0
+
+        raw = await quantum._fetch_quantum_uint16(count=wanted)
+        raw_values = raw if isinstance(raw, list) else [raw]
+
+        fetched_at = time.time()
+        entries = [EntropyValue(v, "QUANTUM", fetched_at).encode() for v in raw_values]
+        await self.redis_client.rpush(RESERVOIR_KEY, *entries)
+        # Concurrent refills may overshoot; keep the oldest values
+        await self.redis_client.ltrim(RESERVOIR_KEY, 0, self.size - 1)
+
+        logger.info("quantum.reservoir.refilled", added=len(entries), level=level + len(entries))
+        return len(entries)
+
+
+# Singleton instance
+_entropy_reservoir: EntropyReservoir | None = None
+
+
+def get_entropy_reservoir() -> EntropyReservoir:
+    """Get the singleton EntropyReservoir instance."""
+    global _entropy_reservoir
+    if _entropy_reservoir is None:
+        _entropy_reservoir = EntropyReservoir()
+    return _entropy_reservoir
@@ -8,6 +8,7 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import asyncio
 from datetime import UTC, date, datetime
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,7 @@ import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.ai.response_cache import cached_llm
 from src.app.models.insight import PromptPhase, PromptStatus, ReflectionPrompt
 from src.app.modules.features.quests.models import Quest, QuestCategory, QuestDifficulty, QuestSource
 from src.app.modules.intelligence.cardology import CardologyModule
@@ -24,6 +26,7 @@ from src.app.modules.intelligence.synthesis import get_user_preferred_model
 
 from .models import OracleReading
 from .quantum import QuantumEntropy
+from .reservoir import get_entropy_reservoir
 
 logger = structlog.get_logger(__name__)
 
@@ -43,20 +46,19 @@ class OracleService:
         """Initialize Oracle Service."""
         self.cardology_module = CardologyModule()
         self.iching_kernel = IChingKernel()
-        self.quantum = QuantumEntropy()
+        self.quantum = QuantumEntropy(reservoir=get_entropy_reservoir())
         # LLM will be fetched per-user based on their preferences
 
     async def _get_user_llm(self, user_id: int, db: AsyncSession):
         """Get LLM instance based on user's preferred model."""
-        from langchain_openai import ChatOpenAI
-
+        from src.app.core.ai.gateway import create_chat_model
         from src.app.core.config import settings
 
         # Fetch user's preferred model
         preferred_model = await get_user_preferred_model(user_id, db)
 
         # Create LLM with user's preferred model
-        return ChatOpenAI(
+        return create_chat_model(
             base_url="https://openrouter.ai/api/v1",
             api_key=settings.OPENROUTER_API_KEY,
             model=preferred_model,
@@ -82,9 +84,8 @@ class OracleService:
         Steps:
         1. Crypto-secure random selection of Card (1-52) and Hexagram (1-64)
         2. Fetch current transit context
-        3. Cross-system synthesis via CouncilOfSystems
-        4. LLM diagnostic question generation
-        5. Persist to database
+        3. Cross-system synthesis and diagnostic question, as concurrent LLM calls
+        4. Persist to database
 
         Args:
             user_id: User ID for reading
@@ -96,7 +97,7 @@ class OracleService:
         """
         logger.info("oracle.draw.start", user_id=user_id)
 
-        # STEP 1: Quantum-seeded random selection (single batched API call)
+        # STEP 1: Quantum-seeded random selection (prefetched reservoir values)
         card_rank, card_suit, hexagram_number, hexagram_line, entropy_source = (
             await self.quantum.get_full_oracle_draw()
         )
@@ -114,30 +115,34 @@ class OracleService:
         now = datetime.now(UTC)
         transit_context = await self._gather_transit_context(user_id, birth_date, now)
 
-        # STEP 3: Generate synthesis
-        synthesis_text = await self._generate_synthesis(
-            card_rank=card_rank,
-            card_suit=card_suit,
-            hexagram_number=hexagram_number,
-            hexagram_line=hexagram_line,
-            transit_context=transit_context,
-            birth_date=birth_date,
-            user_id=user_id,
-            db=db
-        )
-
-        # STEP 4: Generate diagnostic question
-        diagnostic_question = await self._generate_diagnostic_question(
-            card_rank=card_rank,
-            card_suit=card_suit,
-            hexagram_number=hexagram_number,
-            synthesis_text=synthesis_text,
-            transit_context=transit_context,
-            user_id=user_id,
-            db=db
+        # STEP 3: Synthesis and diagnostic question (independent, run concurrently).
+        # The LLM is resolved once: both calls would otherwise share the session.
+        try:
+            llm = await self._get_user_llm(user_id, db)
+        except Exception as e:
+            logger.error("oracle.llm.error", error=str(e))
+            llm = None
+
+        synthesis_text, diagnostic_question = await asyncio.gather(
+            self._generate_synthesis(
+                card_rank=card_rank,
+                card_suit=card_suit,
+                hexagram_number=hexagram_number,
+                hexagram_line=hexagram_line,
+                transit_context=transit_context,
+                llm=llm
+            ),
+            self._generate_diagnostic_question(
+                card_rank=card_rank,
+                card_suit=card_suit,
+                hexagram_number=hexagram_number,
+                hexagram_line=hexagram_line,
+                transit_context=transit_context,
+                llm=llm
+            ),
         )
 
-        # STEP 5: Persist reading
+        # STEP 4: Persist reading
         reading = OracleReading(
             user_id=user_id,
             card_rank=card_rank,
@@ -205,9 +210,7 @@ class OracleService:
         hexagram_number: int,
         hexagram_line: int,
         transit_context: Dict[str, Any],
-        birth_date: Optional[date],
-        user_id: int,
-        db: AsyncSession
+        llm: Any
     ) -> str:
         """
         Generate cross-system synthesis using CouncilOfSystems.
@@ -226,10 +229,13 @@ class OracleService:
             transit_context=transit_context
         )
 
+        if llm is None:
+            return self._fallback_synthesis(card_data, hexagram_data)
+
         # Use Council Service to generate synthesis
         try:
-            llm = await self._get_user_llm(user_id, db)
-            response = await llm.ainvoke(synthesis_prompt)
+            # Same card/hexagram/transit context -> same synthesis
+            response = await cached_llm(llm, "oracle.synthesis").ainvoke(synthesis_prompt)
             synthesis = response.content
             return synthesis
         except Exception as e:
@@ -389,32 +395,41 @@ Line {hexagram_data['line']} ({hexagram_data['line_archetype']}) is your focal "
         card_rank: int,
         card_suit: str,
         hexagram_number: int,
-        synthesis_text: str,
+        hexagram_line: int,
         transit_context: Dict[str, Any],
-        user_id: int,
-        db: AsyncSession
+        llm: Any
     ) -> str:
         """
         Generate a probing diagnostic question using LLM.
 
         This question aims to reveal unconscious patterns or suppressed desires.
+        It is built from the draw itself rather than the synthesis text, so it
+        can be generated alongside the synthesis.
         """
         card_data = self._get_card_data(card_rank, card_suit)
-        hexagram_data = self._get_hexagram_data(hexagram_number, 1)  # Line doesn't matter here
+        hexagram_data = self._get_hexagram_data(hexagram_number, hexagram_line)
+        fallback_question = (
+            f"The {card_data['full_name']} and Gate {hexagram_number} both "
+            f"emphasize {hexagram_data['keynote']} - where in your life are you "
+            f"avoiding this theme?"
+        )
+
+        if llm is None:
+            return fallback_question
 
         prompt = f"""You are a depth psychologist and oracle interpreter.
 
 **The User Drew:**
 - {card_data['full_name']}
 - Gate {hexagram_number}: {hexagram_data['hd_name']}
+  - Line {hexagram_line}: {hexagram_data['line_archetype']}
+  - Shadow: {hexagram_data['shadow']}
+  - Gift: {hexagram_data['gift']}
 
 **Their Recent Context:**
 - Current transit: Gate {transit_context.get('current_sun_gate', 'Unknown')}
 - Period: {transit_context.get('current_period_card', 'Unknown')}
 
-**Oracle Synthesis:**
-{synthesis_text[:500]}...
-
 **Task:**
 Generate ONE piercing diagnostic question that:
 1. Points to a potential blind spot or suppressed truth
@@ -429,18 +444,12 @@ Example style: "The {card_data['suit']} speaks of {card_data['meanings']['domain
 """
 
         try:
-            llm = await self._get_user_llm(user_id, db)
             response = await llm.ainvoke(prompt)
             question = response.content
             return question.strip()
         except Exception as e:
             logger.error("oracle.diagnostic.error", error=str(e))
-            # Fallback question
-            return (
-                f"The {card_data['full_name']} and Gate {hexagram_number} both "
-                f"emphasize {hexagram_data['keynote']} - where in your life are you "
-                f"avoiding this theme?"
-            )
+            return fallback_question
 
     async def accept_reading(
         self,
@@ -7,6 +7,7 @@ Uses LLM with Native Tool Calling to compute charts and retrieve data.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
@@ -16,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.ai.response_cache import cached_llm
 from src.app.core.llm.config import LLMConfig, LLMTier, get_premium_llm
 from src.app.modules.intelligence.generative_ui.generator import ComponentGenerator
 from src.app.modules.intelligence.generative_ui.models import ComponentType
@@ -91,14 +93,9 @@ class QueryEngine:
 
         # START TRACE
         async with TraceContext() as trace:
-            # STEP 0: Check for Interactive Component (Generative UI)
+            # Interactive component (Generative UI), decided after the memory check
             component_spec = None
 
-            # We need some initial context for the component decision;
-            # for now passing empty dict + last n messages from history could happen here
-            # but we will do it after memory check if needed, or simply parallelize.
-            # To keep it simple and fast, we check basic intent first.
-
             # STEP 1: Check Active Memory
             trace.think("Checking Active Memory for user's profile and synthesis...")
 
@@ -133,6 +130,11 @@ class QueryEngine:
                 )
                 context_data = {}
 
+            # STEP 1.5: Generative UI decision, concurrent with retrieval and answer generation
+            component_task = None
+            if self.enable_generative_ui and self.component_generator:
+                component_task = asyncio.create_task(self._generate_component(question, context_data, trace))
+
             # STEP 2: Vector Search (if enabled)
             vector_context = {}
             if use_vector_search:
@@ -203,65 +205,33 @@ class QueryEngine:
             # relying on what's in memory/vector.
             relevant_modules = ["astrology", "human_design", "numerology"]  # Default to all for context building
 
-            # STEP 2.5: Generative UI Decision
-            # We do this before generating answer so we can potentially inform the answer
-            if self.enable_generative_ui and self.component_generator:
-                trace.think("Evaluating need for interactive UI component...")
-                try:
-                    should_gen, comp_type = await self.component_generator.should_generate_component(
-                        question,
-                        [],  # conversation_history pass if available
-                        context_data,  # user context
-                    )
-
-                    if should_gen and comp_type:
-                        gen_start = time.time()
-
-                        if comp_type == ComponentType.MOOD_SLIDER:
-                            component_spec = await self.component_generator.generate_mood_slider(question, context_data)
-                        elif comp_type == ComponentType.MULTI_SLIDER:
-                            component_spec = await self.component_generator.generate_multi_slider(
-                                question, context_data
-                            )
-                        elif comp_type == ComponentType.HYPOTHESIS_PROBE:
-                            # In real flow we'd identify relevant hypothesis first
-                            # For MVP we might skip complex probe generation here unless triggered by specific logic
-                            pass
-
-                        gen_latency = int((time.time() - gen_start) * 1000)
-
-                        if component_spec:
-                            trace.tool_call(
-                                ToolType.GENESIS,
-                                "generate_component",
-                                gen_latency,
-                                f"Generated {comp_type.value} (ID: {component_spec.component_id[:8]})",
-                            )
-                except Exception as e:
-                    logger.error(f"Component generation failed: {e}")
-                    trace.think(f"Component generation error: {e}")
-
             # STEP 3: Build prompt
             trace.think("Building enhanced prompt with all available context...")
-            # Convert context_data to the string format expected by _generate_answer
-            context_str = await self._build_context_from_data(user_id, relevant_modules, context_data, db)
-
-            # STEP 4: LLM call
-            trace.think("Generating response with LLM...")
-
-            start_time = time.time()
-            # Pass trace object to capture internal reasoning
-            # Pass user_id and db for Tool Binding
-            answer, confidence = await self._generate_answer(
-                question,
-                context_str,
-                relevant_modules,
-                trace_id or str(uuid.uuid4()),
-                vector_context,
-                trace,
-                user_id=user_id,
-                db=db,  # NEW: Pass context for tools
-            )
+            try:
+                # Convert context_data to the string format expected by _generate_answer
+                context_str = await self._build_context_from_data(user_id, relevant_modules, context_data, db)
+
+                # STEP 4: LLM call
+                trace.think("Generating response with LLM...")
+
+                start_time = time.time()
+                # Pass trace object to capture internal reasoning
+                # Pass user_id and db for Tool Binding
+                answer, confidence = await self._generate_answer(
+                    question,
+                    context_str,
+                    relevant_modules,
+                    trace_id or str(uuid.uuid4()),
+                    vector_context,
+                    trace,
+                    user_id=user_id,
+                    db=db,  # NEW: Pass context for tools
+                )
+            except BaseException:
+                # Don't leave the component decision (possibly an LLM call) running
+                if component_task is not None:
+                    component_task.cancel()
+                raise
 
             # Record latency for the high-level step
             llm_latency = int((time.time() - start_time) * 1000)
@@ -270,6 +240,9 @@ class QueryEngine:
             # but we record the step completion here.
             trace.think(f"LLM response received in {llm_latency}ms")
 
+            if component_task is not None:
+                component_spec = await component_task
+
             # STEP 5: Calculate confidence (Override with smarter logic)
             trace.think("Calculating response confidence based on data quality...")
             confidence = self._calculate_confidence_enhanced(context_data, vector_context, trace)
@@ -297,6 +270,44 @@ class QueryEngine:
                 component=component_spec,  # New: Include component
             )
 
+    async def _generate_component(self, question: str, context_data: dict, trace: TraceContext):
+        """Decide on and build an interactive component for this turn (None if not needed)."""
+        trace.think("Evaluating need for interactive UI component...")
+        component_spec = None
+        try:
+            should_gen, comp_type = await self.component_generator.should_generate_component(
+                question,
+                [],  # conversation_history pass if available
+                context_data,  # user context
+            )
+
+            if should_gen and comp_type:
+                gen_start = time.time()
+
+                if comp_type == ComponentType.MOOD_SLIDER:
+                    component_spec = await self.component_generator.generate_mood_slider(question, context_data)
+                elif comp_type == ComponentType.MULTI_SLIDER:
+                    component_spec = await self.component_generator.generate_multi_slider(question, context_data)
+                elif comp_type == ComponentType.HYPOTHESIS_PROBE:
+                    # In real flow we'd identify relevant hypothesis first
+                    # For MVP we might skip complex probe generation here unless triggered by specific logic
+                    pass
+
+                gen_latency = int((time.time() - gen_start) * 1000)
+
+                if component_spec:
+                    trace.tool_call(
+                        ToolType.GENESIS,
+                        "generate_component",
+                        gen_latency,
+                        f"Generated {comp_type.value} (ID: {component_spec.component_id[:8]})",
+                    )
+        except Exception as e:
+            logger.error(f"Component generation failed: {e}")
+            trace.think(f"Component generation error: {e}")
+
+        return component_spec
+
     async def _build_enhanced_prompt(self, question: str, context: str, vector_context: dict) -> str:
         """Build enhanced prompt with vector context section."""
         vector_sections = []
@@ -633,7 +644,8 @@ Your answer (JSON array only):"""
                 details={"question": question[:100]},
             )
 
-            response = await self.llm.ainvoke(
+            # Same question -> same modules
+            response = await cached_llm(self.llm, "query.classify_question", ttl=7 * 86400).ainvoke(
                 [
                     SystemMessage(
                         content=(
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from langchain_openai import ChatOpenAI
 
 from src.app.core.llm.config import LLMConfig, LLMTier, get_premium_llm
+from src.app.modules.intelligence.matching import get_keyword_matcher, register_vocabulary
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,13 @@ ALLOWED_MODELS = [
 
 DEFAULT_MODEL = "anthropic/claude-sonnet-4.5"
 
+# Stored in place of the synthesis when the LLM call fails
+FALLBACK_SYNTHESIS = "Unable to generate complete synthesis at this time."
+
+# Themes surfaced from the master synthesis text
+THEME_VOCABULARY = "synthesis.themes"
+register_vocabulary(THEME_VOCABULARY, ["leadership", "creativity", "communication", "intuition", "structure"])
+
 
 def get_llm() -> ChatOpenAI:
     """
@@ -141,7 +149,6 @@ class ProfileSynthesizer:
         from ....core.events.bus import get_event_bus
         from ....core.memory.active_memory import get_active_memory
         from ....protocol.events import SYNTHESIS_GENERATED
-        from ...calculation.registry import CalculationModuleRegistry
         from .schemas import UnifiedProfile
 
         trace_id = trace_id or str(uuid.uuid4())
@@ -160,22 +167,7 @@ class ProfileSynthesizer:
             raise ValueError(f"Profile not found for user_id {user_id}")
 
         # Discover which modules have been calculated
-        calculated_modules = {}
-        registry_modules = CalculationModuleRegistry.get_all_modules()
-
-        for module_name, metadata in registry_modules.items():
-            # Check if this module exists in profile data and has no errors
-            if (
-                module_name in profile.data
-                and isinstance(profile.data[module_name], dict)
-                and "error" not in profile.data[module_name]
-            ):
-                calculated_modules[module_name] = {
-                    "data": profile.data[module_name],
-                    "display_name": metadata.display_name,
-                    "description": metadata.description,
-                    "version": metadata.version,
-                }
+        calculated_modules = self.calculated_modules(profile.data)
 
         logger.info(f"Synthesizing {len(calculated_modules)} modules for user {user_id}")
 
@@ -228,7 +220,7 @@ class ProfileSynthesizer:
             )
         except Exception as e:
             logger.error(f"Master synthesis failed: {e}")
-            master_synthesis = "Unable to generate complete synthesis at this time."
+            master_synthesis = FALLBACK_SYNTHESIS
 
         # Cache in Active Memory
         themes = self._extract_themes(master_synthesis)
@@ -269,6 +261,44 @@ class ProfileSynthesizer:
 
         return result
 
+    @staticmethod
+    def calculated_modules(profile_data: dict) -> dict:
+        """Registry modules present in profile data without errors, with their metadata."""
+        from ...calculation.registry import CalculationModuleRegistry
+
+        calculated_modules = {}
+        for module_name, metadata in CalculationModuleRegistry.get_all_modules().items():
+            # Check if this module exists in profile data and has no errors
+            if (
+                module_name in profile_data
+                and isinstance(profile_data[module_name], dict)
+                and "error" not in profile_data[module_name]
+            ):
+                calculated_modules[module_name] = {
+                    "data": profile_data[module_name],
+                    "display_name": metadata.display_name,
+                    "description": metadata.description,
+                    "version": metadata.version,
+                }
+        return calculated_modules
+
+    @classmethod
+    def input_fingerprint(cls, profile_data: dict) -> str:
+        """
+        Hash of everything a synthesis is built from.
+
+        Covers calculated module outputs (and versions) plus Observer findings;
+        an unchanged fingerprint means re-synthesizing would only re-roll the LLM.
+        """
+        import hashlib
+        import json
+
+        modules = {name: [info["version"], info["data"]] for name, info in cls.calculated_modules(profile_data).items()}
+        payload = json.dumps(
+            {"modules": modules, "findings": profile_data.get("observer_findings", [])}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     def _format_modules_for_llm(self, modules: dict) -> str:
         """
         Format module data for LLM prompt.
@@ -339,8 +369,7 @@ class ProfileSynthesizer:
         return ModuleInsights(module_name=module_name, key_points=key_points, raw_data=data)
 
     def _extract_themes(self, text: str) -> list[str]:
-        keywords = ["leadership", "creativity", "communication", "intuition", "structure"]
-        return [k for k in keywords if k in text.lower()][:5]
+        return get_keyword_matcher().scan(text).labels(THEME_VOCABULARY)[:5]
 
     def _extract_patterns(self, insights: dict) -> list:
         from .schemas import SynthesisPattern
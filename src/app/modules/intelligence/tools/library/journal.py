@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.models.insight import JournalEntry, PromptStatus, ReflectionPrompt
+from src.app.modules.features.journal.store import journal_symptoms
 
 
 class JournalEntryInput(BaseModel):
@@ -52,6 +53,7 @@ def get_tool(user_id: int, db: AsyncSession) -> StructuredTool:
                 content=content,
                 mood_score=mood_score,
                 tags=tags,
+                symptoms=journal_symptoms(content, tags),
                 prompt_id=prompt_id,
                 created_at=datetime.now(UTC),
             )
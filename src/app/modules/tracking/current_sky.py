@@ -0,0 +1,170 @@
+# src/app/modules/tracking/current_sky.py
+
+"""
+Materialized Current Sky
+
+The cosmic conditions shared by every user (solar weather, lunar phase/VoC,
+transit positions) are recomputed by the worker on a schedule and stored in
+Redis as one JSON document with a version stamp. API requests read the
+document and only overlay the per-user natal comparison.
+
+- The version is a hash of the user-visible fields (positions rounded to
+  0.1°), so it only changes when the widget would actually change; the
+  dashboard serves it as an ETag and answers If-None-Match with 304.
+- Each component is fetched with a timeout. If one fails or is slow, the
+  previous value for that component is kept and listed in ``stale``, so a
+  NOAA outage never blanks the widget.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.app.core.config import settings
+
+from .base import TrackingData
+from .lunar.tracker import LunarTracker
+from .solar.tracker import SolarTracker
+from .transits.tracker import TransitTracker
+
+logger = logging.getLogger(__name__)
+
+CURRENT_SKY_KEY = "tracking:current_sky"
+
+# Per-user natal overlay, keyed by sky version
+_OVERLAY_KEY = "tracking:current_sky:{version}:overlay:{user_id}"
+
+
+def widget_fields(sky: dict[str, Any]) -> dict[str, Any]:
+    """User-independent CosmicWidget fields derived from a sky document."""
+    solar = sky.get("solar") or {}
+    lunar = sky.get("lunar") or {}
+    positions = (sky.get("transits") or {}).get("positions", {})
+
+    return {
+        "moon_phase": lunar.get("phase_name", "Unknown"),
+        "moon_sign": positions.get("Moon", {}).get("sign") or lunar.get("sign", "Unknown"),
+        "sun_sign": positions.get("Sun", {}).get("sign", "Unknown"),
+        "geomagnetic_index": solar.get("kp_index", 0.0),
+        "bz": solar.get("bz"),
+        "solar_wind_speed": solar.get("solar_wind_speed"),
+        "shield_integrity": solar.get("shield_integrity"),
+        "is_voc": lunar.get("is_voc", False),
+        "retrograde_count": sum(1 for p in positions.values() if p.get("is_retrograde", False)),
+    }
+
+
+def compute_version(sky: dict[str, Any]) -> str:
+    """Stable hash of everything a client can see, including transit inputs."""
+    positions = (sky.get("transits") or {}).get("positions", {})
+    versioned = {
+        "widget": widget_fields(sky),
+        "positions": {name: round(p.get("longitude", 0.0), 1) for name, p in positions.items()},
+    }
+    encoded = json.dumps(versioned, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+class CurrentSkyStore:
+    """Reads, refreshes and overlays the materialized current sky."""
+
+    COMPONENT_TIMEOUT_SECONDS = 10.0
+    OVERLAY_TTL_SECONDS = 3600
+
+    def __init__(self):
+        """Initialize store (call initialize() to connect to Redis)."""
+        self.redis_client: redis.Redis | None = None
+
+    async def initialize(self) -> None:
+        """Connect to Redis."""
+        if self.redis_client:
+            return
+        self.redis_client = redis.Redis(
+            host=settings.REDIS_CACHE_HOST,
+            port=settings.REDIS_CACHE_PORT,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            decode_responses=True,
+        )
+
+    async def get(self) -> dict[str, Any] | None:
+        """Last materialized sky document, or None if never computed."""
+        await self.initialize()
+        data = await self.redis_client.get(CURRENT_SKY_KEY)
+        return json.loads(data) if data else None
+
+    async def get_or_refresh(self) -> dict[str, Any]:
+        """Stored sky, computing it inline only if the worker has not yet."""
+        sky = await self.get()
+        if sky is None:
+            sky = await self.refresh()
+        return sky
+
+    async def refresh(self) -> dict[str, Any]:
+        """
+        Recompute the sky and store it.
+
+        Components that fail or time out keep their previous values.
+        """
+        await self.initialize()
+        previous = await self.get() or {}
+
+        components = {
+            "solar": SolarTracker(),
+            "lunar": LunarTracker(),
+            "transits": TransitTracker(),
+        }
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(tracker.fetch_current_data(), timeout=self.COMPONENT_TIMEOUT_SECONDS)
+                for tracker in components.values()
+            ),
+            return_exceptions=True,
+        )
+
+        sky: dict[str, Any] = {"computed_at": datetime.now(UTC).isoformat(), "stale": []}
+        for name, result in zip(components, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"[CurrentSky] {name} refresh failed, keeping last known value: {result!r}")
+                sky[name] = previous.get(name) or {}
+                sky["stale"].append(name)
+            else:
+                sky[name] = result.data
+
+        sky["version"] = compute_version(sky)
+        await self.redis_client.set(CURRENT_SKY_KEY, json.dumps(sky, default=str))
+        return sky
+
+    async def active_transits_count(self, user_id: int, sky: dict[str, Any]) -> int:
+        """Per-user natal overlay, cached for the lifetime of a sky version."""
+        await self.initialize()
+        key = _OVERLAY_KEY.format(version=sky["version"], user_id=user_id)
+        cached = await self.redis_client.get(key)
+        if cached is not None:
+            return int(cached)
+
+        transits = TrackingData(
+            timestamp=datetime.fromisoformat(sky["computed_at"]),
+            source="current_sky",
+            data=sky.get("transits") or {"positions": {}},
+        )
+        comparison = await TransitTracker().compare_to_natal(user_id, transits)
+        count = comparison.get("total_transits", 0)
+        await self.redis_client.set(key, count, ex=self.OVERLAY_TTL_SECONDS)
+        return count
+
+
+# Singleton instance
+_current_sky_store: CurrentSkyStore | None = None
+
+
+def get_current_sky_store() -> CurrentSkyStore:
+    """Get the singleton CurrentSkyStore instance."""
+    global _current_sky_store
+    if _current_sky_store is None:
+        _current_sky_store = CurrentSkyStore()
+    return _current_sky_store
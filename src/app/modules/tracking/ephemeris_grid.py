@@ -0,0 +1,402 @@
+# src/app/modules/tracking/ephemeris_grid.py
+
+"""
+Precomputed Ephemeris Grid
+
+Positions and speeds for every tracked body are sampled once on a fixed grid
+(hourly for the Moon, six-hourly for the True Node, twice daily for Mercury,
+daily for everything else)
+over a rolling multi-year window and persisted as memory-mapped NumPy arrays.
+Arbitrary-time queries are answered by cubic Hermite interpolation using the
+stored speeds, and batch queries are fully vectorized, so trackers, the
+Observer and history backfills never call swisseph on the hot path.
+
+Each sample row mirrors the layout of ``swe.calc_ut(jd, body)[0]``:
+
+    (longitude, latitude, distance, lon_speed, lat_speed, dist_speed)
+
+Layout on disk (``settings.EPHEMERIS_GRID_DIR``):
+
+    current.json          - pointer to the active build directory
+    v<timestamp>/meta.json
+    v<timestamp>/<body>.npy
+
+Builds are written to a fresh versioned directory and published by atomically
+replacing ``current.json``, so readers holding an open memmap never observe a
+half-written grid.
+
+Queries outside the grid window fall back to Swiss Ephemeris directly, so
+callers can use the grid unconditionally (natal charts decades in the past
+still resolve correctly).
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+import numpy as np
+import swisseph as swe
+
+from src.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Julian Day of the Unix epoch (1970-01-01T00:00:00 UTC)
+_UNIX_EPOCH_JD = 2440587.5
+
+# Body id -> (file stem, grid step in days)
+GRID_BODIES: dict[int, tuple[str, float]] = {
+    swe.SUN: ("sun", 1.0),
+    swe.MOON: ("moon", 1.0 / 24.0),
+    swe.MERCURY: ("mercury", 0.5),
+    swe.VENUS: ("venus", 1.0),
+    swe.MARS: ("mars", 1.0),
+    swe.JUPITER: ("jupiter", 1.0),
+    swe.SATURN: ("saturn", 1.0),
+    swe.URANUS: ("uranus", 1.0),
+    swe.NEPTUNE: ("neptune", 1.0),
+    swe.PLUTO: ("pluto", 1.0),
+    swe.TRUE_NODE: ("true_node", 0.25),
+}
+
+# Rebuild once "now" gets closer than this to either edge of the window
+REBUILD_MARGIN_DAYS = 180.0
+
+# How often a reader re-checks current.json for a newer build (seconds)
+RELOAD_INTERVAL_SECONDS = 3600.0
+
+
+def datetime_to_jd(dt: datetime) -> float:
+    """Convert a datetime to a UT Julian Day without touching swisseph."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp() / 86400.0 + _UNIX_EPOCH_JD
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Convert a UT Julian Day back to an aware UTC datetime."""
+    return datetime.fromtimestamp((jd - _UNIX_EPOCH_JD) * 86400.0, tz=UTC)
+
+
+def _hermite(
+    p0: np.ndarray, p1: np.ndarray, m0: np.ndarray, m1: np.ndarray, s: np.ndarray, h: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cubic Hermite interpolation on a uniform grid.
+
+    Args:
+        p0, p1: Values at the left/right grid nodes
+        m0, m1: Derivatives (per day) at the left/right grid nodes
+        s: Normalized position inside the interval, in [0, 1]
+        h: Grid step in days
+
+    Returns:
+        (value, derivative per day)
+    """
+    s2 = s * s
+    s3 = s2 * s
+
+    h00 = 2 * s3 - 3 * s2 + 1
+    h10 = s3 - 2 * s2 + s
+    h01 = -2 * s3 + 3 * s2
+    h11 = s3 - s2
+
+    d00 = 6 * s2 - 6 * s
+    d10 = 3 * s2 - 4 * s + 1
+    d01 = -6 * s2 + 6 * s
+    d11 = 3 * s2 - 2 * s
+
+    value = h00 * p0 + h10 * h * m0 + h01 * p1 + h11 * h * m1
+    derivative = (d00 * p0 + d10 * h * m0 + d01 * p1 + d11 * h * m1) / h
+    return value, derivative
+
+
+class EphemerisGrid:
+    """
+    Memory-mapped ephemeris grid with Hermite interpolation.
+
+    Usage:
+        grid = get_ephemeris_grid()
+        lon, lat, dist, lon_speed, _, _ = grid.calc_ut(jd, swe.MOON)
+        samples = grid.calc_many(swe.MARS, jds)  # shape (len(jds), 6)
+    """
+
+    def __init__(self, grid_dir: str | None = None):
+        self.grid_dir = grid_dir or settings.EPHEMERIS_GRID_DIR
+        self.start_jd: float | None = None
+        self.end_jd: float | None = None
+        self.built_at: str | None = None
+        self._arrays: dict[int, np.ndarray] = {}
+        self._steps: dict[int, float] = {}
+        self._version: str | None = None
+        self._last_reload_check = 0.0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Loading & building
+    # ------------------------------------------------------------------
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a grid is currently mapped into memory."""
+        return bool(self._arrays)
+
+    def load(self) -> bool:
+        """
+        Map the active build into memory.
+
+        Returns:
+            True if a grid was loaded, False if none has been built yet
+        """
+        pointer_path = os.path.join(self.grid_dir, "current.json")
+        try:
+            with open(pointer_path, encoding="utf-8") as f:
+                version = json.load(f)["version"]
+        except (OSError, ValueError, KeyError):
+            return False
+
+        if version == self._version:
+            return True
+
+        build_dir = os.path.join(self.grid_dir, version)
+        try:
+            with open(os.path.join(build_dir, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+
+            arrays: dict[int, np.ndarray] = {}
+            steps: dict[int, float] = {}
+            for body_id, (stem, _) in GRID_BODIES.items():
+                body_meta = meta["bodies"].get(stem)
+                if body_meta is None:
+                    continue
+                arrays[body_id] = np.load(os.path.join(build_dir, f"{stem}.npy"), mmap_mode="r")
+                steps[body_id] = float(body_meta["step_days"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"[EphemerisGrid] Failed to load build {version}: {e}")
+            return False
+
+        with self._lock:
+            self._arrays = arrays
+            self._steps = steps
+            self.start_jd = float(meta["start_jd"])
+            self.end_jd = float(meta["end_jd"])
+            self.built_at = meta.get("built_at")
+            self._version = version
+
+        logger.info(
+            f"[EphemerisGrid] Loaded {version} ({len(arrays)} bodies, JD {self.start_jd:.1f}-{self.end_jd:.1f})"
+        )
+        return True
+
+    def build(self, years_back: int | None = None, years_ahead: int | None = None) -> str:
+        """
+        Sample every body with Swiss Ephemeris and publish a new build.
+
+        This is the only place that calls swisseph in bulk; it runs in the
+        worker (see ``refresh_ephemeris_grid``), never in a request.
+
+        Returns:
+            Version identifier of the published build
+        """
+        years_back = settings.EPHEMERIS_GRID_YEARS_BACK if years_back is None else years_back
+        years_ahead = settings.EPHEMERIS_GRID_YEARS_AHEAD if years_ahead is None else years_ahead
+
+        now_jd = datetime_to_jd(datetime.now(UTC))
+        # Align the window start to midnight so daily nodes fall on 0h UT
+        start_jd = float(np.floor(now_jd - 0.5 - years_back * 365.25)) + 0.5
+        end_jd = now_jd + years_ahead * 365.25
+
+        version = f"v{int(time.time())}"
+        build_dir = os.path.join(self.grid_dir, version)
+        os.makedirs(build_dir, exist_ok=True)
+
+        bodies_meta = {}
+        for body_id, (stem, step) in GRID_BODIES.items():
+            n = int(np.ceil((end_jd - start_jd) / step)) + 1
+            samples = np.lib.format.open_memmap(
+                os.path.join(build_dir, f"{stem}.npy"), mode="w+", dtype=np.float64, shape=(n, 6)
+            )
+            for i in range(n):
+                samples[i] = swe.calc_ut(start_jd + i * step, body_id)[0]
+            samples.flush()
+            del samples
+            bodies_meta[stem] = {"body_id": body_id, "step_days": step, "samples": n}
+
+        meta = {
+            "start_jd": start_jd,
+            "end_jd": end_jd,
+            "built_at": datetime.now(UTC).isoformat(),
+            "bodies": bodies_meta,
+        }
+        with open(os.path.join(build_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        # Publish atomically
+        pointer_tmp = os.path.join(self.grid_dir, "current.json.tmp")
+        with open(pointer_tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": version}, f)
+        os.replace(pointer_tmp, os.path.join(self.grid_dir, "current.json"))
+
+        self._prune_old_builds(keep={version, self._version})
+        logger.info(f"[EphemerisGrid] Published {version}")
+        return version
+
+    def needs_rebuild(self, at: datetime | None = None) -> bool:
+        """Whether the window is missing or ``at`` is near/over its edges."""
+        if not self.is_loaded and not self.load():
+            return True
+        jd = datetime_to_jd(at or datetime.now(UTC))
+        return jd - self.start_jd < REBUILD_MARGIN_DAYS or self.end_jd - jd < REBUILD_MARGIN_DAYS
+
+    def ensure_current(self) -> bool:
+        """
+        Build (if the window is stale) and load the grid.
+
+        Returns:
+            True if a rebuild happened
+        """
+        rebuilt = False
+        if self.needs_rebuild():
+            self.build()
+            rebuilt = True
+        self.load()
+        return rebuilt
+
+    def _prune_old_builds(self, keep: set) -> None:
+        """Remove superseded build directories (keeps current and previous)."""
+        try:
+            entries = os.listdir(self.grid_dir)
+        except OSError:
+            return
+        for entry in entries:
+            path = os.path.join(self.grid_dir, entry)
+            if entry.startswith("v") and os.path.isdir(path) and entry not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _maybe_reload(self) -> None:
+        """Cheaply pick up a newer build published by the worker."""
+        now = time.monotonic()
+        if now - self._last_reload_check < RELOAD_INTERVAL_SECONDS:
+            return
+        self._last_reload_check = now
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def covers(self, jd: float) -> bool:
+        """Whether ``jd`` lies inside the loaded window."""
+        self._maybe_reload()
+        return self.is_loaded and self.start_jd <= jd <= self.end_jd
+
+    def calc_ut(self, jd: float, body: int) -> tuple[float, float, float, float, float, float]:
+        """
+        Position and speed of ``body`` at ``jd``.
+
+        Drop-in replacement for ``swe.calc_ut(jd, body)[0]``.
+        """
+        # covers() first: it picks up a grid published after this process started
+        if self.covers(jd) and body in self._arrays:
+            return self._interpolate_one(body, jd)
+        return tuple(swe.calc_ut(jd, body)[0])
+
+    def calc_many(self, body: int, jds: Iterable[float]) -> np.ndarray:
+        """
+        Vectorized batch query.
+
+        Args:
+            body: Swiss Ephemeris body id
+            jds: Julian Days (any iterable / array)
+
+        Returns:
+            Array of shape (len(jds), 6) in ``calc_ut`` column order
+        """
+        jds_arr = np.asarray(list(jds) if not isinstance(jds, np.ndarray) else jds, dtype=np.float64)
+        if jds_arr.size == 0:
+            return np.empty((0, 6), dtype=np.float64)
+
+        self._maybe_reload()
+        if body in self._arrays and self.is_loaded:
+            inside = (jds_arr >= self.start_jd) & (jds_arr <= self.end_jd)
+        else:
+            inside = np.zeros(jds_arr.shape, dtype=bool)
+
+        out = np.empty((jds_arr.size, 6), dtype=np.float64)
+        if inside.any():
+            out[inside] = self._interpolate(body, jds_arr[inside])
+        for idx in np.flatnonzero(~inside):
+            out[idx] = swe.calc_ut(float(jds_arr[idx]), body)[0]
+        return out
+
+    def snapshot(self, jd: float, bodies: Iterable[int]) -> dict[int, tuple[float, ...]]:
+        """Positions of several bodies at one instant."""
+        return {body: self.calc_ut(jd, body) for body in bodies}
+
+    def _interpolate_one(self, body: int, jd: float) -> tuple[float, float, float, float, float, float]:
+        """Scalar fast path (plain floats; avoids NumPy per-call overhead)."""
+        samples = self._arrays[body]
+        step = self._steps[body]
+
+        offset = (jd - self.start_jd) / step
+        idx = min(max(int(offset), 0), samples.shape[0] - 2)
+        s = offset - idx
+
+        left = samples[idx].tolist()
+        right = samples[idx + 1].tolist()
+        right[0] = left[0] + ((right[0] - left[0] + 180.0) % 360.0 - 180.0)
+
+        s2 = s * s
+        s3 = s2 * s
+        h00, h10, h01, h11 = 2 * s3 - 3 * s2 + 1, s3 - 2 * s2 + s, -2 * s3 + 3 * s2, s3 - s2
+        d00, d10, d01, d11 = 6 * s2 - 6 * s, 3 * s2 - 4 * s + 1, -6 * s2 + 6 * s, 3 * s2 - 2 * s
+
+        values = []
+        speeds = []
+        for col in range(3):
+            p0, p1 = left[col], right[col]
+            m0, m1 = left[col + 3] * step, right[col + 3] * step
+            values.append(h00 * p0 + h10 * m0 + h01 * p1 + h11 * m1)
+            speeds.append((d00 * p0 + d10 * m0 + d01 * p1 + d11 * m1) / step)
+
+        return (values[0] % 360.0, values[1], values[2], speeds[0], speeds[1], speeds[2])
+
+    def _interpolate(self, body: int, jds: np.ndarray) -> np.ndarray:
+        """Hermite-interpolate all six columns for in-window Julian Days."""
+        samples = self._arrays[body]
+        step = self._steps[body]
+
+        offset = (jds - self.start_jd) / step
+        idx = np.clip(np.floor(offset).astype(np.int64), 0, samples.shape[0] - 2)
+        s = offset - idx
+
+        left = np.asarray(samples[idx])
+        right = np.asarray(samples[idx + 1])
+
+        # Unwrap longitude across the 360° -> 0° boundary before interpolating
+        lon0 = left[:, 0]
+        lon1 = lon0 + ((right[:, 0] - lon0 + 180.0) % 360.0 - 180.0)
+
+        lon, lon_speed = _hermite(lon0, lon1, left[:, 3], right[:, 3], s, step)
+        lat, lat_speed = _hermite(left[:, 1], right[:, 1], left[:, 4], right[:, 4], s, step)
+        dist, dist_speed = _hermite(left[:, 2], right[:, 2], left[:, 5], right[:, 5], s, step)
+
+        return np.column_stack((lon % 360.0, lat, dist, lon_speed, lat_speed, dist_speed))
+
+
+# Module-level singleton
+_grid: EphemerisGrid | None = None
+
+
+def get_ephemeris_grid() -> EphemerisGrid:
+    """Get or create the process-wide ephemeris grid (loads lazily from disk)."""
+    global _grid
+    if _grid is None:
+        _grid = EphemerisGrid()
+        _grid.load()
+    return _grid
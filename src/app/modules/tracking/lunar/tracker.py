@@ -1,21 +1,26 @@
 # src/app/modules/tracking/lunar/tracker.py
 
 import math
-import os
 from datetime import UTC, datetime, timedelta
 from typing import List, Optional, Tuple
 
+import numpy as np
+import swisseph as swe
 from skyfield import almanac
-from skyfield.api import load
 
 from ..base import BaseTrackingModule, TrackingData
+from ..ephemeris_grid import EphemerisGrid, datetime_to_jd, get_ephemeris_grid, jd_to_datetime
+from ..skyfield_ephemeris import get_skyfield_ephemeris
+
+AU_KM = 149597870.7
 
 
 class LunarTracker(BaseTrackingModule):
     """
     Tracks lunar cycles and position.
 
-    Data source: Skyfield (NASA JPL ephemeris)
+    Data source: Precomputed ephemeris grid (Swiss Ephemeris), with
+    Skyfield (NASA JPL ephemeris) as the fallback when the grid is not built
 
     Monitors:
     - Current lunar phase
@@ -28,22 +33,37 @@ class LunarTracker(BaseTrackingModule):
     update_frequency = "daily"
 
     def __init__(self):
-        self.ts = load.timescale()
+        # Timescale and kernel are shared process-wide and loaded on first use,
+        # so trackers served from the grid never touch de421.bsp
+        self._ephemeris = get_skyfield_ephemeris()
+
+    @property
+    def ts(self):
+        return self._ephemeris.timescale
+
+    @property
+    def eph(self):
+        return self._ephemeris.kernel
 
-        # Check if ephemeris exists, download if not
-        eph_path = "de421.bsp"
-        if not os.path.exists(eph_path):
-            print("[LunarTracker] Downloading JPL ephemeris (de421.bsp, ~16MB)...")
+    @property
+    def earth(self):
+        return self._ephemeris.earth
 
-        self.eph = load(eph_path)
-        self.earth = self.eph["earth"]
-        self.moon = self.eph["moon"]
-        self.sun = self.eph["sun"]
+    @property
+    def moon(self):
+        return self._ephemeris.moon
 
-        print(f"[LunarTracker] Initialized with JPL DE421 ephemeris at {os.path.abspath(eph_path)}")
+    @property
+    def sun(self):
+        return self._ephemeris.sun
 
     async def fetch_current_data(self) -> TrackingData:
         """Calculate current lunar data."""
+        grid = get_ephemeris_grid()
+        jd_now = datetime_to_jd(datetime.now(UTC))
+        if grid.covers(jd_now):
+            return self._fetch_from_grid(grid, jd_now)
+
         t = self.ts.now()
 
         # Moon illumination
@@ -99,6 +119,45 @@ class LunarTracker(BaseTrackingModule):
             },
         )
 
+    def _fetch_from_grid(self, grid: EphemerisGrid, jd_now: float) -> TrackingData:
+        """Build lunar data from the ephemeris grid (no kernel access)."""
+        moon_lon, moon_lat, moon_dist, _, _, _ = grid.calc_ut(jd_now, swe.MOON)
+        sun_lon, sun_lat, _, _, _, _ = grid.calc_ut(jd_now, swe.SUN)
+
+        # Geocentric Sun-Moon separation (same quantity as Skyfield's separation_from)
+        cos_sep = math.sin(math.radians(moon_lat)) * math.sin(math.radians(sun_lat)) + math.cos(
+            math.radians(moon_lat)
+        ) * math.cos(math.radians(sun_lat)) * math.cos(math.radians(moon_lon - sun_lon))
+        phase_angle = math.degrees(math.acos(max(-1.0, min(1.0, cos_sep))))
+        illumination = (1 + math.cos(math.radians(phase_angle))) / 2
+
+        sign = self._longitude_to_sign(moon_lon)
+
+        distance_km = moon_dist * AU_KM
+        supermoon_score = 1.0 - ((distance_km - 363300) / (405500 - 363300))
+        supermoon_score = max(0.0, min(1.0, supermoon_score))
+
+        is_voc, time_until_voc, next_ingress = self._calculate_voc_status_from_grid(grid, jd_now)
+
+        return TrackingData(
+            timestamp=datetime.now(UTC),
+            source="Swiss Ephemeris (grid)",
+            data={
+                "phase_angle": float(phase_angle),
+                "illumination": float(illumination),
+                "phase_name": self._get_phase_name(phase_angle),
+                "sign": sign,
+                "longitude": float(moon_lon),
+                "distance_km": float(distance_km),
+                "supermoon_score": float(supermoon_score),
+                "is_voc": is_voc,
+                "time_until_voc_minutes": time_until_voc,
+                "next_ingress": next_ingress.isoformat() if next_ingress else None,
+                "is_new_moon": bool(abs(phase_angle) < 10),
+                "is_full_moon": bool(abs(phase_angle - 180) < 10),
+            },
+        )
+
     async def compare_to_natal(self, user_id: int, current_data: TrackingData) -> dict:
         """Compare current moon to natal moon."""
         # Get user's natal moon
@@ -393,6 +452,36 @@ class LunarTracker(BaseTrackingModule):
 
         return False, None, next_ingress_dt  # Placeholder for "Not VoC" until refined
 
+    def _calculate_voc_status_from_grid(
+        self, grid: EphemerisGrid, jd_now: float
+    ) -> Tuple[bool, Optional[float], Optional[datetime]]:
+        """
+        Grid-backed equivalent of ``_calculate_voc_status``.
+
+        The next ingress is found from one vectorized hourly batch over the
+        next 3 days, then refined by bisection to ~1 minute.
+        """
+        jds = jd_now + np.arange(0, 3 * 24 + 1) / 24.0
+        sign_idx = (grid.calc_many(swe.MOON, jds)[:, 0] // 30).astype(int)
+        changes = np.flatnonzero(sign_idx != sign_idx[0])
+
+        if not len(changes):
+            # Should not happen within 3 days
+            return False, None, None
+
+        lo, hi = float(jds[changes[0] - 1]), float(jds[changes[0]])
+        start_idx = int(sign_idx[0])
+        while hi - lo > 1.0 / 1440.0:
+            mid = (lo + hi) / 2
+            if int(grid.calc_ut(mid, swe.MOON)[0] // 30) == start_idx:
+                lo = mid
+            else:
+                hi = mid
+        next_ingress_dt = jd_to_datetime(hi)
+
+        # VoC itself is still the "Not VoC" placeholder used by the Skyfield path
+        return False, None, next_ingress_dt
+
     def _get_moon_sign_index_for_almanac(self, t):
         """Helper for almanac search."""
         e = self.earth.at(t)
@@ -0,0 +1,100 @@
+# src/app/modules/tracking/skyfield_ephemeris.py
+
+"""
+Shared Skyfield Ephemeris
+
+One JPL kernel and timescale per process. Skyfield opens SPK kernels through
+jplephem, which memory-maps the file, so every tracker and caller shares the
+same pages instead of re-reading de421.bsp per instantiation.
+
+Loading is lazy (first attribute access) and thread-safe; ``warm_up()`` loads
+eagerly so the worker pays the cost at startup rather than on the first job.
+
+Example:
+    >>> eph = get_skyfield_ephemeris()
+    >>> t = eph.timescale.now()
+    >>> eph.earth.at(t).observe(eph.moon)
+"""
+
+import logging
+import os
+import threading
+from typing import Any
+
+from skyfield.api import load
+
+from src.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SkyfieldEphemeris:
+    """Lazily loaded, process-wide Skyfield timescale + JPL kernel."""
+
+    def __init__(self, kernel_path: str | None = None) -> None:
+        self.kernel_path = kernel_path or settings.EPHEMERIS_KERNEL_PATH
+        self._lock = threading.Lock()
+        self._timescale = None
+        self._kernel = None
+        self._bodies: dict[str, Any] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._kernel is not None
+
+    @property
+    def timescale(self):
+        if self._timescale is None:
+            with self._lock:
+                if self._timescale is None:
+                    self._timescale = load.timescale()
+        return self._timescale
+
+    @property
+    def kernel(self):
+        if self._kernel is None:
+            with self._lock:
+                if self._kernel is None:
+                    if not os.path.exists(self.kernel_path):
+                        logger.info(f"[SkyfieldEphemeris] Downloading JPL ephemeris ({self.kernel_path})...")
+                    self._kernel = load(self.kernel_path)
+                    logger.info(f"[SkyfieldEphemeris] Loaded {os.path.abspath(self.kernel_path)}")
+        return self._kernel
+
+    def body(self, name: str):
+        """Kernel segment for a body name (e.g. "earth", "moon"), cached."""
+        body = self._bodies.get(name)
+        if body is None:
+            body = self.kernel[name]
+            self._bodies[name] = body
+        return body
+
+    @property
+    def earth(self):
+        return self.body("earth")
+
+    @property
+    def moon(self):
+        return self.body("moon")
+
+    @property
+    def sun(self):
+        return self.body("sun")
+
+    def warm_up(self) -> None:
+        """Load the timescale, kernel and common bodies now."""
+        _ = self.timescale
+        for name in ("earth", "moon", "sun"):
+            self.body(name)
+
+
+# Singleton instance
+_ephemeris: SkyfieldEphemeris | None = None
+
+
+def get_skyfield_ephemeris() -> SkyfieldEphemeris:
+    """Get the process-wide Skyfield ephemeris (nothing is loaded until used)."""
+    global _ephemeris
+    if _ephemeris is None:
+        _ephemeris = SkyfieldEphemeris()
+    return _ephemeris
@@ -0,0 +1,31 @@
+# src/app/modules/tracking/tests/test_current_sky.py
+
+from src.app.modules.tracking.current_sky import compute_version, widget_fields
+
+
+def _sky(moon_longitude: float, kp: float = 2.0) -> dict:
+    return {
+        "solar": {"kp_index": kp, "bz": -1.5},
+        "lunar": {"phase_name": "Waxing Gibbous", "is_voc": False},
+        "transits": {
+            "positions": {
+                "Moon": {"longitude": moon_longitude, "sign": "Leo", "is_retrograde": False},
+                "Sun": {"longitude": 200.0, "sign": "Libra", "is_retrograde": False},
+                "Mercury": {"longitude": 210.0, "sign": "Scorpio", "is_retrograde": True},
+            }
+        },
+    }
+
+
+def test_widget_fields_from_sky_document():
+    fields = widget_fields(_sky(130.0))
+    assert fields["moon_sign"] == "Leo"
+    assert fields["sun_sign"] == "Libra"
+    assert fields["geomagnetic_index"] == 2.0
+    assert fields["retrograde_count"] == 1
+
+
+def test_version_changes_only_with_visible_or_transit_inputs():
+    assert compute_version(_sky(130.0)) == compute_version(_sky(130.01))
+    assert compute_version(_sky(130.0)) != compute_version(_sky(130.5))
+    assert compute_version(_sky(130.0)) != compute_version(_sky(130.0, kp=5.0))
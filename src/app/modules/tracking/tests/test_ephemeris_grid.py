@@ -0,0 +1,65 @@
+# src/app/modules/tracking/tests/test_ephemeris_grid.py
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from src.app.modules.tracking.ephemeris_grid import GRID_BODIES, EphemerisGrid
+
+
+@pytest.fixture(scope="module")
+def grid(tmp_path_factory):
+    """Small real grid (1 year) built with Swiss Ephemeris."""
+    g = EphemerisGrid(str(tmp_path_factory.mktemp("ephemeris_grid")))
+    g.build(years_back=0, years_ahead=1)
+    assert g.load()
+    return g
+
+
+def test_grid_matches_swiss_ephemeris(grid):
+    """Interpolated positions stay well inside one HD base (~0.0052°)."""
+    rng = np.random.default_rng(42)
+    jds = rng.uniform(grid.start_jd, grid.end_jd, 200)
+
+    for body in GRID_BODIES:
+        interpolated = grid.calc_many(body, jds)
+        reference = np.array([swe.calc_ut(jd, body)[0] for jd in jds])
+
+        lon_error = np.abs((interpolated[:, 0] - reference[:, 0] + 180) % 360 - 180)
+        assert lon_error.max() < 1e-3, f"body {body} longitude error {lon_error.max()}"
+        speed_error = np.abs(interpolated[:, 3] - reference[:, 3])
+        assert speed_error.max() < 1e-2, f"body {body} speed error {speed_error.max()}"
+
+
+def test_scalar_and_batch_queries_agree(grid):
+    jds = np.linspace(grid.start_jd, grid.end_jd, 50)
+    batch = grid.calc_many(swe.MOON, jds)
+    singles = np.array([grid.calc_ut(jd, swe.MOON) for jd in jds])
+    assert np.allclose(batch, singles, atol=1e-9)
+
+
+def test_queries_outside_window_fall_back_to_swisseph(grid):
+    jd = grid.start_jd - 10000  # ~27 years before the window
+    assert not grid.covers(jd)
+    assert grid.calc_ut(jd, swe.SUN) == tuple(swe.calc_ut(jd, swe.SUN)[0])
+
+
+def test_rebuild_publishes_new_version(tmp_path):
+    g = EphemerisGrid(str(tmp_path))
+    assert g.needs_rebuild()
+    assert g.ensure_current() is True
+    assert g.is_loaded
+    assert g.ensure_current() is False
+
+
+def test_scalar_query_picks_up_grid_built_later(tmp_path, monkeypatch):
+    """A process started before the worker built the grid switches to it."""
+    monkeypatch.setattr("src.app.modules.tracking.ephemeris_grid.RELOAD_INTERVAL_SECONDS", 0)
+    reader = EphemerisGrid(str(tmp_path))
+    assert not reader.load()
+
+    EphemerisGrid(str(tmp_path)).build(years_back=0, years_ahead=1)
+
+    jd = swe.julday(2026, 12, 1)
+    reader.calc_ut(jd, swe.MOON)
+    assert reader.is_loaded and swe.MOON in reader._arrays
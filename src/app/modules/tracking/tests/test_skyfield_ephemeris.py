@@ -0,0 +1,15 @@
+# src/app/modules/tracking/tests/test_skyfield_ephemeris.py
+
+from src.app.modules.tracking.lunar.tracker import LunarTracker
+from src.app.modules.tracking.skyfield_ephemeris import get_skyfield_ephemeris
+
+
+def test_trackers_share_one_lazily_loaded_ephemeris():
+    """Trackers reference the process-wide ephemeris instead of loading their own."""
+    first, second = LunarTracker(), LunarTracker()
+    assert first._ephemeris is second._ephemeris is get_skyfield_ephemeris()
+
+
+def test_timescale_is_loaded_once():
+    eph = get_skyfield_ephemeris()
+    assert eph.timescale is eph.timescale
@@ -6,13 +6,15 @@ from typing import List, Optional
 import swisseph as swe
 
 from ..base import BaseTrackingModule, TrackingData
+from ..ephemeris_grid import datetime_to_jd, get_ephemeris_grid
 
 
 class TransitTracker(BaseTrackingModule):
     """
     Tracks planetary transits against natal chart.
 
-    Data source: Swiss Ephemeris (same as natal charts)
+    Data source: Swiss Ephemeris (same as natal charts), served from the
+    precomputed ephemeris grid
 
     Monitors:
     - Current planet positions
@@ -47,13 +49,14 @@ class TransitTracker(BaseTrackingModule):
     async def fetch_current_data(self) -> TrackingData:
         """Calculate current planetary positions."""
         now = datetime.now(UTC)
-        jd = swe.julday(now.year, now.month, now.day, now.hour + now.minute / 60.0)
+        jd = datetime_to_jd(now)
+        grid = get_ephemeris_grid()
 
         positions = {}
         for planet_id, planet_name in self.PLANETS.items():
-            result = swe.calc_ut(jd, planet_id)
-            longitude = result[0][0]
-            speed = result[0][3]  # Longitudinal velocity
+            result = grid.calc_ut(jd, planet_id)
+            longitude = result[0]
+            speed = result[3]  # Longitudinal velocity
 
             positions[planet_name] = {
                 "longitude": longitude,
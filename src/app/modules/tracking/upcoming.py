@@ -10,29 +10,18 @@ Calculates significant astrological events within a specified time window:
 - Retrograde stations (direct/retrograde)
 - Exact transits to natal chart
 
-Uses Swiss Ephemeris and Skyfield for high-precision calculations.
+Positions come from the precomputed ephemeris grid (Swiss Ephemeris samples
+with Hermite interpolation), queried in vectorized batches per body.
 """
 
 import math
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
 import swisseph as swe
-from skyfield.api import load
-
-# Ephemeris data (loaded once)
-_ts = None
-_eph = None
-
-
-def _get_skyfield():
-    """Lazy-load Skyfield ephemeris."""
-    global _ts, _eph
-    if _ts is None:
-        _ts = load.timescale()
-        _eph = load("de421.bsp")
-    return _ts, _eph
 
+from .ephemeris_grid import datetime_to_jd, get_ephemeris_grid
 
 # Sign boundaries at 0° of each sign
 SIGNS = [
@@ -71,16 +60,36 @@ def _longitude_to_sign(longitude: float) -> str:
     return SIGNS[int(longitude / 30) % 12]
 
 
+def _angular_separation(lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray, lat2: np.ndarray) -> np.ndarray:
+    """Great-circle separation in degrees between two sets of ecliptic coordinates."""
+    lon1, lat1, lon2, lat2 = (np.radians(a) for a in (lon1, lat1, lon2, lat2))
+    cos_sep = np.sin(lat1) * np.sin(lat2) + np.cos(lat1) * np.cos(lat2) * np.cos(lon1 - lon2)
+    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0)))
+
+
 def _get_julian_day(dt: datetime) -> float:
     """Convert datetime to Julian Day."""
-    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0)
+    return datetime_to_jd(dt)
+
+
+def _sample_times(now: datetime, count: int, step: timedelta) -> tuple[list[datetime], np.ndarray]:
+    """Evenly spaced check times starting at ``now`` and their Julian Days."""
+    times = [now + step * i for i in range(count)]
+    start_jd = datetime_to_jd(now)
+    step_days = step.total_seconds() / 86400.0
+    return times, start_jd + np.arange(count) * step_days
 
 
 def _get_planet_position(planet_id: int, jd: float) -> dict[str, Any]:
     """Get planet position at Julian Day."""
-    result = swe.calc_ut(jd, planet_id)
-    longitude = result[0][0]
-    speed = result[0][3]
+    result = get_ephemeris_grid().calc_ut(jd, planet_id)
+    return _position_from_row(result)
+
+
+def _position_from_row(row) -> dict[str, Any]:
+    """Build a position dict from a ``calc_ut``-ordered sample row."""
+    longitude = float(row[0])
+    speed = float(row[3])
     return {
         "longitude": longitude,
         "sign": _longitude_to_sign(longitude),
@@ -98,24 +107,15 @@ async def calculate_upcoming_voc_periods(days: int = 7) -> list[dict[str, Any]]:
     We approximate by finding when Moon enters next sign.
     """
     events = []
-    ts, eph = _get_skyfield()
-
-    earth = eph["earth"]
-    moon = eph["moon"]
-
     now = datetime.now(UTC)
 
     # Check each hour for the next N days to find sign changes
-    current_t = ts.utc(now.year, now.month, now.day, now.hour)
-    current_pos = earth.at(current_t).observe(moon).ecliptic_latlon()
-    current_sign = _longitude_to_sign(current_pos[0].degrees)
+    check_times, jds = _sample_times(now, days * 24, timedelta(hours=1))
+    moon_lons = get_ephemeris_grid().calc_many(swe.MOON, jds)[:, 0]
+    current_sign = _longitude_to_sign(moon_lons[0])
 
-    for hour_offset in range(days * 24):
-        check_time = now + timedelta(hours=hour_offset)
-        t = ts.utc(check_time.year, check_time.month, check_time.day, check_time.hour)
-
-        moon_pos = earth.at(t).observe(moon).ecliptic_latlon()
-        sign = _longitude_to_sign(moon_pos[0].degrees)
+    for check_time, moon_lon in zip(check_times, moon_lons):
+        sign = _longitude_to_sign(moon_lon)
 
         if sign != current_sign:
             # Moon is changing signs - VoC ends here
@@ -141,27 +141,20 @@ async def calculate_upcoming_voc_periods(days: int = 7) -> list[dict[str, Any]]:
 async def calculate_upcoming_lunar_phases(days: int = 30) -> list[dict[str, Any]]:
     """Calculate upcoming New and Full Moons."""
     events = []
-    ts, eph = _get_skyfield()
-
-    earth = eph["earth"]
-    moon = eph["moon"]
-    sun = eph["sun"]
-
     now = datetime.now(UTC)
 
     # Check every 6 hours for phase changes
-    prev_phase_angle = None
+    check_times, jds = _sample_times(now, days * 4, timedelta(hours=6))
+    grid = get_ephemeris_grid()
+    moon_rows = grid.calc_many(swe.MOON, jds)
+    sun_rows = grid.calc_many(swe.SUN, jds)
+    phase_angles = _angular_separation(moon_rows[:, 0], moon_rows[:, 1], sun_rows[:, 0], sun_rows[:, 1])
 
-    for hour_offset in range(0, days * 24, 6):
-        check_time = now + timedelta(hours=hour_offset)
-        t = ts.utc(check_time.year, check_time.month, check_time.day, check_time.hour)
-
-        moon_geo = earth.at(t).observe(moon)
-        sun_geo = earth.at(t).observe(sun)
-        phase_angle = moon_geo.apparent().separation_from(sun_geo).degrees
+    prev_phase_angle = None
 
-        moon_pos = earth.at(t).observe(moon).ecliptic_latlon()
-        sign = _longitude_to_sign(moon_pos[0].degrees)
+    for check_time, moon_row, phase_angle in zip(check_times, moon_rows, phase_angles):
+        phase_angle = float(phase_angle)
+        sign = _longitude_to_sign(moon_row[0])
         illumination = (1 + math.cos(math.radians(phase_angle))) / 2
 
         if prev_phase_angle is not None:
@@ -219,12 +212,13 @@ async def calculate_upcoming_ingresses(days: int = 30) -> list[dict[str, Any]]:
         current_signs[planet_id] = pos["sign"]
 
     # Check daily for sign changes (planets move slowly enough)
-    for day_offset in range(days):
-        check_time = now + timedelta(days=day_offset)
-        jd = _get_julian_day(check_time)
+    check_times, jds = _sample_times(now, days, timedelta(days=1))
+    grid = get_ephemeris_grid()
+    samples = {planet_id: grid.calc_many(planet_id, jds) for planet_id in PLANETS}
 
+    for day_offset, check_time in enumerate(check_times):
         for planet_id, (name, symbol) in PLANETS.items():
-            pos = _get_planet_position(planet_id, jd)
+            pos = _position_from_row(samples[planet_id][day_offset])
             if pos["sign"] != current_signs[planet_id]:
                 old_sign = current_signs[planet_id]
                 new_sign = pos["sign"]
@@ -265,13 +259,14 @@ async def calculate_upcoming_retrogrades(days: int = 90) -> list[dict[str, Any]]
         current_retrogrades[planet_id] = pos["is_retrograde"]
 
     # Check daily for retrograde status changes
-    for day_offset in range(days):
-        check_time = now + timedelta(days=day_offset)
-        jd = _get_julian_day(check_time)
+    check_times, jds = _sample_times(now, days, timedelta(days=1))
+    grid = get_ephemeris_grid()
+    samples = {planet_id: grid.calc_many(planet_id, jds) for planet_id in OUTER_PLANETS}
 
+    for day_offset, check_time in enumerate(check_times):
         for planet_id in OUTER_PLANETS:
             name, symbol = PLANETS[planet_id]
-            pos = _get_planet_position(planet_id, jd)
+            pos = _position_from_row(samples[planet_id][day_offset])
             is_retro = pos["is_retrograde"]
 
             if is_retro != current_retrogrades[planet_id]:
@@ -364,14 +359,14 @@ async def calculate_upcoming_natal_transits(user_id: int, days: int = 30) -> lis
     }
 
     # Check daily for exact transits
-    for day_offset in range(days):
-        check_time = now + timedelta(days=day_offset)
-        jd = _get_julian_day(check_time)
+    check_times, jds = _sample_times(now, days, timedelta(days=1))
+    grid = get_ephemeris_grid()
+    samples = {planet_id: grid.calc_many(planet_id, jds) for planet_id in OUTER_PLANETS}
 
+    for day_offset, check_time in enumerate(check_times):
         for planet_id in OUTER_PLANETS:
             transit_name, transit_symbol = PLANETS[planet_id]
-            transit_pos = _get_planet_position(planet_id, jd)
-            transit_lon = transit_pos["longitude"]
+            transit_lon = float(samples[planet_id][day_offset][0])
 
             for natal_name, natal_lon in natal_positions.items():
                 for aspect_name, (angle, symbol, orb) in ASPECTS.items():
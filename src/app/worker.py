@@ -1,9 +1,14 @@
+import asyncio
 import logging
 
 from arq import run_worker
 
 from src.app.core.db.database import init_db
 from src.app.core.scheduler import WorkerSettings
+from src.app.core.scheduler import shutdown as scheduler_shutdown
+from src.app.core.scheduler import startup as scheduler_startup
+from src.app.modules.tracking.ephemeris_grid import get_ephemeris_grid
+from src.app.modules.tracking.skyfield_ephemeris import get_skyfield_ephemeris
 
 # Ensure logging is configured
 logging.basicConfig(level=logging.INFO)
@@ -13,11 +18,18 @@ logger = logging.getLogger(__name__)
 async def startup(ctx):
     logger.info("Initializing Worker...")
     await init_db()
-    # Any other startup logic (e.g., Redis connections which ARQ handles mostly)
+    # Build/load the ephemeris grid before any tracking job runs
+    await asyncio.to_thread(get_ephemeris_grid().ensure_current)
+    # Map the JPL kernel once so Skyfield fallbacks never load it mid-job
+    await asyncio.to_thread(get_skyfield_ephemeris().warm_up)
+    # Scheduler startup (first heartbeat, journal backfill, background LLM lane) replaced by this hook
+    await scheduler_startup(ctx)
 
 
 async def shutdown(ctx):
     logger.info("Shutting down Worker...")
+    # Flushes buffered trace/activity writes, closes the LLM gateway's connection pools
+    await scheduler_shutdown(ctx)
 
 
 # Update settings with specific startup/shutdown if needed,
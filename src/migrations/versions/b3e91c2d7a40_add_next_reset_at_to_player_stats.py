@@ -0,0 +1,28 @@
+"""add_next_reset_at_to_player_stats
+
+Revision ID: b3e91c2d7a40
+Revises: 6705bf3976ca
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e91c2d7a40'
+down_revision: Union[str, None] = '6705bf3976ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL = due on the next daily_reset_job run, which then schedules it
+    op.add_column('player_stats', sa.Column('next_reset_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_player_stats_next_reset_at', 'player_stats', ['next_reset_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_player_stats_next_reset_at', table_name='player_stats')
+    op.drop_column('player_stats', 'next_reset_at')
@@ -0,0 +1,212 @@
+"""add_hypothesis_tables
+
+Moves hypotheses out of user_profile.data['hypotheses'] into dedicated tables
+for hypotheses, their evidence records and confidence snapshots.
+
+Revision ID: c4d2a8f61b93
+Revises: b3e91c2d7a40
+Create Date: 2026-10-18 14:05:12.337861
+
+"""
+import json
+import uuid
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2a8f61b93'
+down_revision: Union[str, None] = 'b3e91c2d7a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROW_FIELDS = (
+    'id', 'user_id', 'hypothesis_type', 'claim', 'predicted_value', 'confidence', 'status',
+    'evidence_count', 'contradictions', 'generated_at', 'last_updated', 'last_evidence_at',
+)
+WEIGHT_FIELDS = ('recency_multiplier', 'effective_weight')
+
+
+def _as_utc(value):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def upgrade() -> None:
+    hypotheses = op.create_table(
+        'hypotheses',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('hypothesis_type', sa.String(50), nullable=False),
+        sa.Column('claim', sa.Text(), nullable=False),
+        sa.Column('predicted_value', sa.Text(), nullable=False),
+        sa.Column('confidence', sa.Float(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('evidence_count', sa.Integer(), nullable=False),
+        sa.Column('contradictions', sa.Integer(), nullable=False),
+        sa.Column('attributes', JSONB(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_updated', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_evidence_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_hypotheses_user_id', 'hypotheses', ['user_id'])
+    op.create_index('ix_hypotheses_user_status_confidence', 'hypotheses', ['user_id', 'status', 'confidence'])
+
+    evidence = op.create_table(
+        'hypothesis_evidence',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('hypothesis_id', sa.String(36), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('evidence_type', sa.String(50), nullable=False),
+        sa.Column('is_contradiction', sa.Boolean(), nullable=False),
+        sa.Column('recency_multiplier', sa.Float(), nullable=False),
+        sa.Column('effective_weight', sa.Float(), nullable=False),
+        sa.Column('record', JSONB(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['hypothesis_id'], ['hypotheses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_hypothesis_evidence_hypothesis_position', 'hypothesis_evidence', ['hypothesis_id', 'position']
+    )
+
+    snapshots = op.create_table(
+        'hypothesis_confidence_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('hypothesis_id', sa.String(36), nullable=False),
+        sa.Column('confidence', sa.Float(), nullable=False),
+        sa.Column('snapshot', JSONB(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['hypothesis_id'], ['hypotheses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_hypothesis_confidence_snapshots_hypothesis_recorded',
+        'hypothesis_confidence_snapshots',
+        ['hypothesis_id', 'recorded_at'],
+    )
+
+    # Backfill from user_profile.data['hypotheses']
+    conn = op.get_bind()
+    profiles = conn.execute(
+        sa.text("SELECT user_id, data->'hypotheses' FROM user_profile WHERE data ? 'hypotheses'")
+    ).all()
+
+    for user_id, stored in profiles:
+        if isinstance(stored, str):
+            stored = json.loads(stored)
+        for h in stored or []:
+            if not h.get('id') or not h.get('claim'):
+                continue
+            now = datetime.now(UTC)
+            row = {field: h.get(field) for field in ROW_FIELDS}
+            row.update(
+                user_id=user_id,
+                hypothesis_type=h.get('hypothesis_type') or 'theme_correlation',
+                predicted_value=h.get('predicted_value') or '',
+                confidence=h.get('confidence') or 0.0,
+                status=h.get('status') or 'forming',
+                evidence_count=h.get('evidence_count') or 0,
+                contradictions=h.get('contradictions') or 0,
+                generated_at=_as_utc(h.get('generated_at')) or now,
+                last_updated=_as_utc(h.get('last_updated')) or now,
+                last_evidence_at=_as_utc(h.get('last_evidence_at')),
+                attributes={
+                    k: v for k, v in h.items()
+                    if k not in ROW_FIELDS and k not in ('evidence_records', 'confidence_history')
+                },
+            )
+            conn.execute(sa.insert(hypotheses).values(**row))
+
+            evidence_rows = [
+                {
+                    'id': record.get('id') or str(uuid.uuid5(uuid.NAMESPACE_OID, f"{h['id']}:{position}")),
+                    'hypothesis_id': h['id'],
+                    'position': position,
+                    'evidence_type': str(record.get('evidence_type', '')),
+                    'is_contradiction': bool(record.get('is_contradiction', False)),
+                    'recency_multiplier': float(record.get('recency_multiplier', 1.0)),
+                    'effective_weight': float(record.get('effective_weight', 0.0)),
+                    'record': {k: v for k, v in record.items() if k not in WEIGHT_FIELDS and k != 'id'},
+                    'recorded_at': _as_utc(record.get('timestamp')) or now,
+                }
+                for position, record in enumerate(h.get('evidence_records') or [])
+            ]
+            if evidence_rows:
+                conn.execute(sa.insert(evidence), evidence_rows)
+
+            snapshot_rows = [
+                {
+                    'hypothesis_id': h['id'],
+                    'confidence': float(snapshot.get('confidence', 0.0)),
+                    'snapshot': snapshot,
+                    'recorded_at': _as_utc(snapshot.get('timestamp')) or now,
+                }
+                for snapshot in (h.get('confidence_history') or [])[-50:]
+            ]
+            if snapshot_rows:
+                conn.execute(sa.insert(snapshots), snapshot_rows)
+
+    conn.execute(sa.text("UPDATE user_profile SET data = data - 'hypotheses' WHERE data ? 'hypotheses'"))
+
+
+def downgrade() -> None:
+    # Restore the JSONB list before dropping the tables
+    conn = op.get_bind()
+    conn.execute(sa.text("""
+        UPDATE user_profile p
+        SET data = jsonb_set(p.data, '{hypotheses}', agg.hypotheses)
+        FROM (
+            SELECT h.user_id, jsonb_agg(
+                h.attributes || jsonb_build_object(
+                    'id', h.id,
+                    'user_id', h.user_id,
+                    'hypothesis_type', h.hypothesis_type,
+                    'claim', h.claim,
+                    'predicted_value', h.predicted_value,
+                    'confidence', h.confidence,
+                    'status', h.status,
+                    'evidence_count', h.evidence_count,
+                    'contradictions', h.contradictions,
+                    'generated_at', h.generated_at,
+                    'last_updated', h.last_updated,
+                    'last_evidence_at', h.last_evidence_at,
+                    'evidence_records', COALESCE((
+                        SELECT jsonb_agg(
+                            e.record || jsonb_build_object(
+                                'id', e.id,
+                                'recency_multiplier', e.recency_multiplier,
+                                'effective_weight', e.effective_weight
+                            ) ORDER BY e.position
+                        )
+                        FROM hypothesis_evidence e WHERE e.hypothesis_id = h.id
+                    ), '[]'::jsonb),
+                    'confidence_history', COALESCE((
+                        SELECT jsonb_agg(s.snapshot ORDER BY s.recorded_at, s.id)
+                        FROM hypothesis_confidence_snapshots s WHERE s.hypothesis_id = h.id
+                    ), '[]'::jsonb)
+                ) ORDER BY h.generated_at
+            ) AS hypotheses
+            FROM hypotheses h
+            GROUP BY h.user_id
+        ) agg
+        WHERE p.user_id = agg.user_id
+    """))
+
+    op.drop_index(
+        'ix_hypothesis_confidence_snapshots_hypothesis_recorded', table_name='hypothesis_confidence_snapshots'
+    )
+    op.drop_table('hypothesis_confidence_snapshots')
+    op.drop_index('ix_hypothesis_evidence_hypothesis_position', table_name='hypothesis_evidence')
+    op.drop_table('hypothesis_evidence')
+    op.drop_index('ix_hypotheses_user_status_confidence', table_name='hypotheses')
+    op.drop_index('ix_hypotheses_user_id', table_name='hypotheses')
+    op.drop_table('hypotheses')
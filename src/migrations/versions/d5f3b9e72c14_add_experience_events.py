@@ -0,0 +1,71 @@
+"""add_experience_events
+
+Append-only XP ledger. XP entries that EvolutionEngine used to copy into
+player_stats.sync_history are moved into it, leaving sync_history with the
+daily sync scores only.
+
+Revision ID: d5f3b9e72c14
+Revises: c4d2a8f61b93
+Create Date: 2026-10-18 16:42:08.118204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f3b9e72c14'
+down_revision: Union[str, None] = 'c4d2a8f61b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'experience_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Integer(), nullable=False),
+        sa.Column('reason', sa.String(255), nullable=False),
+        sa.Column('category', sa.String(30), nullable=False),
+        sa.Column('source', sa.String(50), nullable=True),
+        sa.Column('details', JSONB(), nullable=False),
+        sa.Column('total_after', sa.Integer(), nullable=False),
+        sa.Column('level_after', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_experience_events_user_created', 'experience_events', ['user_id', 'created_at'])
+
+    # Backfill from the XP entries mixed into sync_history
+    op.execute("""
+        INSERT INTO experience_events
+            (user_id, amount, reason, category, details, total_after, level_after, created_at)
+        SELECT
+            s.user_id,
+            (e->>'amount')::int,
+            left(COALESCE(e->>'reason', 'Insight Integration'), 255),
+            left(COALESCE(e->>'category', 'SYNC'), 30),
+            '{}'::jsonb,
+            COALESCE((e->>'new_total')::int, 0),
+            COALESCE((e->>'level')::int, 1),
+            COALESCE((e->>'timestamp')::timestamptz, now())
+        FROM player_stats s, jsonb_array_elements(COALESCE(s.sync_history, '[]'::jsonb)) e
+        WHERE e ? 'amount'
+    """)
+    op.execute("""
+        UPDATE player_stats
+        SET sync_history = COALESCE((
+            SELECT jsonb_agg(e) FROM jsonb_array_elements(sync_history) e WHERE NOT e ? 'amount'
+        ), '[]'::jsonb)
+        WHERE jsonb_typeof(sync_history) = 'array'
+    """)
+
+
+def downgrade() -> None:
+    # Ledger entries are not copied back into sync_history
+    op.drop_index('ix_experience_events_user_created', table_name='experience_events')
+    op.drop_table('experience_events')
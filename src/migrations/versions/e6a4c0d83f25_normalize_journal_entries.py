@@ -0,0 +1,77 @@
+"""normalize_journal_entries
+
+Makes journal_entries the single journal store: a stable entry_uuid,
+energy/themes/symptoms columns, JSONB tags and (user_id, created_at) plus
+GIN indexes. Indexes are built CONCURRENTLY so writes are not blocked.
+
+Entries in UserProfile.data['journal_entries'] are moved online, in
+batches, by the backfill_journal_entries worker job (JournalStore.backfill).
+
+Revision ID: e6a4c0d83f25
+Revises: d5f3b9e72c14
+Create Date: 2026-10-18 18:20:47.593310
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a4c0d83f25'
+down_revision: Union[str, None] = 'd5f3b9e72c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('journal_entries', sa.Column('entry_uuid', sa.String(36), nullable=True))
+    op.execute("UPDATE journal_entries SET entry_uuid = gen_random_uuid()::text WHERE entry_uuid IS NULL")
+    op.alter_column('journal_entries', 'entry_uuid', nullable=False)
+    op.create_unique_constraint('journal_entries_entry_uuid_key', 'journal_entries', ['entry_uuid'])
+
+    op.add_column('journal_entries', sa.Column('energy_score', sa.Integer(), nullable=True))
+    op.add_column('journal_entries', sa.Column('themes', JSONB(), nullable=True, server_default='[]'))
+    # NULL until labelled; JournalStore labels such rows on read
+    op.add_column('journal_entries', sa.Column('symptoms', JSONB(), nullable=True))
+    op.alter_column(
+        'journal_entries', 'tags', type_=JSONB(), existing_type=sa.JSON(), postgresql_using='tags::jsonb'
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_journal_entries_user_created',
+            'journal_entries',
+            ['user_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_journal_entries_tags',
+            'journal_entries',
+            ['tags'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_journal_entries_symptoms',
+            'journal_entries',
+            ['symptoms'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # Backfilled profile entries stay in the table
+    op.drop_index('ix_journal_entries_symptoms', table_name='journal_entries')
+    op.drop_index('ix_journal_entries_tags', table_name='journal_entries')
+    op.drop_index('ix_journal_entries_user_created', table_name='journal_entries')
+    op.alter_column(
+        'journal_entries', 'tags', type_=sa.JSON(), existing_type=JSONB(), postgresql_using='tags::json'
+    )
+    op.drop_column('journal_entries', 'symptoms')
+    op.drop_column('journal_entries', 'themes')
+    op.drop_column('journal_entries', 'energy_score')
+    op.drop_constraint('journal_entries_entry_uuid_key', 'journal_entries', type_='unique')
+    op.drop_column('journal_entries', 'entry_uuid')
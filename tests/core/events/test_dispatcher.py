@@ -0,0 +1,102 @@
+"""
+Tests for the EventBus dispatcher.
+
+Verifies pattern matching semantics, that slow handlers do not block
+delivery to other handlers, and handler removal.
+"""
+
+import asyncio
+
+import pytest
+
+from src.app.core.events.dispatcher import EventDispatcher, PatternMatcher
+from src.app.protocol.packet import Packet
+
+
+def _packet(event_type: str) -> Packet:
+    return Packet(source="test", event_type=event_type, payload={})
+
+
+def test_pattern_matcher_semantics():
+    """Trie/regex matching agrees with the original glob behaviour."""
+    matcher = PatternMatcher()
+    for pattern in ["*", "module.*", "cosmic.storm.*", "cosmic*", "a.*.c", "user.created"]:
+        matcher.add(pattern)
+
+    assert set(matcher.match("module.initialized")) == {"*", "module.*"}
+    assert set(matcher.match("module.a.b")) == {"*", "module.*"}
+    assert set(matcher.match("module")) == {"*"}
+    assert set(matcher.match("cosmic.storm.detected")) == {"*", "cosmic.storm.*", "cosmic*"}
+    assert set(matcher.match("a.b.c")) == {"*", "a.*.c"}
+    assert set(matcher.match("user.created")) == {"*", "user.created"}
+
+    matcher.remove("*")
+    matcher.remove("module.*")
+    assert matcher.match("module.initialized") == ()
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_stall_others():
+    dispatcher = EventDispatcher(default_max_queue=10, default_max_concurrency=1)
+    release = asyncio.Event()
+    fast_seen = []
+
+    async def slow_handler(packet: Packet):
+        await release.wait()
+
+    async def fast_handler(packet: Packet):
+        fast_seen.append(packet.event_type)
+
+    dispatcher.add("module.*", slow_handler)
+    dispatcher.add("module.*", fast_handler)
+
+    for i in range(3):
+        assert await dispatcher.dispatch(f"module.event{i}", _packet(f"module.event{i}")) == 2
+
+    await asyncio.sleep(0.05)
+    assert fast_seen == ["module.event0", "module.event1", "module.event2"]
+
+    metrics = {h["handler"].split(".")[-1]: h for h in dispatcher.metrics()["handlers"]}
+    assert metrics["slow_handler"]["queue_depth"] == 2  # one in flight, two waiting
+
+    release.set()
+    await dispatcher.close()
+    assert dispatcher.metrics()["total_queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    dispatcher = EventDispatcher(default_max_queue=1, default_max_concurrency=1)
+    release = asyncio.Event()
+
+    async def blocked_handler(packet: Packet):
+        await release.wait()
+
+    dispatcher.add("jobs.*", blocked_handler)
+    await dispatcher.dispatch("jobs.a", _packet("jobs.a"))  # picked up by the worker
+    await asyncio.sleep(0)
+    await dispatcher.dispatch("jobs.b", _packet("jobs.b"))  # fills the queue
+
+    pending = asyncio.create_task(dispatcher.dispatch("jobs.c", _packet("jobs.c")))
+    await asyncio.sleep(0.05)
+    assert not pending.done()
+
+    release.set()
+    await asyncio.wait_for(pending, timeout=1)
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_remove_matches_bound_methods():
+    class Hub:
+        async def publish(self, packet: Packet):
+            pass
+
+    hub = Hub()
+    dispatcher = EventDispatcher(default_max_queue=10, default_max_concurrency=1)
+    dispatcher.add("*", hub.publish)
+
+    # A fresh bound method object, as in SSEHub.stop()
+    assert await dispatcher.remove("*", hub.publish) is True
+    assert dispatcher.workers == {}
+    assert await dispatcher.dispatch("module.event", _packet("module.event")) == 0
@@ -0,0 +1,112 @@
+"""
+Tests for the SSE hub.
+
+Verifies single bus subscription, per-client filters, overflow policies and
+Last-Event-ID replay.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.core.config import SSEOverflowPolicyOption
+from src.app.core.events.sse import SSEHub
+from src.app.protocol.packet import Packet
+
+
+def _packet(event_type: str, user_id: str | None = None, **payload) -> Packet:
+    return Packet(source="test", event_type=event_type, payload=payload, user_id=user_id)
+
+
+def _hub(**kwargs) -> SSEHub:
+    bus = MagicMock()
+    bus.subscribe = AsyncMock()
+    bus.unsubscribe = AsyncMock()
+    return SSEHub(bus=bus, **kwargs)
+
+
+async def _drain(client) -> list[str]:
+    frames = []
+    while (frame := await client.next_frame(timeout=0.01)) is not None:
+        frames.append(frame)
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_one_bus_subscription_for_many_clients():
+    hub = _hub()
+    for _ in range(3):
+        await hub.start()
+        hub.connect()
+
+    hub.bus.subscribe.assert_awaited_once()
+    await hub.stop()
+    hub.bus.unsubscribe.assert_awaited_once_with("*", hub.publish)
+
+
+@pytest.mark.asyncio
+async def test_serializes_once_and_filters_by_topic_and_user():
+    hub = _hub()
+    everything = hub.connect()
+    cosmic_for_user = hub.connect(topics=["cosmic.*"], user_id="1")
+
+    with patch("src.app.core.events.sse.json.dumps", wraps=__import__("json").dumps) as dumps:
+        await hub.publish(_packet("cosmic.storm.detected"))
+        await hub.publish(_packet("cosmic.transit.exact", user_id="2"))
+        await hub.publish(_packet("quest.created", user_id="1"))
+    assert dumps.call_count == 3
+
+    assert len(await _drain(everything)) == 3
+    frames = await _drain(cosmic_for_user)
+    assert len(frames) == 1 and "cosmic.storm.detected" in frames[0]
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop_and_coalesce():
+    hub = _hub()
+    dropping = hub.connect(policy=SSEOverflowPolicyOption.DROP)
+    dropping.max_queue = 2
+    coalescing = hub.connect(policy=SSEOverflowPolicyOption.COALESCE)
+    coalescing.max_queue = 2
+
+    await hub.publish(_packet("cosmic.lunar.phase", n=1))
+    await hub.publish(_packet("quest.created", n=2))
+    await hub.publish(_packet("cosmic.lunar.phase", n=3))
+
+    frames = await _drain(dropping)
+    assert dropping.dropped == 1
+    assert '"n": 2' in frames[0] and '"n": 3' in frames[1]
+
+    frames = await _drain(coalescing)
+    assert coalescing.coalesced == 1 and coalescing.dropped == 0
+    assert '"n": 2' in frames[0] and '"n": 3' in frames[1]
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replay():
+    hub = _hub(replay_size=10)
+    for i in range(5):
+        await hub.publish(_packet("module.tick", n=i))
+
+    resumed = hub.connect(last_event_id=f"{hub.epoch}-3")
+    frames = await _drain(resumed)
+    assert [f.split("\n")[0] for f in frames] == [f"id: {hub.epoch}-4", f"id: {hub.epoch}-5"]
+
+    # Ids from another process lifetime are not replayed
+    assert await _drain(hub.connect(last_event_id="1-3")) == []
+
+
+@pytest.mark.asyncio
+async def test_next_frame_times_out_and_metrics_report_lag():
+    hub = _hub()
+    client = hub.connect()
+    assert await asyncio.wait_for(client.next_frame(timeout=0.01), timeout=1) is None
+
+    await hub.publish(_packet("module.tick"))
+    metrics = hub.metrics()
+    assert metrics["connections"] == 1
+    assert metrics["clients"][0]["queued"] == 1
+
+    hub.disconnect(client)
+    assert hub.metrics()["connections"] == 0
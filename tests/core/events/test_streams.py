@@ -0,0 +1,45 @@
+"""
+Tests for the Redis Streams EventBus transport.
+
+Covers group routing and ack decisions; Redis I/O is exercised in integration.
+"""
+
+import json
+
+import pytest
+
+from src.app.core.events.streams import StreamTransport, default_group_name
+from src.app.protocol.packet import Packet
+
+
+def _fields(event_type: str) -> dict:
+    packet = Packet(source="test", event_type=event_type, payload={})
+    return {"event_type": event_type, "packet": json.dumps(packet.to_dict())}
+
+
+@pytest.mark.asyncio
+async def test_entries_are_routed_and_acked_per_group():
+    transport = StreamTransport(redis_client=None, stream_key="events:test")
+    seen = []
+
+    async def on_module(packet: Packet):
+        seen.append(packet.event_type)
+
+    async def on_failure(packet: Packet):
+        raise RuntimeError("boom")
+
+    assert await transport.subscribe("module.*", on_module) == default_group_name(on_module)
+    await transport.subscribe("cosmic.*", on_failure, group="failing")
+
+    module_group = transport.groups[default_group_name(on_module)]
+    failing_group = transport.groups["failing"]
+
+    # Matching entry is delivered and acked; non-matching one is skipped and acked
+    assert await transport._process_entry(module_group, "1-0", _fields("module.initialized")) is True
+    assert await transport._process_entry(module_group, "2-0", _fields("cosmic.update")) is True
+    assert seen == ["module.initialized"]
+    assert module_group.skipped == 1
+
+    # A failing handler leaves the entry pending for redelivery
+    assert await transport._process_entry(failing_group, "2-0", _fields("cosmic.update")) is False
+    assert failing_group.failed == 1
@@ -0,0 +1,116 @@
+"""
+Tests for the LLM gateway.
+
+Covers priority lanes (slots and rate budget), jittered retries of
+rate-limited calls, and the fake backend staying within the per-model
+concurrency limit.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import openai
+import pytest
+
+from src.app.core.ai.fake_llm import FakeChatModel
+from src.app.core.ai.gateway import LLMGateway, LLMPriority, PrioritySemaphore, TokenBucket, llm_priority
+
+
+def _rate_limit_error(retry_after=None):
+    headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+    response = httpx.Response(429, headers=headers, request=httpx.Request("POST", "https://fake.local"))
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.mark.asyncio
+async def test_interactive_waiters_are_served_before_background():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire(LLMPriority.BACKGROUND)
+    order = []
+
+    async def waiter(name, priority):
+        await semaphore.acquire(priority)
+        order.append(name)
+        semaphore.release()
+
+    tasks = [
+        asyncio.create_task(waiter("background-1", LLMPriority.BACKGROUND)),
+        asyncio.create_task(waiter("background-2", LLMPriority.BACKGROUND)),
+        asyncio.create_task(waiter("interactive", LLMPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert semaphore.queued == 3
+
+    semaphore.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive", "background-1", "background-2"]
+    assert semaphore.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_goes_to_interactive_waiters_first():
+    bucket = TokenBucket(per_minute=600, burst=1)  # One token per 100ms
+    order = []
+
+    async def caller(name, priority):
+        await bucket.take(priority)
+        order.append(name)
+
+    await bucket.take(LLMPriority.BACKGROUND)  # Drain the burst
+    background = [asyncio.create_task(caller(f"background-{i}", LLMPriority.BACKGROUND)) for i in range(2)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(caller("interactive", LLMPriority.INTERACTIVE))
+    await asyncio.gather(interactive, *background)
+
+    assert order == ["interactive", "background-0", "background-1"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_calls_are_retried_with_jitter():
+    gateway = LLMGateway()
+    call = AsyncMock(side_effect=[_rate_limit_error(), _rate_limit_error(retry_after=2), "ok"])
+
+    with patch("src.app.core.ai.gateway.asyncio.sleep", AsyncMock()) as sleep:
+        assert await gateway.run("model", call) == "ok"
+
+    first, second = (c.args[0] for c in sleep.await_args_list)
+    assert 0 <= first <= 0.5  # uniform(0, base)
+    assert second == 2.0  # Retry-After wins over a shorter backoff
+    metrics = gateway.metrics()["models"][0]
+    assert (metrics["retries"], metrics["failures"], metrics["requests"]["interactive"]) == (2, 0, 3)
+
+    gateway.max_retries = 0
+    with pytest.raises(openai.RateLimitError):
+        await gateway.run("model", AsyncMock(side_effect=_rate_limit_error()))
+    assert gateway.metrics()["models"][0]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_respects_model_concurrency():
+    gateway = LLMGateway()
+    gateway.lane("fake-model").semaphore.limit = 2
+    gateway.lane("fake-model").bucket.rate = 0
+    peak = 0
+
+    original_sleep = asyncio.sleep
+
+    async def tracking_sleep(delay):
+        nonlocal peak
+        peak = max(peak, gateway.lane("fake-model").semaphore.in_use)
+        await original_sleep(0.01)
+
+    llm = FakeChatModel(model_name="fake-model", latency_ms=10, error_rate=0.0)
+    with (
+        patch("src.app.core.ai.fake_llm.get_llm_gateway", return_value=gateway),
+        patch("src.app.core.ai.fake_llm.asyncio.sleep", tracking_sleep),
+        llm_priority(LLMPriority.BACKGROUND),
+    ):
+        responses = await asyncio.gather(*(llm.ainvoke(f"entry {i}") for i in range(6)))
+
+    assert responses[0].content == "[fake:fake-model] entry 0"
+    assert peak == 2
+    metrics = gateway.metrics()["models"][0]
+    assert metrics["requests"] == {"interactive": 0, "background": 6}
+    assert metrics["in_flight"] == 0 and metrics["latency_p50_ms"] is not None
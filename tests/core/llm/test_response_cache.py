@@ -0,0 +1,133 @@
+"""
+Tests for the LLM response cache.
+
+Verifies prompt normalization in the key, hits after a miss, LRU eviction,
+single-flight dedup of concurrent identical requests and metrics reporting.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.app.core.ai.response_cache import KEY_PREFIX, LLMResponseCache, prompt_key
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.lru = {}
+        self.clock = 0
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def zadd(self, key, mapping):
+        for member in mapping:
+            self.clock += 1
+            self.lru[member] = self.clock
+
+    async def zcard(self, key):
+        return len(self.lru)
+
+    async def zpopmin(self, key, count):
+        oldest = sorted(self.lru.items(), key=lambda item: item[1])[:count]
+        for member, _ in oldest:
+            del self.lru[member]
+        return oldest
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+def _llm(model="anthropic/claude-haiku-4.5", temperature=0.7, delay=0.0):
+    llm = SimpleNamespace(model_name=model, temperature=temperature, calls=[])
+
+    async def ainvoke(prompt, **kwargs):
+        llm.calls.append(prompt)
+        await asyncio.sleep(delay)
+        return SimpleNamespace(content=f"answer {len(llm.calls)}")
+
+    llm.ainvoke = ainvoke
+    return llm
+
+
+@pytest.fixture
+def redis_client():
+    client = _FakeRedis()
+    activity = AsyncMock()
+    with (
+        patch.object(LLMResponseCache, "_redis", AsyncMock(return_value=client)),
+        patch("src.app.core.activity.logger.get_activity_logger", return_value=activity),
+    ):
+        client.activity = activity
+        yield client
+
+
+def test_key_normalizes_whitespace_but_not_model_settings():
+    llm = _llm()
+    a = prompt_key(llm, [SystemMessage(content="Be brief."), HumanMessage(content="Log  the\n event ")])
+    b = prompt_key(llm, [SystemMessage(content="Be brief."), HumanMessage(content="Log the event")])
+    assert a == b
+    assert prompt_key(llm, "Log the event") != a
+    assert prompt_key(_llm(temperature=0.2), "Log the event") != prompt_key(llm, "Log the event")
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit_and_lru_eviction(redis_client):
+    cache = LLMResponseCache(max_entries=1, default_ttl=60)
+    llm = _llm()
+
+    first = await cache.ainvoke(llm, "prompt A", "journalist.log_entry")
+    second = await cache.ainvoke(llm, "prompt  A", "journalist.log_entry")
+
+    assert len(llm.calls) == 1
+    assert isinstance(second, AIMessage) and second.content == first.content == "answer 1"
+    assert cache.stats["journalist.log_entry"].hit_rate == 0.5
+    events = [call.kwargs["activity_type"] for call in redis_client.activity.log_activity.await_args_list]
+    assert events == ["cache_miss", "cache_hit"]
+
+    # A second entry evicts the least recently used one
+    await cache.ainvoke(llm, "prompt B", "journalist.log_entry")
+    assert KEY_PREFIX + prompt_key(llm, "prompt A") not in redis_client.values
+    assert list(redis_client.lru) == [prompt_key(llm, "prompt B")]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(redis_client):
+    cache = LLMResponseCache(max_entries=10, default_ttl=60)
+    llm = _llm(delay=0.02)
+
+    results = await asyncio.gather(*(cache.ainvoke(llm, "same prompt", "oracle.synthesis") for _ in range(3)))
+
+    assert len(llm.calls) == 1
+    assert {r.content for r in results} == {"answer 1"}
+    stats = cache.stats["oracle.synthesis"]
+    assert (stats.misses, stats.shared) == (1, 2)
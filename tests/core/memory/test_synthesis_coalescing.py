@@ -0,0 +1,136 @@
+"""
+Tests for coalesced background synthesis.
+
+Covers a burst of tracker triggers collapsing into one deferred job and one
+synthesis run, critical triggers pulling the batch forward, and skipping
+re-synthesis when the input fingerprint is unchanged.
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.core.memory.synthesis_orchestrator import SynthesisOrchestrator, SynthesisTrigger
+from src.app.modules.intelligence.synthesis import ProfileSynthesizer
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    async def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    async def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key):
+        self.hashes.pop(key, None)
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class _FakeArqPool:
+    def __init__(self):
+        self.jobs = {}
+
+    async def enqueue_job(self, function, *args, _job_id=None, _defer_by=None):
+        if _job_id in self.jobs:
+            return None
+        self.jobs[_job_id] = _defer_by.total_seconds()
+        return SimpleNamespace(job_id=_job_id)
+
+
+@pytest.fixture
+def orchestrator():
+    memory = MagicMock(redis_client=_FakeRedis(), HOT_TTL=86400, set_master_synthesis=AsyncMock())
+    memory.get_master_synthesis = AsyncMock(return_value={"synthesis": "old", "validity": "stale"})
+    return SynthesisOrchestrator(memory)
+
+
+@pytest.mark.asyncio
+async def test_trigger_burst_runs_one_synthesis(orchestrator):
+    pool = _FakeArqPool()
+
+    with patch("src.app.core.worker.client.get_arq_pool", AsyncMock(return_value=pool)):
+        for trigger in [SynthesisTrigger.SOLAR_STORM_DETECTED] * 5 + [SynthesisTrigger.LUNAR_PHASE_CHANGE]:
+            await orchestrator.trigger_synthesis(7, trigger, background=True)
+
+        # All tracker triggers share one deferred job
+        assert len(pool.jobs) == 1
+        assert 290 < next(iter(pool.jobs.values())) <= 300
+
+        # New module data pulls the same batch forward with a second, earlier job
+        await orchestrator.trigger_synthesis(7, SynthesisTrigger.MODULE_CALCULATED, background=True)
+        assert sorted(round(d) for d in pool.jobs.values()) == [30, 300]
+
+    orchestrator._run_synthesis = AsyncMock(return_value={"synthesis": "new"})
+    assert await orchestrator.run_pending_synthesis(7) == {"synthesis": "new"}
+    assert await orchestrator.run_pending_synthesis(7) is None  # Later job finds the batch claimed
+
+    orchestrator._run_synthesis.assert_awaited_once_with(7, "module_calculated,solar_storm,lunar_phase")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_inputs_skip_resynthesis(orchestrator):
+    profile_data = {"observer_findings": [{"finding": "Headaches follow storms", "confidence": 0.8}]}
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=profile_data)))
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    synthesis = SimpleNamespace(
+        synthesis="fresh", themes=[], modules_included=[], model_dump=lambda: {"synthesis": "fresh"}
+    )
+    with (
+        patch("src.app.core.db.database.local_session", session),
+        patch.object(ProfileSynthesizer, "synthesize_profile", AsyncMock(return_value=synthesis)) as synthesize,
+    ):
+        assert (await orchestrator._run_synthesis(7, "solar_storm"))["synthesis"] == "fresh"
+        assert (await orchestrator._run_synthesis(7, "lunar_phase"))["synthesis"] == "old"
+        assert synthesize.await_count == 1
+
+        # A new finding changes the fingerprint
+        profile_data["observer_findings"].append({"finding": "Sleep dips at full moon", "confidence": 0.7})
+        await orchestrator._run_synthesis(7, "pattern_detected")
+        assert synthesize.await_count == 2
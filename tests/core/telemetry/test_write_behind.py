@@ -0,0 +1,76 @@
+"""
+Tests for the telemetry write-behind buffer.
+
+Verifies batching into a single pipeline, drop-oldest on overflow and that
+both worker entrypoints flush the buffers on shutdown.
+"""
+
+import importlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.core.telemetry.write_behind import WriteBehindBuffer
+
+
+class _RecordingPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        self.client.executed.append(self.commands)
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.executed = []
+
+    def pipeline(self, transaction=True):
+        return _RecordingPipeline(self)
+
+
+@pytest.mark.asyncio
+async def test_records_flush_in_one_pipeline_and_overflow_drops_oldest():
+    client = _RecordingClient()
+    buffer = WriteBehindBuffer("test", lambda: client, flush_interval=60, batch_size=100, max_size=3)
+
+    for i in range(5):
+        await buffer.write(lambda pipe, i=i: pipe.set(f"key:{i}", i))
+
+    assert client.executed == []  # nothing written on the caller's path
+    assert buffer.metrics()["dropped"] == 2
+
+    await buffer.close()
+    assert client.executed == [[("key:2", 2), ("key:3", 3), ("key:4", 4)]]
+    assert buffer.metrics()["flushed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_buffer_writes_through():
+    client = _RecordingClient()
+    buffer = WriteBehindBuffer("test", lambda: client, enabled=False)
+
+    await buffer.write(lambda pipe: pipe.set("key", "value"))
+    assert client.executed == [[("key", "value")]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("module", ["src.app.core.scheduler", "src.app.core.worker.functions"])
+async def test_worker_shutdown_flushes_buffers(module):
+    shutdown = importlib.import_module(module).shutdown
+    tracer, activity, gateway = (MagicMock(cleanup=AsyncMock(), close=AsyncMock()) for _ in range(3))
+
+    with (
+        patch("src.app.core.telemetry.tracer.get_tracer", return_value=tracer),
+        patch("src.app.core.activity.logger.get_activity_logger", return_value=activity),
+        patch("src.app.core.ai.gateway.get_llm_gateway", return_value=gateway),
+    ):
+        await shutdown({})
+
+    tracer.cleanup.assert_awaited_once()
+    activity.cleanup.assert_awaited_once()
+    gateway.close.assert_awaited_once()
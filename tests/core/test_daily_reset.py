@@ -0,0 +1,51 @@
+"""
+Tests for the timezone-bucketed daily reset.
+
+Covers next-reset scheduling (including DST and timezone changes) and the
+per-user sync update.
+"""
+
+from datetime import UTC, date, datetime
+from zoneinfo import ZoneInfo
+
+from src.app.core.scheduler import apply_daily_sync, next_local_midnight, next_reset_for
+from src.app.models.progression import PlayerStats
+
+
+def test_next_local_midnight_follows_user_timezone():
+    now = datetime(2026, 3, 7, 12, 0, tzinfo=UTC)
+
+    assert next_local_midnight(now, UTC) == datetime(2026, 3, 8, 0, 0, tzinfo=UTC)
+    assert next_local_midnight(now, ZoneInfo("Asia/Tokyo")) == datetime(2026, 3, 7, 15, 0, tzinfo=UTC)
+
+
+def test_next_local_midnight_across_dst_change():
+    tz = ZoneInfo("America/New_York")
+
+    # Midnight before the spring-forward day is EST (UTC-5), the one after is EDT (UTC-4)
+    assert next_local_midnight(datetime(2026, 3, 7, 12, 0, tzinfo=UTC), tz) == datetime(2026, 3, 8, 5, 0, tzinfo=UTC)
+    assert next_local_midnight(datetime(2026, 3, 8, 12, 0, tzinfo=UTC), tz) == datetime(2026, 3, 9, 4, 0, tzinfo=UTC)
+
+
+def test_next_reset_after_timezone_change():
+    now = datetime(2026, 3, 7, 20, 0, tzinfo=UTC)
+    last_reset = datetime(2026, 3, 7, 6, 0, tzinfo=UTC)
+
+    # Already reset on today's New York date: next local midnight
+    assert next_reset_for(last_reset, ZoneInfo("America/New_York"), now) == datetime(2026, 3, 8, 5, 0, tzinfo=UTC)
+    # Already March 8 in Tokyo, with no reset since: due now
+    assert next_reset_for(last_reset, ZoneInfo("Asia/Tokyo"), now) == now
+    assert next_reset_for(None, UTC, now) == now
+
+
+def test_apply_daily_sync_updates_wma_history_and_streak():
+    stats = PlayerStats(user_id=1, sync_rate=0.5, streak_count=2, sync_history=[])
+
+    apply_daily_sync(stats, total=4, completed=3, day=date(2026, 3, 7))
+    assert stats.sync_rate == 0.75 * 0.4 + 0.5 * 0.6
+    assert stats.sync_history == [{"date": "2026-03-07", "score": 0.75}]
+    assert stats.streak_count == 3
+
+    apply_daily_sync(stats, total=2, completed=0, day=date(2026, 3, 8))
+    assert stats.streak_count == 0
+    assert len(stats.sync_history) == 2
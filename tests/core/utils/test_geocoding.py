@@ -0,0 +1,101 @@
+"""
+Tests for the async geocoding service.
+
+Uses the offline gazetteer and an in-memory stand-in for the Redis cache.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.app.core.utils.geocoding import (
+    AsyncRateLimiter,
+    GeocodingService,
+    OfflineGazetteer,
+    normalize_place,
+)
+
+
+class _DictRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+
+class _CountingGazetteer(OfflineGazetteer):
+    def __init__(self):
+        self.calls = 0
+
+    def geocode(self, query):
+        self.calls += 1
+        return super().geocode(query)
+
+
+def test_normalize_place():
+    assert normalize_place("  San Francisco ,CA,  USA. ") == "san francisco, ca, usa"
+
+
+@pytest.mark.asyncio
+async def test_geocode_resolves_timezone_and_caches():
+    backend = _CountingGazetteer()
+    redis_client = _DictRedis()
+    service = GeocodingService(backend=backend, get_client=lambda: redis_client)
+
+    result = await service.geocode("San Francisco, CA, USA")
+    assert result["timezone"] == "America/Los_Angeles"
+    assert 37.0 < result["latitude"] < 38.0
+
+    # Different spelling of the same place is served from the cache
+    assert await service.geocode("san francisco,ca, usa") == result
+    assert backend.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_misses_are_cached():
+    backend = _CountingGazetteer()
+    redis_client = _DictRedis()
+    service = GeocodingService(backend=backend, get_client=lambda: redis_client)
+
+    assert await service.geocode("Atlantis") is None
+    assert await service.geocode("Atlantis") is None
+    assert backend.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls_without_blocking_loop():
+    limiter = AsyncRateLimiter(interval=0.05)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+    elapsed = time.monotonic() - start
+    task.cancel()
+
+    assert elapsed >= 0.09  # Two 0.05s gaps, less timer granularity
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_shares_slot_through_redis():
+    redis_client = _DictRedis()
+    limiter = AsyncRateLimiter(interval=1.0)
+
+    await limiter.acquire(redis_client)
+    assert limiter.key in redis_client.data
@@ -3,9 +3,31 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from sqlalchemy import select
 
+from src.app.models.push import PushSubscription
 from src.app.models.user_profile import UserProfile
 from src.app.modules.infrastructure.push.router import notification_router
 
+BATCH_RESULT = {"success": 1, "failed": 0, "expired": 0, "expired_endpoints": []}
+
+
+async def _subscribe(db, user) -> str:
+    """Give the user a push subscription and return its endpoint."""
+    endpoint = f"https://push.example.com/{user.id}"
+    result = await db.execute(select(PushSubscription).where(PushSubscription.endpoint == endpoint))
+    if result.scalar_one_or_none() is None:
+        db.add(PushSubscription(user_id=user.id, endpoint=endpoint, p256dh="test_key", auth="test_auth"))
+        await db.commit()
+    return endpoint
+
+
+def _batches_for(mock_send, endpoint):
+    """(subscriptions, message) of each /send-batch call that included the endpoint."""
+    return [
+        call.args
+        for call in mock_send.call_args_list
+        if any(sub["endpoint"] == endpoint for sub in call.args[0])
+    ]
+
 
 @pytest.mark.asyncio
 async def test_notification_preferences_persistence(client, test_user, db):
@@ -61,8 +83,11 @@ async def test_notification_router_generic_filtering(db, test_user):
     await db.commit()
 
     # 2. Patch Service
+    endpoint = await _subscribe(db, test_user)
     with patch(
-        "src.app.modules.infrastructure.push.service.NotificationService.send_to_user", new_callable=AsyncMock
+        "src.app.modules.infrastructure.push.service.NotificationService._send_batch",
+        new_callable=AsyncMock,
+        return_value=BATCH_RESULT,
     ) as mock_send:
         # 3. Trigger Hypothesis Update (via generic packet handler)
         from src.app.protocol.packet import Packet
@@ -74,7 +99,7 @@ async def test_notification_router_generic_filtering(db, test_user):
         await notification_router.handle_event_packet(packet)
 
         # 4. Assert NOT called
-        calls_for_user = [c for c in mock_send.call_args_list if c.kwargs.get("user_id") == test_user.id]
+        calls_for_user = _batches_for(mock_send, endpoint)
         assert len(calls_for_user) == 0, "Should not send intelligence alert when disabled"
 
 
@@ -97,8 +122,11 @@ async def test_notification_router_generic_delivery(db, test_user):
     await db.commit()
 
     # 2. Patch Service
+    endpoint = await _subscribe(db, test_user)
     with patch(
-        "src.app.modules.infrastructure.push.service.NotificationService.send_to_user", new_callable=AsyncMock
+        "src.app.modules.infrastructure.push.service.NotificationService._send_batch",
+        new_callable=AsyncMock,
+        return_value=BATCH_RESULT,
     ) as mock_send:
         # 3. Trigger Hypothesis Update
         from src.app.protocol.packet import Packet
@@ -110,10 +138,10 @@ async def test_notification_router_generic_delivery(db, test_user):
         await notification_router.handle_event_packet(packet)
 
         # 4. Assert CALLED and FORMATTED
-        calls_for_user = [c for c in mock_send.call_args_list if c.kwargs.get("user_id") == test_user.id]
+        calls_for_user = _batches_for(mock_send, endpoint)
         assert len(calls_for_user) == 1
-        assert "Pattern Detected" in calls_for_user[0].kwargs["title"]
-        assert "Manif" in calls_for_user[0].kwargs["body"]  # Template check
+        assert "Pattern Detected" in calls_for_user[0][1]["title"]
+        assert "Manif" in calls_for_user[0][1]["body"]  # Template check
 
 
 @pytest.mark.asyncio
@@ -137,10 +165,12 @@ async def test_notification_router_filtering(db, test_user):
     await db.commit()
 
     # 2. Patch the external service call (The only allowed mock)
-    # We want to verify if 'send_to_user' calls the underlying push logic.
-    # Let's patch 'src.app.modules.infrastructure.push.service.NotificationService.send_to_user'
+    # We want to verify which subscriptions reach the push service batch call.
+    endpoint = await _subscribe(db, test_user)
     with patch(
-        "src.app.modules.infrastructure.push.service.NotificationService.send_to_user", new_callable=AsyncMock
+        "src.app.modules.infrastructure.push.service.NotificationService._send_batch",
+        new_callable=AsyncMock,
+        return_value=BATCH_RESULT,
     ) as mock_send:
         # 3. Trigger Cosmic Update (High Intensity)
         from src.app.protocol.packet import Packet
@@ -151,7 +181,7 @@ async def test_notification_router_filtering(db, test_user):
         await notification_router.handle_event_packet(packet)
 
         # 4. Assert NOT called for this user
-        calls_for_user = [c for c in mock_send.call_args_list if c.kwargs.get("user_id") == test_user.id]
+        calls_for_user = _batches_for(mock_send, endpoint)
         assert len(calls_for_user) == 0, "Should not send cosmic alert when disabled"
 
 
@@ -174,8 +204,11 @@ async def test_notification_router_delivery(db, test_user):
     await db.commit()
 
     # 2. Patch Service
+    endpoint = await _subscribe(db, test_user)
     with patch(
-        "src.app.modules.infrastructure.push.service.NotificationService.send_to_user", new_callable=AsyncMock
+        "src.app.modules.infrastructure.push.service.NotificationService._send_batch",
+        new_callable=AsyncMock,
+        return_value=BATCH_RESULT,
     ) as mock_send:
         # 3. Trigger Update
         from src.app.protocol.packet import Packet
@@ -186,6 +219,6 @@ async def test_notification_router_delivery(db, test_user):
         await notification_router.handle_event_packet(packet)
 
         # 4. Assert CALLED
-        calls_for_user = [c for c in mock_send.call_args_list if c.kwargs.get("user_id") == test_user.id]
+        calls_for_user = _batches_for(mock_send, endpoint)
         assert len(calls_for_user) == 1, "Should send cosmic alert when enabled"
-        assert "Cosmic Alert" in calls_for_user[0].kwargs["title"]
+        assert "Cosmic Alert" in calls_for_user[0][1]["title"]
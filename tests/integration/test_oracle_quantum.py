@@ -41,9 +41,15 @@ from src.app.models.user import User
 from src.app.models.user_profile import UserProfile
 from src.app.modules.intelligence.oracle.models import OracleReading
 from src.app.modules.intelligence.oracle.quantum import QuantumEntropy
+from src.app.modules.intelligence.oracle.reservoir import EntropyValue
 from src.app.modules.intelligence.oracle.service import OracleService
 
 
+def _reservoir_values(source, raw=(5000, 2000, 30000, 3000)):
+    """Reservoir take() result: one provenance-tagged value per draw slot."""
+    return [EntropyValue(value, source, 0.0) for value in raw]
+
+
 # ============================================================================
 # SECTION 1: QuantumEntropy Unit Tests (Pure Logic, No Network)
 # ============================================================================
@@ -547,29 +553,7 @@ class TestOracleServiceQuantumIntegration:
         user_id = oracle_test_user
         service = OracleService()
 
-        # Mock the quantum API to return valid values
-        # The service now uses get_full_oracle_draw() which makes ONE batch call
-        # requesting 4 uint16 values at once
-        _req = httpx.Request("GET", "https://qrng.anu.edu.au/API/jsonI.php")
-
-        async def mock_get(*args, **kwargs):
-            params = kwargs.get("params", {})
-            count = params.get("length", 1)
-            if count == 4:
-                # Batched call: return all 4 values at once
-                return httpx.Response(
-                    200,
-                    json={"success": True, "data": [5000, 2000, 30000, 3000]},
-                    request=_req,
-                )
-            else:
-                # Single call fallback
-                return httpx.Response(
-                    200,
-                    json={"success": True, "data": [5000]},
-                    request=_req,
-                )
-
+        # The service draws from the prefetched reservoir, never the live API
         # Mock LLM to avoid real API calls
         mock_llm = AsyncMock()
         mock_llm.ainvoke = AsyncMock(
@@ -577,7 +561,11 @@ class TestOracleServiceQuantumIntegration:
         )
 
         with (
-            patch.object(httpx.AsyncClient, "get", side_effect=mock_get),
+            patch.object(
+                service.quantum.reservoir,
+                "take",
+                return_value=_reservoir_values("QUANTUM"),
+            ),
             patch.object(service, "_get_user_llm", return_value=mock_llm),
         ):
             async with local_session() as db:
@@ -607,7 +595,7 @@ class TestOracleServiceQuantumIntegration:
         self, oracle_test_user
     ):
         """
-        When quantum API fails, reading should have
+        When the reservoir is drained, reading should have
         entropy_source='LOCAL_CHAOS' persisted in the database.
         """
         user_id = oracle_test_user
@@ -621,9 +609,9 @@ class TestOracleServiceQuantumIntegration:
 
         with (
             patch.object(
-                httpx.AsyncClient,
-                "get",
-                side_effect=httpx.TimeoutException("ANU offline"),
+                service.quantum.reservoir,
+                "take",
+                return_value=_reservoir_values("LOCAL_CHAOS"),
             ),
             patch.object(service, "_get_user_llm", return_value=mock_llm),
         ):
@@ -647,7 +635,7 @@ class TestOracleServiceQuantumIntegration:
         self, oracle_test_user
     ):
         """
-        Even when BOTH quantum and LLM fail, the draw should
+        Even when BOTH the reservoir and LLM fail, the draw should
         complete with fallback synthesis and LOCAL_CHAOS entropy.
         """
         user_id = oracle_test_user
@@ -661,9 +649,9 @@ class TestOracleServiceQuantumIntegration:
 
         with (
             patch.object(
-                httpx.AsyncClient,
-                "get",
-                side_effect=httpx.ConnectError("No network"),
+                service.quantum.reservoir,
+                "take",
+                return_value=_reservoir_values("LOCAL_CHAOS"),
             ),
             patch.object(service, "_get_user_llm", return_value=mock_llm),
         ):
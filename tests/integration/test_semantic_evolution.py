@@ -14,6 +14,7 @@ from src.app.models.user_profile import UserProfile
 from src.app.modules.features.quests.manager import QuestManager
 from src.app.modules.features.quests.models import QuestCategory, QuestDifficulty
 from src.app.modules.intelligence.evolution.engine import get_evolution_engine
+from src.app.modules.intelligence.evolution.ledger import experience_history
 from src.app.modules.intelligence.genesis.listener import get_genesis_listener
 from src.app.modules.intelligence.genesis.uncertainty import UncertaintyDeclaration, UncertaintyField
 from src.app.protocol import events
@@ -160,8 +161,9 @@ async def test_semantic_evolution_loop(db: AsyncSession, test_user: User):
     # EvolutionEngine worked?
     # Base 50 XP * 1.5 Insight Multiplier = 75 XP
     assert stats.experience_points >= 75
-    assert len(stats.sync_history) >= 1
-    assert stats.sync_history[-1]["reason"].startswith("Quest Completed")
+    history = await experience_history(db, user_id_val)
+    assert len(history) >= 1
+    assert history[-1]["reason"].startswith("Quest Completed")
 
     # 7. Test Passive Environmental XP
     from src.app.modules.tracking.base import TrackingData
@@ -198,6 +200,7 @@ async def test_semantic_evolution_loop(db: AsyncSession, test_user: User):
     print(f"[*] Post-Passive XP: {stats.experience_points}")
     assert stats.experience_points >= 80  # 75 + 5
     # Verify history entry contains the high-fidelity reason
-    assert any("G4 Severe Solar Storm" in entry["reason"] for entry in stats.sync_history)
+    history = await experience_history(db, user_id_val)
+    assert any("G4 Severe Solar Storm" in entry["reason"] for entry in history)
 
     print("[OK] Semantic Evolution Loop & Passive XP Verified.")
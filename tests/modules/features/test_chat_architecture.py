@@ -80,18 +80,16 @@ async def test_journal_entry_creation(seeded_user, real_db):
     assert response["metadata"].get("entry_created") is True
     assert "entry_id" in response["metadata"]
 
-    # Verify persistence in UserProfile
-    from sqlalchemy import select
+    # Verify persistence in the journal store
+    from src.app.modules.features.journal.store import JournalStore
 
-    from src.app.models.user_profile import UserProfile
-
-    result = await real_db.execute(select(UserProfile).where(UserProfile.user_id == seeded_user))
-    profile = result.scalar_one()
-    entries = profile.data.get("journal_entries", [])
+    entries = await JournalStore().get_recent(seeded_user, real_db, limit=1)
 
     assert len(entries) > 0
     latest = entries[-1]
-    assert "anxious" in latest["text"]
+    assert "anxious" in latest.content
+    assert latest.entry_uuid == response["metadata"]["entry_id"]
+    assert "anxiety" in latest.symptoms and "headache" in latest.symptoms
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,83 @@
+"""
+Tests for the push broadcast pipeline.
+
+Verifies chunked /send-batch calls, bounded concurrency and bulk pruning of
+expired endpoints (in the caller's transaction), and that the opt-out filter
+compares JSONB instead of casting it, without a database or push service.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.modules.infrastructure.push.service import NotificationService, opted_in_subscriptions
+
+
+class _StreamResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def partitions(self, size):
+        for i in range(0, len(self.rows), size):
+            yield self.rows[i : i + size]
+
+
+def _rows(count):
+    return [SimpleNamespace(endpoint=f"https://push.example.com/{i}", p256dh="k", auth="a") for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_chunks_bounds_concurrency_and_prunes():
+    service = NotificationService()
+    db = AsyncMock()
+    db.stream.return_value = _StreamResult(_rows(7))
+
+    in_flight = 0
+    peak = 0
+    messages = []
+
+    async def send_batch(chunk, message):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        messages.append(message)
+        return {"success": len(chunk) - 1, "failed": 0, "expired": 1, "expired_endpoints": [chunk[0]["endpoint"]]}
+
+    with (
+        patch("src.app.modules.infrastructure.push.service.settings.PUSH_BATCH_SIZE", 2),
+        patch("src.app.modules.infrastructure.push.service.settings.PUSH_MAX_CONCURRENCY", 2),
+        patch.object(service, "_send_batch", side_effect=send_batch),
+        patch.object(service, "prune_subscriptions", new_callable=AsyncMock) as prune,
+    ):
+        totals = await service.broadcast(db, preference_key="cosmic", title="T", body="B")
+
+    assert totals == {"success": 3, "failed": 0, "expired": 4}
+    assert len(messages) == 4 and all(m["title"] == "T" for m in messages)
+    assert peak <= 2
+    prune.assert_awaited_once()
+    assert len(prune.call_args.args[1]) == 4
+
+
+@pytest.mark.asyncio
+async def test_prune_leaves_commit_to_caller():
+    db = AsyncMock()
+    db.execute.return_value = SimpleNamespace(rowcount=2)
+
+    assert await NotificationService().prune_subscriptions(db, ["https://push.example.com/0"]) == 2
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+def test_opt_out_filter_compares_jsonb_without_a_cast():
+    compiled = opted_in_subscriptions("cosmic").compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    # Missing key: enabled; only JSON true otherwise, so "true" or 1 opt out rather than fail the query
+    assert "IS NULL OR (user_profile.data #> %(data_1)s) = %(param_1)s::JSONB" in sql
+    assert "AS BOOLEAN" not in sql
+    assert compiled.params["param_1"] is True
@@ -0,0 +1,120 @@
+"""
+Tests for the local Generative UI component classifier.
+
+Covers cold-start decisions from the seed set, low confidence for unfamiliar
+messages, ComponentGenerator escalating only ambiguous turns to the LLM, the
+decision log holding no message text, and QueryEngine cancelling a pending
+decision when answer generation fails.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.modules.intelligence.generative_ui.classifier import DECISION_LOG_KEY, ComponentClassifier
+from src.app.modules.intelligence.generative_ui.generator import ComponentGenerator
+from src.app.modules.intelligence.generative_ui.models import ComponentType
+from src.app.modules.intelligence.query.engine import QueryEngine
+
+
+def test_seed_decisions_and_learning():
+    classifier = ComponentClassifier(threshold=0.8)
+
+    feeling = classifier.classify("I felt anxious today")
+    assert feeling.component_type == ComponentType.MULTI_SLIDER and feeling.confidence >= 0.8
+
+    factual = classifier.classify("What's my sun sign?")
+    assert not factual.should_generate and factual.confidence >= 0.8
+
+    # Nothing in common with any decision: not confident either way
+    assert classifier.classify("hello").confidence < 0.5
+
+    for _ in range(3):
+        classifier.learn("hello", "none")
+    assert classifier.classify("hello") == classifier.classify("hello")
+    assert classifier.classify("hello").component_type is None
+
+
+@pytest.mark.asyncio
+async def test_generator_escalates_only_ambiguous_turns():
+    llm = AsyncMock()
+    llm.ainvoke.return_value = MagicMock(content='{"should_generate": true, "component_type": "vote_component"}')
+
+    with (
+        patch("src.app.modules.intelligence.generative_ui.generator.get_premium_llm", return_value=llm),
+        patch(
+            "src.app.modules.intelligence.generative_ui.generator.get_component_classifier",
+            return_value=ComponentClassifier(threshold=0.8),
+        ),
+        patch.object(ComponentClassifier, "_redis", AsyncMock(return_value=None)),
+    ):
+        generator = ComponentGenerator()
+
+        assert await generator.should_generate_component("I felt anxious today", [], {}) == (
+            True,
+            ComponentType.MULTI_SLIDER,
+        )
+        llm.ainvoke.assert_not_awaited()
+
+        assert await generator.should_generate_component("Should I take the new job offer", [], {}) == (
+            True,
+            ComponentType.VOTE_COMPONENT,
+        )
+        llm.ainvoke.assert_awaited_once()
+
+    # The LLM's decision was learned
+    assert "vote_component" in generator.classifier._sums
+
+
+@pytest.mark.asyncio
+async def test_decision_log_holds_features_not_text():
+    redis = MagicMock()
+    pipe = redis.pipeline.return_value
+    pipe.execute = AsyncMock()
+
+    with patch.object(ComponentClassifier, "_redis", AsyncMock(return_value=redis)):
+        await ComponentClassifier().record("Should I quit my job at Acme", ComponentType.VOTE_COMPONENT)
+
+    logged = pipe.lpush.call_args.args[1]
+    assert "Acme" not in logged and "job" not in logged
+    pipe.expire.assert_called_once_with(DECISION_LOG_KEY, ComponentClassifier().log_ttl)
+
+    # Another process learns the same decision from the logged features
+    redis.lrange = AsyncMock(return_value=[logged])
+    with patch.object(ComponentClassifier, "_redis", AsyncMock(return_value=redis)):
+        classifier = ComponentClassifier()
+        await classifier.load()
+
+    assert json.loads(logged)["label"] == "vote_component"
+    assert classifier.classify("Should I quit my job at Acme").component_type == ComponentType.VOTE_COMPONENT
+
+
+@pytest.mark.asyncio
+async def test_failed_answer_cancels_component_decision():
+    decision = None
+
+    async def pending_decision(*args):
+        nonlocal decision
+        decision = asyncio.current_task()
+        await asyncio.Event().wait()
+
+    async def failing_answer(*args, **kwargs):
+        await asyncio.sleep(0)
+        raise RuntimeError("LLM down")
+
+    engine = QueryEngine(
+        llm=MagicMock(), embedding_service=MagicMock(), search_engine=MagicMock(), enable_generative_ui=False
+    )
+    engine.enable_generative_ui, engine.component_generator = True, MagicMock()
+    engine._generate_component = pending_decision
+    engine._build_context_from_data = AsyncMock(return_value="")
+    engine._generate_answer = failing_answer
+
+    memory = MagicMock(get_full_context=AsyncMock(return_value={}))
+    with patch("src.app.core.memory.get_active_memory", return_value=memory), pytest.raises(RuntimeError):
+        await engine.answer_query(7, "I felt anxious today", MagicMock(), use_vector_search=False)
+
+    await asyncio.sleep(0)
+    assert decision is not None and decision.cancelled()
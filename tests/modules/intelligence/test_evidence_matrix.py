@@ -0,0 +1,159 @@
+"""
+Tests for the columnar evidence engine.
+
+Covers agreement with the per-record formulas, incremental appends, grouped
+(batch) evaluation, write-back of changed weights and the nightly decay batch
+(including its status-change events).
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.modules.intelligence.hypothesis.confidence import (
+    EvidenceRecord,
+    EvidenceType,
+    WeightedConfidenceCalculator,
+)
+from src.app.modules.intelligence.hypothesis.evidence_matrix import EvidenceMatrix
+from src.app.modules.intelligence.hypothesis.updater import HypothesisUpdater
+from src.app.protocol.events import HYPOTHESIS_REJECTED, HYPOTHESIS_THRESHOLD_CROSSED, HYPOTHESIS_UPDATED
+
+NOW = datetime(2026, 10, 1, 12, 0)
+SOURCES = ["user_api", "journal_analysis", "observer", "system"]
+
+
+def make_records(count: int, seed: int = 3, hypothesis_id: str = "h") -> list[dict]:
+    rng = random.Random(seed)
+    records = []
+    for position in range(count):
+        record = EvidenceRecord.create(
+            hypothesis_id=hypothesis_id,
+            user_id=1,
+            evidence_type=rng.choice(list(EvidenceType)),
+            data={},
+            source=rng.choice(SOURCES),
+            reasoning=f"evidence {position}",
+            position=position,
+        )
+        record.timestamp = NOW - timedelta(days=rng.uniform(0, 150))
+        records.append(record.model_dump(mode="json"))
+    return records
+
+
+def test_matches_per_record_formulas():
+    calculator = WeightedConfidenceCalculator()
+    records = make_records(25)
+
+    breakdown = EvidenceMatrix.from_records(records, calculator).evaluate(NOW)
+
+    weights = []
+    for r in records:
+        recency = calculator.calculate_recency_multiplier(datetime.fromisoformat(r["timestamp"]), NOW)
+        scale = r["base_weight"] * r["source_reliability"]
+        weights.append((scale * 2.0) if r["is_contradiction"] else scale * recency * r["position_factor"])
+
+    assert breakdown["evidence_count"] == 25
+    assert breakdown["total_confidence"] == pytest.approx(calculator.normalize_score(sum(weights)))
+    assert breakdown["weighted_support"] == pytest.approx(
+        sum(w for w, r in zip(weights, records) if not r["is_contradiction"])
+    )
+    top = sorted(range(25), key=lambda i: abs(weights[i]), reverse=True)[:5]
+    assert [c["id"] for c in breakdown["top_contributors"]] == [records[i]["id"] for i in top]
+
+
+def test_append_folds_into_running_aggregates():
+    calculator = WeightedConfidenceCalculator()
+    records = make_records(30)
+    matrix = EvidenceMatrix.from_records(records[:29], calculator)
+    matrix.evaluate(NOW)
+
+    matrix.append(records[29])
+    with patch.object(matrix, "_aggregate", wraps=matrix._aggregate) as full_pass:
+        incremental = matrix.evaluate(NOW + timedelta(seconds=5))
+        full_pass.assert_not_called()
+
+    full = EvidenceMatrix.from_records(records, calculator).evaluate(NOW + timedelta(seconds=5))
+    assert incremental["total_confidence"] == pytest.approx(full["total_confidence"], abs=1e-12)
+    assert incremental["top_contributors"] == full["top_contributors"]
+    assert incremental["by_evidence_type"] == full["by_evidence_type"]
+
+    # A day later ages change, so the matrix recomputes everything
+    with patch.object(matrix, "_aggregate", wraps=matrix._aggregate) as full_pass:
+        matrix.evaluate(NOW + timedelta(days=1))
+        full_pass.assert_called_once()
+
+
+def test_grouped_evaluation_matches_individual_hypotheses():
+    calculator = WeightedConfidenceCalculator()
+    groups = [make_records(n, seed=n, hypothesis_id=f"h{n}") for n in (4, 0, 9)]
+
+    rows = [r for records in groups for r in records]
+    labels = [g for g, records in enumerate(groups) for _ in records]
+    batch = EvidenceMatrix.from_records(rows, calculator).evaluate_groups(labels, len(groups), NOW)
+
+    for records, breakdown in zip(groups, batch):
+        assert breakdown == EvidenceMatrix.from_records(records, calculator).evaluate(NOW)
+
+
+def test_write_back_touches_only_changed_records():
+    calculator = WeightedConfidenceCalculator()
+    records = make_records(6)
+    matrix = EvidenceMatrix.from_records(records, calculator)
+    matrix.evaluate(NOW)
+    assert matrix.write_back(records) > 0
+
+    # Same instant: nothing left to write
+    assert matrix.write_back(records) == 0
+    assert matrix.evaluate(NOW)["evidence_count"] == 6
+    assert matrix.write_back(records) == 0
+
+    # The calculator API still updates EvidenceRecord models in place
+    later = NOW + timedelta(days=45)
+    models = [EvidenceRecord(**r) for r in make_records(3)]
+    calculator.update_evidence_recency(models, later)
+    for m in models:
+        assert math.isclose(m.recency_multiplier, calculator.calculate_recency_multiplier(m.timestamp, later))
+
+
+@pytest.mark.asyncio
+async def test_decay_all_hypotheses_writes_changed_rows_in_bulk():
+    old = make_records(3, hypothesis_id="h-old")
+    for r in old:
+        r["timestamp"] = (NOW - timedelta(days=90)).isoformat()
+
+    def hypothesis_row(hypothesis_id, confidence):
+        return SimpleNamespace(
+            id=hypothesis_id, user_id=1, hypothesis_type="cosmic_sensitivity", claim="Storms bring headaches",
+            predicted_value="headache", confidence=confidence, status="testing", evidence_count=3,
+            contradictions=1, generated_at=NOW, last_updated=NOW, last_evidence_at=None,
+            attributes={"magi_period_card": "King of Clubs"},
+        )
+
+    storage = MagicMock(
+        get_hypothesis_rows=AsyncMock(side_effect=[[hypothesis_row("h-old", 0.9), hypothesis_row("h-none", 0.7)], []]),
+        get_evidence_columns=AsyncMock(return_value=[{**r, "hypothesis_id": "h-old"} for r in old]),
+        apply_recalculations=AsyncMock(),
+    )
+    updater = HypothesisUpdater(storage=storage)
+    updater.event_bus = MagicMock(publish=AsyncMock())
+
+    assert await updater.decay_all_hypotheses(db=AsyncMock()) == 1
+
+    updates, weights, snapshots, invalidate, _ = storage.apply_recalculations.await_args.args
+    assert [u["id"] for u in updates] == ["h-old"]  # h-none has no evidence and keeps its confidence
+    assert updates[0]["confidence"] < 0.9
+    assert updates[0]["attributes"]["magi_period_card"] == "King of Clubs"
+    assert len(weights) == 3 and all(w["recency_multiplier"] < 1.0 for w in weights)
+    assert [s["hypothesis_id"] for s in snapshots] == ["h-old"]
+    assert invalidate == ["h-old"]
+
+    # Decaying into REJECTED publishes the same events as the per-evidence path
+    assert updates[0]["status"] == "rejected"
+    published = [c.args for c in updater.event_bus.publish.await_args_list]
+    assert [event for event, _ in published] == [HYPOTHESIS_UPDATED, HYPOTHESIS_THRESHOLD_CROSSED, HYPOTHESIS_REJECTED]
+    assert published[0][1]["status_before"] == "testing" and published[0][1]["evidence_id"] == "recency_decay"
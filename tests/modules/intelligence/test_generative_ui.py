@@ -134,9 +134,12 @@ async def test_api_component_submission(seeded_user, db, memory):
     assert matches[0]["slider_values"]["anxiety"] == 8
 
     # Check journal entry creation
-    journal_entries = updated_profile.data.get("journal_entries", [])
+    from src.app.modules.features.journal.store import JournalStore
+
+    journal_entries = await JournalStore().get_recent(seeded_user, db, limit=1)
     assert len(journal_entries) > 0
     latest_entry = journal_entries[-1]
-    assert latest_entry["source"] == "multi_slider_component"
-    assert "Mood: 5/10" in latest_entry["content"]
-    assert "Anxiety: 8/10" in latest_entry["content"]
+    assert latest_entry.source == "multi_slider_component"
+    assert latest_entry.mood_score == 5 and latest_entry.energy_score == 3
+    assert "Mood: 5/10" in latest_entry.content
+    assert "Anxiety: 8/10" in latest_entry.content
@@ -92,9 +92,10 @@ async def test_hypothesis_storage_and_retrieval(seeded_user, db):
     from src.app.core.memory.active_memory import get_active_memory
     memory = get_active_memory()
     await memory.initialize()
-    cached = await memory.get(f"hypotheses:{seeded_user}")
-    assert cached is not None
-    assert len(cached) >= len(hypotheses)
+    for h in hypotheses:
+        cached = await memory.get(f"hypothesis:{h.id}")
+        assert cached is not None
+        assert cached["id"] == h.id
 
 @pytest.mark.asyncio
 async def test_hypothesis_confidence_update(seeded_user, db):
@@ -0,0 +1,115 @@
+"""
+Tests for the normalized hypothesis store.
+
+Covers the row mapping round trip and the incremental writes (only new
+evidence inserted, only reweighted evidence updated, only new snapshots
+appended).
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.app.modules.intelligence.hypothesis.confidence import EvidenceRecord, EvidenceType
+from src.app.modules.intelligence.hypothesis.models import Hypothesis, HypothesisStatus, HypothesisType
+from src.app.modules.intelligence.hypothesis.storage import (
+    HypothesisStorage,
+    evidence_row,
+    hypothesis_from_rows,
+    hypothesis_row,
+    snapshot_row,
+)
+
+NOW = datetime(2026, 10, 1, 12, 0, tzinfo=UTC)
+
+
+def make_hypothesis(evidence: int = 2) -> Hypothesis:
+    hypothesis = Hypothesis(
+        id="h-1",
+        user_id=7,
+        hypothesis_type=HypothesisType.COSMIC_SENSITIVITY,
+        claim="Sensitive to solar storms",
+        predicted_value="solar_sensitive",
+        confidence=0.7,
+        status=HypothesisStatus.TESTING,
+        generated_at=NOW,
+        last_updated=NOW,
+        magi_period_card="King of Clubs",
+        period_evidence_count={"Mercury": 2},
+    )
+    for position in range(evidence):
+        record = EvidenceRecord.create(
+            hypothesis_id="h-1",
+            user_id=7,
+            evidence_type=EvidenceType.JOURNAL_ENTRY,
+            data={"n": position},
+            source="journal_analysis",
+            reasoning="mentions headaches",
+            position=position,
+        )
+        hypothesis.add_evidence_record(record.model_dump(mode="json"))
+    hypothesis.add_confidence_snapshot({"timestamp": NOW.isoformat(), "confidence": 0.7, "status": "testing"})
+    return hypothesis
+
+
+def test_rows_round_trip_to_the_same_hypothesis():
+    hypothesis = make_hypothesis()
+
+    row = SimpleNamespace(**hypothesis_row(hypothesis))
+    evidence = [
+        SimpleNamespace(**evidence_row(hypothesis.id, i, r)) for i, r in enumerate(hypothesis.evidence_records)
+    ]
+    snapshots = [SimpleNamespace(**snapshot_row(hypothesis.id, s)) for s in hypothesis.confidence_history]
+
+    assert row.status == "testing"
+    assert "evidence_records" not in row.attributes and "claim" not in row.attributes
+    assert all("effective_weight" not in e.record for e in evidence)
+
+    rebuilt = hypothesis_from_rows(row, evidence, snapshots)
+    assert rebuilt.model_dump(mode="json") == hypothesis.model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_store_writes_only_new_and_reweighted_evidence():
+    hypothesis = make_hypothesis(evidence=3)
+    records = hypothesis.evidence_records
+    # Record 0 is stored unchanged, record 1 has decayed, record 2 is new
+    stored = [(records[0]["id"], records[0]["effective_weight"]), (records[1]["id"], 0.1)]
+    records[1]["recency_multiplier"] = 0.5
+    records[1]["effective_weight"] = 0.2
+
+    result = MagicMock()
+    result.all.return_value = stored
+    db = AsyncMock()
+    db.execute.return_value = result
+
+    await HypothesisStorage()._store_evidence(hypothesis, db)
+
+    (_, inserted), (_, updated) = [c.args for c in db.execute.await_args_list[1:]]
+    assert [row["id"] for row in inserted] == [records[2]["id"]]
+    assert inserted[0]["position"] == 2
+    assert updated == [{"id": records[1]["id"], "recency_multiplier": 0.5, "effective_weight": 0.2}]
+
+
+@pytest.mark.asyncio
+async def test_store_appends_only_snapshots_newer_than_stored():
+    hypothesis = make_hypothesis()
+    hypothesis.add_confidence_snapshot(
+        {"timestamp": (NOW + timedelta(hours=1)).isoformat(), "confidence": 0.75, "status": "testing"}
+    )
+
+    db = AsyncMock()
+    db.scalar.return_value = NOW
+
+    await HypothesisStorage()._store_snapshots(hypothesis, db)
+
+    _, inserted = db.execute.await_args_list[0].args
+    assert [row["confidence"] for row in inserted] == [0.75]
+    assert db.execute.await_count == 2  # insert + trim
+
+    db.reset_mock()
+    db.scalar.return_value = NOW + timedelta(hours=1)
+    await HypothesisStorage()._store_snapshots(hypothesis, db)
+    db.execute.assert_not_awaited()
@@ -0,0 +1,111 @@
+"""
+Tests for index-targeted cosmic insight evaluation.
+
+Covers index membership from findings, trigger matching, and the batched
+evaluation path (bounded concurrency, one cooldown query, one commit).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.models.insight import PromptPhase
+from src.app.modules.intelligence.insight import manager as manager_module
+from src.app.modules.intelligence.insight.index import LUNAR_KEY, SOLAR_KEY, index_keys
+from src.app.modules.intelligence.insight.manager import InsightManager
+
+SOLAR = {"pattern_type": "solar_symptom", "confidence": 0.9, "finding": "Fatigue when Kp > 5"}
+LUNAR = {"pattern_type": "lunar_phase", "phase": "Full", "confidence": 0.7, "finding": "Anxious at Full Moon"}
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(manager_module, "get_premium_llm", lambda: MagicMock())
+    manager = InsightManager()
+    manager.notification_service = AsyncMock()
+    return manager
+
+
+def test_index_keys_only_include_qualifying_findings():
+    weak_solar = dict(SOLAR, confidence=0.5)
+
+    assert index_keys([SOLAR, LUNAR]) == {SOLAR_KEY, LUNAR_KEY.format(phase="full")}
+    assert index_keys([weak_solar, {"pattern_type": "time_of_day", "confidence": 0.9}]) == set()
+
+
+def test_match_cosmic_triggers_one_per_topic(manager):
+    findings = [SOLAR, dict(SOLAR, finding="Headaches"), LUNAR]
+
+    matches = manager.match_cosmic_triggers(
+        findings, {"kp_index": 7, "moon_event_type": "anticipation", "moon_phase_name": "Full Moon"}
+    )
+    assert [(topic, finding["finding"], phase) for topic, finding, _, phase in matches] == [
+        ("solar_sensitivity", "Fatigue when Kp > 5", PromptPhase.PEAK),
+        ("lunar_pattern", "Anxious at Full Moon", PromptPhase.ANTICIPATION),
+    ]
+    assert manager.match_cosmic_triggers(findings, {"kp_index": 3}) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_evaluation_is_bounded_and_inserts_once(manager):
+    in_flight = 0
+    peak = 0
+
+    async def generate_prompt_text(finding, trigger, phase):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"How is your {trigger.metric}?"
+
+    cooldown_rows = MagicMock()
+    cooldown_rows.all.return_value = [(2, "solar_sensitivity")]
+    db = AsyncMock()
+    db.execute.return_value = cooldown_rows
+    db.add_all = MagicMock()
+
+    index = MagicMock(mark_prompted=AsyncMock())
+    manager.observer_storage = MagicMock(get_findings=AsyncMock(return_value=[SOLAR]))
+
+    with (
+        patch.object(manager_module, "COSMIC_EVAL_CONCURRENCY", 2),
+        patch.object(manager_module, "get_trigger_index", return_value=index),
+        patch.object(manager, "generate_prompt_text", side_effect=generate_prompt_text),
+        patch.object(manager, "_emit_prompt_event", new_callable=AsyncMock),
+        patch.object(manager, "generate_quest_from_insight", new_callable=AsyncMock),
+    ):
+        prompts = await manager.evaluate_cosmic_triggers_batch([1, 2, 3, 4, 5], {"kp_index": 8}, db)
+
+    # User 2 is in cooldown; everyone else gets one prompt
+    assert sorted(p.user_id for p in prompts) == [1, 3, 4, 5]
+    assert all(p.topic == "solar_sensitivity" for p in prompts)
+    assert peak <= 2
+    db.execute.assert_awaited_once()
+    db.add_all.assert_called_once()
+    db.commit.assert_awaited_once()
+    index.mark_prompted.assert_awaited_once()
+    assert manager.notification_service.send_notification.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_candidates_come_from_index_minus_cooldown(manager):
+    index = MagicMock(
+        ensure_built=AsyncMock(),
+        solar_candidates=AsyncMock(return_value={1, 2, 3}),
+        lunar_candidates=AsyncMock(),
+        cooling_down=AsyncMock(return_value={2}),
+    )
+    active = MagicMock()
+    active.scalars.return_value.all.return_value = [1]
+    db = AsyncMock()
+    db.execute.return_value = active
+
+    with patch.object(manager_module, "get_trigger_index", return_value=index):
+        assert await manager.find_cosmic_candidates({"kp_index": 6}, db) == [1]
+        index.lunar_candidates.assert_not_awaited()
+
+        db.execute.reset_mock()
+        assert await manager.find_cosmic_candidates({"kp_index": 2}, db) == []
+        db.execute.assert_not_awaited()
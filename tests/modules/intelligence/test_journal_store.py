@@ -0,0 +1,127 @@
+"""
+Tests for the journal store.
+
+Covers the legacy entry conversion (with precomputed symptoms), keyset paging
+merged with not-yet-backfilled profile entries, the idempotent backfill, and
+new entries scheduling a feed refresh.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import src.app.models  # noqa: F401
+import src.app.models.push  # noqa: F401
+from src.app.models.insight import JournalEntry
+from src.app.modules.features.journal.store import JournalStore, entry_from_legacy, entry_to_dict
+from src.app.modules.intelligence.observer.feed import IntelligenceFeedStore
+
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _rows(entries):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = entries
+    return result
+
+
+def test_legacy_entry_round_trip_precomputes_symptoms():
+    item = {
+        "id": "e-1",
+        "timestamp": "2026-01-01T09:00:00",
+        "text": "Brain fog and a headache all morning",
+        "tags": ["insomnia"],
+        "scores": {"mood": 4, "energy": 2},
+        "source": "multi_slider_component",
+    }
+
+    entry = entry_from_legacy(7, item)
+
+    assert entry.created_at == T0 + timedelta(hours=9)
+    assert (entry.mood_score, entry.energy_score) == (4, 2)
+    assert entry.symptoms == ["headache", "insomnia", "brain_fog"]
+
+    data = entry_to_dict(entry)
+    assert data["id"] == "e-1" and data["text"] == item["text"]
+    assert data["source"] == "multi_slider_component"
+
+    # Entries without an ID get the same ID on every read
+    del item["id"]
+    assert entry_from_legacy(7, item).entry_uuid == entry_from_legacy(7, item).entry_uuid
+
+
+@pytest.mark.asyncio
+async def test_iter_entries_pages_by_keyset_and_merges_legacy():
+    rows = [
+        JournalEntry(id=i, user_id=7, content=f"row {i}", tags=[], symptoms=[], created_at=T0 + timedelta(days=i))
+        for i in (1, 2, 3)
+    ]
+    db = AsyncMock()
+    db.execute.side_effect = [_rows(rows[:2]), _rows(rows[2:])]
+    db.scalar.return_value = [
+        {"id": "old", "text": "legacy", "timestamp": (T0 + timedelta(days=2, hours=12)).isoformat()}
+    ]
+
+    entries = [e async for e in JournalStore().iter_entries(7, db, page_size=2)]
+
+    assert [e.content for e in entries] == ["row 1", "row 2", "legacy", "row 3"]
+    assert db.execute.await_count == 2
+    second_page = _sql(db.execute.await_args_list[1].args[0])
+    assert "(journal_entries.created_at, journal_entries.id) >" in second_page
+    assert "ORDER BY journal_entries.created_at, journal_entries.id" in second_page
+
+
+@pytest.mark.asyncio
+async def test_backfill_inserts_idempotently_and_removes_unchanged_lists():
+    items = [{"id": "e-1", "timestamp": T0.isoformat(), "text": "Anxiety all day"}]
+    selected = MagicMock()
+    selected.all.return_value = [(7, items)]
+    db = AsyncMock()
+    db.execute.side_effect = [selected, MagicMock(), MagicMock(rowcount=1)]
+
+    assert await JournalStore().backfill(db, batch_size=10) == 1
+
+    insert, rows = db.execute.await_args_list[1].args
+    assert "ON CONFLICT (entry_uuid) DO NOTHING" in _sql(insert)
+    assert rows[0]["entry_uuid"] == "e-1" and rows[0]["symptoms"] == ["anxiety"]
+
+    remove = _sql(db.execute.await_args_list[2].args[0])
+    assert "SET data=(user_profile.data - " in remove
+    assert "AND user_profile.data[" in remove  # only if the list is unchanged
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_backfill_counts_only_removed_keys():
+    changing = [{"id": "e-1", "timestamp": T0.isoformat(), "text": "Edited meanwhile"}]
+    selected = MagicMock()
+    selected.all.return_value = [(7, None), (8, changing)]
+    db = AsyncMock()
+    db.execute.side_effect = [selected, MagicMock(rowcount=1), MagicMock(), MagicMock(rowcount=0)]
+
+    # JSONB null is dropped without the equality guard; the changed list is not counted
+    assert await JournalStore().backfill(db, batch_size=10) == 1
+    remove_null = _sql(db.execute.await_args_list[1].args[0])
+    assert "SET data=(user_profile.data - " in remove_null and "AND user_profile.data[" not in remove_null
+
+
+@pytest.mark.asyncio
+async def test_add_entry_schedules_feed_refresh():
+    db = MagicMock(flush=AsyncMock())
+
+    with patch.object(IntelligenceFeedStore, "request_refresh", AsyncMock(return_value=True)) as refresh:
+        entry = await JournalStore().add_entry(7, "Headache again", db, source="journal_chat")
+
+    assert entry.symptoms == ["headache"]
+    db.add.assert_called_once_with(entry)
+    refresh.assert_awaited_once_with(7)
+
+    # A queue failure never fails the write
+    with patch.object(IntelligenceFeedStore, "request_refresh", AsyncMock(side_effect=ConnectionError)):
+        await JournalStore().add_entry(7, "Fine today", db)
@@ -0,0 +1,66 @@
+"""
+Tests for the shared Aho-Corasick keyword matcher.
+
+Covers overlapping terms, word boundaries, aliases, the per-entry scan cache
+and a consumer (cyclical symptom extraction).
+"""
+
+import random
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.app.modules.intelligence import matching
+from src.app.modules.intelligence.matching import KeywordMatcher, match_entry
+from src.app.modules.intelligence.observer.cyclical import CyclicalPatternDetector
+
+
+def test_overlapping_terms_agree_with_substring_search():
+    terms = ["he", "she", "his", "hers", "her", "ers", "s"]
+    matcher = KeywordMatcher({"v": terms})
+    rng = random.Random(7)
+
+    for _ in range(200):
+        text = " ".join("".join(rng.choice("hers i") for _ in range(rng.randint(1, 6))) for _ in range(4))
+        expected = [t for t in terms if any(word.startswith(t) for word in text.split())]
+        assert matcher.scan(text).labels("v") == expected, text
+
+
+def test_word_boundaries_aliases_and_vocabulary_masks():
+    matcher = KeywordMatcher({
+        "themes": ["art", "pain", "every time"],
+        "symptoms": {"brain_fog": ["brain fog", "brain_fog"], "headache": ["headache"]},
+    })
+
+    doc = matcher.scan("Started a new painting. Brain fog and HEADACHES, every time.")
+    assert doc.labels("themes") == ["pain", "every time"]  # not "art" inside "started"
+    assert doc.labels("symptoms") == ["brain_fog", "headache"]
+    assert doc.has("symptoms", "headache") and not doc.has("themes", "art")
+    assert doc.count("themes") == 2 and doc.any("symptoms")
+
+    strict = KeywordMatcher({"v": ["pain"]}, match_suffixes=False)
+    assert strict.scan("painting").labels("v") == []
+    assert strict.scan("the pain.").labels("v") == ["pain"]
+
+
+def test_match_entry_scans_each_entry_once_until_content_changes():
+    matching.register_vocabulary("test.words", ["alpha", "beta"])
+    matcher = matching.get_keyword_matcher()
+
+    with patch.object(matcher, "scan", wraps=matcher.scan) as scan:
+        assert match_entry("e1", "alpha and beta").labels("test.words") == ["alpha", "beta"]
+        assert match_entry("e1", "alpha and beta").has("test.words", "beta")
+        assert scan.call_count == 1
+
+        assert match_entry("e1", "only beta now").labels("test.words") == ["beta"]
+        assert scan.call_count == 2
+
+    # Changing a vocabulary recompiles the shared matcher
+    matching.register_vocabulary("test.words", ["gamma"])
+    assert match_entry("e1", "alpha gamma").labels("test.words") == ["gamma"]
+
+
+def test_cyclical_symptoms_from_content_and_tags():
+    detector = CyclicalPatternDetector()
+    entry = SimpleNamespace(id=101, content="Brain fog all morning, headaches later", tags=["Insomnia"])
+
+    assert detector._extract_symptoms_from_entry(entry) == ["headache", "insomnia", "brain_fog"]
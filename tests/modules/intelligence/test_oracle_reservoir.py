@@ -0,0 +1,125 @@
+"""
+Tests for the Oracle entropy reservoir.
+
+Covers bulk refill with provenance, CSPRNG top-up when drained, reservoir-fed
+draws, and the concurrent synthesis/question LLM calls.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.app.modules.intelligence.oracle.quantum import QuantumEntropy
+from src.app.modules.intelligence.oracle.reservoir import RESERVOIR_KEY, EntropyReservoir, EntropyValue
+from src.app.modules.intelligence.oracle.service import OracleService
+
+
+class _ListRedis:
+    """In-memory stand-in for the Redis list commands the reservoir uses."""
+
+    def __init__(self):
+        self.lists: dict[str, list[str]] = {}
+
+    async def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    async def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start : end + 1]
+
+    async def lpop(self, key, count):
+        items = self.lists.get(key, [])
+        popped, self.lists[key] = items[:count], items[count:]
+        return popped or None
+
+
+def _reservoir(size=10, refill_batch=6) -> EntropyReservoir:
+    reservoir = EntropyReservoir(size=size, refill_batch=refill_batch)
+    reservoir.redis_client = _ListRedis()
+    return reservoir
+
+
+@pytest.mark.asyncio
+async def test_refill_is_bulk_capped_and_tagged_quantum():
+    reservoir = _reservoir()
+    quantum = QuantumEntropy()
+
+    with patch.object(quantum, "_fetch_quantum_uint16", new_callable=AsyncMock) as fetch:
+        fetch.side_effect = lambda count: list(range(count))
+        assert await reservoir.refill(quantum) == 6
+        assert await reservoir.refill(quantum) == 4
+        assert await reservoir.refill(quantum) == 0
+
+    assert [call.kwargs["count"] for call in fetch.await_args_list] == [6, 4]
+    entries = [EntropyValue.decode(e) for e in reservoir.redis_client.lists[RESERVOIR_KEY]]
+    assert len(entries) == 10
+    assert all(entry.source == "QUANTUM" for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_take_is_fifo_and_tops_up_from_csprng_when_drained():
+    reservoir = _reservoir()
+    await reservoir.redis_client.rpush(RESERVOIR_KEY, "11:QUANTUM:100", "22:QUANTUM:100")
+
+    values = await reservoir.take(3)
+    assert [v.value for v in values[:2]] == [11, 22]
+    assert [v.source for v in values] == ["QUANTUM", "QUANTUM", "LOCAL_CHAOS"]
+    assert 0 <= values[2].value <= 65535
+
+    broken = EntropyReservoir()
+    broken.redis_client = MagicMock(lpop=AsyncMock(side_effect=ConnectionError("down")))
+    assert [v.source for v in await broken.take(2)] == ["LOCAL_CHAOS", "LOCAL_CHAOS"]
+
+
+@pytest.mark.asyncio
+async def test_reservoir_draw_makes_no_api_call_and_handles_rejection_zone():
+    reservoir = _reservoir()
+    qe = QuantumEntropy(reservoir=reservoir)
+
+    await reservoir.redis_client.rpush(RESERVOIR_KEY, *(f"{v}:QUANTUM:0" for v in (5000, 2000, 30000, 3000)))
+    with patch.object(httpx.AsyncClient, "get", side_effect=AssertionError("live API call")):
+        rank, suit, hexagram, line, source = await qe.get_full_oracle_draw()
+    assert (rank, suit, hexagram, line, source) == (1 + 5000 % 13, "Hearts", 1 + 30000 % 64, 1 + 3000 % 6, "QUANTUM")
+
+    # 65535 is in the rejection zone for 13 ranks
+    await reservoir.redis_client.rpush(RESERVOIR_KEY, *(f"{v}:QUANTUM:0" for v in (65535, 2000, 30000, 3000)))
+    rank, _, _, _, source = await qe.get_full_oracle_draw()
+    assert source == "LOCAL_CHAOS"
+    assert 1 <= rank <= 13
+
+
+@pytest.mark.asyncio
+async def test_daily_draw_runs_llm_calls_concurrently_with_one_llm():
+    service = OracleService()
+    in_flight = 0
+    peak = 0
+
+    async def ainvoke(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(content="Oracle text")
+
+    llm = MagicMock(ainvoke=ainvoke)
+    db = AsyncMock()
+    db.add = MagicMock()
+
+    with (
+        patch.object(service.quantum, "get_full_oracle_draw", return_value=(5, "Hearts", 12, 3, "QUANTUM")),
+        patch.object(service, "_get_user_llm", return_value=llm) as get_llm,
+    ):
+        reading = await service.perform_daily_draw(user_id=1, db=db)
+
+    get_llm.assert_awaited_once()
+    assert peak == 2
+    assert reading.synthesis_text == "Oracle text"
+    assert reading.diagnostic_question == "Oracle text"
+    assert reading.entropy_source == "QUANTUM"
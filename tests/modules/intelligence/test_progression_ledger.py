@@ -0,0 +1,115 @@
+"""
+Tests for the XP ledger and burst coalescing in EvolutionEngine.
+
+Covers the closed-form level lookup, the atomic increment issued for a batch,
+the running totals written to the ledger, per-user coalescing of packets and
+the progression history merging sync scores with ledger entries.
+"""
+
+import asyncio
+import math
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.api.v1.progression import get_progression_history
+from src.app.models.progression import PlayerStats, level_for_experience, level_threshold, rank_for_level
+from src.app.modules.intelligence.evolution.engine import EvolutionEngine
+from src.app.modules.intelligence.evolution.ledger import ExperienceGain, LedgerUpdate, record_experience
+from src.app.protocol import events
+from src.app.protocol.packet import ProgressionPacket
+
+
+def test_level_lookup_matches_threshold_loop():
+    for xp in [0, 999, 1000, 2999, 3000, 6749, 6750, 10**6, 10**9]:
+        level = 1
+        while xp >= int(level * 1000 * math.pow(1.5, level - 1)):
+            level += 1
+        assert level_for_experience(xp) == level
+
+    assert level_threshold(1) == 1000
+    assert rank_for_level(10) == "E" and rank_for_level(11) == "D" and rank_for_level(51) == "S"
+
+
+@pytest.mark.asyncio
+async def test_record_experience_increments_atomically_and_ledgers_running_totals():
+    gains = [ExperienceGain(amount=400, reason="Quest A", category="SYNC"), ExperienceGain(600, "Quest B", "SYNC")]
+
+    upsert = MagicMock()
+    upsert.one.return_value = (1900, 1, 0.5)  # 900 XP before the batch
+    db = AsyncMock()
+    db.execute.side_effect = [upsert, MagicMock()]
+    db.scalar.return_value = 2
+
+    result = await record_experience(db, 7, gains)
+
+    sql = str(db.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert "coalesce(player_stats.experience_points" in sql
+
+    assert result == LedgerUpdate(user_id=7, experience_points=1900, old_level=1, level=2, sync_rate=0.5, gains=2)
+    assert result.leveled_up and result.rank == "E"
+    db.scalar.assert_awaited_once()  # level raised with GREATEST
+
+    _, rows = db.execute.await_args_list[1].args
+    assert [(r["total_after"], r["level_after"]) for r in rows] == [(1300, 2), (1900, 2)]
+
+
+@pytest.mark.asyncio
+async def test_packets_for_a_user_are_coalesced_into_one_write():
+    engine = EvolutionEngine(coalesce_window=0.05)
+    engine.bus = AsyncMock()
+
+    def packet(user_id, amount):
+        return ProgressionPacket(
+            source="quest_manager",
+            event_type=events.PROGRESSION_EXPERIENCE_GAIN,
+            payload={"title": "Quest"},
+            user_id=user_id,
+            amount=amount,
+            reason="Quest Completed",
+        )
+
+    calls = []
+
+    async def fake_record(db, user_id, gains):
+        calls.append((user_id, [g.amount for g in gains]))
+        return LedgerUpdate(user_id, sum(g.amount for g in gains), 1, 1, 0.0, len(gains))
+
+    session = MagicMock()
+    session.return_value.__aenter__.return_value = AsyncMock()
+    with (
+        patch("src.app.modules.intelligence.evolution.engine.local_session", session),
+        patch("src.app.modules.intelligence.evolution.engine.record_experience", side_effect=fake_record),
+        patch("src.app.modules.intelligence.evolution.engine.experience_history", AsyncMock(return_value=[])),
+        patch("src.app.modules.intelligence.evolution.engine.sync_profile_progression", AsyncMock()),
+    ):
+        for amount in (10, 20, 30):
+            await engine.handle_experience_gain(packet("1", amount))
+        await engine.handle_experience_gain(packet("2", 5))
+        assert calls == []
+
+        await asyncio.sleep(0.1)
+        assert sorted(calls) == [(1, [10, 20, 30]), (2, [5])]
+
+        # A later packet opens a new window; shutdown writes it without waiting
+        await engine.handle_experience_gain(packet("1", 40))
+        await engine.flush()
+        assert calls[-1] == (1, [40])
+
+    engine.bus.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_progression_history_reads_xp_from_the_ledger():
+    sync_history = [{"date": "2026-03-06", "score": 0.5}, {"date": "2026-03-07", "score": 1.0}]
+    stats = PlayerStats(user_id=7, sync_history=sync_history)
+    db = MagicMock(execute=AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=stats))))
+    xp = {"timestamp": "2026-03-07T12:00:00+00:00", "amount": 50, "reason": "Quest", "new_total": 50, "level": 1}
+
+    with patch("src.app.api.v1.progression.experience_history", AsyncMock(return_value=[xp])) as history:
+        timeline = await get_progression_history(limit=2, db=db, current_user={"id": 7})
+
+    history.assert_awaited_once_with(db, 7, limit=2)
+    assert timeline == [xp, {"date": "2026-03-07", "score": 1.0}]
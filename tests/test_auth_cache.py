@@ -0,0 +1,89 @@
+"""Unit tests for the auth fast path (cached users, tiers and revoked tokens)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.api.dependencies import get_current_user
+from src.app.core.schemas import TokenData
+from src.app.core.utils.auth_cache import MISSING, TTLCache, auth_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    auth_cache.users.clear()
+    auth_cache.invalidate_tiers()
+    yield
+    auth_cache.users.clear()
+    auth_cache.invalidate_tiers()
+
+
+class TestCurrentUserCache:
+    """get_current_user only loads the user row on a cache miss."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_skips_user_query(self, mock_db, sample_user_read):
+        user = sample_user_read.model_dump()
+        token_data = TokenData(username_or_email=user["username"])
+
+        with (
+            patch("src.app.api.dependencies.verify_token", AsyncMock(return_value=token_data)),
+            patch("src.app.api.dependencies.crud_users") as mock_crud,
+        ):
+            mock_crud.get = AsyncMock(return_value=user)
+
+            assert await get_current_user("token", mock_db) == user
+            assert await get_current_user("token", mock_db) == user
+            mock_crud.get.assert_called_once()
+
+            # Updates invalidate the cached row
+            auth_cache.invalidate_user(user["username"])
+            await get_current_user("token", mock_db)
+            assert mock_crud.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revocation_without_redis_checks_database(self, mock_db):
+        with (
+            patch("src.app.core.utils.auth_cache.cache.client", None),
+            patch("src.app.core.db.crud_token_blacklist.crud_token_blacklist") as mock_blacklist,
+        ):
+            mock_blacklist.exists = AsyncMock(return_value=True)
+            assert await auth_cache.is_revoked("token", mock_db) is True
+            mock_blacklist.exists.assert_called_once_with(mock_db, token="token")
+
+    @pytest.mark.asyncio
+    async def test_failed_mirror_write_stops_trusting_redis_misses(self, mock_db):
+        redis = MagicMock(set=AsyncMock(side_effect=ConnectionError("redis down")))
+        redis.delete = AsyncMock(side_effect=ConnectionError("redis down"))
+        # Not mirrored but marked warm, then the marker is gone
+        redis.pipeline.return_value.execute = AsyncMock(side_effect=[[0, 1], [0, 0]])
+
+        with (
+            patch("src.app.core.utils.auth_cache.cache.client", redis),
+            patch("src.app.core.db.crud_token_blacklist.crud_token_blacklist") as mock_blacklist,
+            patch.object(auth_cache, "warm_revocations", AsyncMock()) as warm,
+        ):
+            mock_blacklist.exists = AsyncMock(return_value=True)
+            await auth_cache.revoke("token", exp_timestamp=9999999999)
+            assert await auth_cache.is_revoked("token", mock_db) is True
+
+            # The marker is dropped on the next check once Redis accepts the delete
+            redis.delete.side_effect = None
+            assert await auth_cache.is_revoked("token", mock_db) is True
+            assert auth_cache._mirror_stale is False
+            assert mock_blacklist.exists.await_count == 2
+            warm.assert_awaited_once_with(mock_db)
+
+def test_ttl_cache_expiry_and_lru_bound():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", None)  # negative results are cacheable
+    cache.set("c", 3)
+
+    assert cache.get("a") is MISSING
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    expired = TTLCache(ttl=-1, maxsize=2)
+    expired.set("a", 1)
+    assert expired.get("a") is MISSING
@@ -0,0 +1,104 @@
+"""Unit tests for the rate-limit engine (algorithm dispatch, route costs, quota headers)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+
+from src.app.api.dependencies import rate_limiter_dependency
+from src.app.core.config import RateLimitAlgorithmOption
+from src.app.core.exceptions.http_exceptions import RateLimitException
+from src.app.core.utils.rate_limit import (
+    _SLIDING_WINDOW_SCRIPT,
+    _TOKEN_BUCKET_SCRIPT,
+    RateLimiter,
+    RateLimitResult,
+    default_limit,
+    route_cost,
+)
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.eval = AsyncMock(return_value=[1, 7, 1500, 0])
+    with patch.object(RateLimiter, "get_client", return_value=client):
+        yield client
+
+
+class TestRouteCost:
+    def test_llm_routes_cost_more_than_reads(self):
+        assert route_cost("/api/v1/intelligence/oracle/draw") > route_cost("/api/v1/intelligence/query") > 1
+        assert route_cost("/api/v1/users/me") == 1
+
+    def test_costed_routes_default_to_proportional_limits(self):
+        for path in ("/api/v1/intelligence/query", "/api/v1/intelligence/oracle/draw"):
+            limit, _ = default_limit(path)
+            assert limit // route_cost(path) >= 10
+        assert default_limit("/api/v1/users/me") == (10, 3600)
+
+    def test_costed_routes_are_rate_limited(self):
+        from src.app.api import router
+        from src.app.core.config import settings
+        from src.app.schemas.rate_limit import sanitize_path
+
+        limited = {
+            sanitize_path(route.path)
+            for route in router.routes
+            if any(dep.call is rate_limiter_dependency for dep in route.dependant.dependencies)
+        }
+        assert set(settings.RATE_LIMIT_ROUTE_COSTS) <= limited
+
+
+class TestCheck:
+    @pytest.mark.asyncio
+    async def test_dispatches_algorithm_script(self, mock_client):
+        limiter = RateLimiter()
+
+        await limiter.check(1, "/api/v1/tasks/task", limit=10, period=60, cost=3)
+        args = mock_client.eval.call_args.args
+        assert args[0] == _SLIDING_WINDOW_SCRIPT
+        assert args[2:] == ("ratelimit:sliding_window:1:api_v1_tasks_task", 60, 10, 3)
+
+        algorithm = RateLimitAlgorithmOption.TOKEN_BUCKET
+        await limiter.check(1, "/api/v1/tasks/task", limit=10, period=60, algorithm=algorithm)
+        assert mock_client.eval.call_args.args[0] == _TOKEN_BUCKET_SCRIPT
+
+    @pytest.mark.asyncio
+    async def test_result_converts_milliseconds(self, mock_client):
+        result = await RateLimiter().check(1, "/x", limit=10, period=60)
+
+        assert result == RateLimitResult(allowed=True, limit=10, remaining=7, reset_after=2, retry_after=0)
+        assert "Retry-After" not in result.headers
+
+    @pytest.mark.asyncio
+    async def test_is_rate_limited_wraps_check(self, mock_client):
+        mock_client.eval.return_value = [0, 0, 30000, 4000]
+        assert await RateLimiter().is_rate_limited(None, 1, "/x", limit=10, period=60) is True
+
+
+class TestDependency:
+    @pytest.mark.asyncio
+    async def test_sets_quota_headers(self, mock_client, mock_db):
+        request = MagicMock(url=MagicMock(path="/api/v1/intelligence/query"), client=MagicMock(host="1.2.3.4"))
+        del request.app.state.initialization_complete
+        response = Response()
+
+        await rate_limiter_dependency(request, response, mock_db, user=None)
+
+        assert response.headers["X-RateLimit-Remaining"] == "7"
+        *_, period, limit, cost = mock_client.eval.call_args.args
+        assert (limit, period) == default_limit("/api/v1/intelligence/query")
+        assert cost == route_cost("/api/v1/intelligence/query")
+
+    @pytest.mark.asyncio
+    async def test_denied_request_carries_retry_after(self, mock_client, mock_db):
+        mock_client.eval.return_value = [0, 0, 30000, 4000]
+        request = MagicMock(url=MagicMock(path="/api/v1/intelligence/oracle/draw"), client=None)
+        del request.app.state.initialization_complete
+
+        with pytest.raises(RateLimitException) as exc_info:
+            await rate_limiter_dependency(request, Response(), mock_db, user=None)
+
+        assert exc_info.value.headers["Retry-After"] == "4"
+        assert exc_info.value.headers["X-RateLimit-Remaining"] == "0"